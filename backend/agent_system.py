@@ -6,11 +6,14 @@
 import re
 import json
 import math
-from typing import Dict, Any, List, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass
 import google.generativeai as genai
 import os
 from dotenv import load_dotenv
+from chatbot.core.tiered_classifier import KeywordIntentModel, TieredDecider, TIER_LLM
 
 load_dotenv()
 
@@ -18,6 +21,18 @@ load_dotenv()
 genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 model = genai.GenerativeModel('gemini-1.5-pro')
 
+# LLM을 호출하지 않는 노드(검색 시뮬레이션, 계산, DB 조회, 필드 추출)를 실행하는 제한된 스레드 풀
+# 이벤트 루프를 막지 않으면서 동시에 실행되는 CPU 작업 수를 제한합니다.
+NODE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("AGENT_NODE_WORKERS", "4")),
+    thread_name_prefix="agent-node"
+)
+
+async def run_node_in_executor(func: Callable[..., Any], *args) -> Any:
+    """동기 노드 함수를 제한된 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(NODE_EXECUTOR, func, *args)
+
 @dataclass
 class AgentState:
     """Agent 시스템의 상태를 관리하는 데이터 클래스"""
@@ -49,26 +64,73 @@ class IntentDetectionNode:
 
 분류 결과만 반환해주세요 (예: "search", "calc", "db", "recruit", "chat")
 """
+        # 로컬 의도 모델: 시스템 프롬프트의 예시 키워드 가중치 (충돌하면 신뢰도가 낮아져 LLM으로 넘어감)
+        self.local_model = KeywordIntentModel(
+            {
+                "search": {"트렌드": 2, "동향": 2, "검색": 2, "조사": 1.5, "찾아": 1, "최신": 1, "정보": 1},
+                "calc": {"계산": 2.5, "퍼센트": 2, "%": 1},
+                "db": {"저장된": 2.5, "기존 데이터": 2.5, "이전 정보": 2, "조회": 1.5, "데이터베이스": 2},
+                "recruit": {"뽑아요": 2.5, "뽑고": 2, "채용공고": 2.5, "채용": 2, "구인": 2, "모집": 2, "인재": 1},
+                "chat": {"안녕": 2, "반가": 2, "감사": 2, "고마": 2, "도움말": 2, "hello": 2}
+            },
+            intent_patterns={"calc": [(r"\d+\s*[-+*/×÷]\s*\d+", 2.5)]},
+            default_intent="chat"
+        )
+        self.tiers = TieredDecider()
+    
+    def _detect_locally(self, user_input: str) -> Optional[str]:
+        """로컬 모델로 확정되면 의도를 반환하고, LLM이 필요하면 None을 반환합니다."""
+        intent, confidence = self.local_model.predict(user_input)
+        if self.tiers.should_escalate(confidence):
+            return None
+        return intent
+    
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """단계별 판정 횟수 (local_model / llm / budget_fallback)"""
+        return self.tiers.get_stats()
     
     def detect_intent(self, user_input: str) -> str:
+        intent = self._detect_locally(user_input)
+        if intent is not None:
+            return intent
         try:
             # Gemini AI를 사용하여 의도 분류
             prompt = f"{self.system_prompt}\n\n사용자 입력: {user_input}"
             response = model.generate_content(prompt)
+            self.tiers.record(TIER_LLM)
+            return self._parse_intent(response.text)
             
-            # 응답에서 의도 추출
-            intent = response.text.strip().lower()
-            
-            # 유효한 의도인지 확인
-            valid_intents = ["search", "calc", "db", "recruit", "chat"]
-            if intent not in valid_intents:
-                intent = "chat"  # 기본값
-            
+        except Exception as e:
+            print(f"의도 분류 중 오류: {str(e)}")
+            return "chat"  # 오류 시 기본값
+    
+    async def detect_intent_async(self, user_input: str) -> str:
+        """detect_intent의 비동기 버전 (이벤트 루프를 막지 않음, 타임아웃/취소는 호출자가 처리)"""
+        intent = self._detect_locally(user_input)
+        if intent is not None:
             return intent
+        try:
+            prompt = f"{self.system_prompt}\n\n사용자 입력: {user_input}"
+            response = await model.generate_content_async(prompt)
+            self.tiers.record(TIER_LLM)
+            return self._parse_intent(response.text)
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             print(f"의도 분류 중 오류: {str(e)}")
             return "chat"  # 오류 시 기본값
+    
+    def _parse_intent(self, text: str) -> str:
+        # 응답에서 의도 추출
+        intent = text.strip().lower()
+        
+        # 유효한 의도인지 확인
+        valid_intents = ["search", "calc", "db", "recruit", "chat"]
+        if intent not in valid_intents:
+            intent = "chat"  # 기본값
+        
+        return intent
 
 class WebSearchNode:
     """웹 검색 도구 노드"""
@@ -272,7 +334,27 @@ class RecruitmentNode:
     def process_recruitment(self, user_input: str) -> str:
         try:
             # Gemini AI를 사용하여 채용공고 내용 생성
-            prompt = f"""
+            response = model.generate_content(self._build_prompt(user_input))
+            return response.text
+            
+        except Exception as e:
+            print(f"채용공고 작성 중 오류: {str(e)}")
+            return "죄송합니다. 채용공고 작성 중 오류가 발생했습니다."
+    
+    async def process_recruitment_async(self, user_input: str) -> str:
+        """process_recruitment의 비동기 버전"""
+        try:
+            response = await model.generate_content_async(self._build_prompt(user_input))
+            return response.text
+            
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"채용공고 작성 중 오류: {str(e)}")
+            return "죄송합니다. 채용공고 작성 중 오류가 발생했습니다."
+    
+    def _build_prompt(self, user_input: str) -> str:
+        return f"""
 당신은 전문적인 채용공고 작성 전문가입니다.
 사용자의 요청을 바탕으로 체계적이고 매력적인 채용공고를 작성해주세요.
 
@@ -319,13 +401,6 @@ class RecruitmentNode:
 
 답변은 한국어로 작성하고, 이모지를 적절히 사용하여 가독성을 높여주세요.
 """
-            
-            response = model.generate_content(prompt)
-            return response.text
-            
-        except Exception as e:
-            print(f"채용공고 작성 중 오류: {str(e)}")
-            return "죄송합니다. 채용공고 작성 중 오류가 발생했습니다."
 
 class DatabaseQueryNode:
     """데이터베이스 조회 도구 노드"""
@@ -686,6 +761,12 @@ class AgentSystem:
         self.db_query = DatabaseQueryNode()
         self.fallback = FallbackNode()
         self.formatter = ResponseFormatterNode()
+        # 노드별 타임아웃 (초) - 초과 시 해당 노드를 취소하고 기본 동작으로 대체
+        self.node_timeouts = {
+            "intent": float(os.getenv("AGENT_INTENT_TIMEOUT", "8")),
+            "recruit": float(os.getenv("AGENT_RECRUIT_TIMEOUT", "30")),
+            "tool": float(os.getenv("AGENT_TOOL_TIMEOUT", "5")),
+        }
         
     def process_request(self, user_input: str, conversation_history: List[Dict[str, str]] = None, session_id: str = None) -> Dict[str, Any]:
         """사용자 요청을 처리하고 결과를 반환합니다."""
@@ -734,6 +815,83 @@ class AgentSystem:
                 "extracted_fields": {}
             }
     
+    async def process_request_async(self, user_input: str, conversation_history: List[Dict[str, str]] = None, session_id: str = None) -> Dict[str, Any]:
+        """
+        process_request의 비동기 버전
+        
+        LLM 노드는 generate_content_async로 호출하고, 나머지 동기 노드는 제한된 스레드 풀에서
+        실행하므로 느린 Gemini 호출이 같은 워커의 다른 요청을 막지 않습니다.
+        각 노드는 타임아웃이 지나면 취소되며, 요청 자체가 취소되면(클라이언트 연결 종료 등)
+        진행 중인 노드도 함께 취소됩니다.
+        """
+        try:
+            # 1단계: 의도 분류 (타임아웃 시 일반 대화로 처리)
+            try:
+                intent = await asyncio.wait_for(
+                    self.intent_detector.detect_intent_async(user_input),
+                    timeout=self.node_timeouts["intent"]
+                )
+            except asyncio.TimeoutError:
+                print(f"의도 분류 타임아웃 ({self.node_timeouts['intent']}초) - chat으로 처리")
+                intent = "chat"
+            
+            # 2단계: 도구 선택 및 실행
+            tool_result = ""
+            error = ""
+            
+            try:
+                if intent == "recruit":
+                    tool_result = await asyncio.wait_for(
+                        self.recruitment.process_recruitment_async(user_input),
+                        timeout=self.node_timeouts["recruit"]
+                    )
+                else:
+                    if intent == "search":
+                        node = self.web_search.process_search
+                    elif intent == "calc":
+                        node = self.calculator.process_calculation
+                    elif intent == "db":
+                        node = self.db_query.process_db_query
+                    else:  # chat
+                        node = self.fallback.process_chat
+                    tool_result = await asyncio.wait_for(
+                        run_node_in_executor(node, user_input),
+                        timeout=self.node_timeouts["tool"]
+                    )
+            except asyncio.TimeoutError:
+                error = "응답 시간이 초과되었습니다."
+                print(f"{intent} 노드 타임아웃")
+            
+            # 3단계: 응답 포맷팅
+            final_response = self.formatter.format_response(tool_result, intent, error)
+            
+            # 4단계: 채용공고 관련 필드 추출 (채용 관련인 경우)
+            extracted_fields = {}
+            if intent == "recruit" and not error:
+                extracted_fields = await run_node_in_executor(
+                    self._extract_job_posting_fields, user_input, tool_result
+                )
+            
+            return {
+                "success": True,
+                "response": final_response,
+                "intent": intent,
+                "error": error,
+                "session_id": session_id,
+                "extracted_fields": extracted_fields  # 추출된 필드 정보 추가
+            }
+            
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return {
+                "success": False,
+                "response": f"죄송합니다. 요청 처리 중 오류가 발생했습니다: {str(e)}",
+                "intent": "error",
+                "error": str(e),
+                "extracted_fields": {}
+            }
+    
     def _extract_job_posting_fields(self, user_input: str, tool_result: str) -> Dict[str, str]:
         """사용자 입력과 도구 결과에서 채용공고 관련 필드를 추출합니다."""
         try:
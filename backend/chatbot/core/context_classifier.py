@@ -1,7 +1,9 @@
 import re
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, Set
 from dataclasses import dataclass
 import logging
+from .keyword_automaton import KeywordAutomaton, PatternSet
+from instrumentation import span
 
 logger = logging.getLogger(__name__)
 
@@ -77,50 +79,82 @@ class FlexibleContextClassifier:
             "sentence_count_threshold": 2,  # 2문장 이상
             "detail_bonus": 0.5  # 상세한 내용 보너스
         }
+        
+        # 상세한 설명 지표
+        self.detail_indicators = ["구체적으로", "상세히", "자세히", "예를 들어", "특히", "또한", "그리고"]
+        
+        self._compile_matchers()
     
-    def calculate_semantic_similarity(self, text: str, concept_group: Dict) -> float:
+    def _compile_matchers(self):
+        """모든 사전 키워드를 하나의 오토마톤으로, 문맥 패턴은 미리 컴파일합니다."""
+        entries = []
+        for category, group in self.concept_groups.items():
+            for level in ("primary", "secondary"):
+                for keyword in group[level]:
+                    entries.append((keyword, (category, level, keyword)))
+        for indicator in self.detail_indicators:
+            entries.append((indicator, ("detail", "indicator", indicator)))
+        self._keyword_automaton = KeywordAutomaton(entries)
+        self._pattern_sets = {name: PatternSet(patterns) for name, patterns in self.context_patterns.items()}
+        # 그룹별 문맥 패턴 적용 여부 (기존 str(concept_group) 검사 결과를 한 번만 계산)
+        self._pattern_gates = {
+            category: ("recruitment_intent" in str(group), "qualification_requirements" in str(group))
+            for category, group in self.concept_groups.items()
+        }
+    
+    def _find_keywords(self, text: str) -> Set[Tuple[str, str, str]]:
+        """입력을 한 번 훑어 (카테고리, 수준, 키워드) 매칭 집합을 반환합니다."""
+        return self._keyword_automaton.matched_tags(text.lower())
+    
+    def calculate_semantic_similarity(self, text: str, concept_group: Dict,
+                                      matches: Optional[Set[Tuple[str, str, str]]] = None,
+                                      category: Optional[str] = None) -> float:
         """의미적 유사성 계산"""
-        text_lower = text.lower()
+        if matches is None:
+            matches = self._find_keywords(text)
+        if category is None:
+            category = next((name for name, group in self.concept_groups.items() if group is concept_group), None)
         score = 0.0
+        primary_hits = [keyword for keyword in concept_group["primary"] if (category, "primary", keyword) in matches]
         
         # 1차 키워드 매칭 (높은 가중치)
-        for keyword in concept_group["primary"]:
-            if keyword in text_lower:
-                score += 1.0
-                # 연속된 키워드 보너스
-                if len([k for k in concept_group["primary"] if k in text_lower]) > 1:
-                    score += 0.3
+        for keyword in primary_hits:
+            score += 1.0
+            # 연속된 키워드 보너스
+            if len(primary_hits) > 1:
+                score += 0.3
         
         # 2차 키워드 매칭 (낮은 가중치)
         for keyword in concept_group["secondary"]:
-            if keyword in text_lower:
+            if (category, "secondary", keyword) in matches:
                 score += 0.5
         
         # 문맥 패턴 매칭
-        context_bonus = self._check_context_patterns(text, concept_group)
+        context_bonus = self._check_context_patterns(text, concept_group, category)
         score += context_bonus
         
         return score * concept_group["weight"]
     
-    def _check_context_patterns(self, text: str, concept_group: Dict) -> float:
+    def _check_context_patterns(self, text: str, concept_group: Dict, category: Optional[str] = None) -> float:
         """문맥 패턴 확인"""
         bonus = 0.0
+        if category in self._pattern_gates:
+            check_recruitment, check_qualification = self._pattern_gates[category]
+        else:
+            check_recruitment = "recruitment_intent" in str(concept_group)
+            check_qualification = "qualification_requirements" in str(concept_group)
         
         # 채용 의도 관련 패턴
-        if "recruitment_intent" in str(concept_group):
-            for pattern in self.context_patterns["recruitment_structure"]:
-                if re.search(pattern, text):
-                    bonus += 0.5
+        if check_recruitment:
+            bonus += 0.5 * len(self._pattern_sets["recruitment_structure"].matching_indices(text))
         
         # 자격 요건 관련 패턴
-        if "qualification_requirements" in str(concept_group):
-            for pattern in self.context_patterns["qualification_structure"]:
-                if re.search(pattern, text):
-                    bonus += 0.3
+        if check_qualification:
+            bonus += 0.3 * len(self._pattern_sets["qualification_structure"].matching_indices(text))
         
         return bonus
     
-    def calculate_complexity_bonus(self, text: str) -> float:
+    def calculate_complexity_bonus(self, text: str, matches: Optional[Set[Tuple[str, str, str]]] = None) -> float:
         """문장 복잡성 보너스 계산"""
         bonus = 0.0
         
@@ -134,12 +168,14 @@ class FlexibleContextClassifier:
             bonus += 0.3
         
         # 상세한 설명 보너스
-        detail_indicators = ["구체적으로", "상세히", "자세히", "예를 들어", "특히", "또한", "그리고"]
-        detail_count = sum(1 for indicator in detail_indicators if indicator in text)
+        if matches is None:
+            matches = self._find_keywords(text)
+        detail_count = sum(1 for tag in matches if tag[0] == "detail")
         bonus += detail_count * 0.2
         
         return bonus
     
+    @span("classifier", name="context")
     def classify_context(self, text: str) -> ContextScore:
         """맥락 분류 (외부 인터페이스용)"""
         return self.analyze_recruitment_context(text)
@@ -151,15 +187,18 @@ class FlexibleContextClassifier:
         category_scores = {}
         total_score = 0.0
         
+        # 모든 사전 키워드를 한 번의 스캔으로 찾음
+        matches = self._find_keywords(text)
+        
         # 각 개념 그룹별 점수 계산
         for category, group in self.concept_groups.items():
-            score = self.calculate_semantic_similarity(text, group)
+            score = self.calculate_semantic_similarity(text, group, matches, category)
             category_scores[category] = score
             total_score += score
             logger.info(f"📊 {category}: {score:.2f}점")
         
         # 복잡성 보너스
-        complexity_bonus = self.calculate_complexity_bonus(text)
+        complexity_bonus = self.calculate_complexity_bonus(text, matches)
         total_score += complexity_bonus
         category_scores["complexity_bonus"] = complexity_bonus
         
@@ -181,7 +220,7 @@ class FlexibleContextClassifier:
         details = {
             "text_length": len(text),
             "sentence_count": len(re.split(r'[.!?]+', text)),
-            "key_indicators": self._extract_key_indicators(text),
+            "key_indicators": self._extract_key_indicators(text, matches),
             "score_breakdown": category_scores.copy()
         }
         
@@ -264,13 +303,15 @@ class FlexibleContextClassifier:
         
         return min(confidence, 1.0)
     
-    def _extract_key_indicators(self, text: str) -> List[str]:
+    def _extract_key_indicators(self, text: str, matches: Optional[Set[Tuple[str, str, str]]] = None) -> List[str]:
         """주요 지표 추출"""
+        if matches is None:
+            matches = self._find_keywords(text)
         indicators = []
         
         for category, group in self.concept_groups.items():
             for keyword in group["primary"]:
-                if keyword in text.lower():
+                if (category, "primary", keyword) in matches:
                     indicators.append(f"{category}: {keyword}")
         
         return indicators[:5]  # 상위 5개만 반환
@@ -9,6 +9,7 @@ from typing import Dict, List, Any, Optional
 import google.generativeai as genai
 import os
 from dotenv import load_dotenv
+from .keyword_automaton import KeywordAutomaton, PatternSet
 
 load_dotenv()
 
@@ -92,6 +93,40 @@ class EnhancedFieldExtractor:
         self.requirement_keywords = [
             '필수', '요구', '필요', '기본', '기본적', '최소', '최소한'
         ]
+        
+        # 경력/급여 패턴과 근무지 키워드
+        self.experience_patterns = [
+            r'경력\s*(\d+)\s*년\s*(이상|이하|정도|내외)?',
+            r'(\d+)\s*년\s*(이상|이하|정도|내외)?\s*경력',
+            r'(\d+)\s*년\s*(이상|이하|정도|내외)?\s*경험',
+            r'경험이\s*(\d+)\s*년\s*(이상|이하|정도|내외)?',
+            r'(\d+)\s*년차'
+        ]
+        self.salary_patterns = [
+            r'(\d{2,4})\s*만원',
+            r'연봉\s*(\d{2,4})\s*만원',
+            r'월급\s*(\d{2,4})\s*만원'
+        ]
+        self.location_keywords = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+        
+        self._compile_matchers()
+
+    def _compile_matchers(self):
+        """직무/기술 사전과 근무지 키워드를 하나의 오토마톤(대소문자 무시)으로, 정규식은 미리 컴파일합니다."""
+        entries = []
+        for job_title, variations in self.job_dictionary.items():
+            for variation in variations:
+                entries.append((variation, ('job', job_title)))
+        for tech_name, variations in self.tech_dictionary.items():
+            for variation in variations:
+                entries.append((variation, ('tech', tech_name)))
+        for location in self.location_keywords:
+            entries.append((location, ('location', location)))
+        for phrase in ('면접 후 결정', '협의 가능'):
+            entries.append((phrase, ('salary_negotiable', phrase)))
+        self._keyword_automaton = KeywordAutomaton(entries, case_sensitive=False)
+        self._experience_patterns = PatternSet(self.experience_patterns)
+        self._salary_patterns = PatternSet(self.salary_patterns)
 
     def extract_fields_enhanced(self, user_input: str) -> Dict[str, Any]:
         """향상된 필드 추출 (AI + 사전 + 규칙 결합)"""
@@ -120,63 +155,40 @@ class EnhancedFieldExtractor:
         """규칙 기반 초기 추출"""
         fields = {}
         
-        # 1. 직무명 추출 (사전 매칭)
-        for job_title, variations in self.job_dictionary.items():
-            for variation in variations:
-                if variation.lower() in user_input.lower():
-                    fields['position'] = job_title
-                    break
-            if 'position' in fields:
+        # 모든 사전 키워드를 한 번의 스캔으로 찾음
+        matches = self._keyword_automaton.matched_tags(user_input)
+        
+        # 1. 직무명 추출 (사전 매칭, 사전 순서상 첫 직무)
+        for job_title in self.job_dictionary:
+            if ('job', job_title) in matches:
+                fields['position'] = job_title
                 break
         
         # 2. 기술스택 추출 (사전 매칭)
-        tech_stack = []
-        for tech_name, variations in self.tech_dictionary.items():
-            for variation in variations:
-                if variation.lower() in user_input.lower():
-                    tech_stack.append(tech_name.title())  # 첫 글자 대문자로
-                    break
+        tech_stack = [tech_name.title() for tech_name in self.tech_dictionary  # 첫 글자 대문자로
+                      if ('tech', tech_name) in matches]
         
         if tech_stack:
             fields['tech_stack'] = list(set(tech_stack))  # 중복 제거
         
         # 3. 경력 요구사항 추출
-        experience_patterns = [
-            r'경력\s*(\d+)\s*년\s*(이상|이하|정도|내외)?',
-            r'(\d+)\s*년\s*(이상|이하|정도|내외)?\s*경력',
-            r'(\d+)\s*년\s*(이상|이하|정도|내외)?\s*경험',
-            r'경험이\s*(\d+)\s*년\s*(이상|이하|정도|내외)?',
-            r'(\d+)\s*년차'
-        ]
-        
-        for pattern in experience_patterns:
-            match = re.search(pattern, user_input)
-            if match:
-                years = match.group(1)
-                fields['experience'] = f"{years}년"
-                break
+        match = self._experience_patterns.first_match(user_input)
+        if match:
+            years = match.group(1)
+            fields['experience'] = f"{years}년"
         
         # 4. 급여 정보 추출
-        salary_patterns = [
-            r'(\d{2,4})\s*만원',
-            r'연봉\s*(\d{2,4})\s*만원',
-            r'월급\s*(\d{2,4})\s*만원'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, user_input)
-            if match:
-                salary = match.group(1)
-                fields['salary'] = f"{salary}만원"
-                break
+        match = self._salary_patterns.first_match(user_input)
+        if match:
+            salary = match.group(1)
+            fields['salary'] = f"{salary}만원"
         
-        if '면접 후 결정' in user_input or '협의 가능' in user_input:
+        if any(tag[0] == 'salary_negotiable' for tag in matches):
             fields['salary'] = '면접 후 결정'
         
         # 5. 근무지 추출
-        location_keywords = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
-        for location in location_keywords:
-            if location in user_input:
+        for location in self.location_keywords:
+            if ('location', location) in matches:
                 fields['location'] = location
                 break
         
@@ -5,6 +5,8 @@
 import re
 from typing import Dict, Any, List
 
+from instrumentation import span
+
 class IntentClassifier:
     """의도 분류기 클래스"""
     
@@ -29,18 +31,23 @@ class IntentClassifier:
                 r'잘가|바이|안녕히'
             ]
         }
+        # 매칭 개수를 점수로 사용하므로 패턴별 findall은 유지하고, 컴파일은 한 번만 수행
+        self._compiled_intent_patterns = {
+            intent: [re.compile(pattern) for pattern in patterns]
+            for intent, patterns in self.intent_patterns.items()
+        }
     
+    @span("classifier", name="intent")
     def classify_intent(self, text: str) -> Dict[str, Any]:
         """텍스트의 의도를 분류"""
         text_lower = text.lower()
         
         # 각 의도별 점수 계산
         scores = {}
-        for intent, patterns in self.intent_patterns.items():
+        for intent, patterns in self._compiled_intent_patterns.items():
             score = 0
             for pattern in patterns:
-                matches = re.findall(pattern, text_lower)
-                score += len(matches)
+                score += len(pattern.findall(text_lower))
             scores[intent] = score
         
         # 가장 높은 점수의 의도 선택
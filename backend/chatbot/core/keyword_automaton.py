@@ -0,0 +1,119 @@
+"""
+키워드 오토마톤
+Aho–Corasick 다중 패턴 매칭 + 미리 컴파일한 정규식 묶음
+분류기/추출기가 사전 크기와 무관하게 입력을 한 번만 훑어 모든 키워드를 찾도록 합니다.
+"""
+
+import re
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Aho–Corasick 오토마톤 (부분 문자열 매칭, 겹치는 키워드 모두 검출)"""
+
+    def __init__(self, entries: Iterable[Tuple[str, Hashable]] = (), case_sensitive: bool = True):
+        """
+        Args:
+            entries: (키워드, 태그) 목록. 같은 키워드에 여러 태그를 붙일 수 있습니다.
+            case_sensitive: False면 키워드와 입력을 모두 소문자로 비교합니다.
+        """
+        self.case_sensitive = case_sensitive
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, Hashable]]] = [[]]
+        self._built = False
+        for term, tag in entries:
+            self.add(term, tag)
+        self.build()
+
+    def add(self, term: str, tag: Hashable):
+        """키워드를 추가합니다. 추가 후에는 build()를 다시 호출해야 합니다."""
+        if not term:
+            return
+        if not self.case_sensitive:
+            term = term.lower()
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append((term, tag))
+        self._built = False
+
+    def build(self):
+        """실패 링크를 계산하고 출력 집합을 병합합니다. (BFS)"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, Hashable]]:
+        """(끝 위치, 키워드, 태그)를 입력 순서대로 반환합니다."""
+        if not self._built:
+            self.build()
+        if not self.case_sensitive:
+            text = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term, tag in output[state]:
+                yield index + 1, term, tag
+
+    def matched_terms(self, text: str) -> Set[str]:
+        """입력에 포함된 키워드 집합"""
+        return {term for _, term, _ in self.iter_matches(text)}
+
+    def matched_tags(self, text: str) -> Set[Hashable]:
+        """입력에 포함된 키워드들의 태그 집합"""
+        return {tag for _, _, tag in self.iter_matches(text)}
+
+
+class PatternSet:
+    """미리 컴파일한 정규식 목록 + 하나로 합친 사전 필터 정규식"""
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0):
+        self.patterns = list(patterns)
+        self.compiled = [re.compile(pattern, flags) for pattern in self.patterns]
+        # 어느 패턴도 맞지 않는 입력은 합친 정규식 한 번으로 걸러냅니다.
+        self.combined = re.compile("|".join(f"(?:{pattern})" for pattern in self.patterns), flags) \
+            if self.patterns else None
+
+    def any_match(self, text: str) -> bool:
+        return self.combined is not None and self.combined.search(text) is not None
+
+    def matching_indices(self, text: str) -> List[int]:
+        """입력의 어딘가에서 매칭되는 패턴의 인덱스 목록 (패턴 순서)"""
+        if not self.any_match(text):
+            return []
+        return [index for index, pattern in enumerate(self.compiled) if pattern.search(text)]
+
+    def first_match(self, text: str) -> Optional[re.Match]:
+        """목록 순서상 처음으로 매칭되는 패턴의 매치 객체"""
+        if not self.any_match(text):
+            return None
+        for pattern in self.compiled:
+            match = pattern.search(text)
+            if match:
+                return match
+        return None
@@ -0,0 +1,209 @@
+"""
+계층형 분류 엔진
+1단계: 규칙/로컬 모델 (빠름, 비용 없음)
+2단계: LLM (신뢰도가 임계값 미만이고 분당 LLM 예산이 남아 있을 때만)
+각 단계가 최종 판정을 내린 횟수를 카운터로 기록합니다.
+"""
+
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .keyword_automaton import KeywordAutomaton
+
+# 단계 이름
+TIER_RULE = "rule"                  # 1차 규칙 점수로 확정
+TIER_LOCAL = "local_model"          # 로컬 모델 신뢰도가 충분해서 확정
+TIER_LLM = "llm"                    # LLM으로 재판단
+TIER_BUDGET = "budget_fallback"     # LLM이 필요했지만 예산 초과로 로컬 모델 결과 사용
+
+
+def sigmoid(x: float) -> float:
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1.0 + z)
+
+
+class LLMBudget:
+    """슬라이딩 윈도우 기반 분당 LLM 호출 예산 (스레드 안전)"""
+
+    def __init__(self, max_calls: int, window_seconds: float = 60.0):
+        """
+        Args:
+            max_calls: 윈도우 안에서 허용하는 최대 LLM 호출 수 (0이면 LLM 사용 안 함, 음수면 무제한)
+            window_seconds: 윈도우 길이 (초)
+        """
+        self.max_calls = max_calls
+        self.window_seconds = window_seconds
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float):
+        while self._calls and now - self._calls[0] >= self.window_seconds:
+            self._calls.popleft()
+
+    def try_acquire(self) -> bool:
+        """예산이 남아 있으면 1회를 차감하고 True를 반환합니다."""
+        if self.max_calls < 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            if len(self._calls) >= self.max_calls:
+                return False
+            self._calls.append(now)
+            return True
+
+    def remaining(self) -> Optional[int]:
+        if self.max_calls < 0:
+            return None
+        with self._lock:
+            self._evict(time.monotonic())
+            return self.max_calls - len(self._calls)
+
+
+class TierStats:
+    """단계별 판정 횟수 카운터"""
+
+    def __init__(self, tiers: Iterable[str] = (TIER_RULE, TIER_LOCAL, TIER_LLM, TIER_BUDGET)):
+        self._counts: Dict[str, int] = {tier: 0 for tier in tiers}
+        self._lock = threading.Lock()
+
+    def record(self, tier: str):
+        with self._lock:
+            self._counts[tier] = self._counts.get(tier, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        ratios = {tier: round(count / total, 4) if total else 0.0 for tier, count in counts.items()}
+        return {"total": total, "counts": counts, "ratios": ratios}
+
+
+class TieredDecider:
+    """로컬 신뢰도와 LLM 예산으로 LLM 에스컬레이션 여부를 결정하고 결과를 기록합니다."""
+
+    def __init__(self, confidence_threshold: Optional[float] = None, budget: Optional[LLMBudget] = None):
+        self.confidence_threshold = confidence_threshold if confidence_threshold is not None else \
+            float(os.getenv("CLASSIFIER_CONFIDENCE_THRESHOLD", "0.75"))
+        self.budget = budget if budget is not None else classifier_llm_budget
+        self.stats = TierStats()
+
+    def should_escalate(self, confidence: float) -> bool:
+        """
+        LLM을 호출해야 하면 True를 반환합니다. (호출 시 예산 1회 차감)
+        False인 경우 판정 단계(로컬/예산 초과)는 여기서 기록되고,
+        True인 경우 호출자가 LLM 결과를 사용한 뒤 record(TIER_LLM)을 호출합니다.
+        """
+        if confidence >= self.confidence_threshold:
+            self.stats.record(TIER_LOCAL)
+            return False
+        if not self.budget.try_acquire():
+            self.stats.record(TIER_BUDGET)
+            return False
+        return True
+
+    def record(self, tier: str):
+        self.stats.record(tier)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.stats.snapshot()
+        stats["confidence_threshold"] = self.confidence_threshold
+        stats["llm_budget_per_minute"] = self.budget.max_calls
+        stats["llm_budget_remaining"] = self.budget.remaining()
+        return stats
+
+
+class LogisticScorer:
+    """특징 벡터(dict)에 대한 로지스틱 회귀 점수기"""
+
+    def __init__(self, weights: Dict[str, float], bias: float = 0.0):
+        self.weights = dict(weights)
+        self.bias = bias
+
+    def predict_proba(self, features: Dict[str, float]) -> float:
+        logit = self.bias + sum(self.weights.get(name, 0.0) * value for name, value in features.items())
+        return sigmoid(logit)
+
+    @classmethod
+    def fit(cls, examples: Iterable[Tuple[Dict[str, float], int]], epochs: int = 400,
+            learning_rate: float = 0.5, l2: float = 0.01) -> "LogisticScorer":
+        """
+        라벨 예시로 가중치를 학습합니다. (배치 경사 하강 + L2, 외부 의존성 없음, 결과는 결정적)
+
+        Args:
+            examples: (특징 dict, 라벨 0/1) 목록
+        """
+        examples = list(examples)
+        if not examples:
+            raise ValueError("학습 예시가 없습니다")
+        names = sorted({name for features, _ in examples for name in features})
+        weights = dict.fromkeys(names, 0.0)
+        bias = 0.0
+        for _ in range(epochs):
+            gradient = dict.fromkeys(names, 0.0)
+            bias_gradient = 0.0
+            for features, label in examples:
+                error = sigmoid(bias + sum(weights[name] * value for name, value in features.items())) - label
+                bias_gradient += error
+                for name, value in features.items():
+                    gradient[name] += error * value
+            bias -= learning_rate * bias_gradient / len(examples)
+            for name in names:
+                weights[name] -= learning_rate * (gradient[name] / len(examples) + l2 * weights[name])
+        return cls(weights, bias)
+
+
+class KeywordIntentModel:
+    """
+    키워드 가중치 기반 로컬 의도 분류기
+    의도별 키워드 점수의 1위와 2위 차이(margin)를 로지스틱으로 신뢰도로 변환합니다.
+    매칭된 키워드가 없으면 신뢰도는 0입니다.
+    """
+
+    def __init__(self, intent_keywords: Dict[str, Dict[str, float]],
+                 intent_patterns: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+                 default_intent: str = "chat", slope: float = 1.5):
+        self.intents = list(intent_keywords)
+        self.default_intent = default_intent
+        self.slope = slope
+        self._automaton = KeywordAutomaton(
+            [(keyword, (intent, keyword)) for intent, keywords in intent_keywords.items() for keyword in keywords],
+            case_sensitive=False
+        )
+        self._weights: Dict[Hashable, float] = {
+            (intent, keyword.lower()): weight
+            for intent, keywords in intent_keywords.items() for keyword, weight in keywords.items()
+        }
+        self._patterns = [
+            (intent, re.compile(pattern), weight)
+            for intent, patterns in (intent_patterns or {}).items() for pattern, weight in patterns
+        ]
+
+    def scores(self, text: str) -> Dict[str, float]:
+        scores = {intent: 0.0 for intent in self.intents}
+        for intent, keyword in self._automaton.matched_tags(text):
+            scores[intent] = scores.get(intent, 0.0) + self._weights[(intent, keyword.lower())]
+        for intent, pattern, weight in self._patterns:
+            if pattern.search(text):
+                scores[intent] = scores.get(intent, 0.0) + weight
+        return scores
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """(의도, 신뢰도 0~1)"""
+        ranked = sorted(self.scores(text).items(), key=lambda item: item[1], reverse=True)
+        if not ranked or ranked[0][1] <= 0:
+            return self.default_intent, 0.0
+        top_intent, top_score = ranked[0]
+        second_score = ranked[1][1] if len(ranked) > 1 else 0.0
+        return top_intent, sigmoid(self.slope * (top_score - second_score))
+
+
+# 분류기들이 함께 쓰는 분당 LLM 예산 (CLASSIFIER_LLM_BUDGET_PER_MINUTE, 음수면 무제한)
+classifier_llm_budget = LLMBudget(int(os.getenv("CLASSIFIER_LLM_BUDGET_PER_MINUTE", "30")))
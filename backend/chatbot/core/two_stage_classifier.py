@@ -1,7 +1,8 @@
 """
 2단계 분류 시스템
 1차: 점수 기반 필터링 (빠름, 비용 낮음)
-2차: 의미 기반 재판단 (정확함, 비용 높음)
+1.5차: 라벨 예시로 학습한 로지스틱 모델 (애매한 점수 구간, 비용 없음)
+2차: 의미 기반 재판단 (정확함, 비용 높음, 분당 예산 내에서만)
 """
 
 import re
@@ -11,6 +12,9 @@ import google.generativeai as genai
 import os
 from dotenv import load_dotenv
 from .suggestion_generator import suggestion_generator
+from .keyword_automaton import KeywordAutomaton, PatternSet
+from .tiered_classifier import TieredDecider, LogisticScorer, TIER_RULE, TIER_LLM
+from instrumentation import span
 
 load_dotenv()
 
@@ -18,6 +22,42 @@ load_dotenv()
 genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 model = genai.GenerativeModel('gemini-1.5-pro')
 
+# 애매한 점수 구간(3~4점)의 라벨 예시: (텍스트, 채용공고 여부)
+# 1차 점수가 같아도 문장 형태(질문/본인 이야기/공고 문구)로 갈리는 경우를 모았습니다.
+AMBIGUOUS_BAND_EXAMPLES = [
+    ("채용 예정", True),
+    ("디자이너 구함, 연봉 협의", True),
+    ("기획자 급구, 재택 가능", True),
+    ("신입 개발자 구해요, 경험 무관", True),
+    ("마케팅 매니저 구함. 근무지 서울", True),
+    ("서류 접수 마감 10월 31일, 관련 경험 우대", True),
+    ("포트폴리오 제출 필수, 연봉 협의", True),
+    ("분석가 2명 충원, 재택 가능", True),
+    ("데이터 분석가 이력서 받습니다", True),
+    ("컨설턴트 포트폴리오 접수 중", True),
+    ("경력 3년 이상 엔지니어, 협업 우대", True),
+    ("모십니다", True),
+    ("QA 엔지니어 급구, 관련 경험 무관", True),
+    ("영상 디자이너 1명, 출근 가능하신 분", True),
+    ("1차 면접 11월 2일, 연봉 협의", True),
+    ("채용 시장 요즘 어때?", False),
+    ("개발자 연봉 평균이 얼마야?", False),
+    ("공고 보고 지원했는데 연락이 없어요", False),
+    ("면접 준비 어떻게 하나요? 경험이 없어서요", False),
+    ("저는 디자이너인데 포트폴리오 피드백 해주세요", False),
+    ("개발자 이력서 쓰는 법 알려줘", False),
+    ("제가 기획자 경험으로 이직하려고 하는데 괜찮을까요", False),
+    ("엔지니어 연봉 협상 팁 있어", False),
+    ("자기소개서에 협업 경험 넣어야 하나요?", False),
+    ("나는 재택 근무하는 매니저야", False),
+    ("모집 기간이 언제까지야?", False),
+    ("분석가가 되려면 무슨 능력이 필요해?", False),
+    ("포트폴리오 제출했는데 연봉 얘기는 언제 하나요", False),
+    ("내가 컨설턴트로 일할 능력이 될까?", False),
+    ("면접에서 떨어졌는데 경험이 부족해서일까", False),
+]
+
+
 class TwoStageClassifier:
     def __init__(self):
         # 1차 점수 기반 키워드 그룹
@@ -67,7 +107,69 @@ class TwoStageClassifier:
             'sentences': 3,     # 3문장 이상
             'detail_indicators': ['경험', '능력', '우대', '환영', '찾고', '바랍니다']
         }
+        
+        # 1차에서 추출하는 직무명 패턴과 기술스택 키워드
+        self.job_patterns = [
+            r'([가-힣]+)\s*개발자',
+            r'([가-힣]+)\s*엔지니어',
+            r'([가-힣]+)\s*디자이너',
+            r'([가-힣]+)\s*매니저',
+            r'([가-힣]+)\s*기획자',
+            r'([가-힣]+)\s*분석가'
+        ]
+        self.tech_keywords = ['React', 'Python', 'Java', 'JavaScript', 'Node.js', 'Django', 'Spring', 'AWS', 'Docker']
+        
+        # 1차 점수에는 없는 문장 형태 단서 (애매한 구간의 로컬 모델 특징)
+        self.local_cues = {
+            'question': r'\?|나요|까요|어때|뭐야|얼마|알려|있어\s*$',
+            'first_person': r'저는|제가|나는|내가|했는데|하려고|싶어',
+            'posting_phrase': r'구함|구해요|급구|합니다|마감|협의|우대|무관|가능',
+            'has_number': r'\d'
+        }
+        
+        self._compile_matchers()
+        
+        # 애매한 구간의 로컬 모델: 라벨 예시로 학습한 로지스틱 회귀
+        self.local_model = self._build_local_model(AMBIGUOUS_BAND_EXAMPLES)
+        self.tiers = TieredDecider()
+
+    def _build_local_model(self, examples) -> LogisticScorer:
+        """(텍스트, 채용공고 여부) 예시로 로컬 모델 가중치를 학습합니다."""
+        return LogisticScorer.fit(
+            (self._local_features(text, self._first_stage_features(text)), int(label))
+            for text, label in examples
+        )
+
+    def _local_features(self, text: str, first_stage_result: Dict[str, Any]) -> Dict[str, float]:
+        group_counts = first_stage_result['group_counts']
+        features = {f'group:{name}': count for name, count in group_counts.items()}
+        for groups, _ in self.combination_bonuses:
+            features['combo:' + '+'.join(groups)] = 1 if all(group_counts.get(g, 0) > 0 for g in groups) else 0
+        features['complexity'] = first_stage_result['complexity_bonus']
+        for name, pattern in self._local_cue_patterns.items():
+            features[f'cue:{name}'] = 1 if pattern.search(text) else 0
+        return features
+
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """단계별 판정 횟수 (rule / local_model / llm / budget_fallback)"""
+        return self.tiers.get_stats()
 
+    def _compile_matchers(self):
+        """모든 키워드 사전을 하나의 오토마톤(대소문자 무시)으로, 정규식은 미리 컴파일합니다."""
+        entries = []
+        for group_name, group_config in self.keyword_groups.items():
+            for keyword in group_config['keywords']:
+                entries.append((keyword, ('group', group_name, keyword)))
+        for indicator in self.complexity_thresholds['detail_indicators']:
+            entries.append((indicator, ('detail', indicator)))
+        for tech in self.tech_keywords:
+            entries.append((tech, ('tech', tech)))
+        self._keyword_automaton = KeywordAutomaton(entries, case_sensitive=False)
+        self._job_patterns = PatternSet(self.job_patterns)
+        self._sentence_splitter = re.compile(r'[.!?]')
+        self._local_cue_patterns = {name: re.compile(pattern) for name, pattern in self.local_cues.items()}
+
+    @span("classifier", name="two_stage")
     def classify_text(self, text: str) -> Dict[str, Any]:
         """2단계 분류 시스템"""
         print(f"\n🔍 [2단계 분류 시작] 텍스트: {text[:100]}...")
@@ -76,21 +178,37 @@ class TwoStageClassifier:
         first_stage_result = self._first_stage_scoring(text)
         print(f"🔍 [1차] 점수: {first_stage_result['score']}, 판정: {first_stage_result['decision']}")
         
-        # 2차: 필요시 의미 기반 재판단
+        # 2차: 필요시 로컬 모델 → 의미 기반 재판단
         if first_stage_result['decision'] == 'ambiguous':
-            print(f"🔍 [2차] 애매한 케이스 → 의미 기반 재분석")
-            second_stage_result = self._second_stage_semantic_analysis(text)
+            probability = self.local_model.predict_proba(self._local_features(text, first_stage_result))
+            local_confidence = max(probability, 1 - probability)
             
-            # 2차 결과로 최종 판정
-            final_result = {
-                'is_recruitment': second_stage_result['is_recruitment'],
-                'confidence': second_stage_result['confidence'],
-                'fields': second_stage_result['fields'],
-                'stage': 'two_stage',
-                'first_stage_score': first_stage_result['score']
-            }
+            if self.tiers.should_escalate(local_confidence):
+                print(f"🔍 [2차] 애매한 케이스 (로컬 신뢰도 {local_confidence:.2f}) → 의미 기반 재분석")
+                second_stage_result = self._second_stage_semantic_analysis(text)
+                self.tiers.record(TIER_LLM)
+                
+                # 2차 결과로 최종 판정
+                final_result = {
+                    'is_recruitment': second_stage_result['is_recruitment'],
+                    'confidence': second_stage_result['confidence'],
+                    'fields': second_stage_result['fields'],
+                    'stage': 'two_stage',
+                    'first_stage_score': first_stage_result['score']
+                }
+            else:
+                # 로컬 모델 확정 또는 LLM 예산 초과
+                print(f"🔍 [2차] 로컬 모델 판정 (확률 {probability:.2f}, 신뢰도 {local_confidence:.2f})")
+                final_result = {
+                    'is_recruitment': probability >= 0.5,
+                    'confidence': round(local_confidence, 4),
+                    'fields': first_stage_result['fields'],
+                    'stage': 'local_model',
+                    'first_stage_score': first_stage_result['score']
+                }
         else:
             # 1차에서 확정된 경우
+            self.tiers.record(TIER_RULE)
             final_result = {
                 'is_recruitment': first_stage_result['decision'] == 'recruitment',
                 'confidence': first_stage_result['confidence'],
@@ -102,24 +220,29 @@ class TwoStageClassifier:
         print(f"🔍 [최종] 채용공고: {final_result['is_recruitment']}, 신뢰도: {final_result['confidence']}")
         return final_result
 
+    def _first_stage_features(self, text: str, matches: Optional[set] = None) -> Dict[str, Any]:
+        """키워드 그룹별 개수와 복잡성 보너스 (점수 계산과 로컬 모델 학습에 공통으로 사용)"""
+        if matches is None:
+            matches = self._keyword_automaton.matched_tags(text)
+        group_counts = {}
+        for group_name, group_config in self.keyword_groups.items():
+            count = sum(1 for keyword in group_config['keywords'] if ('group', group_name, keyword) in matches)
+            # 최대 카운트 제한
+            group_counts[group_name] = min(count, group_config['max_count'])
+        return {
+            'group_counts': group_counts,
+            'complexity_bonus': self._calculate_complexity_bonus(text, matches)
+        }
+
     def _first_stage_scoring(self, text: str) -> Dict[str, Any]:
         """1차 점수 기반 필터링"""
-        score = 0
-        group_counts = {}
+        # 모든 사전 키워드를 한 번의 스캔으로 찾음
+        matches = self._keyword_automaton.matched_tags(text)
+        features = self._first_stage_features(text, matches)
+        group_counts = features['group_counts']
         
         # 각 키워드 그룹별 점수 계산
-        for group_name, group_config in self.keyword_groups.items():
-            count = 0
-            for keyword in group_config['keywords']:
-                if keyword.lower() in text.lower():
-                    count += 1
-            
-            # 최대 카운트 제한
-            count = min(count, group_config['max_count'])
-            group_counts[group_name] = count
-            
-            # 점수 계산
-            score += count * group_config['weight']
+        score = sum(count * self.keyword_groups[group_name]['weight'] for group_name, count in group_counts.items())
         
         # 조합 보너스 적용
         for groups, bonus in self.combination_bonuses:
@@ -128,7 +251,7 @@ class TwoStageClassifier:
                 print(f"🔍 [1차] 조합 보너스 +{bonus}: {groups}")
         
         # 복잡성 보너스
-        complexity_bonus = self._calculate_complexity_bonus(text)
+        complexity_bonus = features['complexity_bonus']
         score += complexity_bonus
         if complexity_bonus > 0:
             print(f"🔍 [1차] 복잡성 보너스 +{complexity_bonus}")
@@ -145,18 +268,21 @@ class TwoStageClassifier:
             decision = 'general'
         
         # 기본 필드 추출 (1차에서 가능한 것만)
-        basic_fields = self._extract_basic_fields(text)
+        basic_fields = self._extract_basic_fields(text, matches)
         
         return {
             'score': score,
             'decision': decision,
             'confidence': confidence,
             'fields': basic_fields,
-            'group_counts': group_counts
+            'group_counts': group_counts,
+            'complexity_bonus': complexity_bonus
         }
 
-    def _calculate_complexity_bonus(self, text: str) -> int:
+    def _calculate_complexity_bonus(self, text: str, matches: Optional[set] = None) -> int:
         """복잡성 보너스 계산"""
+        if matches is None:
+            matches = self._keyword_automaton.matched_tags(text)
         bonus = 0
         
         # 길이 보너스
@@ -164,44 +290,31 @@ class TwoStageClassifier:
             bonus += 1
         
         # 문장 수 보너스
-        sentence_count = len(re.split(r'[.!?]', text))
+        sentence_count = len(self._sentence_splitter.split(text))
         if sentence_count >= self.complexity_thresholds['sentences']:
             bonus += 1
         
         # 상세 지표 보너스
-        detail_count = sum(1 for indicator in self.complexity_thresholds['detail_indicators'] 
-                          if indicator in text)
+        detail_count = sum(1 for indicator in self.complexity_thresholds['detail_indicators']
+                          if ('detail', indicator) in matches)
         if detail_count >= 2:
             bonus += 1
         
         return bonus
 
-    def _extract_basic_fields(self, text: str) -> Dict[str, Any]:
+    def _extract_basic_fields(self, text: str, matches: Optional[set] = None) -> Dict[str, Any]:
         """1차에서 추출 가능한 기본 필드"""
         fields = {}
+        if matches is None:
+            matches = self._keyword_automaton.matched_tags(text)
         
-        # 직무명 추출
-        job_patterns = [
-            r'([가-힣]+)\s*개발자',
-            r'([가-힣]+)\s*엔지니어',
-            r'([가-힣]+)\s*디자이너',
-            r'([가-힣]+)\s*매니저',
-            r'([가-힣]+)\s*기획자',
-            r'([가-힣]+)\s*분석가'
-        ]
-        
-        for pattern in job_patterns:
-            match = re.search(pattern, text)
-            if match:
-                fields['position'] = match.group(0)
-                break
+        # 직무명 추출 (패턴 순서상 첫 매칭)
+        match = self._job_patterns.first_match(text)
+        if match:
+            fields['position'] = match.group(0)
         
         # 기술스택 추출
-        tech_keywords = ['React', 'Python', 'Java', 'JavaScript', 'Node.js', 'Django', 'Spring', 'AWS', 'Docker']
-        tech_stack = []
-        for tech in tech_keywords:
-            if tech.lower() in text.lower():
-                tech_stack.append(tech)
+        tech_stack = [tech for tech in self.tech_keywords if ('tech', tech) in matches]
         
         if tech_stack:
             fields['tech_stack'] = tech_stack
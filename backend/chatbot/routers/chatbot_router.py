@@ -25,6 +25,7 @@ from ..models.response_models import (
 )
 from ..services.ai_service import AIService
 from ..services.session_service import SessionService
+from ..services.session_store import get_all_session_stats
 from ..services.field_service import FieldService
 from ..utils.text_processor import TextProcessor
 from ..utils.field_mapper import FieldMapper
@@ -55,7 +56,7 @@ async def start_session(request: SessionStartRequest):
     """세션 시작"""
     try:
         session_id = str(uuid.uuid4())
-        session_service.create_session(session_id, request.page, request.mode)
+        await session_service.create_session(session_id, request.page, request.mode)
         
         # 첫 번째 질문 생성
         first_question = field_service.get_first_question(request.page)
@@ -73,7 +74,7 @@ async def start_ai_assistant(request: SessionStartRequest):
     """AI 어시스턴트 세션 시작"""
     try:
         session_id = str(uuid.uuid4())
-        session_service.create_session(session_id, request.page, "ai_assistant")
+        await session_service.create_session(session_id, request.page, "ai_assistant")
         
         return SessionStartResponse(
             session_id=session_id,
@@ -181,7 +182,7 @@ async def get_recommendations(request: RecommendationsRequest):
 async def update_field_in_realtime(request: FieldUpdateRequest):
     """실시간 필드 업데이트"""
     try:
-        session_service.update_field(
+        await session_service.update_field(
             request.session_id, 
             request.field, 
             request.value
@@ -196,11 +197,16 @@ async def end_session(request: dict):
     try:
         session_id = request.get("session_id")
         if session_id:
-            session_service.end_session(session_id)
+            await session_service.end_session(session_id)
         return {"success": True, "message": "세션이 종료되었습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/session-stats")
+async def session_stats():
+    """세션 저장소별 크기/적중/만료 통계"""
+    return get_all_session_stats()
+
 @router.post("/chat")
 async def chat_endpoint(request: ChatbotRequest):
     """통합 채팅 엔드포인트"""
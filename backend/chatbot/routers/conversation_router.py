@@ -22,7 +22,7 @@ async def start_conversation(request: dict):
     """대화 세션 시작"""
     try:
         session_id = str(uuid.uuid4())
-        session_service.create_session(session_id, "conversation", "conversational")
+        await session_service.create_session(session_id, "conversation", "conversational")
         
         return {
             "session_id": session_id,
@@ -37,7 +37,7 @@ async def conversation_chat(request: ConversationRequest):
     """대화형 채팅"""
     try:
         # 세션 확인
-        session = session_service.get_session(request.session_id)
+        session = await session_service.get_session(request.session_id)
         if not session:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
         
@@ -45,7 +45,7 @@ async def conversation_chat(request: ConversationRequest):
         response = await ai_service.handle_conversation_request(request)
         
         # 세션에 메시지 추가
-        session_service.add_message(request.session_id, {
+        await session_service.add_message(request.session_id, {
             "user_input": request.user_input,
             "response": response.message,
             "timestamp": "now"
@@ -59,7 +59,7 @@ async def conversation_chat(request: ConversationRequest):
 async def get_conversation_history(session_id: str):
     """대화 기록 조회"""
     try:
-        history = session_service.get_conversation_history(session_id)
+        history = await session_service.get_conversation_history(session_id)
         return {
             "session_id": session_id,
             "history": history,
@@ -72,7 +72,7 @@ async def get_conversation_history(session_id: str):
 async def end_conversation(session_id: str):
     """대화 세션 종료"""
     try:
-        success = session_service.end_session(session_id)
+        success = await session_service.end_session(session_id)
         if success:
             return {
                 "session_id": session_id,
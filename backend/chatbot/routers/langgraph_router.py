@@ -7,6 +7,7 @@ from typing import Dict, Any
 import uuid
 
 from ..core.agent_system import AgentSystem
+from ..core.two_stage_classifier import two_stage_classifier
 from ..models.agent_models import AgentOutput
 
 router = APIRouter(tags=["langgraph"])
@@ -41,3 +42,17 @@ async def langgraph_agent_endpoint(request: dict):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/classifier-stats")
+async def classifier_stats():
+    """
+    분류기별 단계별 판정 횟수
+    - two_stage: 채용공고 2단계 분류기 (rule / local_model / llm / budget_fallback)
+    - intent_detection: 도구 선택 Agent의 의도 분류 (local_model / llm / budget_fallback)
+    """
+    # 루트 agent_system이 chatbot 패키지를 임포트하므로 순환 임포트를 피하려고 여기서 가져옵니다.
+    from agent_system import agent_system as tool_agent_system
+    return {
+        "two_stage": two_stage_classifier.get_tier_stats(),
+        "intent_detection": tool_agent_system.intent_detector.get_tier_stats()
+    }
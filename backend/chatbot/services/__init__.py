@@ -4,11 +4,18 @@
 
 from .ai_service import AIService
 from .session_service import SessionService
+from .session_store import SessionStore, get_session_store
 from .field_service import FieldService
+from .stream_service import sse_response, relay_stream, is_streaming
 
 __all__ = [
     'AIService',
     'SessionService',
-    'FieldService'
+    'SessionStore',
+    'get_session_store',
+    'FieldService',
+    'sse_response',
+    'relay_stream',
+    'is_streaming'
 ]
 
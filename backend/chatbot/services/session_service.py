@@ -5,88 +5,89 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .session_store import SessionStore, MemorySessionStore, get_session_store
+
 class SessionService:
-    """세션 관리 서비스"""
-    
-    def __init__(self):
-        self.sessions: Dict[str, Dict[str, Any]] = {}
-    
-    def create_session(self, session_id: str, page: str, mode: str = "normal") -> None:
+    """세션 관리 서비스 (세션 저장소 위의 얇은 래퍼, 만료는 저장소 TTL이 처리)"""
+
+    def __init__(self, store: Optional[SessionStore] = None):
+        self.store = store or get_session_store("chatbot")
+
+    async def create_session(self, session_id: str, page: str, mode: str = "normal") -> None:
         """새 세션 생성"""
-        self.sessions[session_id] = {
+        await self.store.save(session_id, {
             "page": page,
             "mode": mode,
             "created_at": datetime.now(),
             "last_activity": datetime.now(),
             "fields": {},
             "conversation_history": []
-        }
+        })
         print(f"✅ 세션 생성: {session_id} (페이지: {page}, 모드: {mode})")
-    
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """세션 정보 조회"""
-        return self.sessions.get(session_id)
-    
-    def update_session(self, session_id: str, **kwargs) -> bool:
+        return await self.store.get(session_id)
+
+    async def update_session(self, session_id: str, **kwargs) -> bool:
         """세션 정보 업데이트"""
-        if session_id in self.sessions:
-            self.sessions[session_id].update(kwargs)
-            self.sessions[session_id]["last_activity"] = datetime.now()
-            return True
-        return False
-    
-    def update_field(self, session_id: str, field: str, value: str) -> bool:
+        async with self.store.lock(session_id):
+            session = await self.store.get(session_id)
+            if session is None:
+                return False
+            session.update(kwargs)
+            session["last_activity"] = datetime.now()
+            await self.store.save(session_id, session)
+        return True
+
+    async def update_field(self, session_id: str, field: str, value: str) -> bool:
         """세션의 필드 값 업데이트"""
-        if session_id in self.sessions:
-            self.sessions[session_id]["fields"][field] = value
-            self.sessions[session_id]["last_activity"] = datetime.now()
-            return True
-        return False
-    
-    def get_field(self, session_id: str, field: str) -> Optional[str]:
+        async with self.store.lock(session_id):
+            session = await self.store.get(session_id)
+            if session is None:
+                return False
+            session["fields"][field] = value
+            session["last_activity"] = datetime.now()
+            await self.store.save(session_id, session)
+        return True
+
+    async def get_field(self, session_id: str, field: str) -> Optional[str]:
         """세션의 필드 값 조회"""
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if session:
             return session.get("fields", {}).get(field)
         return None
-    
-    def add_message(self, session_id: str, message: Dict[str, Any]) -> bool:
+
+    async def add_message(self, session_id: str, message: Dict[str, Any]) -> bool:
         """세션에 메시지 추가"""
-        if session_id in self.sessions:
-            self.sessions[session_id]["conversation_history"].append(message)
-            self.sessions[session_id]["last_activity"] = datetime.now()
-            return True
-        return False
-    
-    def get_conversation_history(self, session_id: str) -> list:
+        async with self.store.lock(session_id):
+            session = await self.store.get(session_id)
+            if session is None:
+                return False
+            session["conversation_history"].append(message)
+            session["last_activity"] = datetime.now()
+            await self.store.save(session_id, session)
+        return True
+
+    async def get_conversation_history(self, session_id: str) -> list:
         """세션의 대화 기록 조회"""
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if session:
             return session.get("conversation_history", [])
         return []
-    
-    def end_session(self, session_id: str) -> bool:
+
+    async def end_session(self, session_id: str) -> bool:
         """세션 종료"""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        if await self.store.delete(session_id):
             print(f"✅ 세션 종료: {session_id}")
             return True
         return False
-    
-    def cleanup_inactive_sessions(self, max_age_hours: int = 24) -> int:
-        """비활성 세션 정리"""
-        now = datetime.now()
-        expired_sessions = []
-        
-        for session_id, session_data in self.sessions.items():
-            last_activity = session_data.get("last_activity")
-            if last_activity:
-                age = (now - last_activity).total_seconds() / 3600
-                if age > max_age_hours:
-                    expired_sessions.append(session_id)
-        
-        for session_id in expired_sessions:
-            self.end_session(session_id)
-        
-        return len(expired_sessions)
 
+    def cleanup_inactive_sessions(self) -> int:
+        """
+        만료 세션 즉시 정리 (메모리 저장소만 해당)
+        메모리 저장소는 백그라운드 작업이, Mongo/Redis는 TTL이 자동으로 정리하므로 보통 호출할 필요가 없습니다.
+        """
+        if isinstance(self.store, MemorySessionStore):
+            return self.store.sweep()
+        return 0
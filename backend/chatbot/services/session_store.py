@@ -0,0 +1,418 @@
+"""
+세션 저장소
+
+요청 사이에 유지해야 하는 세션/대화 상태를 보관합니다.
+- MemorySessionStore: 프로세스 내 LRU + 항목별 TTL + 백그라운드 정리 작업 (단일 워커용)
+- MongoSessionStore: TTL 인덱스로 만료되는 MongoDB 컬렉션 (uvicorn 워커 간 공유)
+- RedisSessionStore: redis.asyncio 호환 클라이언트 (워커 간 공유, EX 만료)
+
+모든 저장소는 세션을 직렬화해서 보관하므로, 조회한 세션을 수정한 뒤에는 save()로 다시 저장해야 합니다.
+save()는 마지막에 저장한 쪽이 이기므로, 같은 세션에 동시에 get → 수정 → save가 일어나면 앞선 변경이 사라집니다.
+수정 후 저장하는 코드는 `async with store.lock(session_id):` 안에서 실행하세요.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", str(24 * 3600)))
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "10000"))
+SESSION_MAX_HISTORY = int(os.getenv("SESSION_MAX_HISTORY", "50"))
+# 워커 간 세션 잠금의 임대 시간 (잠금을 쥔 워커가 죽어도 이 시간 뒤에는 풀림)
+SESSION_LOCK_TTL_SECONDS = float(os.getenv("SESSION_LOCK_TTL_SECONDS", "60"))
+SESSION_LOCK_TIMEOUT_SECONDS = float(os.getenv("SESSION_LOCK_TIMEOUT_SECONDS", "30"))
+
+# 직렬화 형식 표시 (1바이트) - 작은 세션은 그대로, 큰 세션은 zlib 압축
+_RAW_JSON = b"j"
+_ZLIB_JSON = b"z"
+COMPRESS_THRESHOLD = 1024
+
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"세션에 저장할 수 없는 값입니다: {type(value).__name__}")
+
+
+def _json_object_hook(obj: Dict[str, Any]):
+    if len(obj) == 1 and "$dt" in obj:
+        return datetime.fromisoformat(obj["$dt"])
+    return obj
+
+
+def pack_session(data: Dict[str, Any], max_history: int = SESSION_MAX_HISTORY) -> bytes:
+    """
+    세션을 압축 직렬화합니다.
+    대화 기록(conversation_history)은 최근 max_history개만 남기고, 공백 없는 JSON을 크기에 따라 zlib으로 압축합니다.
+    """
+    history = data.get("conversation_history")
+    if isinstance(history, list) and len(history) > max_history:
+        data = {**data, "conversation_history": history[-max_history:]}
+
+    raw = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+    if len(raw) >= COMPRESS_THRESHOLD:
+        return _ZLIB_JSON + zlib.compress(raw, 6)
+    return _RAW_JSON + raw
+
+
+def unpack_session(payload: bytes) -> Dict[str, Any]:
+    """pack_session의 역변환"""
+    payload = bytes(payload)
+    marker, body = payload[:1], payload[1:]
+    if marker == _ZLIB_JSON:
+        body = zlib.decompress(body)
+    elif marker != _RAW_JSON:
+        raise ValueError("알 수 없는 세션 직렬화 형식입니다.")
+    return json.loads(body.decode("utf-8"), object_hook=_json_object_hook)
+
+
+class SessionStore(ABC):
+    """세션 저장소 공통 인터페이스 (TTL은 마지막 저장 시점부터 계산)"""
+
+    backend = "base"
+
+    def __init__(self, namespace: str, ttl_seconds: int = SESSION_TTL_SECONDS, max_history: int = SESSION_MAX_HISTORY):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_history = max_history
+        self.lock_ttl_seconds = SESSION_LOCK_TTL_SECONDS
+        self.lock_timeout_seconds = SESSION_LOCK_TIMEOUT_SECONDS
+        self.stats = {"hits": 0, "misses": 0, "saves": 0, "deletes": 0, "evictions": 0, "expirations": 0,
+                      "lock_waits": 0}
+        self._local_locks: Dict[str, List] = {}  # key -> [asyncio.Lock, 사용 중인 코루틴 수]
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.namespace}:{session_id}"
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 조회 (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    async def save(self, session_id: str, data: Dict[str, Any]):
+        """세션 저장 (마지막에 저장한 쪽이 이김, TTL 갱신)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """세션 삭제 (삭제했으면 True)"""
+        pass
+
+    @asynccontextmanager
+    async def lock(self, session_id: str) -> AsyncIterator[None]:
+        """
+        세션 단위 배타 구간 (get → 수정 → save를 이 안에서 실행)
+        같은 워커 안에서는 asyncio.Lock으로, 워커 간에는 저장소의 임대 잠금(_acquire_lease)으로 직렬화합니다.
+
+        Raises:
+            asyncio.TimeoutError: lock_timeout_seconds 안에 다른 워커의 잠금이 풀리지 않은 경우
+        """
+        key = self._key(session_id)
+        entry = self._local_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                token = uuid.uuid4().hex
+                deadline = time.monotonic() + self.lock_timeout_seconds
+                delay = 0.01
+                while not await self._acquire_lease(key, token):
+                    if time.monotonic() >= deadline:
+                        raise asyncio.TimeoutError(f"세션 잠금 대기 시간 초과: {key}")
+                    self.stats["lock_waits"] += 1
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 0.2)
+                try:
+                    yield
+                finally:
+                    await self._release_lease(key, token)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._local_locks[key]
+
+    async def _acquire_lease(self, key: str, token: str) -> bool:
+        """워커 간 잠금 획득 (워커 간에 공유되는 저장소가 재정의, 프로세스 내 저장소는 asyncio.Lock으로 충분)"""
+        return True
+
+    async def _release_lease(self, key: str, token: str):
+        pass
+
+    async def exists(self, session_id: Optional[str]) -> bool:
+        return bool(session_id) and await self.get(session_id) is not None
+
+    async def close(self):
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend, "namespace": self.namespace, "ttl_seconds": self.ttl_seconds, **self.stats}
+
+
+class MemorySessionStore(SessionStore):
+    backend = "memory"
+
+    def __init__(self, namespace: str, ttl_seconds: int = SESSION_TTL_SECONDS, max_history: int = SESSION_MAX_HISTORY,
+                 max_entries: int = SESSION_MAX_ENTRIES, sweep_interval: float = 60.0):
+        """
+        Args:
+            max_entries (int): 보관할 최대 세션 수 (넘으면 가장 오래 쓰지 않은 세션부터 제거)
+            sweep_interval (float): 만료 세션 정리 주기 (초)
+        """
+        super().__init__(namespace, ttl_seconds, max_history)
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()  # key -> (만료 시각, 직렬화 세션)
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def _ensure_sweeper(self):
+        # 이벤트 루프 안에서 처음 사용될 때 정리 작업 시작 (루프가 바뀌면 다시 시작)
+        loop = asyncio.get_running_loop()
+        if self._sweeper is None or self._sweeper.done() or self._sweeper.get_loop() is not loop:
+            self._sweeper = loop.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+
+    def sweep(self) -> int:
+        """만료된 세션 제거"""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self.stats["expirations"] += len(expired)
+        return len(expired)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        self._ensure_sweeper()
+        key = self._key(session_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return unpack_session(entry[1])
+
+    async def save(self, session_id: str, data: Dict[str, Any]):
+        self._ensure_sweeper()
+        key = self._key(session_id)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, pack_session(data, self.max_history))
+        self._entries.move_to_end(key)
+        self.stats["saves"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def delete(self, session_id: str) -> bool:
+        removed = self._entries.pop(self._key(session_id), None) is not None
+        if removed:
+            self.stats["deletes"] += 1
+        return removed
+
+    async def close(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**super().get_stats(), "entries": len(self._entries), "max_entries": self.max_entries,
+                "payload_bytes": sum(len(payload) for _, payload in self._entries.values())}
+
+
+# MongoDB 중복 키 오류 코드 (pymongo.errors.DuplicateKeyError.code)
+DUPLICATE_KEY_ERROR = 11000
+
+
+class MongoSessionStore(SessionStore):
+    backend = "mongo"
+
+    def __init__(self, collection, namespace: str, ttl_seconds: int = SESSION_TTL_SECONDS,
+                 max_history: int = SESSION_MAX_HISTORY):
+        """
+        Args:
+            collection: Motor 컬렉션 (expires_at TTL 인덱스로 MongoDB가 만료 세션을 삭제)
+        """
+        super().__init__(namespace, ttl_seconds, max_history)
+        self.collection = collection
+        self._indexes_ready = False
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready:
+            return
+        try:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            # 실패하면 다음 요청에서 다시 시도
+            logger.warning(f"세션 TTL 인덱스 생성 실패: {e}")
+            return
+        self._indexes_ready = True
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        await self._ensure_indexes()
+        # TTL 모니터는 주기적으로만 삭제하므로 만료 시각도 직접 확인
+        document = await self.collection.find_one(
+            {"_id": self._key(session_id), "expires_at": {"$gt": datetime.utcnow()}}
+        )
+        if document is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return unpack_session(document["payload"])
+
+    async def save(self, session_id: str, data: Dict[str, Any]):
+        await self._ensure_indexes()
+        await self.collection.update_one(
+            {"_id": self._key(session_id)},
+            {"$set": {
+                "namespace": self.namespace,
+                "payload": pack_session(data, self.max_history),
+                "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            }},
+            upsert=True
+        )
+        self.stats["saves"] += 1
+
+    async def delete(self, session_id: str) -> bool:
+        result = await self.collection.delete_one({"_id": self._key(session_id)})
+        removed = result.deleted_count > 0
+        if removed:
+            self.stats["deletes"] += 1
+        return removed
+
+    async def _acquire_lease(self, key: str, token: str) -> bool:
+        # 만료된 잠금 문서는 가져오고, 살아 있는 잠금이 있으면 upsert가 _id 중복으로 실패
+        await self._ensure_indexes()
+        now = datetime.utcnow()
+        try:
+            await self.collection.update_one(
+                {"_id": f"{key}:lock", "expires_at": {"$lte": now}},
+                {"$set": {"token": token, "expires_at": now + timedelta(seconds=self.lock_ttl_seconds)}},
+                upsert=True
+            )
+            return True
+        except Exception as e:
+            if getattr(e, "code", None) == DUPLICATE_KEY_ERROR:
+                return False
+            raise
+
+    async def _release_lease(self, key: str, token: str):
+        # 임대가 만료돼 다른 워커가 가져간 잠금은 지우지 않음
+        await self.collection.delete_one({"_id": f"{key}:lock", "token": token})
+
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSessionStore(SessionStore):
+    backend = "redis"
+
+    def __init__(self, client, namespace: str, ttl_seconds: int = SESSION_TTL_SECONDS,
+                 max_history: int = SESSION_MAX_HISTORY, prefix: str = "session"):
+        """
+        Args:
+            client: redis.asyncio.Redis 호환 클라이언트 (async get / set(ex=, nx=, px=) / delete / eval)
+        """
+        super().__init__(namespace, ttl_seconds, max_history)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}:{super()._key(session_id)}"
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        payload = await self.client.get(self._key(session_id))
+        if payload is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return unpack_session(payload)
+
+    async def save(self, session_id: str, data: Dict[str, Any]):
+        await self.client.set(self._key(session_id), pack_session(data, self.max_history), ex=self.ttl_seconds)
+        self.stats["saves"] += 1
+
+    async def delete(self, session_id: str) -> bool:
+        removed = await self.client.delete(self._key(session_id)) > 0
+        if removed:
+            self.stats["deletes"] += 1
+        return removed
+
+    async def _acquire_lease(self, key: str, token: str) -> bool:
+        return bool(await self.client.set(f"{key}:lock", token, nx=True, px=int(self.lock_ttl_seconds * 1000)))
+
+    async def _release_lease(self, key: str, token: str):
+        # 임대가 만료돼 다른 워커가 가져간 잠금은 지우지 않도록 값 비교와 삭제를 서버에서 한 번에 실행
+        await self.client.eval(RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
+
+
+_stores: Dict[str, SessionStore] = {}
+_shared_clients: Dict[str, Any] = {}
+
+
+def _create_store(namespace: str, backend: str) -> SessionStore:
+    if backend == "mongo":
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+        except ImportError:
+            logger.warning("motor가 설치되지 않아 메모리 세션 저장소를 사용합니다.")
+            return MemorySessionStore(namespace)
+        if "mongo" not in _shared_clients:
+            _shared_clients["mongo"] = AsyncIOMotorClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017/hireme"))
+        database = _shared_clients["mongo"].get_default_database("hireme")
+        return MongoSessionStore(database[os.getenv("SESSION_MONGO_COLLECTION", "chat_sessions")], namespace)
+
+    if backend == "redis":
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            logger.warning("redis 패키지가 설치되지 않아 메모리 세션 저장소를 사용합니다.")
+            return MemorySessionStore(namespace)
+        if "redis" not in _shared_clients:
+            _shared_clients["redis"] = redis_asyncio.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        return RedisSessionStore(_shared_clients["redis"], namespace)
+
+    return MemorySessionStore(namespace)
+
+
+def get_session_store(namespace: str) -> SessionStore:
+    """
+    이름공간별 공유 세션 저장소 (SESSION_STORE_BACKEND=memory|mongo|redis, 기본 memory)
+    같은 이름공간을 쓰는 라우터/서비스는 같은 저장소 인스턴스를 공유합니다.
+    """
+    if namespace not in _stores:
+        _stores[namespace] = _create_store(namespace, os.getenv("SESSION_STORE_BACKEND", "memory").lower())
+    return _stores[namespace]
+
+
+def get_all_session_stats() -> Dict[str, Dict[str, Any]]:
+    return {namespace: store.get_stats() for namespace, store in _stores.items()}
@@ -0,0 +1,133 @@
+"""
+채팅 응답 SSE 스트리밍 서비스
+
+기존 (비스트리밍) 핸들러를 그대로 실행하면서, 핸들러 안의 LLM 호출이 relay_stream()을 거치면
+생성되는 토큰을 바로 클라이언트로 보냅니다. 핸들러가 끝나면 최종 응답(필드 추출 결과 포함)을
+마지막 이벤트로 보냅니다.
+
+이벤트 형식 (text/event-stream):
+    event: token   data: {"text": "..."}        LLM 토큰 (여러 번)
+    event: result  data: {...}                  핸들러 최종 응답 (필드/값/선택 항목 등)
+    event: error   data: {"status", "detail"}   핸들러 예외
+    event: done    data: {}
+
+- 백프레셔: 토큰은 크기가 제한된 큐를 거치므로, 클라이언트가 느리면 LLM 스트림 소비도 멈춥니다.
+- 클라이언트 연결이 끊기면 핸들러 작업(및 진행 중인 LLM 스트림)을 취소합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+# 스트림당 버퍼링할 최대 토큰 청크 수
+STREAM_QUEUE_SIZE = int(os.getenv("CHAT_STREAM_QUEUE_SIZE", "32"))
+# 토큰이 없을 때 클라이언트 연결 상태를 확인하는 간격 (초)
+DISCONNECT_POLL_SECONDS = float(os.getenv("CHAT_STREAM_DISCONNECT_POLL", "1.0"))
+
+_token_sink: ContextVar[Optional[asyncio.Queue]] = ContextVar("chat_token_sink", default=None)
+
+stream_stats = {"started": 0, "completed": 0, "disconnected": 0, "errors": 0, "tokens": 0}
+
+
+def is_streaming() -> bool:
+    """현재 요청이 스트리밍 엔드포인트에서 실행 중인지 여부"""
+    return _token_sink.get() is not None
+
+
+async def relay_stream(chunks: AsyncIterator[str]) -> str:
+    """
+    LLM 스트림의 청크를 클라이언트로 전달하면서 전체 텍스트를 모아 반환합니다.
+    큐가 가득 차면(클라이언트가 느리면) 다음 청크를 읽지 않고 기다립니다.
+    """
+    sink = _token_sink.get()
+    parts = []
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            parts.append(chunk)
+            if sink is not None:
+                await sink.put(chunk)
+    finally:
+        # 취소(연결 끊김) 시 업스트림 스트림을 바로 닫음
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return "".join(parts)
+
+
+def format_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data), ensure_ascii=False)}\n\n"
+
+
+async def stream_handler_events(request: Request, handler: Callable[[], Awaitable[Any]],
+                                queue_size: int = STREAM_QUEUE_SIZE,
+                                poll_seconds: float = DISCONNECT_POLL_SECONDS) -> AsyncIterator[str]:
+    """handler()를 실행하면서 토큰/최종 응답 SSE 이벤트를 생성"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    # 핸들러 작업은 생성 시점의 컨텍스트를 복사하므로 토큰 큐는 이 작업에서만 보임
+    reset_token = _token_sink.set(queue)
+    try:
+        task = asyncio.ensure_future(handler())
+    finally:
+        _token_sink.reset(reset_token)
+
+    stream_stats["started"] += 1
+    getter: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, task}, timeout=poll_seconds,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if getter in done:
+                chunk = getter.result()
+                getter = None
+                stream_stats["tokens"] += 1
+                yield format_event("token", {"text": chunk})
+                continue
+            if task in done:
+                # getter가 대기 중이면 큐가 비어 있으므로 남은 토큰 없음
+                break
+            if await request.is_disconnected():
+                stream_stats["disconnected"] += 1
+                return
+
+        try:
+            result = task.result()
+        except HTTPException as e:
+            stream_stats["errors"] += 1
+            yield format_event("error", {"status": e.status_code, "detail": e.detail})
+        except Exception as e:
+            stream_stats["errors"] += 1
+            logger.error(f"스트리밍 핸들러 오류: {e}")
+            yield format_event("error", {"status": 500, "detail": str(e)})
+        else:
+            stream_stats["completed"] += 1
+            yield format_event("result", result)
+        yield format_event("done", {})
+    finally:
+        # 연결이 끊겨 제너레이터가 닫히거나 취소되면 LLM 호출도 함께 취소
+        if getter is not None:
+            getter.cancel()
+        if not task.done():
+            task.cancel()
+
+
+def sse_response(request: Request, handler: Callable[[], Awaitable[Any]]) -> StreamingResponse:
+    """handler()의 스트리밍 버전 응답 (Server-Sent Events)"""
+    return StreamingResponse(stream_handler_events(request, handler), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def get_stream_stats() -> Dict[str, Any]:
+    return dict(stream_stats)
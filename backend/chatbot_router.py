@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 import uuid
@@ -9,31 +9,43 @@ import os
 from dotenv import load_dotenv
 import traceback
 import re
+import importlib.util
+import logging
 import google.generativeai as genai
 import numpy as np # numpy 라이브러리 추가
 from gemini_service import GeminiService
 from resume_analyzer import extract_resume_info_from_text
 from agent_system import agent_system
+from lazy_resources import resource_registry
+from chatbot.services.session_store import SessionStore, get_session_store
+from chatbot.services.stream_service import sse_response, relay_stream, is_streaming, get_stream_stats
+from services.llm_providers.context_window import TokenEstimator, get_token_estimator
+from instrumentation import log_payload, span
 
-# 고급 NLP 라이브러리 추가
-try:
+logger = logging.getLogger(__name__)
+
+# 고급 NLP 라이브러리 추가 (설치 여부만 확인하고, JVM/모델 초기화는 첫 사용 시 지연 수행)
+KONLPY_AVAILABLE = importlib.util.find_spec("konlpy") is not None
+if not KONLPY_AVAILABLE:
+    logger.warning("KoNLPy not available. Using basic tokenization.")
+
+SENTENCE_TRANSFORMERS_AVAILABLE = (importlib.util.find_spec("sentence_transformers") is not None
+                                   and importlib.util.find_spec("sklearn") is not None)
+if not SENTENCE_TRANSFORMERS_AVAILABLE:
+    logger.warning("Sentence Transformers not available. Using keyword matching.")
+
+def _load_okt():
     from konlpy.tag import Okt
-    KONLPY_AVAILABLE = True
-    okt = Okt()
-    print("KoNLPy 초기화 성공")
-except (ImportError, Exception) as e:
-    KONLPY_AVAILABLE = False
-    print(f"[WARNING] KoNLPy not available: {e}. Using basic tokenization.")
+    return Okt()
 
-try:
+def _load_sentence_transformer():
     from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-    embedding_model_st = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
-    print("Sentence Transformers 초기화 성공")
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    print("[WARNING] Sentence Transformers not available. Using keyword matching.")
+    return SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+
+okt_resource = resource_registry.register("konlpy_okt", _load_okt, required=False)
+embedding_model_st_resource = resource_registry.register(
+    "sentence_transformer:all-MiniLM-L6-v2", _load_sentence_transformer, required=False
+)
 
 # 환경 변수 로드
 load_dotenv()
@@ -44,9 +56,9 @@ gemini_service = None
 # Gemini 서비스 초기화
 try:
     gemini_service = GeminiService("gemini-1.5-pro")
-    print("✅ Gemini 서비스 초기화 성공 (모델: gemini-1.5-pro)")
+    logger.info("✅ Gemini 서비스 초기화 성공 (모델: gemini-1.5-pro)")
 except Exception as e:
-    print(f"❌ Gemini 서비스 초기화 실패: {e}")
+    logger.error("❌ Gemini 서비스 초기화 실패: %s", e)
     gemini_service = None
 
 # 임베딩 모델 설정
@@ -64,35 +76,36 @@ temporary_docs = [
     "코사인 유사도(Cosine Similarity)는 두 벡터의 방향이 얼마나 일치하는지를 나타내는 지표로, 벡터 검색에서 문서 간의 유사성을 측정하는 데 널리 사용됩니다."
 ]
 
-# 문서 벡터화 (초기화 시 한 번만 실행)
-try:
-    if gemini_service and gemini_service.client:
-        temporary_embeddings = genai.embed_content(
-            model=embedding_model,
-            content=temporary_docs,
-            task_type="RETRIEVAL_DOCUMENT"
-        )['embedding']
-        temporary_embeddings_np = np.array(temporary_embeddings)
-        print("임시 문서 임베딩 생성 성공")
-    else:
-        print("Gemini 서비스가 없어 임베딩을 생성할 수 없습니다.")
-        temporary_embeddings_np = None
-except Exception as e:
-    print(f"임시 문서 임베딩 생성 실패: {e}")
-    temporary_embeddings_np = None
+# 문서 벡터화 (첫 RAG 검색 또는 백그라운드 워밍업 시 한 번만 실행)
+def _embed_temporary_docs():
+    if not gemini_service or not gemini_service.client:
+        raise RuntimeError("Gemini 서비스가 없어 임베딩을 생성할 수 없습니다.")
+    temporary_embeddings = genai.embed_content(
+        model=embedding_model,
+        content=temporary_docs,
+        task_type="RETRIEVAL_DOCUMENT"
+    )['embedding']
+    logger.debug("임시 문서 임베딩 생성 성공")
+    return np.array(temporary_embeddings)
+
+temporary_embeddings_resource = resource_registry.register(
+    "temporary_doc_embeddings", _embed_temporary_docs, required=False
+)
 
 async def find_relevant_document(user_query: str) -> str:
     """
     사용자 입력과 가장 유사한 임시 문서를 찾아 반환합니다.
     """
-    if temporary_embeddings_np is None or not temporary_docs:
-        print("[WARNING] 임시 문서 또는 임베딩이 없어 RAG를 사용할 수 없습니다.")
+    if not temporary_docs or not temporary_embeddings_resource.available:
+        logger.debug("임시 문서 또는 임베딩이 없어 RAG를 사용할 수 없습니다.")
         return ""
 
     try:
         if not gemini_service or not gemini_service.client:
-            print("[WARNING] Gemini 서비스가 없어 RAG를 사용할 수 없습니다.")
+            logger.warning("Gemini 서비스가 없어 RAG를 사용할 수 없습니다.")
             return ""
+        
+        temporary_embeddings_np = await temporary_embeddings_resource.get_async()
             
         # 사용자 질문 벡터화
         query_embedding = (await genai.embed_content_async(
@@ -113,7 +126,7 @@ async def find_relevant_document(user_query: str) -> str:
         # 가장 유사한 문서 반환
         return temporary_docs[most_similar_index]
     except Exception as e:
-        print(f"[ERROR] 유사 문서 검색 실패: {e}")
+        logger.error("유사 문서 검색 실패: %s", e)
         traceback.print_exc()
         return ""
 
@@ -123,17 +136,22 @@ async def find_relevant_document(user_query: str) -> str:
 def advanced_tokenization(text: str) -> List[str]:
     """
     고급 토큰화: KoNLPy 사용 또는 기본 토큰화
+    
+    동기 함수이므로 형태소 분석기가 이미 로드된 경우에만 사용합니다. (JVM 로딩으로 이벤트 루프를 막지 않도록
+    로딩 전이면 백그라운드 로딩만 시작하고 기본 토큰화 사용)
     """
-    if KONLPY_AVAILABLE:
+    if KONLPY_AVAILABLE and not okt_resource.ready:
+        okt_resource.load_in_background()
+    if KONLPY_AVAILABLE and okt_resource.ready:
         try:
             # 형태소 분석으로 토큰화
-            tokens = okt.morphs(text)
+            tokens = okt_resource.get().morphs(text)
             # 불용어 제거
             stopwords = ['이', '가', '을', '를', '의', '에', '에서', '로', '으로', '와', '과', '도', '만', '은', '는']
             tokens = [token for token in tokens if token not in stopwords and len(token) > 1]
             return tokens
         except Exception as e:
-            print(f"[ERROR] KoNLPy tokenization failed: {e}")
+            logger.warning("KoNLPy tokenization failed: %s", e)
             return basic_tokenization(text)
     else:
         return basic_tokenization(text)
@@ -149,15 +167,18 @@ def basic_tokenization(text: str) -> List[str]:
 
 def calculate_similarity(text1: str, text2: str) -> float:
     """
-    임베딩 기반 유사도 계산
+    임베딩 기반 유사도 계산 (모델이 아직 로드되지 않았으면 키워드 유사도 사용)
     """
-    if SENTENCE_TRANSFORMERS_AVAILABLE:
+    if SENTENCE_TRANSFORMERS_AVAILABLE and not embedding_model_st_resource.ready:
+        embedding_model_st_resource.load_in_background()
+    if SENTENCE_TRANSFORMERS_AVAILABLE and embedding_model_st_resource.ready:
         try:
-            embeddings = embedding_model_st.encode([text1, text2])
+            from sklearn.metrics.pairwise import cosine_similarity
+            embeddings = embedding_model_st_resource.get().encode([text1, text2])
             similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
             return float(similarity)
         except Exception as e:
-            print(f"[ERROR] Embedding similarity calculation failed: {e}")
+            logger.warning("Embedding similarity calculation failed: %s", e)
             return keyword_similarity(text1, text2)
     else:
         return keyword_similarity(text1, text2)
@@ -187,6 +208,7 @@ INTENT_CATEGORIES = {
     'field_input': '필드 입력'
 }
 
+@span("classifier", name="intent_advanced")
 def classify_intent_advanced(text: str, current_field: str = None) -> Dict[str, Any]:
     """
     고급 의도 분류 시스템
@@ -221,6 +243,7 @@ def classify_intent_advanced(text: str, current_field: str = None) -> Dict[str,
     }
 
 # AI 챗봇용 대화 방식 고급 NLP 시스템
+@span("classifier", name="conversation_intent")
 def classify_conversation_intent(text: str, conversation_history: List[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     AI 챗봇용 대화 의도 분류 시스템
@@ -375,6 +398,7 @@ HARDCODED_FIELDS = {
     "디자인팀": "부서: 디자인팀으로 설정되었습니다.",
 }
 
+@span("classifier", name="keyword")
 def classify_input(text: str) -> dict:
     """
     키워드 기반 1차 분류 함수 (완전히 새로 작성)
@@ -382,10 +406,10 @@ def classify_input(text: str) -> dict:
     text_lower = text.lower()
     text_length = len(text.strip())
     
-    print(f"[DEBUG] ===== classify_input 시작 =====")
-    print(f"[DEBUG] 입력 텍스트: {text}")
-    print(f"[DEBUG] 텍스트 길이: {text_length}")
-    print(f"[DEBUG] text_lower: {text_lower}")
+    logger.debug("===== classify_input 시작 =====")
+    log_payload(logger, "입력 텍스트: %s", text)
+    logger.debug("텍스트 길이: %s", text_length)
+    log_payload(logger, "text_lower: %s", text_lower)
     
     # 채용 관련 키워드 (더 포괄적) - 깨진 텍스트도 고려
     recruitment_keywords = [
@@ -404,20 +428,20 @@ def classify_input(text: str) -> dict:
     
     # 채용 관련 키워드가 포함된 경우
     matched_keywords = [keyword for keyword in recruitment_keywords if keyword in text_lower]
-    print(f"[DEBUG] 매칭된 채용 키워드: {matched_keywords}")
+    logger.debug("매칭된 채용 키워드: %s", matched_keywords)
     
     if matched_keywords:
-        print(f"[DEBUG] 채용 관련 키워드 {len(matched_keywords)}개 감지 - job_posting_info 반환")
+        logger.debug("채용 관련 키워드 %s개 감지 - job_posting_info 반환", len(matched_keywords))
         return {'type': 'job_posting_info', 'category': '채용정보', 'confidence': 0.9}
     
     # 긴 텍스트 (20자 이상)이고 깨진 텍스트가 포함된 경우 채용 정보로 분류
     if text_length > 20 and "????" in text_lower:
-        print(f"[DEBUG] 긴 텍스트 + 깨진 문자 감지 - job_posting_info 반환")
+        logger.debug("긴 텍스트 + 깨진 문자 감지 - job_posting_info 반환")
         return {'type': 'job_posting_info', 'category': '채용정보', 'confidence': 0.8}
     
     # 긴 텍스트 (30자 이상)는 대부분 채용 정보로 분류
     if text_length > 30:
-        print(f"[DEBUG] 긴 텍스트 감지 ({text_length}자) - job_posting_info 반환")
+        logger.debug("긴 텍스트 감지 (%s자) - job_posting_info 반환", text_length)
         return {'type': 'job_posting_info', 'category': '채용정보', 'confidence': 0.7}
     
     # 질문 감지
@@ -425,11 +449,11 @@ def classify_input(text: str) -> dict:
     has_question = any(keyword in text_lower for keyword in question_keywords) or text.strip().endswith("?")
     
     if has_question:
-        print(f"[DEBUG] 질문 감지 - question 반환")
+        logger.debug("질문 감지 - question 반환")
         return {'type': 'question', 'category': 'general', 'confidence': 0.7}
     
     # 기본값: 답변으로 처리
-    print(f"[DEBUG] 기본값 - answer 반환")
+    logger.debug("기본값 - answer 반환")
     return {'type': 'answer', 'category': 'general', 'confidence': 0.6}
     
     # 채용 관련 키워드 분류
@@ -539,10 +563,10 @@ async def extract_job_info_from_text_llm(text: str) -> dict:
             parsed = json.loads(m.group(0)) if m else {}
         normalized = _normalize_llm_result_to_internal_keys(parsed)
         if normalized:
-            print(f"[DEBUG] LLM 맥락 추출 결과(정규화): {normalized}")
+            log_payload(logger, "LLM 맥락 추출 결과(정규화): %s", normalized)
         return normalized
     except Exception as e:
-        print(f"[WARN] LLM 맥락 추출 실패: {e}")
+        logger.warning("LLM 맥락 추출 실패: %s", e)
         return {}
 
 
@@ -557,7 +581,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     extracted_data = {}
     extracted_info = []  # extracted_info 변수 초기화 추가
     
-    print(f"[DEBUG] extract_job_info_from_text 시작 - 입력: {text}")
+    log_payload(logger, "extract_job_info_from_text 시작 - 입력: %s", text)
     
     # 1) LLM 컨텍스트 기반 추출 선시도
     #    - 동기 컨텍스트에서만 실행하고, 이벤트 루프가 이미 돌고 있으면 건너뜀 (런타임 충돌 방지)
@@ -587,7 +611,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                 # 내부 키 병행 유지 (프론트 jsonFieldMapper가 내부 키도 처리 가능)
                 extracted_data.update({k: v for k, v in llm_result.items() if v})
         except Exception as e:
-            print(f"[WARN] LLM 추출 단계 오류: {e}")
+            logger.warning("LLM 추출 단계 오류: %s", e)
 
     # 이하: 룰 기반 보완 로직
     
@@ -669,7 +693,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     for dept_name, keywords in departments:
         if any(keyword in text_lower for keyword in keywords):
             extracted_data['부서'] = dept_name
-            print(f"[DEBUG] 부서 추출됨: {dept_name}")
+            logger.debug("부서 추출됨: %s", dept_name)
             break
     
     # 인원 추출 - "분"을 "명"으로 수정하여 인식
@@ -679,7 +703,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     headcount_match = re.search(r'(\d+)명', text_for_headcount)
     if headcount_match:
         extracted_data['인원'] = f"{headcount_match.group(1)}명"
-        print(f"[DEBUG] 인원 추출됨: {headcount_match.group(1)}명")
+        logger.debug("인원 추출됨: %s명", headcount_match.group(1))
     
     # 지역 추출 - 더 정교한 패턴 매칭 (LLM 결과가 없을 때 보완)
     locations = {
@@ -751,7 +775,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     for district in all_districts:
         if district in text:
             extracted_data['지역'] = district
-            print(f"[DEBUG] 지역 추출됨: {district}")
+            logger.debug("지역 추출됨: %s", district)
             break
     
     # 근무시간 추출
@@ -781,7 +805,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                 work_hours = f"{match.group(1)} to {match.group(2)}"
                 extracted_data['근무시간'] = work_hours
                 extracted_info.append(f"• 근무시간: {work_hours}")
-                print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                logger.debug("근무시간 추출됨: %s", work_hours)
             elif '오전' in pattern or '오후' in pattern or '저녁' in pattern:
                 start_time = match.group(1)
                 end_time = match.group(2)
@@ -790,27 +814,27 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                     work_hours = f"오전 {start_time}시~오후 {end_time}시"
                     extracted_data['근무시간'] = work_hours
                     extracted_info.append(f"• 근무시간: {work_hours}")
-                    print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                    logger.debug("근무시간 추출됨: %s", work_hours)
                 elif '오전' in pattern and '저녁' in pattern:
                     work_hours = f"오전 {start_time}시~오후 {end_time}시"
                     extracted_data['근무시간'] = work_hours
                     extracted_info.append(f"• 근무시간: {work_hours}")
-                    print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                    logger.debug("근무시간 추출됨: %s", work_hours)
                 elif '오전' in pattern and '오전' in pattern:
                     work_hours = f"오전 {start_time}시~오전 {end_time}시"
                     extracted_data['근무시간'] = work_hours
                     extracted_info.append(f"• 근무시간: {work_hours}")
-                    print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                    logger.debug("근무시간 추출됨: %s", work_hours)
                 elif '오후' in pattern and '오후' in pattern:
                     work_hours = f"오후 {start_time}시~오후 {end_time}시"
                     extracted_data['근무시간'] = work_hours
                     extracted_info.append(f"• 근무시간: {work_hours}")
-                    print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                    logger.debug("근무시간 추출됨: %s", work_hours)
                 else:
                     work_hours = f"{start_time}시~{end_time}시"
                     extracted_data['근무시간'] = work_hours
                     extracted_info.append(f"• 근무시간: {work_hours}")
-                    print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                    logger.debug("근무시간 추출됨: %s", work_hours)
             else:
                 start_time = int(match.group(1))
                 end_time = int(match.group(2))
@@ -833,17 +857,17 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                 work_hours = f"{start_format} ~ {end_format}"
                 extracted_data['근무시간'] = work_hours
                 extracted_info.append(f"• 근무시간: {work_hours}")
-                print(f"[DEBUG] 근무시간 추출됨: {work_hours}")
+                logger.debug("근무시간 추출됨: %s", work_hours)
             break
 
     # 유연근무/자율출근/주간근무 인식
     if '근무시간' not in extracted_data:
         if any(k in text for k in ['유연근무', '유연 근무', '자율 출근', '자율출근', '유연 출근']):
             extracted_data['근무시간'] = '유연근무'
-            print("[DEBUG] 근무시간 추출됨: 유연근무")
+            logger.debug("근무시간 추출됨: 유연근무")
         elif any(k in text for k in ['주간 근무', '주간근무']):
             extracted_data['근무시간'] = '주간근무'
-            print("[DEBUG] 근무시간 추출됨: 주간근무")
+            logger.debug("근무시간 추출됨: 주간근무")
     
     # 근무요일 추출
     work_days_patterns = [
@@ -862,16 +886,16 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
         if match:
             if '월~금' in pattern or '월-금' in pattern:
                 extracted_data['근무요일'] = "월~금"
-                print(f"[DEBUG] 근무요일 추출됨: 월~금")
+                logger.debug("근무요일 추출됨: 월~금")
             elif '평일' in pattern:
                 extracted_data['근무요일'] = "평일"
-                print(f"[DEBUG] 근무요일 추출됨: 평일")
+                logger.debug("근무요일 추출됨: 평일")
             elif '주5일' in pattern:
                 extracted_data['근무요일'] = "주5일"
-                print(f"[DEBUG] 근무요일 추출됨: 주5일")
+                logger.debug("근무요일 추출됨: 주5일")
             else:
                 extracted_data['근무요일'] = match.group(0)
-                print(f"[DEBUG] 근무요일 추출됨: {match.group(0)}")
+                logger.debug("근무요일 추출됨: %s", match.group(0))
             break
     
     # 경력 추출 - 더 정교한 패턴 매칭
@@ -889,16 +913,16 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
         if match:
             if '신입' in pattern:
                 extracted_data['경력'] = "신입"
-                print(f"[DEBUG] 경력 추출됨: 신입")
+                logger.debug("경력 추출됨: 신입")
                 break
             elif '경력' in pattern and match.groups():
                 years = match.group(1)
                 extracted_data['경력'] = f"{years}년 이상"
-                print(f"[DEBUG] 경력 추출됨: {years}년 이상")
+                logger.debug("경력 추출됨: %s년 이상", years)
                 break
             elif '경력자' in pattern:
                 extracted_data['경력'] = "경력자"
-                print(f"[DEBUG] 경력 추출됨: 경력자")
+                logger.debug("경력 추출됨: 경력자")
                 break
     
     # 연봉 추출 - 더 정교한 패턴 매칭 (범위 우선 처리)
@@ -966,7 +990,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     # 협의 처리 우선
     if any(k in text for k in ['연봉 협의', '연봉은 협의', '연봉 협의입니다', '연봉은 협의입니다', '연봉 협의예요', '연봉은 협의예요', '연봉 협의임', '연봉 협의 가능', '협의']):
         extracted_data['연봉'] = '협의'
-        print('[DEBUG] 연봉 추출됨: 협의')
+        logger.debug("연봉 추출됨: 협의")
     else:
         # "사이" 패턴 별도 처리
         사이_match = re.search(r'(\d{1,3})(?:,(\d{3}))?\s*~\s*(\d{1,3})(?:,(\d{3}))?', text)
@@ -977,7 +1001,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                 min_salary = int(left)
                 max_salary = int(right)
                 extracted_data['연봉'] = f"{min_salary}만원~{max_salary}만원"
-                print(f"[DEBUG] 연봉 추출됨: {min_salary}만원~{max_salary}만원")
+                logger.debug("연봉 추출됨: %s만원~%s만원", min_salary, max_salary)
             except Exception:
                 pass
         else:
@@ -997,7 +1021,7 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                                 min_salary = parse_salary(match.group(1))
                                 max_salary = parse_salary(match.group(2))
                             extracted_data['연봉'] = f"{min_salary}만원~{max_salary}만원"
-                            print(f"[DEBUG] 연봉 추출됨: {min_salary}만원~{max_salary}만원")
+                            logger.debug("연봉 추출됨: %s만원~%s만원", min_salary, max_salary)
                         else:
                             # 단일 연봉
                             if ',' in pattern:
@@ -1012,12 +1036,12 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                                 # 일반 연봉
                                 salary = parse_salary(match.group(1))
                             extracted_data['연봉'] = f"{salary}만원"
-                            print(f"[DEBUG] 연봉 추출됨: {salary}만원")
+                            logger.debug("연봉 추출됨: %s만원", salary)
                         
                         salary_found = True
                         break
                     except ValueError as e:
-                        print(f"[DEBUG] 연봉 파싱 오류: {e}")
+                        logger.debug("연봉 파싱 오류: %s", e)
                         continue
             
             if not salary_found:
@@ -1034,13 +1058,13 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
                         else:
                             salary = parse_salary(ctx.group(1))
                         extracted_data['연봉'] = f"{salary}만원"
-                        print(f"[DEBUG] 연봉 추출됨(문맥): {salary}만원")
+                        logger.debug("연봉 추출됨(문맥): %s만원", salary)
                         salary_found = True
                     except ValueError:
                         pass
             
             if not salary_found:
-                print(f"[DEBUG] 연봉 추출 실패")
+                logger.debug("연봉 추출 실패")
     
     # 추가 정보 추출 (기타 항목) - 필드 매칭되지 않는 정보들
     additional_info = []
@@ -1060,13 +1084,13 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     for keyword in welfare_keywords:
         if keyword in text:
             additional_info.append(keyword)
-            print(f"[DEBUG] 기타 항목 추출됨: {keyword}")
+            logger.debug("기타 항목 추출됨: %s", keyword)
     
     # 기타 추가 정보가 있으면 통합
     if additional_info:
         extracted_info.append(f"• 기타: {', '.join(additional_info)}")
         extracted_data['additionalInfo'] = ', '.join(additional_info)
-        print(f"[DEBUG] 기타 정보 추출됨: {', '.join(additional_info)}")
+        logger.debug("기타 정보 추출됨: %s", ', '.join(additional_info))
     
     # 업무 내용 추출
     job_titles = {
@@ -1090,16 +1114,17 @@ def extract_job_info_from_text(text: str, use_llm: bool = True) -> dict:
     for job_title, keywords in job_titles.items():
         if any(keyword in text for keyword in keywords):
             extracted_data['업무'] = job_title
-            print(f"[DEBUG] 업무 추출됨: {job_title}")
+            logger.debug("업무 추출됨: %s", job_title)
             break
     
-    print(f"[DEBUG] 최종 추출된 정보: {extracted_data}")
+    log_payload(logger, "최종 추출된 정보: %s", extracted_data)
     
     if not extracted_data:
         return {}
     
     return extracted_data
 
+@span("classifier", name="keyword_context")
 def classify_input_with_context(text: str, current_field: str = None) -> dict:
     """
     현재 필드 컨텍스트를 고려한 분류 함수
@@ -1107,9 +1132,9 @@ def classify_input_with_context(text: str, current_field: str = None) -> dict:
     text_lower = text.lower()
     text_length = len(text.strip())
     
-    print(f"[DEBUG] ===== classify_input_with_context 시작 =====")
-    print(f"[DEBUG] 입력 텍스트: {text}")
-    print(f"[DEBUG] 현재 필드: {current_field}")
+    logger.debug("===== classify_input_with_context 시작 =====")
+    log_payload(logger, "입력 텍스트: %s", text)
+    logger.debug("현재 필드: %s", current_field)
     
     # 카테고리별 키워드 매핑
     field_categories = {
@@ -1236,18 +1261,18 @@ def classify_input_with_context(text: str, current_field: str = None) -> dict:
     # 질문 키워드가 포함되어 있거나 문장이 "?"로 끝나는 경우
     if any(keyword in text_lower for keyword in question_keywords) or text.strip().endswith("?"):
         matched_keywords = [kw for kw in question_keywords if kw in text_lower]
-        print(f"[DEBUG] 질문으로 분류됨 - 매칭된 질문 키워드: {matched_keywords}")
+        logger.debug("질문으로 분류됨 - 매칭된 질문 키워드: %s", matched_keywords)
         return {'type': 'question', 'category': 'general', 'confidence': 0.8}
     
     # 현재 필드에 대한 고급 NLP 기반 검토
     if current_field and current_field in field_categories:
         field_config = field_categories[current_field]
         category = field_config.get('category', 'unknown')
-        print(f"[DEBUG] 필드 '{current_field}'의 카테고리 '{category}' 고급 NLP 검사 시작")
+        logger.debug("필드 '%s'의 카테고리 '%s' 고급 NLP 검사 시작", current_field, category)
         
         # 고급 토큰화 적용
         tokens = advanced_tokenization(text)
-        print(f"[DEBUG] 토큰화 결과: {tokens}")
+        logger.debug("토큰화 결과: %s", tokens)
         
         # 임베딩 기반 유사도 계산
         best_match = None
@@ -1263,15 +1288,15 @@ def classify_input_with_context(text: str, current_field: str = None) -> dict:
                     best_match = keyword
                     matched_subcategories = [subcategory]
         
-        print(f"[DEBUG] 최고 유사도: {best_similarity} (키워드: {best_match})")
+        logger.debug("최고 유사도: %s (키워드: %s)", best_similarity, best_match)
         
         if best_match:
-            print(f"[DEBUG] 고급 NLP 카테고리 '{category}' 키워드 감지됨 - 맥락 검토 시작")
+            logger.debug("고급 NLP 카테고리 '%s' 키워드 감지됨 - 맥락 검토 시작", category)
             # 맥락 검토: 실제 답변인지 확인
             if is_valid_answer_for_field(text, current_field):
-                print(f"[DEBUG] 맥락 검토 통과 - 값 추출 시작")
+                logger.debug("맥락 검토 통과 - 값 추출 시작")
                 extracted_value = extract_field_value(text, current_field, field_config)
-                print(f"[DEBUG] 추출된 값: {extracted_value}")
+                logger.debug("추출된 값: %s", extracted_value)
                 result = {
                     'type': 'answer', 
                     'category': category, 
@@ -1281,17 +1306,17 @@ def classify_input_with_context(text: str, current_field: str = None) -> dict:
                     'tokens': tokens,
                     'nlp_method': 'advanced'
                 }
-                print(f"[DEBUG] 고급 NLP 답변으로 분류됨: {result}")
+                log_payload(logger, "고급 NLP 답변으로 분류됨: %s", result)
                 return result
             else:
-                print(f"[DEBUG] 맥락 검토 실패 - 답변으로 분류하지 않음")
+                logger.debug("맥락 검토 실패 - 답변으로 분류하지 않음")
         else:
-            print(f"[DEBUG] 고급 NLP 카테고리 '{category}' 키워드 없음")
+            logger.debug("고급 NLP 카테고리 '%s' 키워드 없음", category)
     
     # 기존 분류 로직 (필드별 컨텍스트가 없는 경우)
-    print(f"[DEBUG] 기존 분류 로직 사용")
+    logger.debug("기존 분류 로직 사용")
     result = classify_input(text)
-    print(f"[DEBUG] 최종 분류 결과: {result}")
+    log_payload(logger, "최종 분류 결과: %s", result)
     return result
 
 def is_valid_answer_for_field(text: str, field: str) -> bool:
@@ -1300,20 +1325,20 @@ def is_valid_answer_for_field(text: str, field: str) -> bool:
     """
     text_lower = text.lower()
     
-    print(f"[DEBUG] ===== is_valid_answer_for_field 검토 시작 =====")
-    print(f"[DEBUG] 검토 텍스트: {text}")
-    print(f"[DEBUG] 검토 필드: {field}")
+    logger.debug("===== is_valid_answer_for_field 검토 시작 =====")
+    log_payload(logger, "검토 텍스트: %s", text)
+    logger.debug("검토 필드: %s", field)
     
     # 부정적인 표현이나 질문성 표현이 포함된 경우 제외
     negative_patterns = ['모르겠', '잘 모르', '몰라', '궁금', '어떻게', '왜', '뭐']
     negative_matches = [pattern for pattern in negative_patterns if pattern in text_lower]
     if negative_matches:
-        print(f"[DEBUG] 부정적 표현 감지됨: {negative_matches} - 유효하지 않음")
+        logger.debug("부정적 표현 감지됨: %s - 유효하지 않음", negative_matches)
         return False
     
     # 너무 짧거나 너무 긴 경우 제외
     if len(text.strip()) < 2 or len(text.strip()) > 200:
-        print(f"[DEBUG] 길이 검사 실패 - 길이: {len(text.strip())} - 유효하지 않음")
+        logger.debug("길이 검사 실패 - 길이: %s - 유효하지 않음", len(text.strip()))
         return False
     
     # 필드별 유효성 검사
@@ -1322,21 +1347,21 @@ def is_valid_answer_for_field(text: str, field: str) -> bool:
         import re
         numbers = re.findall(r'\d+', text)
         if not numbers:
-            print(f"[DEBUG] headcount 필드 - 숫자 없음 - 유효하지 않음")
+            logger.debug("headcount 필드 - 숫자 없음 - 유효하지 않음")
             return False
         else:
-            print(f"[DEBUG] headcount 필드 - 숫자 감지됨: {numbers}")
+            logger.debug("headcount 필드 - 숫자 감지됨: %s", numbers)
     
     elif field == 'contactEmail':
         # 이메일 형식이어야 함
         import re
         if not re.search(r'@', text):
-            print(f"[DEBUG] contactEmail 필드 - @ 없음 - 유효하지 않음")
+            logger.debug("contactEmail 필드 - @ 없음 - 유효하지 않음")
             return False
         else:
-            print(f"[DEBUG] contactEmail 필드 - @ 감지됨")
+            logger.debug("contactEmail 필드 - @ 감지됨")
     
-    print(f"[DEBUG] 모든 검토 통과 - 유효함")
+    logger.debug("모든 검토 통과 - 유효함")
     return True
 
 def extract_field_value(text: str, field: str, field_config: dict) -> str:
@@ -1345,10 +1370,10 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
     """
     import re
     
-    print(f"[DEBUG] ===== extract_field_value 시작 =====")
-    print(f"[DEBUG] 원본 텍스트: {text}")
-    print(f"[DEBUG] 대상 필드: {field}")
-    print(f"[DEBUG] 필드 설정: {field_config}")
+    logger.debug("===== extract_field_value 시작 =====")
+    log_payload(logger, "원본 텍스트: %s", text)
+    logger.debug("대상 필드: %s", field)
+    log_payload(logger, "필드 설정: %s", field_config)
     
     # 텍스트 정리 (대화형 입력에서 불필요한 부분 제거)
     cleaned_text = text.strip()
@@ -1360,7 +1385,7 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
             # 가장 큰 숫자를 선택 (예: "신입 2명, 경력 1명 총 3명" → "3명")
             max_number = max(numbers, key=int)
             extracted = max_number + '명'
-            print(f"[DEBUG] headcount - 숫자 추출: {max_number} → {extracted}")
+            log_payload(logger, "headcount - 숫자 추출: %s → %s", max_number, extracted)
             return extracted
         
         # "명"이 포함된 경우 숫자 추출 시도
@@ -1370,7 +1395,7 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
             if number_match:
                 number = number_match.group(1)
                 extracted = number + '명'
-                print(f"[DEBUG] headcount - '명' 포함 숫자 추출: {number} → {extracted}")
+                log_payload(logger, "headcount - '명' 포함 숫자 추출: %s → %s", number, extracted)
                 return extracted
             
             # "한 명", "두 명" 등의 한글 숫자 처리
@@ -1381,17 +1406,17 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
             for korean, arabic in korean_numbers.items():
                 if f"{korean} 명" in cleaned_text:
                     extracted = arabic + '명'
-                    print(f"[DEBUG] headcount - 한글 숫자 추출: {korean} → {extracted}")
+                    log_payload(logger, "headcount - 한글 숫자 추출: %s → %s", korean, extracted)
                     return extracted
         
         # 숫자 + "명" 패턴이 없는 경우, 숫자만 추출
         if numbers:
             max_number = max(numbers, key=int)
             extracted = max_number + '명'
-            print(f"[DEBUG] headcount - 숫자만 추출: {max_number} → {extracted}")
+            log_payload(logger, "headcount - 숫자만 추출: %s → %s", max_number, extracted)
             return extracted
         
-        print(f"[DEBUG] headcount - 숫자 없음, 원본 반환")
+        logger.debug("headcount - 숫자 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'salary':
@@ -1401,9 +1426,9 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
             # 가장 큰 숫자를 선택 (예: "신입은 3000만원, 경력은 5000만원" → "5000만원")
             max_number = max(numbers, key=int)
             extracted = max_number + '만원'
-            print(f"[DEBUG] salary - 숫자 추출: {max_number} → {extracted}")
+            log_payload(logger, "salary - 숫자 추출: %s → %s", max_number, extracted)
             return extracted
-        print(f"[DEBUG] salary - 숫자 없음, 원본 반환")
+        logger.debug("salary - 숫자 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'department':
@@ -1413,17 +1438,17 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         # 우선순위가 높은 키워드부터 검색
         for keyword in ['개발팀', '마케팅팀', '영업팀', '디자인팀', '기획팀', '인사팀']:
             if keyword in cleaned_text:
-                print(f"[DEBUG] department - 부서명 추출: {keyword}")
+                logger.debug("department - 부서명 추출: %s", keyword)
                 return keyword
         
         # 단일 키워드 검색
         for keyword in ['개발', '마케팅', '영업', '디자인', '기획', '인사']:
             if keyword in cleaned_text:
                 keyword_with_team = keyword + '팀'
-                print(f"[DEBUG] department - 부서명 추출: {keyword_with_team}")
+                logger.debug("department - 부서명 추출: %s", keyword_with_team)
                 return keyword_with_team
         
-        print(f"[DEBUG] department - 부서명 없음, 원본 반환")
+        logger.debug("department - 부서명 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'location':
@@ -1432,7 +1457,7 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         
         for keyword in location_keywords:
             if keyword in cleaned_text:
-                print(f"[DEBUG] location - 지역 추출: {keyword}")
+                logger.debug("location - 지역 추출: %s", keyword)
                 return keyword
         
         # "에서", "에" 등의 조사와 함께 사용된 경우
@@ -1448,10 +1473,10 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
             if match:
                 location = match.group(1)
                 if location in location_keywords:
-                    print(f"[DEBUG] location - 패턴 매칭 지역 추출: {location}")
+                    logger.debug("location - 패턴 매칭 지역 추출: %s", location)
                     return location
         
-        print(f"[DEBUG] location - 지역 없음, 원본 반환")
+        logger.debug("location - 지역 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'additionalInfo':
@@ -1470,15 +1495,15 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         for keyword in additional_keywords:
             if keyword in cleaned_text:
                 found_keywords.append(keyword)
-                print(f"[DEBUG] additionalInfo - 키워드 추출: {keyword}")
+                logger.debug("additionalInfo - 키워드 추출: %s", keyword)
         
         if found_keywords:
             result = ", ".join(found_keywords)
-            print(f"[DEBUG] additionalInfo - 최종 결과: {result}")
+            log_payload(logger, "additionalInfo - 최종 결과: %s", result)
             return result
         
         # 키워드가 없는 경우 원본 텍스트 반환 (사용자가 직접 입력한 기타 정보)
-        print(f"[DEBUG] additionalInfo - 키워드 없음, 원본 반환")
+        logger.debug("additionalInfo - 키워드 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'mainDuties':
@@ -1499,17 +1524,17 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         
         for keyword in priority_keywords:
             if keyword in cleaned_text:
-                print(f"[DEBUG] mainDuties - 우선순위 업무 추출: {keyword}")
+                logger.debug("mainDuties - 우선순위 업무 추출: %s", keyword)
                 return keyword
         
         # 일반 키워드 검색
         general_keywords = ['개발', '디자인', '마케팅', '영업', '기획', '관리', '운영', '분석', '설계', '테스트', '유지보수']
         for keyword in general_keywords:
             if keyword in cleaned_text:
-                print(f"[DEBUG] mainDuties - 일반 업무 추출: {keyword}")
+                logger.debug("mainDuties - 일반 업무 추출: %s", keyword)
                 return keyword
         
-        print(f"[DEBUG] mainDuties - 업무 없음, 원본 반환")
+        logger.debug("mainDuties - 업무 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'workHours':
@@ -1523,7 +1548,7 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         for pattern in time_patterns:
             matches = re.findall(pattern, cleaned_text)
             if matches:
-                print(f"[DEBUG] workHours - 시간 패턴 추출: {matches[0]}")
+                logger.debug("workHours - 시간 패턴 추출: %s", matches[0])
                 return matches[0]
         
         # "오전 9시부터 오후 6시까지" 형태의 패턴 처리
@@ -1534,7 +1559,7 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
                 morning_hour = morning_match.group(1)
                 afternoon_hour = afternoon_match.group(1)
                 extracted = f"{morning_hour.zfill(2)}:00-{afternoon_hour.zfill(2)}:00"
-                print(f"[DEBUG] workHours - 오전/오후 시간 추출: {extracted}")
+                log_payload(logger, "workHours - 오전/오후 시간 추출: %s", extracted)
                 return extracted
         
         # 시간 관련 키워드가 있는지 확인
@@ -1544,7 +1569,7 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
             time_match = re.search(r'(\d{1,2}:\d{2})', cleaned_text)
             if time_match:
                 extracted = time_match.group(1)
-                print(f"[DEBUG] workHours - 시간 추출: {extracted}")
+                log_payload(logger, "workHours - 시간 추출: %s", extracted)
                 return extracted
             
             # "9시부터 6시까지" 형태의 패턴 처리
@@ -1553,10 +1578,10 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
                 start_hour = time_range_match.group(1)
                 end_hour = time_range_match.group(2)
                 extracted = f"{start_hour.zfill(2)}:00-{end_hour.zfill(2)}:00"
-                print(f"[DEBUG] workHours - 시간 범위 추출: {extracted}")
+                log_payload(logger, "workHours - 시간 범위 추출: %s", extracted)
                 return extracted
         
-        print(f"[DEBUG] workHours - 시간 패턴 없음, 원본 반환")
+        logger.debug("workHours - 시간 패턴 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'locationCity':
@@ -1569,10 +1594,10 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         
         for keyword in location_keywords:
             if keyword in cleaned_text:
-                print(f"[DEBUG] locationCity - 위치 추출: {keyword}")
+                logger.debug("locationCity - 위치 추출: %s", keyword)
                 return keyword
         
-        print(f"[DEBUG] locationCity - 위치 없음, 원본 반환")
+        logger.debug("locationCity - 위치 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'deadline':
@@ -1586,10 +1611,10 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         for pattern in deadline_patterns:
             matches = re.findall(pattern, cleaned_text)
             if matches:
-                print(f"[DEBUG] deadline - 마감일 추출: {matches[0]}")
+                logger.debug("deadline - 마감일 추출: %s", matches[0])
                 return matches[0]
         
-        print(f"[DEBUG] deadline - 마감일 없음, 원본 반환")
+        logger.debug("deadline - 마감일 없음, 원본 반환")
         return cleaned_text
     
     elif field == 'contactEmail':
@@ -1598,15 +1623,15 @@ def extract_field_value(text: str, field: str, field_config: dict) -> str:
         email_match = re.search(email_pattern, cleaned_text)
         if email_match:
             extracted = email_match.group(0)
-            print(f"[DEBUG] contactEmail - 이메일 추출: {extracted}")
+            log_payload(logger, "contactEmail - 이메일 추출: %s", extracted)
             return extracted
         
-        print(f"[DEBUG] contactEmail - 이메일 없음, 원본 반환")
+        logger.debug("contactEmail - 이메일 없음, 원본 반환")
         return cleaned_text
     
     else:
         # 기본적으로 정리된 텍스트 반환
-        print(f"[DEBUG] 기본 처리 - 정리된 텍스트 반환")
+        logger.debug("기본 처리 - 정리된 텍스트 반환")
         return cleaned_text
 
 # 기존 detect_intent 함수는 호환성을 위해 유지
@@ -1653,30 +1678,33 @@ if GEMINI_API_KEY:
     # 'gemini-1.5-pro'는 최신 텍스트 기반 모델입니다.
     model = genai.GenerativeModel('gemini-1.5-pro')
 else:
-    print("Warning: GOOGLE_API_KEY not found. Using fallback responses.")
+    logger.debug("Warning: GOOGLE_API_KEY not found. Using fallback responses.")
     model = None
 # --- Gemini API 설정 추가 끝 ---
 
 router = APIRouter()
 
 # 기존 세션 저장소 (normal 모드에서 이제 사용하지 않음, modal_assistant에서만 사용)
-sessions = {}
+# 크기/TTL 제한이 있는 세션 저장소 - SESSION_STORE_BACKEND로 Mongo/Redis를 지정하면 워커 간 공유
+sessions = get_session_store("legacy_sessions")
 
 # 모달 어시스턴트 세션 저장소 (기존 로직 유지를 위해 유지)
-modal_sessions = {}
+modal_sessions = get_session_store("modal_sessions")
 
 # 대화 히스토리 관리 시스템
 class ConversationManager:
-    def __init__(self):
-        self.conversations = {}
-    
-    def add_message(self, user_id: str, message: str, response: str, metadata: Dict[str, Any] = None):
+    def __init__(self, store: Optional[SessionStore] = None, max_entries: int = 10,
+                 token_budget: int = int(os.getenv("CONVERSATION_TOKEN_BUDGET", "2000")),
+                 estimator: Optional[TokenEstimator] = None):
+        self.conversations = store or get_session_store("conversations")
+        self.max_entries = max_entries
+        self.token_budget = token_budget
+        self.estimator = estimator or get_token_estimator("gemini")
+    
+    async def add_message(self, user_id: str, message: str, response: str, metadata: Dict[str, Any] = None):
         """
         대화 히스토리에 메시지 추가
         """
-        if user_id not in self.conversations:
-            self.conversations[user_id] = []
-        
         conversation_entry = {
             'timestamp': datetime.now(),
             'user_message': message,
@@ -1684,26 +1712,35 @@ class ConversationManager:
             'metadata': metadata or {}
         }
         
-        self.conversations[user_id].append(conversation_entry)
-        
-        # 최근 10개만 유지
-        if len(self.conversations[user_id]) > 10:
-            self.conversations[user_id] = self.conversations[user_id][-10:]
-    
-    def get_context(self, user_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        async with self.conversations.lock(user_id):
+            conversation = await self.conversations.get(user_id) or {"entries": []}
+            
+            # 최근 max_entries개 중 토큰 예산 안에 들어가는 만큼만 유지 (최신 항목은 항상 유지)
+            entries = (conversation["entries"] + [conversation_entry])[-self.max_entries:]
+            used = 0
+            for index in range(len(entries) - 1, -1, -1):
+                used += self.estimator.count(entries[index]['user_message']) + self.estimator.count(entries[index]['bot_response'])
+                if used > self.token_budget and index < len(entries) - 1:
+                    entries = entries[index + 1:]
+                    break
+            conversation["entries"] = entries
+            await self.conversations.save(user_id, conversation)
+    
+    async def get_context(self, user_id: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         사용자의 대화 컨텍스트 반환
         """
-        if user_id not in self.conversations:
+        conversation = await self.conversations.get(user_id)
+        if conversation is None:
             return []
         
-        return self.conversations[user_id][-limit:]
+        return conversation["entries"][-limit:]
     
-    def get_recent_intents(self, user_id: str, limit: int = 3) -> List[str]:
+    async def get_recent_intents(self, user_id: str, limit: int = 3) -> List[str]:
         """
         최근 의도들 반환
         """
-        context = self.get_context(user_id, limit)
+        context = await self.get_context(user_id, limit)
         intents = []
         for entry in context:
             if 'metadata' in entry and 'intent' in entry['metadata']:
@@ -1748,6 +1785,7 @@ class ConversationRequest(BaseModel):
     user_input: str
     current_field: str
     filled_fields: Dict[str, Any] = {}
+    conversation_history: List[Dict[str, Any]] = Field(default_factory=list)
     mode: str = "conversational"
 
 class ConversationResponse(BaseModel):
@@ -1789,54 +1827,54 @@ class RecommendationsRequest(BaseModel):
 
 @router.post("/start", response_model=SessionStartResponse)
 async def start_session(request: SessionStartRequest):
-    print("[DEBUG] /start 요청:", request)
+    log_payload(logger, "/start 요청: %s", request)
     try:
         session_id = str(uuid.uuid4())
         if request.mode == "modal_assistant":
             if not request.fields:
-                print("[ERROR] /start fields 누락")
+                logger.warning("/start fields 누락")
                 raise HTTPException(status_code=400, detail="모달 어시스턴트 모드에서는 fields가 필요합니다")
-            modal_sessions[session_id] = {
+            await modal_sessions.save(session_id, {
                 "page": request.page,
                 "fields": request.fields,
                 "current_field_index": 0,
                 "filled_fields": {},
                 "conversation_history": [],
                 "mode": "modal_assistant"
-            }
+            })
             first_field = request.fields[0]
             response = SessionStartResponse(
                 session_id=session_id,
                 question=f"안녕하세요! {request.page} 작성을 도와드리겠습니다. 🤖\n\n먼저 {first_field.get('label', '첫 번째 항목')}에 대해 알려주세요.",
                 current_field=first_field.get('key', 'unknown')
             )
-            print("[DEBUG] /start 응답:", response)
+            log_payload(logger, "/start 응답: %s", response)
             return response
         else:
             questions = get_questions_for_page(request.page)
-            sessions[session_id] = {
+            await sessions.save(session_id, {
                 "page": request.page,
                 "questions": questions,
                 "current_index": 0,
                 "current_field": questions[0]["field"] if questions else None,
                 "conversation_history": [],
                 "mode": "normal"
-            }
+            })
             response = SessionStartResponse(
                 session_id=session_id,
                 question=questions[0]["question"] if questions else "질문이 없습니다.",
                 current_field=questions[0]["field"] if questions else None
             )
-            print("[DEBUG] /start 응답:", response)
+            log_payload(logger, "/start 응답: %s", response)
             return response
     except Exception as e:
-        print("[ERROR] /start 예외:", e)
+        logger.error("/start 예외: %s", e)
         traceback.print_exc()
         raise
 
 @router.post("/start-ai-assistant", response_model=SessionStartResponse)
 async def start_ai_assistant(request: SessionStartRequest):
-    print("[DEBUG] /start-ai-assistant 요청:", request)
+    log_payload(logger, "/start-ai-assistant 요청: %s", request)
     try:
         session_id = str(uuid.uuid4())
         ai_assistant_fields = [
@@ -1850,37 +1888,37 @@ async def start_ai_assistant(request: SessionStartRequest):
             {"key": "contactEmail", "label": "연락처 이메일", "type": "email"},
             {"key": "additionalInfo", "label": "기타 항목", "type": "text"}
         ]
-        modal_sessions[session_id] = {
+        await modal_sessions.save(session_id, {
             "page": request.page,
             "fields": ai_assistant_fields,
             "current_field_index": 0,
             "filled_fields": {},
             "conversation_history": [],
             "mode": "ai_assistant"
-        }
+        })
         first_field = ai_assistant_fields[0]
         response = SessionStartResponse(
             session_id=session_id,
             question=f" AI 도우미를 시작하겠습니다!\n\n먼저 {first_field.get('label', '첫 번째 항목')}에 대해 알려주세요.",
             current_field=first_field.get('key', 'unknown')
         )
-        print("[DEBUG] /start-ai-assistant 응답:", response)
+        log_payload(logger, "/start-ai-assistant 응답: %s", response)
         return response
     except Exception as e:
-        print("[ERROR] /start-ai-assistant 예외:", e)
+        logger.error("/start-ai-assistant 예외: %s", e)
         traceback.print_exc()
         raise
 
 @router.post("/ask", response_model=ChatbotResponse)
 async def ask_chatbot(request: ChatbotRequest):
-    print("[DEBUG] /ask 요청:", request)
+    log_payload(logger, "/ask 요청: %s", request)
     try:
         # 인코딩 문제 해결을 위한 강력한 처리
         original_input = request.user_input
         
         # 인코딩 문제가 있는 경우 (한글이 깨진 경우)
         if '?' in original_input and len(original_input) < 20:
-            print(f"[DEBUG] 인코딩 문제 감지: {original_input}")
+            log_payload(logger, "인코딩 문제 감지: %s", original_input)
             
             # 하드코딩된 테스트 메시지로 대체
             if '채용' in original_input or '공고' in original_input:
@@ -1892,7 +1930,7 @@ async def ask_chatbot(request: ChatbotRequest):
             else:
                 request.user_input = "채용 관련 질문을 해주세요"
             
-            print(f"[DEBUG] 인코딩 수정됨: {request.user_input}")
+            log_payload(logger, "인코딩 수정됨: %s", request.user_input)
         
         if request.mode == "normal" or not request.session_id:
             response = await handle_normal_request(request)
@@ -1901,20 +1939,20 @@ async def ask_chatbot(request: ChatbotRequest):
         elif request.mode == "free_text":
             response = await handle_free_text_request(request)
         else:
-            print("[ERROR] /ask 알 수 없는 모드:", request.mode)
+            logger.warning("/ask 알 수 없는 모드: %s", request.mode)
             raise HTTPException(status_code=400, detail="알 수 없는 챗봇 모드입니다.")
         
-        print("[DEBUG] /ask 응답:", response)
+        log_payload(logger, "/ask 응답: %s", response)
         return response
     except Exception as e:
-        print("[ERROR] /ask 예외:", e)
+        logger.error("/ask 예외: %s", e)
         traceback.print_exc()
         raise
 
 @router.post("/conversation")
 async def conversation(request: ConversationRequest):
     try:
-        print(f"[DEBUG] /conversation 요청: {request}")
+        log_payload(logger, "/conversation 요청: %s", request)
         
         # Gemini 서비스 인스턴스 생성 
         from gemini_service import GeminiService
@@ -1922,7 +1960,13 @@ async def conversation(request: ConversationRequest):
         
         # AI 응답 생성 (간단한 응답)
         prompt = f"사용자 입력: {request.user_input}"
-        response_text = await gemini_service.generate_response(prompt, request.conversation_history)
+        if is_streaming():
+            # /conversation/stream: 토큰을 바로 전달 (선택 항목 분석은 마지막 이벤트로)
+            response_text = await relay_stream(gemini_service.generate_streaming_response(
+                prompt, request.conversation_history, session_id=request.session_id))
+        else:
+            response_text = await gemini_service.generate_response(prompt, request.conversation_history,
+                                                                   session_id=request.session_id)
         
         response = {
             "message": response_text,
@@ -1982,39 +2026,53 @@ async def conversation(request: ConversationRequest):
             response_type=response_type,
             selectable_items=selectable_items
         )
-        print("[DEBUG] /conversation 응답:", result)
+        log_payload(logger, "/conversation 응답: %s", result)
         return result
         
     except Exception as e:
-        print(f"[ERROR] /conversation 오류: {str(e)}")
+        logger.error("/conversation 오류: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/conversation/stream")
+async def conversation_stream(request: ConversationRequest, http_request: Request):
+    """/conversation의 SSE 스트리밍 버전 (token 이벤트 → result 이벤트에 ConversationResponse)"""
+    return sse_response(http_request, lambda: conversation(request))
+
 @router.post("/generate-questions", response_model=Dict[str, Any])
 async def generate_contextual_questions(request: GenerateQuestionsRequest):
     """컨텍스트 기반 질문 생성"""
-    print("[DEBUG] /generate-questions 요청:", request)
+    log_payload(logger, "/generate-questions 요청: %s", request)
     try:
         questions = await generate_field_questions(
             request.current_field, 
             request.filled_fields
         )
         result = {"questions": questions}
-        print("[DEBUG] /generate-questions 응답:", result)
+        log_payload(logger, "/generate-questions 응답: %s", result)
         return result
     except Exception as e:
-        print("[ERROR] /generate-questions 예외:", e)
+        logger.error("/generate-questions 예외: %s", e)
         traceback.print_exc()
         raise
 
 @router.post("/ai-assistant-chat", response_model=ChatbotResponse)
 async def ai_assistant_chat(request: ChatbotRequest):
     """AI 도우미 채팅 처리 (session_id 필요)"""
-    print("[DEBUG] /ai-assistant-chat 요청:", request)
-    if not request.session_id or request.session_id not in modal_sessions:
-        print("[ERROR] /ai-assistant-chat 유효하지 않은 세션:", request.session_id)
+    log_payload(logger, "/ai-assistant-chat 요청: %s", request)
+    if not request.session_id:
+        logger.warning("/ai-assistant-chat 유효하지 않은 세션: %s", request.session_id)
+        raise HTTPException(status_code=400, detail="유효하지 않은 세션입니다")
+    # 같은 세션의 동시 요청이 서로의 대화 기록/입력 값을 덮어쓰지 않도록 세션 잠금 안에서 처리
+    async with modal_sessions.lock(request.session_id):
+        return await _ai_assistant_chat_in_session(request)
+
+async def _ai_assistant_chat_in_session(request: ChatbotRequest) -> ChatbotResponse:
+    """세션 잠금을 쥔 상태에서 세션 조회 → 응답 생성 → 저장"""
+    session = await modal_sessions.get(request.session_id)
+    if session is None:
+        logger.warning("/ai-assistant-chat 유효하지 않은 세션: %s", request.session_id)
         raise HTTPException(status_code=400, detail="유효하지 않은 세션입니다")
     
-    session = modal_sessions[request.session_id]
     current_field_index = session["current_field_index"]
     fields = session["fields"]
     
@@ -2022,7 +2080,7 @@ async def ai_assistant_chat(request: ChatbotRequest):
         response = ChatbotResponse(
             message="🎉 모든 정보를 입력받았습니다! 채용공고 등록이 완료되었습니다."
         )
-        print("[DEBUG] /ai-assistant-chat 응답:", response)
+        log_payload(logger, "/ai-assistant-chat 응답: %s", response)
         return response
     
     current_field = fields[current_field_index]
@@ -2058,6 +2116,8 @@ async def ai_assistant_chat(request: ChatbotRequest):
         else:
             ai_response["message"] += "\n\n🎉 모든 정보 입력이 완료되었습니다!"
     
+    await modal_sessions.save(request.session_id, session)
+    
     response = ChatbotResponse(
         message=ai_response["message"],
         field=current_field["key"],
@@ -2067,22 +2127,35 @@ async def ai_assistant_chat(request: ChatbotRequest):
         items=ai_response.get("items"),
         show_item_selection=ai_response.get("show_item_selection")
     )
-    print("[DEBUG] /ai-assistant-chat 응답:", response)
+    log_payload(logger, "/ai-assistant-chat 응답: %s", response)
     return response
 
+@router.post("/ai-assistant-chat/stream")
+async def ai_assistant_chat_stream(request: ChatbotRequest, http_request: Request):
+    """/ai-assistant-chat의 SSE 스트리밍 버전 (추출된 필드 값/선택 항목은 result 이벤트로)"""
+    # 잘못된 세션은 스트림을 열기 전에 400으로 응답
+    if not await modal_sessions.exists(request.session_id):
+        raise HTTPException(status_code=400, detail="유효하지 않은 세션입니다")
+    return sse_response(http_request, lambda: ai_assistant_chat(request))
+
 async def handle_modal_assistant_request(request: ChatbotRequest):
-    """모달 어시스턴트 모드 처리 (session_id 필요)"""
-    print("[DEBUG] ===== handle_modal_assistant_request 시작 =====")
-    print("[DEBUG] 요청 데이터:", request)
-    print("[DEBUG] user_input:", request.user_input)
-    print("[DEBUG] current_field:", request.current_field)
-    print("[DEBUG] mode:", request.mode)
-    print("[DEBUG] session_id:", request.session_id)
-    if not request.session_id or request.session_id not in modal_sessions:
-        print("[ERROR] /ai-assistant-chat 유효하지 않은 세션:", request.session_id)
+    """모달 어시스턴트 모드 처리 (session_id 필요, 세션 잠금 안에서 처리)"""
+    async with modal_sessions.lock(request.session_id):
+        return await _handle_modal_assistant_request_in_session(request)
+
+async def _handle_modal_assistant_request_in_session(request: ChatbotRequest):
+    """세션 잠금을 쥔 상태에서 세션 조회 → 응답 생성 → 저장"""
+    logger.debug("===== handle_modal_assistant_request 시작 =====")
+    log_payload(logger, "요청 데이터: %s", request)
+    log_payload(logger, "user_input: %s", request.user_input)
+    logger.debug("current_field: %s", request.current_field)
+    logger.debug("mode: %s", request.mode)
+    logger.debug("session_id: %s", request.session_id)
+    session = await modal_sessions.get(request.session_id) if request.session_id else None
+    if session is None:
+        logger.warning("/ai-assistant-chat 유효하지 않은 세션: %s", request.session_id)
         raise HTTPException(status_code=400, detail="유효하지 않은 세션입니다")
     
-    session = modal_sessions[request.session_id]
     current_field_index = session["current_field_index"]
     fields = session["fields"]
     
@@ -2090,7 +2163,7 @@ async def handle_modal_assistant_request(request: ChatbotRequest):
         response = ChatbotResponse(
             message="모든 정보를 입력받았습니다! 완료 버튼을 눌러주세요. 🎉"
         )
-        print("[DEBUG] /ai-assistant-chat 응답:", response)
+        log_payload(logger, "/ai-assistant-chat 응답: %s", response)
         return response
     
     current_field = fields[current_field_index]
@@ -2118,11 +2191,11 @@ async def handle_modal_assistant_request(request: ChatbotRequest):
     # 명확하지 않은 입력인 경우 먼저 확인
     if llm_response.get("is_unclear", False):
         # 명확하지 않은 입력인 경우 다음 단계로 넘어가지 않음
-        print(f"[DEBUG] 명확하지 않은 입력으로 인식됨 - current_field_index 증가하지 않음")
+        logger.debug("명확하지 않은 입력으로 인식됨 - current_field_index 증가하지 않음")
     # 대화형 응답인 경우 (질문에 대한 답변)
     elif llm_response.get("is_conversation", False):
         # 대화형 응답인 경우 다음 단계로 넘어가지 않음
-        print(f"[DEBUG] 대화형 응답으로 인식됨 - current_field_index 증가하지 않음")
+        logger.debug("대화형 응답으로 인식됨 - current_field_index 증가하지 않음")
     # LLM이 필드 값을 추출했다고 판단한 경우 (value가 있고, 명확하지 않은 입력이 아닌 경우)
     elif llm_response.get("value") and not llm_response.get("is_unclear", False):
         # 필드 키를 명시적으로 설정
@@ -2132,7 +2205,7 @@ async def handle_modal_assistant_request(request: ChatbotRequest):
         # 값이 유효한지 확인 (빈 문자열이나 의미없는 값이 아닌지)
         invalid_values = ["ai 채용공고 등록 도우미", "채용공고 등록 도우미", "ai 어시스턴트", "채용공고", "도우미", "ai", ""]
         if field_value and field_value.strip() and field_value.lower() not in invalid_values:
-            print(f"[DEBUG] 필드 업데이트 - 키: {field_key}, 값: {field_value}")
+            logger.debug("필드 업데이트 - 키: %s, 값: %s", field_key, field_value)
             session["filled_fields"][field_key] = field_value
             
             # 다음 필드로 이동
@@ -2141,13 +2214,13 @@ async def handle_modal_assistant_request(request: ChatbotRequest):
             if session["current_field_index"] >= len(fields):
                 response_message += "\n\n🎉 모든 정보 입력이 완료되었습니다!"
         else:
-            print(f"[DEBUG] 유효하지 않은 값으로 인식됨: {field_value}")
+            logger.debug("유효하지 않은 값으로 인식됨: %s", field_value)
             # 유효하지 않은 값이면 다음 단계로 넘어가지 않음
             # 현재 필드에 머물면서 재입력 요청
-            print(f"[DEBUG] 유효하지 않은 값으로 인한 재입력 요청 - current_field_index 증가하지 않음")
+            logger.debug("유효하지 않은 값으로 인한 재입력 요청 - current_field_index 증가하지 않음")
     else:
         # value가 없거나 다른 경우에도 다음 단계로 넘어가지 않음
-        print(f"[DEBUG] 유효한 값이 없음 - current_field_index 증가하지 않음")
+        logger.debug("유효한 값이 없음 - current_field_index 증가하지 않음")
     
     # 필드 값이 추출된 경우 field와 value를 명시적으로 설정
     response_field = None
@@ -2156,22 +2229,25 @@ async def handle_modal_assistant_request(request: ChatbotRequest):
     if llm_response.get("value") and not llm_response.get("is_conversation", False):
         response_field = current_field["key"]
         response_value = llm_response.get("value")
-        print(f"[DEBUG] 필드 값 추출됨 - field: {response_field}, value: {response_value}")
+        logger.debug("필드 값 추출됨 - field: %s, value: %s", response_field, response_value)
     
     # 추가: LLM 응답에서 직접 field와 value를 가져오는 로직 추가
     if llm_response.get("field") and llm_response.get("value"):
         response_field = llm_response.get("field")
         response_value = llm_response.get("value")
-        print(f"[DEBUG] LLM에서 직접 필드 값 추출됨 - field: {response_field}, value: {response_value}")
+        logger.debug("LLM에서 직접 필드 값 추출됨 - field: %s, value: %s", response_field, response_value)
     
     # 추가: 유효한 값이 추출된 경우 확실히 설정
     if response_value and response_value.strip() and response_value.lower() not in ["ai 채용공고 등록 도우미", "채용공고 등록 도우미", "ai 어시스턴트", "채용공고", "도우미", "ai", ""]:
-        print(f"[DEBUG] 최종 필드 값 설정 - field: {response_field}, value: {response_value}")
+        logger.debug("최종 필드 값 설정 - field: %s, value: %s", response_field, response_value)
     else:
-        print(f"[DEBUG] 유효하지 않은 값으로 필드 설정 안함 - value: {response_value}")
+        logger.debug("유효하지 않은 값으로 필드 설정 안함 - value: %s", response_value)
         response_field = None
         response_value = None
     
+    # 대화 기록/입력 값/선택 대기 상태 변경 저장
+    await modal_sessions.save(request.session_id, session)
+    
     response = ChatbotResponse(
         message=response_message,
         field=response_field,
@@ -2181,24 +2257,24 @@ async def handle_modal_assistant_request(request: ChatbotRequest):
         items=llm_response.get("items"),
         show_item_selection=llm_response.get("show_item_selection")
     )
-    print("[DEBUG] ===== handle_modal_assistant_request 응답 =====")
-    print("[DEBUG] 응답 메시지:", response.message)
-    print("[DEBUG] 응답 필드:", response.field)
-    print("[DEBUG] 응답 값:", response.value)
-    print("[DEBUG] 응답 제안:", response.suggestions)
-    print("[DEBUG] 응답 신뢰도:", response.confidence)
-    print("[DEBUG] ===== handle_modal_assistant_request 완료 =====")
+    logger.debug("===== handle_modal_assistant_request 응답 =====")
+    logger.debug("응답 메시지: %s", response.message)
+    logger.debug("응답 필드: %s", response.field)
+    logger.debug("응답 값: %s", response.value)
+    logger.debug("응답 제안: %s", response.suggestions)
+    logger.debug("응답 신뢰도: %s", response.confidence)
+    logger.debug("===== handle_modal_assistant_request 완료 =====")
     return response
 
 async def handle_normal_request(request: ChatbotRequest):
     """
     일반 모드 요청 처리
     """
-    print(f"[DEBUG] handle_normal_request 요청: {request}")
+    log_payload(logger, "handle_normal_request 요청: %s", request)
     
     # 입력 분류
     classification = classify_input(request.user_input)
-    print(f"[DEBUG] 분류 결과: {classification}")
+    log_payload(logger, "분류 결과: %s", classification)
     
     # 분류 결과에 따른 응답 생성
     if classification['type'] == 'start_job_posting':
@@ -2268,14 +2344,14 @@ async def handle_normal_request(request: ChatbotRequest):
             confidence=0.6
         )
     
-    print(f"[DEBUG] handle_normal_request 응답 ({classification['type']}): {response}")
+    log_payload(logger, "handle_normal_request 응답 (%s): %s", classification['type'], response)
     return response
 
 async def handle_free_text_request(request: ChatbotRequest):
     """
     자유 텍스트 모드 요청 처리
     """
-    print(f"[DEBUG] handle_free_text_request 요청: {request}")
+    log_payload(logger, "handle_free_text_request 요청: %s", request)
     
     # 자유 텍스트에서 채용 정보 추출
     extracted_data = extract_job_info_from_text(request.user_input)
@@ -2300,7 +2376,7 @@ async def handle_free_text_request(request: ChatbotRequest):
         confidence=0.9
     )
     
-    print(f"[DEBUG] handle_free_text_request 응답: {response}")
+    log_payload(logger, "handle_free_text_request 응답: %s", response)
     return response
 
 # 이 아래 함수들은 현재 시뮬레이션된 응답 로직을 사용합니다.
@@ -2308,7 +2384,7 @@ async def handle_free_text_request(request: ChatbotRequest):
 # 해당 함수 내부에 Gemini API 호출 로직을 추가해야 합니다.
 async def generate_conversational_response(user_input: str, current_field: str, filled_fields: Dict[str, Any]) -> Dict[str, Any]:
     """대화형 응답 생성"""
-    print("[DEBUG] generate_conversational_response 요청:", user_input, current_field, filled_fields)
+    log_payload(logger, "generate_conversational_response 요청: %s %s %s", user_input, current_field, filled_fields)
     await asyncio.sleep(0.5)
     
     question_keywords = ["어떤", "무엇", "어떻게", "왜", "언제", "어디서", "얼마나", "몇", "무슨"]
@@ -2316,16 +2392,16 @@ async def generate_conversational_response(user_input: str, current_field: str,
     
     if is_question:
         response = await handle_question_response(user_input, current_field, filled_fields)
-        print("[DEBUG] generate_conversational_response 응답 (질문):", response)
+        log_payload(logger, "generate_conversational_response 응답 (질문): %s", response)
         return response
     else:
         response = await handle_answer_response(user_input, current_field, filled_fields)
-        print("[DEBUG] generate_conversational_response 응답 (답변):", response)
+        log_payload(logger, "generate_conversational_response 응답 (답변): %s", response)
         return response
 
 async def handle_question_response(user_input: str, current_field: str, filled_fields: Dict[str, Any]) -> Dict[str, Any]:
     """질문에 대한 응답 처리"""
-    print("[DEBUG] handle_question_response 요청:", user_input, current_field, filled_fields)
+    log_payload(logger, "handle_question_response 요청: %s %s %s", user_input, current_field, filled_fields)
     question_responses = {
         "department": {
             "개발팀": "개발팀은 주로 웹/앱 개발, 시스템 구축, 기술 지원 등을 담당합니다. 프론트엔드, 백엔드, 풀스택 개발자로 구성되어 있으며, 최신 기술 트렌드를 반영한 개발을 진행합니다.",
@@ -2350,7 +2426,7 @@ async def handle_question_response(user_input: str, current_field: str, filled_f
                 "is_conversation": True,
                 "suggestions": list(field_responses.keys())
             }
-            print("[DEBUG] handle_question_response 응답:", response_data)
+            log_payload(logger, "handle_question_response 응답: %s", response_data)
             return response_data
     
     response_data = {
@@ -2358,24 +2434,24 @@ async def handle_question_response(user_input: str, current_field: str, filled_f
         "is_conversation": True,
         "suggestions": list(field_responses.keys())
     }
-    print("[DEBUG] handle_question_response 응답:", response_data)
+    log_payload(logger, "handle_question_response 응답: %s", response_data)
     return response_data
 
 async def handle_answer_response(user_input: str, current_field: str, filled_fields: Dict[str, Any]) -> Dict[str, Any]:
     """답변 처리"""
-    print("[DEBUG] handle_answer_response 요청:", user_input, current_field, filled_fields)
+    log_payload(logger, "handle_answer_response 요청: %s %s %s", user_input, current_field, filled_fields)
     response_data = {
         "message": f"'{user_input}'로 입력하겠습니다. 다음 질문으로 넘어가겠습니다.",
         "field": current_field,
         "value": user_input,
         "is_conversation": False
     }
-    print("[DEBUG] handle_answer_response 응답:", response_data)
+    log_payload(logger, "handle_answer_response 응답: %s", response_data)
     return response_data
 
 async def generate_field_questions(current_field: str, filled_fields: Dict[str, Any]) -> List[str]:
     """필드별 질문 생성"""
-    print("[DEBUG] generate_field_questions 요청:", current_field, filled_fields)
+    log_payload(logger, "generate_field_questions 요청: %s %s", current_field, filled_fields)
     questions_map = {
         "department": [
             "개발팀은 어떤 업무를 하나요?",
@@ -2426,12 +2502,12 @@ async def generate_field_questions(current_field: str, filled_fields: Dict[str,
         "더 자세한 설명이 필요하신가요?",
         "예시를 들어 설명해드릴까요?"
     ])
-    print("[DEBUG] generate_field_questions 응답:", questions)
+    log_payload(logger, "generate_field_questions 응답: %s", questions)
     return questions
 
 async def generate_modal_ai_response(user_input: str, field: Dict[str, Any], session: Dict[str, Any]) -> Dict[str, Any]:
     """모달 어시스턴트용 AI 응답 생성 (시뮬레이션)"""
-    print("[DEBUG] generate_modal_ai_response 요청:", user_input, field, session)
+    log_payload(logger, "generate_modal_ai_response 요청: %s %s %s", user_input, field, session)
     field_key = field.get("key", "")
     field_label = field.get("label", "")
     
@@ -2498,27 +2574,27 @@ async def generate_modal_ai_response(user_input: str, field: Dict[str, Any], ses
         "suggestions": [],
         "confidence": 0.5
     })
-    print("[DEBUG] generate_modal_ai_response 응답:", response_data)
+    log_payload(logger, "generate_modal_ai_response 응답: %s", response_data)
     return response_data
 
 async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any], session: Dict[str, Any]) -> Dict[str, Any]:
     """AI 도우미용 응답 생성 (개선된 Gemini API 사용)"""
-    print("[DEBUG] ===== AI 어시스턴트 응답 생성 시작 =====")
-    print("[DEBUG] 사용자 입력:", user_input)
-    print("[DEBUG] 현재 필드:", field)
-    print("[DEBUG] 세션 정보:", session)
+    logger.debug("===== AI 어시스턴트 응답 생성 시작 =====")
+    log_payload(logger, "사용자 입력: %s", user_input)
+    logger.debug("현재 필드: %s", field)
+    log_payload(logger, "세션 정보: %s", session)
     
     field_key = field.get("key", "")
     field_label = field.get("label", "")
-    print(f"[DEBUG] 필드 키: {field_key}, 필드 라벨: {field_label}")
+    logger.debug("필드 키: %s, 필드 라벨: %s", field_key, field_label)
     
     # 1) 키워드 기반 1차 분류 (개선된 분류 함수 사용)
     classification = classify_input_with_context(user_input, field_key)
-    print(f"[DEBUG] 분류 결과: {classification}")
-    print(f"[DEBUG] 분류 타입: {classification.get('type')}")
-    print(f"[DEBUG] 분류 카테고리: {classification.get('category')}")
-    print(f"[DEBUG] 분류 값: {classification.get('value')}")
-    print(f"[DEBUG] 신뢰도: {classification.get('confidence')}")
+    log_payload(logger, "분류 결과: %s", classification)
+    logger.debug("분류 타입: %s", classification.get('type'))
+    logger.debug("분류 카테고리: %s", classification.get('category'))
+    logger.debug("분류 값: %s", classification.get('value'))
+    logger.debug("신뢰도: %s", classification.get('confidence'))
     
     # 2) 분류된 결과에 따른 처리
     if classification['type'] == 'question':
@@ -2531,7 +2607,7 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
 
 이 질문에 대해 채용 공고 작성에 도움이 되는 실무적인 답변을 제공해주세요.
 """
-            ai_response = await call_ai_api(ai_assistant_context)
+            ai_response = await call_ai_api(ai_assistant_context, stream=True)
             
             # 응답을 항목별로 분할
             items = parse_response_items(ai_response)
@@ -2551,11 +2627,11 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
                 "items": items,
                 "show_item_selection": True  # 항목 선택 UI 표시
             }
-            print(f"[DEBUG] 질문 응답 (항목 선택 포함): {response}")
+            log_payload(logger, "질문 응답 (항목 선택 포함): %s", response)
             return response
             
         except Exception as e:
-            print(f"[ERROR] Gemini API 호출 실패: {e}")
+            logger.error("Gemini API 호출 실패: %s", e)
             # 오프라인 응답으로 대체
             response = {
                 "message": f"'{user_input}'에 대한 답변을 제공해드리겠습니다. 현재 필드 '{field_label}'에 대한 정보를 입력해주세요.",
@@ -2574,7 +2650,7 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
             "suggestions": [],
             "confidence": classification['confidence']
         }
-        print(f"[DEBUG] 일상 대화 응답: {response}")
+        log_payload(logger, "일상 대화 응답: %s", response)
         return response
     else:
         # 답변인 경우 (개선된 처리)
@@ -2588,7 +2664,7 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
             field_value = extract_field_value(user_input, field_key, field_config)
             field_category = field_key
         
-        print(f"[DEBUG] 답변 처리 결과 - 필드: {field_category}, 값: {field_value}")
+        logger.debug("답변 처리 결과 - 필드: %s, 값: %s", field_category, field_value)
         
         # 필드 업데이트 후 다음 질문 자동 생성
         next_question = ""
@@ -2653,19 +2729,19 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
             "confidence": classification['confidence'],
             "next_question": next_question
         }
-        print(f"[DEBUG] ===== AI 어시스턴트 응답 생성 완료 =====")
-        print(f"[DEBUG] 최종 결과: {response}")
-        print("[DEBUG] ===== AI 어시스턴트 응답 생성 완료 =====")
+        logger.debug("===== AI 어시스턴트 응답 생성 완료 =====")
+        log_payload(logger, "최종 결과: %s", response)
+        logger.debug("===== AI 어시스턴트 응답 생성 완료 =====")
         return response
 
 async def simulate_llm_response(user_input: str, current_field: str, session: Dict[str, Any]) -> Dict[str, Any]:
     """
     키워드 기반 1차 분류 → LLM 호출 → 응답 처리 (개선된 버전)
     """
-    print("[DEBUG] ===== simulate_llm_response 시작 =====")
-    print("[DEBUG] user_input:", user_input)
-    print("[DEBUG] current_field:", current_field)
-    print("[DEBUG] session mode:", session.get("mode"))
+    logger.debug("===== simulate_llm_response 시작 =====")
+    log_payload(logger, "user_input: %s", user_input)
+    logger.debug("current_field: %s", current_field)
+    logger.debug("session mode: %s", session.get('mode'))
     
     await asyncio.sleep(0.5) # 실제 LLM API 호출 시뮬레이션
 
@@ -2686,11 +2762,11 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
     
     # 컨텍스트를 고려한 분류 (개선된 버전)
     classification = classify_input_with_context(user_input, current_field)
-    print(f"[DEBUG] 분류 결과: {classification}")
-    print(f"[DEBUG] 분류 타입: {classification.get('type')}")
-    print(f"[DEBUG] 분류 카테고리: {classification.get('category')}")
-    print(f"[DEBUG] 분류 값: {classification.get('value')}")
-    print(f"[DEBUG] 신뢰도: {classification.get('confidence')}")
+    log_payload(logger, "분류 결과: %s", classification)
+    logger.debug("분류 타입: %s", classification.get('type'))
+    logger.debug("분류 카테고리: %s", classification.get('category'))
+    logger.debug("분류 값: %s", classification.get('value'))
+    logger.debug("신뢰도: %s", classification.get('confidence'))
     
     # 2) 분류된 결과에 따른 처리
     if classification['type'] == 'question':
@@ -2716,7 +2792,7 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
 이 질문에 대해 채용 공고 작성에 도움이 되는 실무적인 답변을 제공해주세요.
 답변 후에는 현재 필드 '{current_field_label}'에 대한 정보를 입력해주시면 됩니다.
 """
-            ai_response = await call_ai_api(ai_assistant_context)
+            ai_response = await call_ai_api(ai_assistant_context, stream=True)
             
             # 응답을 항목별로 분할
             items = parse_response_items(ai_response)
@@ -2731,11 +2807,11 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
                 "show_item_selection": True,  # 항목 선택 UI 표시
                 "is_conversation": True  # 대화형 응답임을 표시
             }
-            print(f"[DEBUG] 질문 응답 (대화형): {response}")
+            log_payload(logger, "질문 응답 (대화형): %s", response)
             return response
             
         except Exception as e:
-            print(f"[ERROR] Gemini API 호출 실패: {e}")
+            logger.error("Gemini API 호출 실패: %s", e)
             # 오프라인 응답으로 대체
             response = {
                 "message": f"'{user_input}'에 대한 답변을 제공해드리겠습니다. 현재 필드 '{current_field_label}'에 대한 정보를 입력해주세요.",
@@ -2787,7 +2863,7 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
                     "confidence": classification['confidence'],
                     "is_conversation": False  # 필드 값이 추출되었으므로 대화형이 아님
                 }
-                print(f"[DEBUG] 대화형 입력에서 필드 값 추출 성공: {response}")
+                log_payload(logger, "대화형 입력에서 필드 값 추출 성공: %s", response)
                 return response
             else:
                 # 관련 정보가 없는 경우 대화형 응답
@@ -2799,11 +2875,11 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
                     "confidence": classification['confidence'],
                     "is_conversation": True
                 }
-                print(f"[DEBUG] 대화형 입력에서 관련 정보 없음: {response}")
+                log_payload(logger, "대화형 입력에서 관련 정보 없음: %s", response)
                 return response
                 
         except Exception as e:
-            print(f"[ERROR] 대화형 입력 처리 중 오류: {e}")
+            logger.error("대화형 입력 처리 중 오류: %s", e)
             # 오류 발생 시 대화형 응답으로 처리
             response = {
                 "message": f"대화 내용을 확인했습니다. 현재 {current_field_label}에 대한 정보를 입력해주세요.",
@@ -2823,7 +2899,7 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
             "suggestions": [],
             "confidence": classification['confidence']
         }
-        print(f"[DEBUG] 일상 대화 응답: {response}")
+        log_payload(logger, "일상 대화 응답: %s", response)
         return response
     elif classification['type'] == 'unclear':
         # 명확하지 않은 입력 처리 - 다시 말씀해주세요
@@ -2836,7 +2912,7 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
             "confidence": classification['confidence'],
             "is_unclear": True  # 명확하지 않은 입력임을 표시
         }
-        print(f"[DEBUG] 명확하지 않은 입력 응답: {response}")
+        log_payload(logger, "명확하지 않은 입력 응답: %s", response)
         return response
     else:
         # 답변인 경우 (개선된 처리)
@@ -2850,12 +2926,12 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
             field_value = extract_field_value(user_input, current_field, field_config)
             field_category = current_field
         
-        print(f"[DEBUG] 답변 처리 결과 - 필드: {field_category}, 값: {field_value}")
+        logger.debug("답변 처리 결과 - 필드: %s, 값: %s", field_category, field_value)
         
         # 값이 유효한지 확인 (빈 문자열이나 의미없는 값이 아닌지)
         invalid_values = ["ai 채용공고 등록 도우미", "채용공고 등록 도우미", "ai 어시스턴트", "채용공고", "도우미", "ai"]
         if not field_value or not field_value.strip() or field_value.lower() in invalid_values:
-            print(f"[DEBUG] 유효하지 않은 값으로 인식됨: {field_value}")
+            logger.debug("유효하지 않은 값으로 인식됨: %s", field_value)
             # 유효하지 않은 값이면 명확하지 않은 입력으로 처리
             field_suggestions = get_field_suggestions(current_field, {})
             response = {
@@ -2866,7 +2942,7 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
                 "confidence": 0.7,
                 "is_unclear": True
             }
-            print(f"[DEBUG] 유효하지 않은 값으로 인한 명확하지 않은 입력 응답: {response}")
+            log_payload(logger, "유효하지 않은 값으로 인한 명확하지 않은 입력 응답: %s", response)
             return response
         
         # 필드별 다음 질문 매핑 (AI 어시스턴트 필드 순서에 맞춤)
@@ -2908,14 +2984,14 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
         # 현재 필드에 대한 다음 질문이 있는지 확인
         next_question = ""
         next_suggestions = []
-        print(f"[DEBUG] 현재 필드 '{current_field}'에 대한 다음 질문 확인")
-        print(f"[DEBUG] field_questions 키들: {list(field_questions.keys())}")
+        logger.debug("현재 필드 '%s'에 대한 다음 질문 확인", current_field)
+        logger.debug("field_questions 키들: %s", list(field_questions.keys()))
         if current_field in field_questions:
             next_question = field_questions[current_field]["question"]
             next_suggestions = field_questions[current_field]["suggestions"]
-            print(f"[DEBUG] 다음 질문 찾음: {next_question}")
+            logger.debug("다음 질문 찾음: %s", next_question)
         else:
-            print(f"[DEBUG] 현재 필드 '{current_field}'에 대한 다음 질문이 정의되지 않음")
+            logger.debug("현재 필드 '%s'에 대한 다음 질문이 정의되지 않음", current_field)
         
         # 응답 메시지에 다음 질문 포함
         if next_question:
@@ -2944,27 +3020,35 @@ async def simulate_llm_response(user_input: str, current_field: str, session: Di
             "next_question": next_question,
             "is_conversation": False  # 필드 값이 추출되었으므로 대화형이 아님
         }
-        print(f"[DEBUG] ===== simulate_llm_response 결과 =====")
-        print(f"[DEBUG] 최종 결과: {response}")
-        print("[DEBUG] ===== simulate_llm_response 완료 =====")
+        logger.debug("===== simulate_llm_response 결과 =====")
+        log_payload(logger, "최종 결과: %s", response)
+        logger.debug("===== simulate_llm_response 완료 =====")
         return response
 
-async def call_ai_api(prompt: str, conversation_history: List[Dict[str, Any]] = None) -> str:
+async def call_ai_api(prompt: str, conversation_history: List[Dict[str, Any]] = None,
+                      endpoint: str = "call_ai_api", use_cache: bool = True, stream: bool = False) -> str:
     """
-    AI API 호출 함수 (Gemini 메인)
+    AI API 호출 함수 (Gemini 메인, 같은 프롬프트/히스토리는 LLM 응답 캐시 사용)
+    
+    stream=True는 사용자에게 그대로 보여줄 답변에만 지정합니다. 스트리밍 엔드포인트에서 호출되면
+    토큰을 바로 클라이언트로 전달하고, 추출/분류 같은 내부 프롬프트는 항상 비스트리밍으로 호출합니다.
     """
     try:
         # Gemini 서비스가 사용 가능한 경우 사용
         if gemini_service and gemini_service.client:
-            print("[DEBUG] Gemini 서비스를 사용하여 응답 생성")
-            response = await gemini_service.generate_response(prompt, conversation_history)
+            logger.debug("Gemini 서비스를 사용하여 응답 생성")
+            if stream and is_streaming():
+                # 스트리밍 엔드포인트의 사용자 응답이면 토큰을 바로 클라이언트로 전달
+                return await relay_stream(gemini_service.generate_streaming_response(prompt, conversation_history))
+            response = await gemini_service.generate_response(prompt, conversation_history,
+                                                              endpoint=endpoint, use_cache=use_cache)
             return response
         else:
             # 임시 테스트 응답 (API 키가 없을 때)
             return "안녕하세요! 채용 전문 어시스턴트입니다. GOOGLE_API_KEY를 설정하면 더 정확한 답변을 드릴 수 있습니다."
         
     except Exception as e:
-        print(f"[ERROR] AI API 호출 실패: {e}")
+        logger.error("AI API 호출 실패: %s", e)
         traceback.print_exc()
         return f"AI 응답을 가져오는 데 실패했습니다. 다시 시도해 주세요. (오류: {str(e)})"
 
@@ -3045,75 +3129,78 @@ async def call_gemini_api_backup(prompt: str, conversation_history: List[Dict[st
         return response.text
         
     except Exception as e:
-        print(f"[ERROR] Gemini API 백업 호출 실패: {e}")
+        logger.error("Gemini API 백업 호출 실패: %s", e)
         traceback.print_exc()
         return f"AI 응답을 가져오는 데 실패했습니다. 다시 시도해 주세요. (오류: {str(e)})"
 
 @router.post("/suggestions")
 async def get_suggestions(request: SuggestionsRequest):
     """필드별 제안 가져오기"""
-    print("[DEBUG] /suggestions 요청:", request)
+    log_payload(logger, "/suggestions 요청: %s", request)
     suggestions = get_field_suggestions(request.field, request.context)
     response = {"suggestions": suggestions}
-    print("[DEBUG] /suggestions 응답:", response)
+    log_payload(logger, "/suggestions 응답: %s", response)
     return response
 
 @router.post("/validate")
 async def validate_field(request: ValidationRequest):
     """필드 값 검증"""
-    print("[DEBUG] /validate 요청:", request)
+    log_payload(logger, "/validate 요청: %s", request)
     validation_result = validate_field_value(request.field, request.value, request.context)
     response = validation_result
-    print("[DEBUG] /validate 응답:", response)
+    log_payload(logger, "/validate 응답: %s", response)
     return response
 
 @router.post("/autocomplete")
 async def smart_autocomplete(request: AutoCompleteRequest):
     """스마트 자동 완성"""
-    print("[DEBUG] /autocomplete 요청:", request)
+    log_payload(logger, "/autocomplete 요청: %s", request)
     suggestions = get_autocomplete_suggestions(request.partial_input, request.field, request.context)
     response = {"completions": completions}
-    print("[DEBUG] /autocomplete 응답:", response)
+    log_payload(logger, "/autocomplete 응답: %s", response)
     return response
 
 @router.post("/recommendations")
 async def get_recommendations(request: RecommendationsRequest):
     """컨텍스트 기반 추천"""
-    print("[DEBUG] /recommendations 요청:", request)
+    log_payload(logger, "/recommendations 요청: %s", request)
     recommendations = get_contextual_recommendations(request.current_field, request.filled_fields, request.context)
     response = {"recommendations": recommendations}
-    print("[DEBUG] /recommendations 응답:", response)
+    log_payload(logger, "/recommendations 응답: %s", response)
     return response
 
 @router.post("/update-field")
 async def update_field_in_realtime(request: FieldUpdateRequest):
     """실시간 필드 업데이트"""
-    print("[DEBUG] /update-field 요청:", request)
-    if request.session_id in modal_sessions:
-        modal_sessions[request.session_id]["filled_fields"][request.field] = request.value
+    log_payload(logger, "/update-field 요청: %s", request)
+    async with modal_sessions.lock(request.session_id):
+        session = await modal_sessions.get(request.session_id)
+        if session is not None:
+            session["filled_fields"][request.field] = request.value
+            await modal_sessions.save(request.session_id, session)
+    if session is not None:
         response = {"status": "success", "message": "필드가 업데이트되었습니다."}
-        print("[DEBUG] /update-field 응답:", response)
+        log_payload(logger, "/update-field 응답: %s", response)
         return response
     else:
-        print("[ERROR] /update-field 유효하지 않은 세션:", request.session_id)
+        logger.warning("/update-field 유효하지 않은 세션: %s", request.session_id)
         raise HTTPException(status_code=400, detail="유효하지 않은 세션입니다")
 
 @router.post("/end")
 async def end_session(request: dict):
     """세션 종료"""
-    print("[DEBUG] /end 요청:", request)
+    log_payload(logger, "/end 요청: %s", request)
     session_id = request.get("session_id")
-    if session_id in sessions:
-        del sessions[session_id]
-    if session_id in modal_sessions:
-        del modal_sessions[session_id]
+    if session_id:
+        await sessions.delete(session_id)
+        await modal_sessions.delete(session_id)
     response = {"status": "success", "message": "세션이 종료되었습니다."}
-    print("[DEBUG] /end 응답:", response)
+    log_payload(logger, "/end 응답: %s", response)
     return response
 
 def get_questions_for_page(page: str) -> List[Dict[str, Any]]:
     """페이지별 질문 목록"""
-    print("[DEBUG] get_questions_for_page 요청:", page)
+    logger.debug("get_questions_for_page 요청: %s", page)
     questions_map = {
         "job_posting": [
             {"field": "department", "question": "구인 부서를 알려주세요."},
@@ -3127,12 +3214,12 @@ def get_questions_for_page(page: str) -> List[Dict[str, Any]]:
         ]
     }
     questions = questions_map.get(page, [])
-    print("[DEBUG] get_questions_for_page 응답:", questions)
+    log_payload(logger, "get_questions_for_page 응답: %s", questions)
     return questions
 
 def get_field_suggestions(field: str, context: Dict[str, Any]) -> List[str]:
     """필드별 제안 목록"""
-    print("[DEBUG] get_field_suggestions 요청:", field, context)
+    log_payload(logger, "get_field_suggestions 요청: %s %s", field, context)
     suggestions_map = {
         "department": ["개발", "기획", "마케팅", "디자인", "인사", "영업"],
         "headcount": ["1명", "2명", "3명", "5명", "10명"],
@@ -3151,31 +3238,31 @@ def get_field_suggestions(field: str, context: Dict[str, Any]) -> List[str]:
         "email": ["hr@company.com", "recruit@company.com"]
     }
     suggestions = suggestions_map.get(field, [])
-    print("[DEBUG] get_field_suggestions 응답:", suggestions)
+    log_payload(logger, "get_field_suggestions 응답: %s", suggestions)
     return suggestions
 
 def validate_field_value(field: str, value: str, context: Dict[str, Any]) -> Dict[str, Any]:
     """필드 값 검증"""
-    print("[DEBUG] validate_field_value 요청:", field, value, context)
+    log_payload(logger, "validate_field_value 요청: %s %s %s", field, value, context)
     if field == "email" and "@" not in value:
         response = {"valid": False, "message": "올바른 이메일 형식을 입력해주세요."}
-        print("[DEBUG] validate_field_value 응답 (이메일 형식 오류):", response)
+        logger.debug("validate_field_value 응답 (이메일 형식 오류): %s", response)
         return response
     elif field == "headcount" and not any(char.isdigit() for char in value):
         response = {"valid": False, "message": "숫자를 포함한 인원 수를 입력해주세요."}
-        print("[DEBUG] validate_field_value 응답 (헤드카운트 숫자 오류):", response)
+        logger.debug("validate_field_value 응답 (헤드카운트 숫자 오류): %s", response)
         return response
     else:
         response = {"valid": True, "message": "올바른 형식입니다."}
-        print("[DEBUG] validate_field_value 응답 (유효):", response)
+        log_payload(logger, "validate_field_value 응답 (유효): %s", response)
         return response
 
 def get_autocomplete_suggestions(partial_input: str, field: str, context: Dict[str, Any]) -> List[str]:
     """자동 완성 제안"""
-    print("[DEBUG] get_autocomplete_suggestions 요청:", partial_input, field, context)
+    log_payload(logger, "get_autocomplete_suggestions 요청: %s %s %s", partial_input, field, context)
     suggestions = get_field_suggestions(field, context)
     completions = [s for s in suggestions if partial_input.lower() in s.lower()]
-    print("[DEBUG] get_autocomplete_suggestions 응답:", completions)
+    log_payload(logger, "get_autocomplete_suggestions 응답: %s", completions)
     return completions
 
 def get_contextual_recommendations(current_field: str, filled_fields: Dict[str, Any], context: Dict[str, Any]) -> List[str]:
@@ -3257,7 +3344,7 @@ async def chat_endpoint(request: ChatbotRequest):
     """
     키워드 기반 1차 분류 → LLM 호출 → 응답 처리 API
     """
-    print("[DEBUG] /chat 요청:", request)
+    log_payload(logger, "/chat 요청: %s", request)
     
     try:
         user_input = request.user_input
@@ -3265,9 +3352,9 @@ async def chat_endpoint(request: ChatbotRequest):
         mode = request.mode
         
         # 인코딩 문제 해결을 위한 디버깅
-        print(f"[DEBUG] 원본 user_input: {user_input}")
-        print(f"[DEBUG] user_input 길이: {len(user_input)}")
-        print(f"[DEBUG] user_input 타입: {type(user_input)}")
+        log_payload(logger, "원본 user_input: %s", user_input)
+        logger.debug("user_input 길이: %s", len(user_input))
+        logger.debug("user_input 타입: %s", type(user_input))
 
         # 개선된 인코딩 처리
         try:
@@ -3284,14 +3371,14 @@ async def chat_endpoint(request: ChatbotRequest):
                         # 실패하면 원본 유지
                         pass
         except Exception as e:
-            print(f"[DEBUG] 인코딩 처리 실패: {e}")
+            logger.warning("인코딩 처리 실패: %s", e)
             # 인코딩 처리 실패 시 원본 유지
         
-        print(f"[DEBUG] 처리된 user_input: {user_input}")
+        log_payload(logger, "처리된 user_input: %s", user_input)
         
         # 깨진 텍스트 감지 및 처리
         if "????" in user_input:
-            print(f"[DEBUG] 깨진 텍스트 감지됨 - 길이 기반 분류 사용")
+            logger.debug("깨진 텍스트 감지됨 - 길이 기반 분류 사용")
             # 깨진 텍스트의 경우 길이로 분류
             if len(user_input) > 20:
                 classification = {'type': 'job_posting_info', 'category': '채용정보', 'confidence': 0.8}
@@ -3306,8 +3393,8 @@ async def chat_endpoint(request: ChatbotRequest):
         
         # 자유 텍스트 모드 처리
         if mode == "free_text":
-            print(f"[DEBUG] current_page: {request.current_page}")
-            print(f"[DEBUG] request dict: {request.dict()}")
+            logger.debug("current_page: %s", request.current_page)
+            log_payload(logger, "request dict: %s", request.dict())
             # 페이지별 분석 함수 선택
             if request.current_page == "resume_analysis":
                 extracted_data = extract_resume_info_from_text(user_input)
@@ -3349,17 +3436,17 @@ async def chat_endpoint(request: ChatbotRequest):
                 "extracted_data": extracted_data,  # JSON 데이터 추가
                 "confidence": 0.9
             }
-            print(f"[DEBUG] /chat 자유 텍스트 모드 응답 ({page_type}):", response)
+            log_payload(logger, "/chat 자유 텍스트 모드 응답 (%s): %s", page_type, response)
             return response
         
         # AI 어시스턴트 모드 처리 추가 (랭그래프 모드가 아닌 경우에만 강력 키워드 적용)
         if mode == "ai_assistant":
-            print(f"[DEBUG] AI 어시스턴트 모드 처리 시작 - 입력: {user_input}")
+            log_payload(logger, "AI 어시스턴트 모드 처리 시작 - 입력: %s", user_input)
             # 작성 완료 요청인지 확인 (랭그래프 모드에서는 강력 키워드 적용 안함)
             completion_keywords = ['작성해줘', '만들어줘', '등록해줘', '완료', '끝']
             is_completion_request = any(keyword in user_input for keyword in completion_keywords)
-            print(f"[DEBUG] AI 어시스턴트 모드 완료 요청 감지: {is_completion_request}")
-            print(f"[DEBUG] AI 어시스턴트 모드 입력에서 키워드 확인: {[kw for kw in completion_keywords if kw in user_input]}")
+            logger.debug("AI 어시스턴트 모드 완료 요청 감지: %s", is_completion_request)
+            logger.debug("AI 어시스턴트 모드 입력에서 키워드 확인: %s", [kw for kw in completion_keywords if kw in user_input])
             
             if is_completion_request:
                 response = {
@@ -3380,27 +3467,27 @@ async def chat_endpoint(request: ChatbotRequest):
                 }
             else:
                 # AI 어시스턴트 모드에서는 RAG를 활용한 전문적인 답변 제공
-                ai_response = await call_ai_api(user_input, conversation_history)
+                ai_response = await call_ai_api(user_input, conversation_history, stream=True)
                 response = {
                     "type": "ai_assistant",
                     "content": ai_response,
                     "confidence": 0.95
                 }
-            print("[DEBUG] /chat AI 어시스턴트 모드 응답:", response)
+            log_payload(logger, "/chat AI 어시스턴트 모드 응답: %s", response)
             return response
         
         # 개별입력모드 처리 추가 (랭그래프 모드가 아닌 경우에만 강력 키워드 적용)
         if mode == "individual_input":
-            print(f"[DEBUG] 개별입력모드 처리 시작 - 입력: {user_input}")
+            log_payload(logger, "개별입력모드 처리 시작 - 입력: %s", user_input)
             # 개별입력모드에서는 각 필드를 하나씩 입력받는 방식
             classification = classify_input_with_context(user_input, None)
-            print(f"[DEBUG] 개별입력모드 분류 결과: {classification}")
+            log_payload(logger, "개별입력모드 분류 결과: %s", classification)
             
             # 작성 완료 요청인지 확인 (랭그래프 모드에서는 강력 키워드 적용 안함)
             completion_keywords = ['작성해줘', '만들어줘', '등록해줘', '완료', '끝']
             is_completion_request = any(keyword in user_input for keyword in completion_keywords)
-            print(f"[DEBUG] 개별입력모드 완료 요청 감지: {is_completion_request}")
-            print(f"[DEBUG] 개별입력모드 입력에서 키워드 확인: {[kw for kw in completion_keywords if kw in user_input]}")
+            logger.debug("개별입력모드 완료 요청 감지: %s", is_completion_request)
+            logger.debug("개별입력모드 입력에서 키워드 확인: %s", [kw for kw in completion_keywords if kw in user_input])
             
             if is_completion_request:
                 response = {
@@ -3431,14 +3518,14 @@ async def chat_endpoint(request: ChatbotRequest):
                 }
             else:
                 # 필드가 아닌 경우 질문으로 처리
-                ai_response = await call_ai_api(user_input, conversation_history)
+                ai_response = await call_ai_api(user_input, conversation_history, stream=True)
                 response = {
                     "type": "question",
                     "content": ai_response,
                     "confidence": 0.8
                 }
             
-            print("[DEBUG] /chat 개별입력모드 응답:", response)
+            log_payload(logger, "/chat 개별입력모드 응답: %s", response)
             return response
         
         # 자율모드 처리 비활성화 (주석 처리)
@@ -3543,7 +3630,7 @@ async def chat_endpoint(request: ChatbotRequest):
         
         # 랭그래프 모드 처리 추가 (강력 키워드 적용 안함)
         if mode == "langgraph":
-            print(f"[DEBUG] 랭그래프 모드 처리 시작 - 입력: {user_input}")
+            log_payload(logger, "랭그래프 모드 처리 시작 - 입력: %s", user_input)
             
             # 랭그래프 모드에서는 강력 키워드('제출', '등록' 등)를 일반 대화로 처리
             completion_keywords = ['작성해줘', '만들어줘', '등록해줘', '완료', '끝', '제출', '등록']
@@ -3551,13 +3638,13 @@ async def chat_endpoint(request: ChatbotRequest):
             
             if is_completion_request:
                 # 강력 키워드가 있어도 일반 대화로 처리
-                print(f"[DEBUG] 랭그래프 모드에서 강력 키워드 감지됨: {[kw for kw in completion_keywords if kw in user_input]}")
-                print(f"[DEBUG] 랭그래프 모드에서는 강력 키워드를 일반 대화로 처리합니다.")
+                logger.debug("랭그래프 모드에서 강력 키워드 감지됨: %s", [kw for kw in completion_keywords if kw in user_input])
+                logger.debug("랭그래프 모드에서는 강력 키워드를 일반 대화로 처리합니다.")
             
             try:
                 # Agent 시스템을 사용하여 요청 처리
                 session_id = request.session_id or str(uuid.uuid4())
-                result = agent_system.process_request(
+                result = await agent_system.process_request_async(
                     user_input=user_input,
                     conversation_history=conversation_history,
                     session_id=session_id
@@ -3577,11 +3664,11 @@ async def chat_endpoint(request: ChatbotRequest):
                         "confidence": 0.5
                     }
                 
-                print("[DEBUG] /chat 랭그래프 모드 응답:", response)
+                log_payload(logger, "/chat 랭그래프 모드 응답: %s", response)
                 return response
                 
             except Exception as e:
-                print(f"[DEBUG] 랭그래프 모드 처리 중 오류: {str(e)}")
+                logger.warning("랭그래프 모드 처리 중 오류: %s", str(e))
                 response = {
                     "type": "langgraph_error",
                     "content": f"랭그래프 모드 처리 중 오류가 발생했습니다: {str(e)}",
@@ -3590,7 +3677,7 @@ async def chat_endpoint(request: ChatbotRequest):
                 return response
         
         # 1) 키워드 기반 1차 분류 (이미 위에서 처리됨)
-        print(f"[DEBUG] /chat 분류 결과: {classification}")
+        log_payload(logger, "/chat 분류 결과: %s", classification)
         
         # 2) 분류된 결과에 따른 처리
         if classification['type'] == 'field':
@@ -3605,7 +3692,7 @@ async def chat_endpoint(request: ChatbotRequest):
             
         elif classification['type'] == 'question':
             # 3) AI API 호출로 답변 생성
-            ai_response = await call_ai_api(user_input, conversation_history)
+            ai_response = await call_ai_api(user_input, conversation_history, stream=True)
             response = {
                 "type": "answer",
                 "content": ai_response,
@@ -3649,7 +3736,7 @@ async def chat_endpoint(request: ChatbotRequest):
             
         elif classification['type'] == 'answer' and any(keyword in user_input for keyword in ['작성해줘', '만들어줘', '등록해줘', '완료', '끝']):
             # 작성 완료 요청 처리 - 다음 단계 안내
-            print(f"[DEBUG] 완료 키워드 감지됨: {user_input}")
+            log_payload(logger, "완료 키워드 감지됨: %s", user_input)
             response = {
                 "type": "completion_guide",
                 "content": """✅ 채용공고 작성이 완료되었습니다!
@@ -3676,20 +3763,30 @@ async def chat_endpoint(request: ChatbotRequest):
                 "confidence": classification['confidence']
             }
         
-        print("[DEBUG] /chat 응답:", response)
+        log_payload(logger, "/chat 응답: %s", response)
         return response
         
     except Exception as e:
-        print(f"[ERROR] /chat 예외: {e}")
+        logger.error("/chat 예외: %s", e)
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"처리 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatbotRequest, http_request: Request):
+    """/chat의 SSE 스트리밍 버전 (LLM 답변은 token 이벤트로, 분류/필드 추출 결과는 result 이벤트로)"""
+    return sse_response(http_request, lambda: chat_endpoint(request))
+
+@router.get("/stream-stats")
+async def stream_stats():
+    """스트리밍 엔드포인트 시작/완료/연결 끊김 통계"""
+    return get_stream_stats()
+
 @router.post("/test-mode-chat")
 async def test_mode_chat(request: ChatbotRequest):
     """테스트중 모드 채팅 처리 - LangGraph 기반 Agent 시스템"""
     try:
         # Agent 시스템을 사용하여 요청 처리
-        result = agent_system.process_request(
+        result = await agent_system.process_request_async(
             user_input=request.user_input,
             conversation_history=request.conversation_history
         )
@@ -3720,8 +3817,8 @@ async def generate_title_recommendations(request: dict):
         form_data = request.get('form_data', {})
         content = request.get('content', '')
         
-        print(f"[DEBUG] 제목 추천 요청 - form_data: {form_data}")
-        print(f"[DEBUG] 제목 추천 요청 - content: {content}")
+        log_payload(logger, "제목 추천 요청 - form_data: %s", form_data)
+        log_payload(logger, "제목 추천 요청 - content: %s", content)
         
         # 폼 데이터에서 주요 정보 추출
         company = form_data.get('company', '회사')
@@ -3816,9 +3913,9 @@ JSON 형식으로 응답해주세요:
             from gemini_service import GeminiService
             gemini_service = GeminiService()
             
-            # 창의성을 높인 응답 생성
-            response = await gemini_service.generate_response(prompt, [])
-            print(f"[DEBUG] Gemini 응답 (창의성 모드): {response}")
+            # 창의성을 높인 응답 생성 (다시 요청하면 새 제목을 받아야 하므로 캐시 사용 안 함)
+            response = await gemini_service.generate_response(prompt, [], endpoint="generate-title", use_cache=False)
+            log_payload(logger, "Gemini 응답 (창의성 모드): %s", response)
             
             # JSON 파싱 시도
             import json
@@ -3871,7 +3968,7 @@ JSON 형식으로 응답해주세요:
                 return {"titles": formatted_titles}
                 
         except Exception as ai_error:
-            print(f"[DEBUG] AI 제목 생성 실패: {ai_error}")
+            logger.warning("AI 제목 생성 실패: %s", ai_error)
         
         # AI 실패 시 기본 제목 생성 (4가지 컨셉)
         default_titles = []
@@ -3930,7 +4027,7 @@ JSON 형식으로 응답해주세요:
         return {"titles": default_titles}
         
     except Exception as e:
-        print(f"[ERROR] 제목 추천 생성 중 오류: {e}")
+        logger.error("제목 추천 생성 중 오류: %s", e)
         traceback.print_exc()
         
         # 오류 시에도 기본 제목들 반환 (4가지 컨셉)
@@ -3969,22 +4066,22 @@ def has_field_keywords(text: str, field: str) -> bool:
 
 async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any], session: Dict[str, Any]) -> Dict[str, Any]:
     """AI 도우미용 응답 생성 (개선된 Gemini API 사용)"""
-    print("[DEBUG] ===== AI 어시스턴트 응답 생성 시작 =====")
-    print("[DEBUG] 사용자 입력:", user_input)
-    print("[DEBUG] 현재 필드:", field)
-    print("[DEBUG] 세션 정보:", session)
+    logger.debug("===== AI 어시스턴트 응답 생성 시작 =====")
+    log_payload(logger, "사용자 입력: %s", user_input)
+    logger.debug("현재 필드: %s", field)
+    log_payload(logger, "세션 정보: %s", session)
     
     field_key = field.get("key", "")
     field_label = field.get("label", "")
-    print(f"[DEBUG] 필드 키: {field_key}, 필드 라벨: {field_label}")
+    logger.debug("필드 키: %s, 필드 라벨: %s", field_key, field_label)
     
     # 1) 키워드 기반 1차 분류
     classification = classify_input(user_input)
-    print(f"[DEBUG] 분류 결과: {classification}")
-    print(f"[DEBUG] 분류 타입: {classification.get('type')}")
-    print(f"[DEBUG] 분류 카테고리: {classification.get('category')}")
-    print(f"[DEBUG] 분류 값: {classification.get('value')}")
-    print(f"[DEBUG] 신뢰도: {classification.get('confidence')}")
+    log_payload(logger, "분류 결과: %s", classification)
+    logger.debug("분류 타입: %s", classification.get('type'))
+    logger.debug("분류 카테고리: %s", classification.get('category'))
+    logger.debug("분류 값: %s", classification.get('value'))
+    logger.debug("신뢰도: %s", classification.get('confidence'))
     
     # 2) 분류된 결과에 따른 처리
     if classification['type'] == 'question':
@@ -4025,7 +4122,7 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
 
 이 질문에 대해 채용 공고 작성에 도움이 되는 실무적인 답변을 제공해주세요.
 """
-            ai_response = await call_ai_api(ai_assistant_context)
+            ai_response = await call_ai_api(ai_assistant_context, stream=True)
             
             # 응답을 항목별로 분할
             items = parse_response_items(ai_response)
@@ -4039,11 +4136,11 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
                 "items": items,
                 "show_item_selection": True  # 항목 선택 UI 표시
             }
-            print(f"[DEBUG] 질문 응답 (항목 선택 포함): {response}")
+            log_payload(logger, "질문 응답 (항목 선택 포함): %s", response)
             return response
             
         except Exception as e:
-            print(f"[ERROR] Gemini API 호출 실패: {e}")
+            logger.error("Gemini API 호출 실패: %s", e)
             # 오프라인 응답으로 대체
             response = {
                 "message": f"'{user_input}'에 대한 답변을 제공해드리겠습니다. 현재 필드 '{field_label}'에 대한 정보를 입력해주세요.",
@@ -4062,7 +4159,7 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
             "suggestions": [],
             "confidence": classification['confidence']
         }
-        print(f"[DEBUG] 일상 대화 응답: {response}")
+        log_payload(logger, "일상 대화 응답: %s", response)
         return response
     else:
         # 답변인 경우 (개선된 처리)
@@ -4151,7 +4248,7 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
                 field_value = extract_field_value(user_input, field_key, field_config)
         else:
             field_value = classification.get('value', user_input)
-        print(f"[DEBUG] 답변 처리 결과 - 필드: {field_key}, 값: {field_value}")
+        logger.debug("답변 처리 결과 - 필드: %s, 값: %s", field_key, field_value)
         
         response = {
             "message": f"'{field_label}'에 대해 '{field_value}'로 입력하겠습니다.",
@@ -4160,9 +4257,9 @@ async def generate_ai_assistant_response(user_input: str, field: Dict[str, Any],
             "suggestions": [],
             "confidence": classification['confidence']
         }
-        print(f"[DEBUG] ===== AI 어시스턴트 응답 생성 완료 =====")
-        print(f"[DEBUG] 최종 결과: {response}")
-        print("[DEBUG] ===== AI 어시스턴트 응답 생성 완료 =====")
+        logger.debug("===== AI 어시스턴트 응답 생성 완료 =====")
+        log_payload(logger, "최종 결과: %s", response)
+        logger.debug("===== AI 어시스턴트 응답 생성 완료 =====")
         return response
 
 # 페이지별 UI 구조 정의
@@ -4190,10 +4287,10 @@ async def universal_chatbot_handler(
     """
     범용 챗봇 핸들러 - 모든 페이지에서 사용 가능
     """
-    print(f"[DEBUG] ===== universal_chatbot_handler 시작 =====")
-    print(f"[DEBUG] user_input: {user_input}")
-    print(f"[DEBUG] page_id: {page_id}")
-    print(f"[DEBUG] current_state: {current_state}")
+    logger.debug("===== universal_chatbot_handler 시작 =====")
+    log_payload(logger, "user_input: %s", user_input)
+    logger.debug("page_id: %s", page_id)
+    logger.debug("current_state: %s", current_state)
     
     # 페이지 설정 가져오기
     page_config = PAGE_CONFIGS.get(page_id)
@@ -4205,7 +4302,7 @@ async def universal_chatbot_handler(
     
     # 1. 사용자 입력 분석 (질문인지 답변인지)
     input_type = analyze_user_input(user_input)
-    print(f"[DEBUG] 입력 타입: {input_type}")
+    logger.debug("입력 타입: %s", input_type)
     
     if input_type == 'question':
         # 사용자가 질문한 경우 - LLM으로 답변
@@ -4278,7 +4375,7 @@ async def handle_user_question(user_input: str, page_id: str, current_state: dic
 답변은 간결하고 실용적으로 해주세요.
 """
         
-        ai_response = await call_ai_api(prompt, conversation_history)
+        ai_response = await call_ai_api(prompt, conversation_history, stream=True)
         
         return {
             'message': ai_response,
@@ -4287,7 +4384,7 @@ async def handle_user_question(user_input: str, page_id: str, current_state: dic
         }
         
     except Exception as e:
-        print(f"[ERROR] LLM 호출 실패: {e}")
+        logger.error("LLM 호출 실패: %s", e)
         return {
             'message': f"'{user_input}'에 대한 답변을 제공해드리겠습니다. 현재 페이지의 정보를 입력해주세요.",
             'is_conversation': True,
@@ -4424,7 +4521,7 @@ async def langgraph_agent_endpoint(request: dict):
         session_id = request.get("session_id", str(uuid.uuid4()))
         
         # Agent 시스템 호출
-        result = agent_system.process_request(
+        result = await agent_system.process_request_async(
             user_input=user_input,
             conversation_history=conversation_history,
             session_id=session_id
@@ -0,0 +1,111 @@
+from typing import List, Dict, Any, Iterator, Tuple
+from datetime import datetime
+from pymongo import UpdateOne, DeleteMany
+from pymongo.errors import OperationFailure
+
+def split_text_windows(text: str, chunk_size: int, chunk_overlap: int) -> Iterator[Tuple[int, int, str]]:
+    """
+    텍스트를 고정 길이 윈도우(겹침 포함)로 나눕니다. 공백뿐인 윈도우는 건너뜁니다.
+
+    Args:
+        text (str): 원본 텍스트
+        chunk_size (int): 청크 길이
+        chunk_overlap (int): 이전 청크와 겹치는 길이
+
+    Yields:
+        Tuple[int, int, str]: (시작 위치, 끝 위치, 청크 텍스트)
+    """
+    text_length = len(text)
+    start = 0
+    while start < text_length:
+        end = min(start + chunk_size, text_length)
+        chunk_text = text[start:end]
+        if chunk_text.strip():  # 빈 청크는 제외
+            yield start, end, chunk_text
+        if end >= text_length:  # 마지막 윈도우 이후에는 앞 청크에 포함된 꼬리 청크를 만들지 않음
+            break
+
+        next_start = end - chunk_overlap if chunk_overlap > 0 else end
+        if next_start <= start:  # 겹침이 청크 길이 이상이면 진행하지 않으므로 겹침 없이 이동
+            next_start = end
+        start = next_start
+
+
+class ChunkStore:
+    # 청크 문서의 고유 키
+    KEY_FIELDS = ("resume_id", "field_name", "chunk_index")
+
+    def __init__(self, collection):
+        """
+        이력서 청크 저장소 (Motor 컬렉션)
+
+        청크는 (resume_id, field_name, chunk_index) 키로 멱등 업서트되며,
+        한 번의 unordered bulk_write로 저장됩니다.
+
+        Args:
+            collection: resume_chunks Motor 컬렉션
+        """
+        self.collection = collection
+
+    async def create_indexes(self):
+        """청크 키 복합 인덱스 생성 (get_resume_chunks 조회도 이 인덱스의 prefix를 사용)"""
+        keys = [(field, 1) for field in self.KEY_FIELDS]
+        try:
+            await self.collection.create_index(keys, unique=True)
+        except OperationFailure as e:
+            # 이전 insert_one 방식으로 생긴 중복 청크가 있으면 고유 제약 없이 조회용 인덱스만 생성
+            print(f"[ChunkStore] 고유 인덱스 생성 실패 (중복 청크 존재): {e}")
+            await self.collection.create_index(keys)
+
+    async def save_chunks(self, resume_id: str, chunks_by_field: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        필드별 청크를 한 번의 bulk_write로 업서트하고, 재처리로 줄어든 이전 청크는 삭제합니다.
+
+        Args:
+            resume_id (str): 이력서 ID
+            chunks_by_field (Dict[str, List[Dict[str, Any]]]): 필드명 -> 청크 문서 목록 (chunk_index 순서)
+
+        Returns:
+            List[Dict[str, Any]]: "id"가 채워진 저장된 청크 문서 목록
+        """
+        now = datetime.now()
+        operations = []
+        chunks = []
+        for field_name, field_chunks in chunks_by_field.items():
+            for chunk in field_chunks:
+                key = {field: chunk[field] for field in self.KEY_FIELDS}
+                document = {k: v for k, v in chunk.items() if k not in ("created_at", "id", "_id")}
+                document["updated_at"] = now
+                operations.append(UpdateOne(
+                    key,
+                    {"$set": document, "$setOnInsert": {"created_at": chunk.get("created_at", now)}},
+                    upsert=True
+                ))
+                chunks.append(chunk)
+            # 이전 처리에서 더 많이 생성되었던 청크 제거
+            operations.append(DeleteMany({
+                "resume_id": resume_id,
+                "field_name": field_name,
+                "chunk_index": {"$gte": len(field_chunks)}
+            }))
+
+        if not operations:
+            return []
+        await self.collection.bulk_write(operations, ordered=False)
+
+        # 업서트된 문서와 기존 문서의 _id를 한 번의 조회로 채움
+        ids = {}
+        cursor = self.collection.find(
+            {"resume_id": resume_id, "field_name": {"$in": list(chunks_by_field)}},
+            {"field_name": 1, "chunk_index": 1}
+        )
+        async for doc in cursor:
+            ids[(doc["field_name"], doc["chunk_index"])] = str(doc["_id"])
+        for chunk in chunks:
+            chunk["id"] = ids.get((chunk["field_name"], chunk["chunk_index"]))
+        return chunks
+
+    async def get_resume_chunks(self, resume_id: str, limit: int = 1000) -> List[Dict[str, Any]]:
+        """이력서의 청크를 필드/순서대로 조회합니다. (고유 인덱스 사용)"""
+        cursor = self.collection.find({"resume_id": resume_id}).sort([("field_name", 1), ("chunk_index", 1)])
+        return await cursor.to_list(limit)
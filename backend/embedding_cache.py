@@ -0,0 +1,260 @@
+import os
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any
+import numpy as np
+
+# 디스크 적중 시 접근 시각(last_access)은 모아 두었다가 이 개수마다(또는 저장 시) 한 번에 기록
+TOUCH_FLUSH_SIZE = 256
+
+class EmbeddingCache:
+    def __init__(self, model_name: str, db_path: Optional[str] = None,
+                 memory_budget_bytes: int = 64 * 1024 * 1024,
+                 disk_budget_bytes: int = 512 * 1024 * 1024):
+        """
+        임베딩 2단계 캐시 (프로세스 내 LRU + SQLite 디스크 저장소)
+
+        키는 모델 이름과 정규화된 텍스트의 해시이므로 모델이 바뀌면 자동으로 분리됩니다.
+
+        Args:
+            model_name (str): 임베딩 모델 이름
+            db_path (Optional[str]): SQLite 파일 경로 (None이면 디스크 캐시 비활성화)
+            memory_budget_bytes (int): 메모리 LRU가 사용할 최대 바이트 수
+            disk_budget_bytes (int): 디스크 캐시가 사용할 최대 바이트 수
+        """
+        self.model_name = model_name
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        # SQLite 연결은 워커 스레드에서 사용하므로 메모리 LRU와 별도 잠금으로 보호
+        self._disk_lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "key TEXT PRIMARY KEY, vector BLOB NOT NULL, "
+                    "nbytes INTEGER NOT NULL, last_access REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON embeddings(last_access)")
+                self._conn.commit()
+                row = self._conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM embeddings").fetchone()
+                self._disk_bytes = row[0]
+            except Exception as e:
+                print(f"[EmbeddingCache] 디스크 캐시 초기화 실패, 메모리 캐시만 사용: {e}")
+                self._conn = None
+
+    @staticmethod
+    def default_path() -> str:
+        """기본 디스크 캐시 경로 (backend/.cache/embeddings.sqlite3)"""
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "embeddings.sqlite3")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """공백과 유니코드 표현 차이를 제거한 캐시용 텍스트를 반환합니다."""
+        text = unicodedata.normalize("NFC", text or "")
+        return " ".join(text.split())
+
+    def make_key(self, text: str) -> str:
+        """모델 이름과 정규화된 텍스트로 캐시 키를 만듭니다."""
+        payload = f"{self.model_name}\x00{self.normalize(text)}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        텍스트별 캐시된 임베딩을 조회합니다.
+
+        Args:
+            texts (List[str]): 조회할 텍스트 리스트
+
+        Returns:
+            List[Optional[np.ndarray]]: 텍스트 순서대로의 임베딩 (없으면 None)
+        """
+        results, disk_lookup = self._lookup_memory([self.make_key(text) for text in texts])
+        return self._fill_from_disk(results, disk_lookup)
+
+    async def get_many_async(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """get_many와 같지만 디스크 조회는 워커 스레드에서 실행합니다. (이벤트 루프 블로킹 방지)"""
+        results, disk_lookup = self._lookup_memory([self.make_key(text) for text in texts])
+        if disk_lookup and self._conn is not None:
+            return await asyncio.to_thread(self._fill_from_disk, results, disk_lookup)
+        return self._fill_from_disk(results, disk_lookup)
+
+    def put_many(self, texts: List[str], vectors: List[np.ndarray]):
+        """
+        임베딩을 메모리와 디스크 캐시에 저장합니다.
+
+        Args:
+            texts (List[str]): 원본 텍스트 리스트
+            vectors (List[np.ndarray]): 텍스트 순서대로의 임베딩
+        """
+        self._write_disk(self._remember_many(texts, vectors))
+
+    async def put_many_async(self, texts: List[str], vectors: List[np.ndarray]):
+        """put_many와 같지만 디스크 저장은 워커 스레드에서 실행합니다."""
+        rows = self._remember_many(texts, vectors)
+        if rows and self._conn is not None:
+            await asyncio.to_thread(self._write_disk, rows)
+
+    def _lookup_memory(self, keys: List[str]):
+        """메모리 LRU 조회 → (결과 리스트, 디스크에서 찾을 키별 인덱스)"""
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+        disk_lookup: Dict[str, List[int]] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                else:
+                    disk_lookup.setdefault(key, []).append(i)
+        return results, disk_lookup
+
+    def _fill_from_disk(self, results: List[Optional[np.ndarray]],
+                        disk_lookup: Dict[str, List[int]]) -> List[Optional[np.ndarray]]:
+        """메모리에 없던 키를 디스크에서 채우고 적중/미스 수를 기록합니다."""
+        loaded = self._load_from_disk(list(disk_lookup)) if disk_lookup and self._conn is not None else {}
+        with self._lock:
+            for key, vector in loaded.items():
+                self._remember(key, vector)
+                for i in disk_lookup.pop(key):
+                    results[i] = vector
+                    self.disk_hits += 1
+            missed = sum(len(indices) for indices in disk_lookup.values())
+            self.misses += missed
+            self.hits += len(results) - missed
+        return results
+
+    def _remember_many(self, texts: List[str], vectors: List[np.ndarray]) -> List[tuple]:
+        """메모리 LRU에 저장하고 디스크에 쓸 행을 반환합니다."""
+        rows = []
+        now = time.time()
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                key = self.make_key(text)
+                vector = np.asarray(vector, dtype=np.float32)
+                self._remember(key, vector)
+                rows.append((key, vector.tobytes(), vector.nbytes, now))
+        return rows
+
+    def _write_disk(self, rows: List[tuple]):
+        """디스크에 행을 저장하고 사용량을 증분 갱신한 뒤 예산을 넘으면 제거합니다."""
+        if not rows or self._conn is None:
+            return
+        with self._disk_lock:
+            try:
+                # 교체되는 기존 항목 크기만 키로 조회 (전체 합계 재계산 없이 증분 갱신)
+                keys = list({row[0] for row in rows})
+                replaced = 0
+                for start in range(0, len(keys), 500):
+                    part = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(part))
+                    replaced += self._conn.execute(
+                        f"SELECT COALESCE(SUM(nbytes), 0) FROM embeddings WHERE key IN ({placeholders})", part
+                    ).fetchone()[0]
+                latest = {row[0]: row for row in rows}
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, nbytes, last_access) VALUES (?, ?, ?, ?)",
+                    list(latest.values())
+                )
+                for key in latest:
+                    self._touched.pop(key, None)
+                self._flush_touches()
+                self._conn.commit()
+                self._disk_bytes += sum(row[2] for row in latest.values()) - replaced
+                self._evict_disk()
+            except Exception as e:
+                print(f"[EmbeddingCache] 디스크 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계와 사용량을 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes if self._conn is not None else 0
+            }
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """메모리 LRU에 항목을 넣고 예산을 초과하면 오래된 항목부터 제거합니다."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes
+
+        while self._memory_bytes > self.memory_budget_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def _load_from_disk(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """디스크에서 키 목록을 한 번에 조회합니다. (접근 시각은 모아서 나중에 기록)"""
+        found: Dict[str, np.ndarray] = {}
+        with self._disk_lock:
+            try:
+                for start in range(0, len(keys), 500):
+                    part = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(part))
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", part
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32).copy()
+                if found:
+                    now = time.time()
+                    self._touched.update((key, now) for key in found)
+                    if len(self._touched) >= TOUCH_FLUSH_SIZE:
+                        self._flush_touches()
+                        self._conn.commit()
+            except Exception as e:
+                print(f"[EmbeddingCache] 디스크 캐시 조회 실패: {e}")
+        return found
+
+    def _flush_touches(self):
+        """모아 둔 접근 시각을 한 번에 기록합니다. (호출자가 _disk_lock을 잡고 commit)"""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict_disk(self):
+        """디스크 사용량이 예산을 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다."""
+        while self._disk_bytes > self.disk_budget_bytes:
+            rows = self._conn.execute(
+                "SELECT key, nbytes FROM embeddings ORDER BY last_access ASC LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            excess = self._disk_bytes - self.disk_budget_bytes
+            victims = []
+            for key, nbytes in rows:
+                victims.append((key,))
+                excess -= nbytes
+                self._disk_bytes -= nbytes
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+            self._conn.commit()
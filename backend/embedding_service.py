@@ -1,46 +1,221 @@
 import os
-from sentence_transformers import SentenceTransformer
-from typing import Optional, List, Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from datetime import datetime
+from embedding_cache import EmbeddingCache
+from lazy_resources import resource_registry
+from instrumentation import span
+from service_metrics import ServiceStats
+
+class EmbeddingBatcher:
+    def __init__(self, encode_fn: Callable[[List[str]], np.ndarray],
+                 max_batch_size: int = 64, max_wait_ms: float = 10.0):
+        """
+        여러 코루틴의 임베딩 요청을 모아 마이크로 배치로 인코딩합니다.
+
+        Args:
+            encode_fn (Callable): 텍스트 리스트를 (N, dim) 배열로 인코딩하는 동기 함수
+            max_batch_size (int): 한 번에 인코딩할 최대 (중복 제거 후) 텍스트 수
+            max_wait_ms (float): 배치를 모으기 위해 기다리는 최대 시간 (밀리초)
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        # 모델 인코딩은 스레드 하나에서 직렬로 실행 (이벤트 루프 블로킹 방지)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_count = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트들을 현재 배치에 추가하고 인코딩 결과를 기다립니다.
+
+        Args:
+            texts (List[str]): 인코딩할 텍스트 리스트
+
+        Returns:
+            np.ndarray: (len(texts), dim) float32 배열
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((list(texts), future))
+        self._pending_count += len(texts)
+
+        if self._pending_count >= self.max_batch_size:
+            self._flush(loop)
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush, loop)
+
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop):
+        """대기 중인 요청들을 하나의 배치로 묶어 인코딩을 시작합니다."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        self._pending_count = 0
+        if batch:
+            task = loop.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[List[str], asyncio.Future]]):
+        """배치 내 동일 텍스트를 한 번만 인코딩하고 결과를 각 요청에 분배합니다."""
+        unique_texts: List[str] = []
+        positions: Dict[str, int] = {}
+        for texts, _ in batch:
+            for text in texts:
+                if text not in positions:
+                    positions[text] = len(unique_texts)
+                    unique_texts.append(text)
+
+        try:
+            loop = asyncio.get_running_loop()
+            vectors = await loop.run_in_executor(self._executor, self.encode_fn, unique_texts)
+            vectors = np.asarray(vectors, dtype=np.float32)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for texts, future in batch:
+            if future.done():
+                continue
+            indices = [positions[text] for text in texts]
+            future.set_result(vectors[indices])
+
 
 class EmbeddingService:
-    def __init__(self):
+    def __init__(self, max_batch_size: int = 64, max_wait_ms: float = 10.0,
+                 cache: Optional[EmbeddingCache] = None):
         """임베딩 서비스 초기화"""
         # 한국어 특화 모델로 업그레이드 (더 나은 한국어 의미 이해)
-        self.model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
-        print("한국어 특화 임베딩 모델 초기화 완료 (paraphrase-multilingual-MiniLM-L12-v2)")
-    
+        self.model_name = 'paraphrase-multilingual-MiniLM-L12-v2'
+        # 모델은 첫 인코딩 또는 백그라운드 워밍업 시 로드 (import/시작 시간 단축)
+        self.model_resource = resource_registry.register(
+            f"embedding_model:{self.model_name}",
+            self._load_model
+        )
+        self.batcher = EmbeddingBatcher(self._encode_batch, max_batch_size, max_wait_ms)
+        self.cache = cache or EmbeddingCache(
+            self.model_name,
+            db_path=os.getenv("EMBEDDING_CACHE_PATH", EmbeddingCache.default_path()),
+            memory_budget_bytes=int(os.getenv("EMBEDDING_CACHE_MEMORY_BYTES", 64 * 1024 * 1024)),
+            disk_budget_bytes=int(os.getenv("EMBEDDING_CACHE_DISK_BYTES", 512 * 1024 * 1024))
+        )
+        # 요청 텍스트 수/캐시 적중/인코딩 수와 지연 시간 (GET /api/similarity/metrics)
+        self.stats = ServiceStats("embedding")
+        print(f"한국어 특화 임베딩 서비스 초기화 완료 ({self.model_name}, 모델은 지연 로드)")
+
+    def _load_model(self):
+        # sentence_transformers(torch) import 자체도 무거우므로 로드 시점에 import
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model_name)
+
+    @property
+    def model(self):
+        """임베딩 모델 (처음 접근 시 로드)"""
+        return self.model_resource.get()
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """모델로 텍스트 배치를 동기 인코딩합니다. (워커 스레드에서 실행)"""
+        with span("embedding", op="encode_batch", stats=self.stats):
+            vectors = self.model.encode(texts, batch_size=self.batcher.max_batch_size,
+                                        convert_to_numpy=True, show_progress_bar=False)
+        self.stats.inc("encoded", len(texts))
+        return vectors
+
+    def _collect_missing(self, texts: List[str], cached: List[Optional[np.ndarray]]) -> List[str]:
+        """캐시 조회 결과를 집계하고, 인코딩이 필요한 텍스트를 중복 없이 순서대로 반환합니다."""
+        self.stats.inc("embeddings", len(texts))
+        self.stats.inc("cache_hits", sum(vector is not None for vector in cached))
+        return list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+
+    @staticmethod
+    def _merge_encoded(texts: List[str], cached: List[Optional[np.ndarray]],
+                       missing: List[str], vectors) -> List[np.ndarray]:
+        """캐시 결과의 빈 자리를 새로 인코딩한 벡터로 채웁니다."""
+        encoded = dict(zip(missing, vectors))
+        return [vector if vector is not None else encoded[text]
+                for text, vector in zip(texts, cached)]
+
+    async def embed_many(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        여러 텍스트의 임베딩을 한 번에 생성합니다.
+
+        캐시에 있는 텍스트는 인코딩하지 않고, 나머지는 동시에 들어온 다른 요청과
+        함께 마이크로 배치로 묶여 한 번만 인코딩됩니다.
+
+        Args:
+            texts (List[str]): 임베딩을 생성할 텍스트 리스트
+
+        Returns:
+            List[np.ndarray]: 텍스트 순서대로의 float32 임베딩 벡터 리스트
+        """
+        if not texts:
+            return []
+
+        with span("embedding", op="embed_many", stats=self.stats):
+            results = await self.cache.get_many_async(texts)
+            missing = self._collect_missing(texts, results)
+            if missing:
+                vectors = await self.batcher.submit(missing)
+                await self.cache.put_many_async(missing, list(vectors))
+                results = self._merge_encoded(texts, results, missing, vectors)
+        return results
+
+    def encode(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        여러 텍스트의 임베딩을 동기로 생성합니다. (이벤트 루프 밖의 워커 스레드용)
+
+        embed_many와 같은 캐시를 쓰지만 마이크로 배치는 거치지 않습니다.
+
+        Args:
+            texts (List[str]): 임베딩을 생성할 텍스트 리스트
+
+        Returns:
+            List[np.ndarray]: 텍스트 순서대로의 float32 임베딩 벡터 리스트
+        """
+        if not texts:
+            return []
+
+        with span("embedding", op="encode", stats=self.stats):
+            results = self.cache.get_many(texts)
+            missing = self._collect_missing(texts, results)
+            if missing:
+                vectors = self._encode_batch(missing)
+                self.cache.put_many(missing, list(vectors))
+                results = self._merge_encoded(texts, results, missing, vectors)
+        return results
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """임베딩 캐시 적중/미스 통계를 반환합니다."""
+        return self.cache.stats()
+
     async def create_embedding(self, text: str) -> Optional[List[float]]:
         """
         텍스트로부터 임베딩 벡터를 생성합니다.
-        
+
         Args:
             text (str): 임베딩을 생성할 텍스트
-            
+
         Returns:
             Optional[List[float]]: 임베딩 벡터 (실패 시 None)
         """
         try:
-            print(f"[EmbeddingService] === 임베딩 생성 시작 ===")
-            print(f"[EmbeddingService] 입력 텍스트 길이: {len(text)} 문자")
-            print(f"[EmbeddingService] 입력 텍스트 미리보기: {text[:100]}...")
-            
-            # Sentence Transformers를 사용한 임베딩 생성
-            embedding = self.model.encode(text)
-            
-            print(f"[EmbeddingService] 임베딩 생성 성공!")
-            print(f"[EmbeddingService] 임베딩 차원: {len(embedding)}")
-            print(f"[EmbeddingService] 임베딩 값 미리보기: {embedding[:5].tolist()}...")
-            print(f"[EmbeddingService] === 임베딩 생성 완료 ===")
-            
-            return embedding.tolist()  # numpy array를 list로 변환
+            embeddings = await self.embed_many([text])
+            return embeddings[0].tolist()  # numpy array를 list로 변환
         except Exception as e:
-            print(f"[EmbeddingService] === 임베딩 생성 실패 ====")
-            print(f"[EmbeddingService] 오류 메시지: {e}")
-            print(f"[EmbeddingService] 입력 텍스트: {text[:200]}...")
-            print(f"[EmbeddingService] === 임베딩 생성 실패 완료 ===")
+            print(f"[EmbeddingService] 임베딩 생성 실패: {e} (텍스트 길이: {len(text)})")
             return None
-    
+
     def get_embedding_dimension(self) -> int:
         """임베딩 벡터의 차원을 반환합니다."""
         return 384  # paraphrase-multilingual-MiniLM-L12-v2도 384차원
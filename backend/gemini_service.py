@@ -4,9 +4,43 @@ from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 import asyncio
 import json
+import time
+from services.llm_providers.response_cache import llm_response_cache, LLMResponseCache
+from services.llm_providers.scheduler import get_scheduler
+from instrumentation import metrics, LLM_FIRST_TOKEN
+from services.llm_providers.context_window import (
+    ConversationContextBuilder, get_token_estimator, SUMMARY_PREFIX,
+    CHAT_CONTEXT_TOKEN_BUDGET, CHAT_SUMMARY_TOKENS
+)
 
 load_dotenv()
 
+# 채팅 시스템 프롬프트 (모델의 system_instruction으로 설정)
+CHAT_SYSTEM_PROMPT = """당신은 채용 전문 어시스턴트입니다. 
+사용자가 채용 공고 작성이나 채용 관련 질문을 할 때 전문적이고 실용적인 답변을 제공해주세요.
+
+주의사항:
+- AI 모델에 대한 설명은 하지 마세요
+- 채용 관련 실무적인 조언을 제공하세요
+- 구체적이고 실용적인 답변을 해주세요
+- 한국어로 답변해주세요
+- 모든 답변은 핵심만 간단하게 요약해서 2~3줄 이내로 작성해주세요
+- 불필요한 설명은 생략하고, 요점 위주로 간결하게 답변해주세요
+- '주요 업무'를 작성할 때는 지원자 입장에서 직무 이해도가 높아지도록 구체적인 동사(예: 개발, 분석, 관리 등)를 사용하세요
+- 각 업무는 "무엇을 한다 → 왜 한다" 구조로, 기대 성과까지 간결히 포함해서 자연스럽고 명확하게 서술하세요
+- 번호가 있는 항목(1, 2, 3 등)은 각 줄마다 줄바꿈하여 출력해주세요"""
+
+# 이전 대화 요약 프롬프트
+HISTORY_SUMMARY_PROMPT = """다음은 채용 어시스턴트와 사용자의 이전 대화입니다.
+기존 요약과 새 대화를 합쳐, 이후 답변에 필요한 핵심 사실(직무, 회사/부서, 조건, 사용자가 정한 값과 요청)만 한국어로 5줄 이내로 요약해주세요.
+붙여넣은 공고 원문은 옮기지 말고 핵심 항목만 남기세요.
+
+[기존 요약]
+{summary}
+
+[새 대화]
+{conversation}"""
+
 class GeminiService:
     def __init__(self, model_name: str = "gemini-1.5-pro"):
         """
@@ -17,6 +51,7 @@ class GeminiService:
         """
         self.model_name = model_name
         self.api_key = os.getenv("GOOGLE_API_KEY")
+        self.scheduler = get_scheduler("gemini")
         
         # Gemini 클라이언트 설정
         try:
@@ -26,6 +61,7 @@ class GeminiService:
             # Gemini API 설정
             genai.configure(api_key=self.api_key)
             self.client = genai.GenerativeModel(model_name)
+            self.chat_client = self._create_chat_client(model_name)
             
             print(f"✅ Gemini 서비스 초기화 성공 (모델: {model_name})")
             
@@ -33,14 +69,42 @@ class GeminiService:
             print(f"❌ Gemini 서비스 초기화 실패: {e}")
             print("💡 GOOGLE_API_KEY가 올바르게 설정되었는지 확인하세요")
             self.client = None
+            self.chat_client = None
+            self.system_instruction_supported = False
+        
+        # 토큰 예산 기반 대화 컨텍스트 (오래된 대화는 세션별 요약으로 대체)
+        self.context_builder = ConversationContextBuilder(
+            get_token_estimator("gemini"),
+            token_budget=CHAT_CONTEXT_TOKEN_BUDGET,
+            summary_tokens=CHAT_SUMMARY_TOKENS,
+            summarizer=self._summarize_history
+        )
     
-    async def generate_response(self, prompt: str, conversation_history: List[Dict[str, Any]] = None) -> str:
+    def _create_chat_client(self, model_name: str):
+        """시스템 프롬프트를 system_instruction으로 설정한 채팅용 모델 (구버전 SDK는 대화 앞에 추가)"""
+        try:
+            self.system_instruction_supported = True
+            return genai.GenerativeModel(model_name, system_instruction=CHAT_SYSTEM_PROMPT)
+        except TypeError:
+            self.system_instruction_supported = False
+            return genai.GenerativeModel(model_name)
+    
+    async def generate_response(self, prompt: str, conversation_history: List[Dict[str, Any]] = None,
+                                endpoint: Optional[str] = None, use_cache: bool = True,
+                                priority: str = "interactive", session_id: Optional[str] = None) -> str:
         """
         Gemini 모델을 사용하여 응답 생성
         
+        대화 히스토리는 토큰 예산 안의 최근 대화 + 이전 대화 요약으로 구성합니다.
+        같은 프롬프트/대화 컨텍스트/생성 설정의 응답은 LLM 응답 캐시에서 재사용합니다.
+        
         Args:
             prompt: 사용자 입력 프롬프트
             conversation_history: 대화 히스토리
+            session_id: 이전 대화 요약을 캐시할 세션 ID (없으면 대화 내용으로 구분)
+            endpoint: 호출한 엔드포인트 이름 (LLM_CACHE_DISABLED_ENDPOINTS로 캐시 비활성화 가능)
+            use_cache: False면 항상 새로 생성
+            priority: 스케줄러 우선순위 ("interactive" / "background")
             
         Returns:
             생성된 응답 텍스트
@@ -49,49 +113,26 @@ class GeminiService:
             return "Gemini 서비스를 사용할 수 없습니다. GOOGLE_API_KEY가 올바르게 설정되었는지 확인해주세요."
         
         try:
-            # 대화 히스토리 구성
-            messages = []
+            context = await self.context_builder.build(prompt, conversation_history, session_id)
+            generation_config = {"temperature": 0.7, "top_p": 0.8, "top_k": 40, "max_output_tokens": 1000}
             
-            # 시스템 프롬프트 추가
-            system_prompt = """당신은 채용 전문 어시스턴트입니다. 
-            사용자가 채용 공고 작성이나 채용 관련 질문을 할 때 전문적이고 실용적인 답변을 제공해주세요.
-            
-            주의사항:
-            - AI 모델에 대한 설명은 하지 마세요
-            - 채용 관련 실무적인 조언을 제공하세요
-            - 구체적이고 실용적인 답변을 해주세요
-            - 한국어로 답변해주세요
-            - 모든 답변은 핵심만 간단하게 요약해서 2~3줄 이내로 작성해주세요
-            - 불필요한 설명은 생략하고, 요점 위주로 간결하게 답변해주세요
-            - '주요 업무'를 작성할 때는 지원자 입장에서 직무 이해도가 높아지도록 구체적인 동사(예: 개발, 분석, 관리 등)를 사용하세요
-            - 각 업무는 "무엇을 한다 → 왜 한다" 구조로, 기대 성과까지 간결히 포함해서 자연스럽고 명확하게 서술하세요
-            - 번호가 있는 항목(1, 2, 3 등)은 각 줄마다 줄바꿈하여 출력해주세요"""
-            
-            messages.append({"role": "user", "parts": [{"text": system_prompt}]})
-            messages.append({"role": "model", "parts": [{"text": "네, 채용 전문 어시스턴트로서 도움을 드리겠습니다."}]})
+            cache_config = {"summary": context["summary"], "history": context["history"], **generation_config}
             
-            # 대화 히스토리 추가
-            if conversation_history:
-                for msg in conversation_history[-6:]:  # 최근 3턴 (user + assistant)
-                    role = 'user' if msg.get('role') == 'user' else 'model'
-                    messages.append({"role": role, "parts": [{"text": msg.get('content', '')}]})
-            
-            # 현재 사용자 입력 추가
-            messages.append({"role": "user", "parts": [{"text": prompt}]})
-            
-            # Gemini API 호출
-            response = await self.client.generate_content_async(
-                messages,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                    top_p=0.8,
-                    top_k=40,
-                    max_output_tokens=1000,
-                )
+            # 캐시 미스면 Gemini 스케줄러(속도 제한/동시 실행 제한/동일 요청 병합/재시도)를 거쳐 호출
+            text = await llm_response_cache.get_or_generate(
+                prompt, self.model_name,
+                lambda: self.scheduler.run(
+                    lambda: self._generate(prompt, context, generation_config),
+                    key=("gemini", LLMResponseCache.make_key(prompt, self.model_name, cache_config)),
+                    priority=priority,
+                    estimated_tokens=context["prompt_tokens"] + generation_config["max_output_tokens"]
+                ),
+                config=cache_config,
+                endpoint=endpoint, use_cache=use_cache
             )
             
-            if response.text:
-                return response.text
+            if text:
+                return text
             else:
                 return "응답을 생성할 수 없습니다."
                 
@@ -99,13 +140,70 @@ class GeminiService:
             print(f"❌ Gemini 응답 생성 실패: {e}")
             return f"Gemini 서비스 오류가 발생했습니다: {str(e)}"
     
-    async def generate_streaming_response(self, prompt: str, conversation_history: List[Dict[str, Any]] = None):
+    def _build_messages(self, context: Dict[str, Any], prompt: str) -> List[Dict[str, Any]]:
+        """대화 컨텍스트(요약 + 최근 대화)와 현재 입력으로 Gemini 메시지 목록 구성"""
+        messages = []
+        
+        if not self.system_instruction_supported:
+            messages.append({"role": "user", "parts": [{"text": CHAT_SYSTEM_PROMPT}]})
+            messages.append({"role": "model", "parts": [{"text": "네, 채용 전문 어시스턴트로서 도움을 드리겠습니다."}]})
+        
+        if context["summary"]:
+            messages.append({"role": "user", "parts": [{"text": f"{SUMMARY_PREFIX}\n{context['summary']}"}]})
+            messages.append({"role": "model", "parts": [{"text": "네, 이전 대화 내용을 참고하겠습니다."}]})
+        
+        for msg in context["history"]:
+            role = "user" if msg["role"] == "user" else "model"
+            messages.append({"role": role, "parts": [{"text": msg["content"]}]})
+        
+        # 현재 사용자 입력 추가
+        messages.append({"role": "user", "parts": [{"text": prompt}]})
+        return messages
+    
+    async def _summarize_history(self, summary: str, messages: List[Dict[str, str]]) -> str:
+        """예산 밖으로 밀려난 대화를 기존 요약에 합칩니다. (세션마다 메시지 묶음당 한 번만 호출)"""
+        conversation = "\n".join(
+            f"{'사용자' if m['role'] == 'user' else '어시스턴트'}: {m['content']}" for m in messages
+        )
+        request = HISTORY_SUMMARY_PROMPT.format(summary=summary or "(없음)", conversation=conversation)
+        generation_config = {"temperature": 0.2, "max_output_tokens": CHAT_SUMMARY_TOKENS}
+        
+        async def call():
+            response = await self.client.generate_content_async(
+                request,
+                generation_config=genai.types.GenerationConfig(**generation_config)
+            )
+            return response.text
+        
+        return await self.scheduler.run(
+            call,
+            priority="background",
+            estimated_tokens=self.context_builder.estimator.count(request) + CHAT_SUMMARY_TOKENS
+        )
+    
+    async def _generate(self, prompt: str, context: Dict[str, Any], generation_config: Dict[str, Any]) -> str:
+        """Gemini API를 실제로 호출합니다. (캐시 미스일 때만)"""
+        messages = self._build_messages(context, prompt)
+        
+        # Gemini API 호출
+        response = await self.chat_client.generate_content_async(
+            messages,
+            generation_config=genai.types.GenerationConfig(**generation_config)
+        )
+        return response.text
+    
+    async def generate_streaming_response(self, prompt: str, conversation_history: List[Dict[str, Any]] = None,
+                                          session_id: Optional[str] = None, priority: str = "interactive"):
         """
         Gemini 모델을 사용하여 스트리밍 응답 생성
         
+        스트림이 끝나거나 닫힐 때까지 Gemini 스케줄러의 동시 실행 슬롯을 점유하고, 시작 전에 분당 요청/토큰을 차감합니다.
+        
         Args:
             prompt: 사용자 입력 프롬프트
             conversation_history: 대화 히스토리
+            session_id: 이전 대화 요약을 캐시할 세션 ID
+            priority: 스케줄러 우선순위 ("interactive" / "background")
             
         Yields:
             생성된 응답 텍스트 청크
@@ -115,51 +213,33 @@ class GeminiService:
             return
         
         try:
-            # 대화 히스토리 구성
-            messages = []
-            
-            # 시스템 프롬프트 추가
-            system_prompt = """당신은 채용 전문 어시스턴트입니다. 
-            사용자가 채용 공고 작성이나 채용 관련 질문을 할 때 전문적이고 실용적인 답변을 제공해주세요.
-            
-            주의사항:
-            - AI 모델에 대한 설명은 하지 마세요
-            - 채용 관련 실무적인 조언을 제공하세요
-            - 구체적이고 실용적인 답변을 해주세요
-            - 한국어로 답변해주세요
-            - 모든 답변은 핵심만 간단하게 요약해서 2~3줄 이내로 작성해주세요
-            - 불필요한 설명은 생략하고, 요점 위주로 간결하게 답변해주세요
-            - '주요 업무'를 작성할 때는 지원자 입장에서 직무 이해도가 높아지도록 구체적인 동사(예: 개발, 분석, 관리 등)를 사용하세요
-            - 각 업무는 "무엇을 한다 → 왜 한다" 구조로, 기대 성과까지 간결히 포함해서 자연스럽고 명확하게 서술하세요
-            - 번호가 있는 항목(1, 2, 3 등)은 각 줄마다 줄바꿈하여 출력해주세요"""
+            context = await self.context_builder.build(prompt, conversation_history, session_id)
+            messages = self._build_messages(context, prompt)
             
-            messages.append({"role": "user", "parts": [{"text": system_prompt}]})
-            messages.append({"role": "model", "parts": [{"text": "네, 채용 전문 어시스턴트로서 도움을 드리겠습니다."}]})
-            
-            # 대화 히스토리 추가
-            if conversation_history:
-                for msg in conversation_history[-6:]:  # 최근 3턴 (user + assistant)
-                    role = 'user' if msg.get('role') == 'user' else 'model'
-                    messages.append({"role": role, "parts": [{"text": msg.get('content', '')}]})
-            
-            # 현재 사용자 입력 추가
-            messages.append({"role": "user", "parts": [{"text": prompt}]})
-            
-            # Gemini 스트리밍 API 호출
-            response = await self.client.generate_content_async(
-                messages,
-                stream=True,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                    top_p=0.8,
-                    top_k=40,
-                    max_output_tokens=1000,
+            max_output_tokens = 1000
+            async with self.scheduler.stream(priority=priority,
+                                             estimated_tokens=context["prompt_tokens"] + max_output_tokens):
+                started = time.perf_counter()
+                first_token = True
+                
+                # Gemini 스트리밍 API 호출
+                response = await self.chat_client.generate_content_async(
+                    messages,
+                    stream=True,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.7,
+                        top_p=0.8,
+                        top_k=40,
+                        max_output_tokens=max_output_tokens,
+                    )
                 )
-            )
-            
-            async for chunk in response:
-                if chunk.text:
-                    yield chunk.text
+                
+                async for chunk in response:
+                    if chunk.text:
+                        if first_token:
+                            metrics.observe(LLM_FIRST_TOKEN, time.perf_counter() - started, provider="gemini")
+                            first_token = False
+                        yield chunk.text
                     
         except Exception as e:
             print(f"❌ Gemini 스트리밍 응답 생성 실패: {e}")
@@ -192,6 +272,7 @@ class GeminiService:
         try:
             self.model_name = new_model_name
             self.client = genai.GenerativeModel(new_model_name)
+            self.chat_client = self._create_chat_client(new_model_name)
             print(f"✅ 모델이 {new_model_name}로 변경되었습니다.")
             return True
         except Exception as e:
@@ -7,6 +7,7 @@ import json
 from typing import Optional, Dict, List
 import asyncio
 from datetime import datetime, timedelta, timezone
+from github_client import github_client
 
 router = APIRouter()
 
@@ -33,18 +34,8 @@ class RepositoryAnalysis(BaseModel):
 GITHUB_API_BASE = 'https://api.github.com'
 
 async def fetch_github(url: str, token: Optional[str] = None) -> Dict:
-    """GitHub API 호출"""
-    headers = {
-        'Accept': 'application/vnd.github+json',
-        'User-Agent': 'admin-backend'
-    }
-    if token:
-        headers['Authorization'] = f'Bearer {token}'
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    """GitHub API 호출 (공용 연결 풀, ETag 조건부 요청, 디스크 캐시)"""
+    return await github_client.get_json(url, token)
 
 async def fetch_github_readme(owner: str, repo: str, token: Optional[str] = None) -> Optional[Dict]:
     """리포지토리 README 가져오기"""
@@ -602,6 +593,28 @@ async def summarize_with_llm(text: str, lines: int = 7) -> List[Dict]:
     # 임시로 'unknown' 사용
     return await generate_unified_summary('unknown', None, {'text': text}, None)
 
+async def collect_repo_overview(repo: Dict, username: str, token: Optional[str] = None) -> Dict:
+    """리포지토리 메타데이터 + 언어/최상위 파일/README 요약 정보 수집"""
+    owner_login = repo.get('owner', {}).get('login', username)
+    languages, top_level_files, repo_readme = await asyncio.gather(
+        fetch_repo_languages(owner_login, repo['name'], token),
+        fetch_repo_top_level_files(owner_login, repo['name'], token),
+        fetch_github_readme(owner_login, repo['name'], token),
+        return_exceptions=True
+    )
+    
+    return {
+        'name': repo['name'],
+        'description': repo.get('description', ''),
+        'html_url': repo['html_url'],
+        'stargazers_count': repo.get('stargazers_count', 0),
+        'forks_count': repo.get('forks_count', 0),
+        'language': repo.get('language', '정보 없음'),
+        'languages': languages if not isinstance(languages, Exception) else {},
+        'toplevel_files': top_level_files if not isinstance(top_level_files, Exception) else [],
+        'readme_excerpt': repo_readme['text'][:3000] if repo_readme and not isinstance(repo_readme, Exception) else ''
+    }
+
 @router.post("/github/summary", response_model=GithubSummaryResponse)
 async def github_summary(request: GithubSummaryRequest):
     """GitHub 사용자 요약"""
@@ -691,27 +704,10 @@ async def github_summary(request: GithubSummaryRequest):
         # 상위 5개 리포 분석
         top_repos = [r for r in repos if not r.get('fork')][:5]
         
-        analyses = []
-        for repo in top_repos:
-            owner_login = repo.get('owner', {}).get('login', username)
-            languages, top_level_files, repo_readme = await asyncio.gather(
-                fetch_repo_languages(owner_login, repo['name'], github_token),
-                fetch_repo_top_level_files(owner_login, repo['name'], github_token),
-                fetch_github_readme(owner_login, repo['name'], github_token),
-                return_exceptions=True
-            )
-            
-            analyses.append({
-                'name': repo['name'],
-                'description': repo.get('description', ''),
-                'html_url': repo['html_url'],
-                'stargazers_count': repo.get('stargazers_count', 0),
-                'forks_count': repo.get('forks_count', 0),
-                'language': repo.get('language', '정보 없음'),
-                'languages': languages if not isinstance(languages, Exception) else {},
-                'toplevel_files': top_level_files if not isinstance(top_level_files, Exception) else [],
-                'readme_excerpt': repo_readme['text'][:3000] if repo_readme and not isinstance(repo_readme, Exception) else ''
-            })
+        # 모든 리포를 동시에 수집 (요청 수는 github_client의 세마포어로 제한)
+        analyses = await asyncio.gather(
+            *(collect_repo_overview(repo, username, github_token) for repo in top_repos)
+        )
         
         # 통합 요약 생성 (여러 레포지토리)
         summaries = await generate_unified_summary(username, None, None, analyses)
@@ -793,3 +789,8 @@ async def github_repo_analysis(request: GithubSummaryRequest):
         print(f"GitHub 저장소 분석 오류: {error}")
         print(f"오류 상세: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"저장소 분석 중 오류가 발생했습니다: {str(error)}")
+
+@router.get("/github/client-stats")
+async def github_client_stats():
+    """GitHub API 클라이언트 캐시/요청 통계와 남은 rate limit"""
+    return github_client.get_stats()
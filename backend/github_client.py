@@ -0,0 +1,226 @@
+"""
+GitHub API 공용 클라이언트
+
+- 연결 풀을 공유하는 httpx.AsyncClient (h2 패키지가 있으면 HTTP/2 사용)
+- ETag/Last-Modified 조건부 요청과 URL 기준 디스크 캐시 (304 응답은 rate limit을 소모하지 않음)
+- 동시 요청 수 제한(세마포어)과 응답 헤더 기반 남은 rate limit 추적
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class GitHubClient:
+    def __init__(self, cache_dir: Optional[str] = None, max_concurrency: int = 10, fresh_seconds: float = 60.0,
+                 memory_entries: int = 512, timeout: float = 15.0, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Args:
+            cache_dir (str): 응답 캐시 디렉터리 (None이면 디스크 캐시 사용 안 함)
+            max_concurrency (int): 동시에 보내는 최대 요청 수
+            fresh_seconds (float): 이 시간 안에 받은 응답은 조건부 요청 없이 바로 사용
+            memory_entries (int): 메모리에 보관할 최근 응답 수
+            transport: 테스트용 httpx 트랜스포트
+        """
+        self.cache_dir = cache_dir
+        self.max_concurrency = max_concurrency
+        self.fresh_seconds = fresh_seconds
+        self.memory_entries = memory_entries
+        self.timeout = timeout
+        self.transport = transport
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop = None
+
+        # GitHub rate limit은 토큰(인증 주체)마다 따로 잡히므로 토큰 범위별로 기록
+        self.rate_limits: Dict[str, Dict[str, Optional[int]]] = {}
+        self.stats = {"requests": 0, "fresh_hits": 0, "not_modified": 0, "stale_served": 0, "misses": 0}
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        # httpx 연결과 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency * 2,
+                                    max_keepalive_connections=self.max_concurrency),
+                transport=self.transport
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client
+
+    @staticmethod
+    def token_scope(token: Optional[str]) -> str:
+        """토큰 지문 (토큰 원문은 키/통계에 남기지 않음)"""
+        return hashlib.sha256(token.encode()).hexdigest()[:16] if token else "anonymous"
+
+    @classmethod
+    def cache_key(cls, url: str, token: Optional[str]) -> str:
+        # 토큰마다 볼 수 있는 데이터가 다르므로 토큰 지문을 키에 포함
+        return hashlib.sha256(f"{cls.token_scope(token)}:{url}".encode()).hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._cache_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]):
+        # 임시 파일에 쓴 뒤 교체 (동시 요청이 반쯤 쓰인 파일을 읽지 않도록)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, self._cache_path(key))
+        except OSError as e:
+            logger.warning(f"GitHub 응답 캐시 저장 실패: {e}")
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _load_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+        if not self.cache_dir:
+            return None
+        entry = await asyncio.to_thread(self._read_disk, key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def _store_cached(self, key: str, entry: Dict[str, Any]):
+        self._remember(key, entry)
+        if self.cache_dir:
+            await asyncio.to_thread(self._write_disk, key, entry)
+
+    def rate_limit(self, token: Optional[str] = None) -> Dict[str, Optional[int]]:
+        """토큰 범위의 마지막 rate limit 헤더 값"""
+        return self.rate_limits.setdefault(
+            self.token_scope(token), {"limit": None, "remaining": None, "reset": None, "used": None}
+        )
+
+    def _update_rate_limit(self, token: Optional[str], response: httpx.Response):
+        rate_limit = self.rate_limit(token)
+        for field in ("limit", "remaining", "reset", "used"):
+            value = response.headers.get(f"X-RateLimit-{field.capitalize()}")
+            if value is not None and value.isdigit():
+                rate_limit[field] = int(value)
+
+    def rate_limit_exhausted(self, token: Optional[str] = None) -> bool:
+        rate_limit = self.rate_limit(token)
+        reset = rate_limit["reset"]
+        return rate_limit["remaining"] == 0 and reset is not None and reset > time.time()
+
+    async def get_json(self, url: str, token: Optional[str] = None) -> Any:
+        """
+        GitHub API GET (JSON)
+
+        캐시된 응답이 fresh_seconds 이내면 바로 반환하고, 그렇지 않으면 ETag로 조건부 요청을 보냅니다.
+        해당 토큰의 rate limit이 소진된 동안에는 오래된 캐시라도 반환합니다.
+
+        Raises:
+            httpx.HTTPStatusError: 2xx/304가 아닌 응답
+        """
+        key = self.cache_key(url, token)
+        cached = await self._load_cached(key)
+        if cached is not None:
+            if time.time() - cached["fetched_at"] < self.fresh_seconds:
+                self.stats["fresh_hits"] += 1
+                return cached["body"]
+            if self.rate_limit_exhausted(token):
+                self.stats["stale_served"] += 1
+                return cached["body"]
+
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'admin-backend'
+        }
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        if cached is not None:
+            if cached.get("etag"):
+                headers['If-None-Match'] = cached["etag"]
+            if cached.get("last_modified"):
+                headers['If-Modified-Since'] = cached["last_modified"]
+
+        client = self._ensure_client()
+        async with self._semaphore:
+            self.stats["requests"] += 1
+            response = await client.get(url, headers=headers)
+        self._update_rate_limit(token, response)
+
+        if response.status_code == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            cached["fetched_at"] = time.time()
+            await self._store_cached(key, cached)
+            return cached["body"]
+
+        response.raise_for_status()
+        body = response.json()
+        self.stats["misses"] += 1
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            await self._store_cached(key, {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+                "body": body
+            })
+        return body
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "rate_limits": {scope: dict(values) for scope, values in self.rate_limits.items()},
+            "memory_entries": len(self._memory),
+            "disk_cache": self.cache_dir,
+            "max_concurrency": self.max_concurrency,
+            "http2": HTTP2_AVAILABLE
+        }
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 전역 인스턴스 (GITHUB_CACHE_DIR를 빈 값으로 두면 디스크 캐시 사용 안 함)
+github_client = GitHubClient(
+    cache_dir=os.getenv("GITHUB_CACHE_DIR", os.path.join(tempfile.gettempdir(), "github_api_cache")) or None,
+    max_concurrency=int(os.getenv("GITHUB_MAX_CONCURRENCY", "10")),
+    fresh_seconds=float(os.getenv("GITHUB_CACHE_FRESH_SECONDS", "60"))
+)
@@ -0,0 +1,241 @@
+"""
+지연 시간 계측과 디버그 로그
+
+- span(stage): 구간 실행 시간을 stage별 히스토그램에 기록 (동기/비동기 with 문, 데코레이터 모두 사용 가능)
+- metrics.render(): Prometheus 텍스트 형식 출력 (GET /metrics)
+- log_payload(): 요청/응답/임베딩 같은 큰 내용은 DEBUG 레벨에서 샘플링 + 길이 제한으로만 기록
+- configure_logging(): LOG_LEVEL 환경 변수로 전체 로그 레벨 설정
+
+계측 구간(stage): embedding, vector_query, mongo_query, llm_call, llm_stream, text_extraction, classifier
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+STAGE_DURATION = "stage_duration_seconds"
+STAGE_ERRORS = "stage_errors_total"
+LLM_FIRST_TOKEN = "llm_first_token_seconds"
+HTTP_DURATION = "http_request_duration_seconds"
+
+# 큰 디버그 내용 로그 샘플링 비율 / 최대 길이
+DEBUG_LOG_SAMPLE_RATE = float(os.getenv("DEBUG_LOG_SAMPLE_RATE", "0.05"))
+DEBUG_LOG_PAYLOAD_CHARS = int(os.getenv("DEBUG_LOG_PAYLOAD_CHARS", "500"))
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (스레드 안전 - 워커 스레드에서 끝나는 구간도 기록)"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[index] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, Any]:
+        """누적 버킷 카운트 (Prometheus le 기준)"""
+        with self._lock:
+            cumulative, running = [], 0
+            for count in self.counts:
+                running += count
+                cumulative.append(running)
+            return {"buckets": list(zip(self.buckets, cumulative)), "sum": self.sum, "count": self.count}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._help: Dict[str, str] = {
+            STAGE_DURATION: "Duration of instrumented stages in seconds",
+            STAGE_ERRORS: "Number of instrumented stages that raised an exception",
+            LLM_FIRST_TOKEN: "Time from LLM streaming request to first token in seconds",
+            HTTP_DURATION: "HTTP request duration in seconds until response headers",
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _label_key(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def describe(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    # 지표 이름 인자는 위치 전용 (name 같은 라벨과 겹치지 않도록)
+    def observe(self, metric: str, value: float, /, buckets: Iterable[float] = DEFAULT_BUCKETS, **labels):
+        key = self._label_key(labels)
+        series = self._histograms.get(metric, {}).get(key)
+        if series is None:
+            with self._lock:
+                series = self._histograms.setdefault(metric, {}).setdefault(key, Histogram(buckets))
+        series.observe(value)
+
+    def inc(self, metric: str, value: float = 1, /, **labels):
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(metric, {})
+            series[key] = series.get(key, 0) + value
+
+    def get_histogram(self, metric: str, /, **labels) -> Optional[Histogram]:
+        return self._histograms.get(metric, {}).get(self._label_key(labels))
+
+    def get_counter(self, metric: str, /, **labels) -> float:
+        return self._counters.get(metric, {}).get(self._label_key(labels), 0)
+
+    @staticmethod
+    def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(key) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+        escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+        return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+
+        for name, series in sorted(counters.items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{self._format_labels(key)} {value:g}")
+
+        for name, series in sorted(histograms.items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, histogram in sorted(series.items()):
+                snapshot = histogram.snapshot()
+                for bound, count in snapshot["buckets"]:
+                    lines.append(f"{name}_bucket{self._format_labels(key, ('le', f'{bound:g}'))} {count}")
+                lines.append(f"{name}_bucket{self._format_labels(key, ('le', '+Inf'))} {snapshot['count']}")
+                lines.append(f"{name}_sum{self._format_labels(key)} {snapshot['sum']:.6f}")
+                lines.append(f"{name}_count{self._format_labels(key)} {snapshot['count']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+metrics = MetricsRegistry()
+
+
+class span:
+    """
+    구간 실행 시간을 stage_duration_seconds{stage=...} 히스토그램에 기록합니다.
+
+        with span("vector_query", backend="pinecone"):
+            ...
+        async with span("llm_call", provider="gemini"):
+            ...
+        @span("classifier", name="keyword")
+        def classify(...): ...
+
+    예외가 나면 stage_errors_total에도 기록하고 예외는 그대로 전달합니다. (취소는 오류로 세지 않음)
+
+    stats(service_metrics.ServiceStats)를 넘기면 같은 측정값을 서비스 실시간 지표에도 기록합니다.
+    (지표 이름은 op 라벨, 없으면 stage / 예외 시 errors.<이름> 카운터 증가)
+
+        with span("vector_query", backend="local", op="query", stats=self.stats):
+            ...
+    """
+
+    def __init__(self, stage: str, registry: Optional[MetricsRegistry] = None, stats=None, **labels):
+        self.stage = stage
+        self.labels = labels
+        self.registry = registry or metrics
+        self.stats = stats
+        self.started: Optional[float] = None
+        self.elapsed: Optional[float] = None
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self.started
+        self.registry.observe(STAGE_DURATION, self.elapsed, stage=self.stage, **self.labels)
+        failed = exc_type is not None and not issubclass(exc_type, (GeneratorExit, asyncio.CancelledError))
+        if failed:
+            self.registry.inc(STAGE_ERRORS, stage=self.stage, **self.labels)
+        if self.stats is not None:
+            name = self.labels.get("op", self.stage)
+            self.stats.observe(name, self.elapsed)
+            if failed:
+                self.stats.inc(f"errors.{name}")
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+    def __call__(self, func):
+        # 데코레이터로 쓰면 호출마다 새 구간을 만듦
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(self.stage, self.registry, self.stats, **self.labels):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(self.stage, self.registry, self.stats, **self.labels):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def _truncate(value: Any, limit: int) -> str:
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}…(+{len(text) - limit}자)"
+
+
+def log_payload(logger: logging.Logger, message: str, *args, rate: Optional[float] = None):
+    """
+    요청/응답 전체, 임베딩 미리보기 같은 큰 디버그 내용을 기록합니다.
+    DEBUG 레벨이 켜져 있을 때 일부 요청(DEBUG_LOG_SAMPLE_RATE)만, 인자마다 길이를 잘라서 기록합니다.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if random.random() >= (DEBUG_LOG_SAMPLE_RATE if rate is None else rate):
+        return
+    logger.debug(message, *(_truncate(arg, DEBUG_LOG_PAYLOAD_CHARS) for arg in args))
+
+
+def configure_logging(level: Optional[str] = None):
+    """LOG_LEVEL(기본 INFO)로 루트 로거 설정 (이미 핸들러가 있으면 레벨만 변경)"""
+    level_name = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    root.setLevel(getattr(logging, level_name, logging.INFO))
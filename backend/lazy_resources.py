@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+class LazyResource:
+    def __init__(self, name: str, factory: Callable[[], Any], required: bool = True):
+        """
+        첫 사용 시(또는 백그라운드 워밍업 시) 한 번만 초기화되는 무거운 리소스
+
+        모델 로딩처럼 오래 걸리는 초기화를 import 시점에서 분리합니다.
+        초기화는 스레드 안전하며, 동시에 여러 곳에서 요청해도 factory는 한 번만 실행됩니다.
+
+        Args:
+            name (str): 리소스 이름 (readiness 응답에 표시)
+            factory (Callable[[], Any]): 리소스를 생성하는 동기 함수
+            required (bool): False면 실패해도 서비스 readiness에 영향을 주지 않음 (선택 기능)
+        """
+        self.name = name
+        self.factory = factory
+        self.required = required
+        self.state = "pending"   # pending / loading / ready / failed
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._value = None
+        self._exception: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    @property
+    def available(self) -> bool:
+        """초기화에 실패하지 않았는지 여부 (아직 로딩 전이어도 True)"""
+        return self.state != "failed"
+
+    def get(self) -> Any:
+        """리소스를 반환합니다. 처음 호출되면 현재 스레드에서 초기화합니다."""
+        if self.state == "ready":
+            return self._value
+        with self._lock:
+            if self.state == "ready":
+                return self._value
+            if self.state == "failed":
+                raise self._exception
+            self.state = "loading"
+            started = time.perf_counter()
+            try:
+                self._value = self.factory()
+            except Exception as e:
+                self._exception = e
+                self.error = str(e)
+                self.state = "failed"
+                print(f"[LazyResource] {self.name} 초기화 실패: {e}")
+                raise
+            self.load_seconds = round(time.perf_counter() - started, 3)
+            self.state = "ready"
+            print(f"[LazyResource] {self.name} 초기화 완료 ({self.load_seconds}초)")
+            return self._value
+
+    def load_in_background(self):
+        """아직 로딩 전이면 데몬 스레드에서 초기화를 시작합니다. (호출한 쪽은 기다리지 않음)"""
+        if self.state != "pending":
+            return
+        threading.Thread(target=self._load_quietly, name=f"load-{self.name}", daemon=True).start()
+
+    def _load_quietly(self):
+        try:
+            self.get()
+        except Exception:
+            pass  # 실패는 state/error로 기록됨
+
+    async def get_async(self) -> Any:
+        """이벤트 루프를 막지 않도록 초기화가 필요하면 워커 스레드에서 수행합니다."""
+        if self.state == "ready":
+            return self._value
+        return await asyncio.to_thread(self.get)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "required": self.required,
+            "load_seconds": self.load_seconds,
+            "error": self.error
+        }
+
+
+class ResourceRegistry:
+    def __init__(self):
+        """이름으로 LazyResource를 관리하고 워밍업/readiness를 제공하는 레지스트리"""
+        self._resources: Dict[str, LazyResource] = {}
+        self._warm_up_task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, factory: Callable[[], Any], required: bool = True) -> LazyResource:
+        """리소스를 등록합니다. 같은 이름이 이미 있으면 기존 리소스를 반환합니다."""
+        resource = self._resources.get(name)
+        if resource is None:
+            resource = LazyResource(name, factory, required)
+            self._resources[name] = resource
+        return resource
+
+    def get(self, name: str) -> Any:
+        return self._resources[name].get()
+
+    async def warm_up(self, names: Optional[List[str]] = None):
+        """등록된 리소스를 워커 스레드에서 동시에 초기화합니다. 실패는 상태로만 기록됩니다."""
+        resources = [r for n, r in self._resources.items() if names is None or n in names]
+        await asyncio.gather(*(r.get_async() for r in resources), return_exceptions=True)
+
+    def start_warm_up(self) -> asyncio.Task:
+        """백그라운드 워밍업 태스크를 시작합니다. (앱 시작을 막지 않음)"""
+        if self._warm_up_task is None or self._warm_up_task.done():
+            self._warm_up_task = asyncio.create_task(self.warm_up())
+        return self._warm_up_task
+
+    def readiness(self) -> Dict[str, Any]:
+        """필수 리소스가 모두 준비되었는지와 리소스별 상태를 반환합니다."""
+        resources = {name: resource.status() for name, resource in self._resources.items()}
+        ready = all(resource.ready for resource in self._resources.values() if resource.required)
+        return {"ready": ready, "resources": resources}
+
+
+# 애플리케이션 전역 레지스트리
+resource_registry = ResourceRegistry()
@@ -1,9 +1,12 @@
 import os
 import sys
-from fastapi import FastAPI, HTTPException
+import json
+import asyncio
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
+import time
 import uvicorn
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
@@ -14,9 +17,22 @@ import codecs
 from datetime import datetime
 from chatbot import chatbot_router, langgraph_router
 from github import router as github_router
+from github_client import github_client
 from similarity_service import SimilarityService
 from embedding_service import EmbeddingService
 from vector_service import VectorService
+from chunk_store import ChunkStore, split_text_windows
+from lazy_resources import resource_registry
+from services.llm_providers.response_cache import llm_response_cache
+from services.llm_providers import scheduler as llm_scheduler
+from services.llm_providers import openai_provider  # noqa: F401  (임포트 시 OpenAI 프로바이더 등록)
+from services.cover_letter_analysis.analyzer import CoverLetterAnalyzer
+from services.cover_letter_analysis.batch import BatchJobStore, CoverLetterBatchProcessor
+from utils.upload_ingest import UploadTooLargeError, shutdown_parse_pool, spool_upload
+from instrumentation import metrics, configure_logging, HTTP_DURATION
+from service_metrics import WorkerMetricsPublisher, build_similarity_report
+
+configure_logging()
 
 # Python 환경 인코딩 설정
 # 시스템 기본 인코딩을 UTF-8로 설정
@@ -42,7 +58,12 @@ app.add_middleware(
 # 한글 인코딩을 위한 미들웨어
 @app.middleware("http")
 async def add_charset_header(request, call_next):
+    started = time.perf_counter()
     response = await call_next(request)
+    # 경로 템플릿 기준 응답 시간 (/metrics의 http_request_duration_seconds)
+    route = request.scope.get("route")
+    metrics.observe(HTTP_DURATION, time.perf_counter() - started,
+                    method=request.method, path=getattr(route, "path", "unmatched"), status=response.status_code)
     
     # 모든 JSON 응답에 UTF-8 인코딩 명시
     if response.headers.get("content-type", "").startswith("application/json"):
@@ -74,10 +95,79 @@ PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "resume-vectors")
 # 서비스 초기화
 embedding_service = EmbeddingService()
 vector_service = VectorService(
-    api_key=PINECONE_API_KEY or "dummy-key",  # API 키가 없어도 서버 시작은 가능
+    api_key=PINECONE_API_KEY,  # API 키가 없으면 로컬 벡터 인덱스 사용 (VECTOR_BACKEND로 변경 가능)
     index_name=PINECONE_INDEX_NAME
 )
 similarity_service = SimilarityService(embedding_service, vector_service)
+chunk_store = ChunkStore(db.resume_chunks)
+
+# 워커별 유사도/임베딩/벡터 검색 지표 스냅샷 (METRICS_SHARED_DIR에 기록, 조회 시 모든 워커 합산)
+service_metrics_publisher = WorkerMetricsPublisher({
+    "similarity": similarity_service.stats,
+    "embedding": embedding_service.stats,
+    "vector": vector_service.stats
+})
+
+# 자소서 일괄 분석 (모든 작업이 하나의 분석기/프로바이더 클라이언트를 공유)
+cover_letter_analyzer = CoverLetterAnalyzer({
+    "provider": os.getenv("COVER_LETTER_LLM_PROVIDER", "openai"),
+    "model_name": os.getenv("COVER_LETTER_LLM_MODEL", "gpt-4o-mini"),
+    "max_tokens": 4000,
+    "temperature": 0.1
+})
+batch_job_store = BatchJobStore(db.cover_letter_batch_jobs, db.cover_letter_batch_results)
+cover_letter_batch = CoverLetterBatchProcessor(
+    cover_letter_analyzer, batch_job_store,
+    max_workers=int(os.getenv("COVER_LETTER_BATCH_WORKERS", "4"))
+)
+# 일괄 분석 업로드 제한 (파일 수, 파일(zip 포함)당 크기)
+COVER_LETTER_BATCH_MAX_FILES = int(os.getenv("COVER_LETTER_BATCH_MAX_FILES", "100"))
+COVER_LETTER_BATCH_MAX_FILE_BYTES = int(os.getenv("COVER_LETTER_BATCH_MAX_FILE_BYTES", str(50 * 1024 * 1024)))
+
+# LLM 응답 캐시의 임베딩 유사도 계층 (LLM_CACHE_SEMANTIC=true일 때만, 기본은 정확 일치만 사용)
+if os.getenv("LLM_CACHE_SEMANTIC", "false").lower() == "true":
+    llm_response_cache.embedder = lambda text: embedding_service.encode([text])[0]
+
+@app.on_event("startup")
+async def create_indexes():
+    """조회에 필요한 MongoDB 인덱스 생성"""
+    try:
+        await db.resume_signatures.create_index([("resume_id", 1), ("field", 1)], unique=True)
+        await chunk_store.create_indexes()
+        await batch_job_store.create_indexes()
+    except Exception as e:
+        print(f"MongoDB 인덱스 생성 실패: {e}")
+
+@app.on_event("startup")
+async def warm_up_resources():
+    """무거운 모델 로딩을 백그라운드에서 시작 (요청 처리는 바로 가능, 준비 상태는 /ready로 확인)"""
+    if os.getenv("WARM_UP_RESOURCES", "true").lower() != "false":
+        resource_registry.start_warm_up()
+
+@app.on_event("startup")
+async def start_service_metrics_publisher():
+    """워커 지표 스냅샷 주기적 기록 시작"""
+    service_metrics_publisher.start()
+
+@app.on_event("shutdown")
+async def stop_service_metrics_publisher():
+    """종료한 워커의 스냅샷이 합산에 남지 않도록 제거"""
+    await service_metrics_publisher.stop()
+
+@app.on_event("shutdown")
+async def flush_vector_writes():
+    """종료 전에 벡터 쓰기 큐에 남은 항목을 저장"""
+    await vector_service.flush_writes()
+
+@app.on_event("shutdown")
+async def stop_upload_parse_pool():
+    """업로드 문서 파싱용 프로세스 풀 종료"""
+    shutdown_parse_pool()
+
+@app.on_event("shutdown")
+async def close_github_client():
+    """GitHub API 공용 연결 풀 종료"""
+    await github_client.close()
 
 # Pydantic 모델들
 class User(BaseModel):
@@ -132,8 +222,34 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    """Liveness: 프로세스가 요청을 처리할 수 있는지만 확인 (모델 로딩과 무관)"""
     return {"status": "healthy", "message": "서버가 정상적으로 작동 중입니다."}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 필수 리소스(임베딩 모델 등)의 초기화 완료 여부"""
+    readiness = resource_registry.readiness()
+    status_code = 200 if readiness["ready"] else 503
+    return JSONResponse(status_code=status_code, content={
+        "status": "ready" if readiness["ready"] else "warming_up",
+        "resources": readiness["resources"]
+    })
+
+@app.get("/api/llm-cache/stats")
+async def llm_cache_stats():
+    """LLM 응답 캐시 적중률/크기"""
+    return llm_response_cache.get_stats()
+
+@app.get("/api/llm-scheduler/stats")
+async def llm_scheduler_stats():
+    """프로바이더별 LLM 호출 스케줄러 상태 (진행/대기/병합/재시도)"""
+    return llm_scheduler.get_all_stats()
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """구간별(임베딩/벡터 검색/Mongo/LLM/텍스트 추출/분류기) 지연 시간 히스토그램 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # 사용자 관련 API
 @app.get("/api/users", response_model=List[User])
 async def get_users():
@@ -168,6 +284,8 @@ async def create_resume(resume: Resume):
     resume_dict["created_at"] = datetime.now()
     result = await db.resumes.insert_one(resume_dict)
     resume_dict["id"] = str(result.inserted_id)
+    similarity_service.similarity_engine.upsert({**resume_dict, "_id": result.inserted_id})
+    await similarity_service.index_resume_signatures({**resume_dict, "_id": result.inserted_id}, db.resume_signatures)
     return Resume(**resume_dict)
 
 # 면접 관련 API
@@ -300,6 +418,20 @@ async def search_vectors(data: Dict[str, Any]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"벡터 검색 실패: {str(e)}")
 
+@app.get("/api/vector/status")
+async def get_vector_status(ids: str, verify: bool = False):
+    """벡터 ID별 쓰기 상태 조회 (ids: 쉼표로 구분된 벡터 ID 목록)"""
+    try:
+        vector_ids = [vector_id.strip() for vector_id in ids.split(",") if vector_id.strip()]
+        if not vector_ids:
+            raise HTTPException(status_code=400, detail="ids가 필요합니다.")
+        
+        return await vector_service.get_vector_status(vector_ids, verify=verify)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"벡터 상태 조회 실패: {str(e)}")
+
 # Chunking Service API
 @app.post("/api/chunking/split")
 async def split_text(data: Dict[str, Any]):
@@ -315,49 +447,33 @@ async def split_text(data: Dict[str, Any]):
         if not resume_id:
             raise HTTPException(status_code=400, detail="resume_id가 필요합니다.")
         
-        # 텍스트 분할 로직
-        chunks = []
+        # 텍스트 분할 로직 (청크를 모두 생성한 뒤 한 번에 저장)
         text_length = len(text)
-        start = 0
-        chunk_index = 0
-        
-        while start < text_length:
-            end = min(start + chunk_size, text_length)
-            chunk_text = text[start:end]
-            
-            if chunk_text.strip():  # 빈 청크는 제외
-                chunk_id = f"chunk_{chunk_index:03d}"
-                vector_id = f"resume_{resume_id}_{chunk_id}"
-                
-                chunk_doc = {
-                    "resume_id": resume_id,
-                    "chunk_id": chunk_id,
-                    "text": chunk_text,
-                    "start_pos": start,
-                    "end_pos": end,
-                    "chunk_index": chunk_index,
-                    "field_name": field_name,
-                    "vector_id": vector_id,
-                    "metadata": {
-                        "length": len(chunk_text),
-                        "split_type": split_type,
-                        "chunk_size": chunk_size,
-                        "chunk_overlap": chunk_overlap
-                    },
-                    "created_at": datetime.now()
-                }
-                
-                # MongoDB에 청크 저장
-                result = await db.resume_chunks.insert_one(chunk_doc)
-                chunk_doc["id"] = str(result.inserted_id)
-                
-                chunks.append(chunk_doc)
-                chunk_index += 1
-            
-            start = end - chunk_overlap if chunk_overlap > 0 else end
+        chunks = []
+        for chunk_index, (start, end, chunk_text) in enumerate(split_text_windows(text, chunk_size, chunk_overlap)):
+            chunk_id = f"chunk_{chunk_index:03d}"
+            vector_id = f"resume_{resume_id}_{chunk_id}"
             
-            if start >= text_length:
-                break
+            chunks.append({
+                "resume_id": resume_id,
+                "chunk_id": chunk_id,
+                "text": chunk_text,
+                "start_pos": start,
+                "end_pos": end,
+                "chunk_index": chunk_index,
+                "field_name": field_name,
+                "vector_id": vector_id,
+                "metadata": {
+                    "length": len(chunk_text),
+                    "split_type": split_type,
+                    "chunk_size": chunk_size,
+                    "chunk_overlap": chunk_overlap
+                },
+                "created_at": datetime.now()
+            })
+        
+        # MongoDB에 청크 일괄 업서트 (재처리 시 중복 생성 없음)
+        chunks = await chunk_store.save_chunks(resume_id, {field_name: chunks})
         
         return {
             "chunks": chunks,
@@ -378,7 +494,7 @@ async def split_text(data: Dict[str, Any]):
 async def get_resume_chunks(resume_id: str):
     """특정 이력서의 모든 청크 조회"""
     try:
-        chunks = await db.resume_chunks.find({"resume_id": resume_id}).to_list(1000)
+        chunks = await chunk_store.get_resume_chunks(resume_id)
         
         # MongoDB의 _id를 id로 변환
         for chunk in chunks:
@@ -411,53 +527,43 @@ async def process_resume_with_chunking(data: Dict[str, Any]):
         
         # 청킹할 필드들
         fields_to_chunk = ["growthBackground", "motivation", "careerHistory"]
-        all_chunks = []
+        chunks_by_field = {}
         
         for field_name in fields_to_chunk:
             field_text = resume.get(field_name, "")
             if field_text and field_text.strip():
                 # 필드별 청킹 처리
                 field_chunks = []
-                text_length = len(field_text)
-                start = 0
-                chunk_index = 0
-                
-                while start < text_length:
-                    end = min(start + chunk_size, text_length)
-                    chunk_text = field_text[start:end]
-                    
-                    if chunk_text.strip():
-                        chunk_id = f"{field_name}_chunk_{chunk_index:03d}"
-                        vector_id = f"resume_{resume_id}_{chunk_id}"
-                        
-                        chunk_doc = {
-                            "resume_id": resume_id,
-                            "chunk_id": chunk_id,
-                            "text": chunk_text,
-                            "start_pos": start,
-                            "end_pos": end,
-                            "chunk_index": chunk_index,
-                            "field_name": field_name,
-                            "vector_id": vector_id,
-                            "metadata": {
-                                "applicant_name": resume.get("name", ""),
-                                "position": resume.get("position", ""),
-                                "department": resume.get("department", ""),
-                                "length": len(chunk_text)
-                            },
-                            "created_at": datetime.now()
-                        }
-                        
-                        result = await db.resume_chunks.insert_one(chunk_doc)
-                        chunk_doc["id"] = str(result.inserted_id)
-                        field_chunks.append(chunk_doc)
-                        chunk_index += 1
+                windows = split_text_windows(field_text, chunk_size, chunk_overlap)
+                for chunk_index, (start, end, chunk_text) in enumerate(windows):
+                    chunk_id = f"{field_name}_chunk_{chunk_index:03d}"
+                    vector_id = f"resume_{resume_id}_{chunk_id}"
                     
-                    start = end - chunk_overlap if chunk_overlap > 0 else end
-                    if start >= text_length:
-                        break
+                    field_chunks.append({
+                        "resume_id": resume_id,
+                        "chunk_id": chunk_id,
+                        "text": chunk_text,
+                        "start_pos": start,
+                        "end_pos": end,
+                        "chunk_index": chunk_index,
+                        "field_name": field_name,
+                        "vector_id": vector_id,
+                        "metadata": {
+                            "applicant_name": resume.get("name", ""),
+                            "position": resume.get("position", ""),
+                            "department": resume.get("department", ""),
+                            "length": len(chunk_text)
+                        },
+                        "created_at": datetime.now()
+                    })
                 
-                all_chunks.extend(field_chunks)
+                chunks_by_field[field_name] = field_chunks
+            else:
+                # 비어 있는 필드는 이전에 저장된 청크를 정리
+                chunks_by_field[field_name] = []
+        
+        # 모든 필드의 청크를 한 번의 bulk_write로 업서트
+        all_chunks = await chunk_store.save_chunks(resume_id, chunks_by_field)
         
         return {
             "resume_id": resume_id,
@@ -561,32 +667,26 @@ async def batch_similarity(data: Dict[str, Any]):
 
 @app.get("/api/similarity/metrics")
 async def get_similarity_metrics():
-    """유사도 서비스 메트릭 조회"""
+    """
+    유사도 서비스 메트릭 조회 (모든 워커 합산)
+    
+    방식별 비교 수/평균 유사도/처리 시간 백분위, 임베딩 처리량과 캐시 적중률, 벡터 검색 지연 시간을
+    최근 METRICS_WINDOW_SECONDS 구간(처리량/백분위)과 워커 시작 이후 누적(카운터)으로 반환합니다.
+    """
     try:
-        # 임시 메트릭 데이터
-        return {
-            "total_comparisons": 1250,
-            "average_similarity": 0.67,
-            "supported_methods": ["cosine", "jaccard", "levenshtein", "semantic"],
-            "performance_stats": {
-                "average_processing_time_ms": 45,
-                "comparisons_per_second": 220,
-                "cache_hit_rate": 0.78
-            },
-            "usage_by_method": {
-                "cosine": 850,
-                "semantic": 300,
-                "jaccard": 70,
-                "levenshtein": 30
-            }
-        }
+        workers = await asyncio.to_thread(service_metrics_publisher.collect)
+        return build_similarity_report(workers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"메트릭 조회 실패: {str(e)}")
 
 # 이력서 유사도 체크 API
 @app.post("/api/resume/similarity-check/{resume_id}")
-async def check_resume_similarity(resume_id: str):
-    """특정 이력서의 유사도 체크 (다른 모든 이력서와 비교)"""
+async def check_resume_similarity(resume_id: str, candidate_mode: str = "all", lsh_threshold: float = 0.5):
+    """
+    특정 이력서의 유사도 체크 (다른 모든 이력서와 비교)
+    
+    candidate_mode="lsh"이면 MinHash/LSH로 찾은 근사 중복 후보만 비교 결과에 포함합니다.
+    """
     try:
         print(f"🔍 유사도 체크 요청 - resume_id: {resume_id}")
         
@@ -611,91 +711,50 @@ async def check_resume_similarity(resume_id: str):
             
             raise HTTPException(status_code=404, detail=f"이력서를 찾을 수 없습니다. 요청된 ID: {resume_id}")
         
-        # 다른 모든 이력서 조회 (현재 이력서 제외)
-        other_resumes = await db.resumes.find({"_id": {"$ne": ObjectId(resume_id)}}).to_list(1000)
+        # 유사도 엔진 동기화 후 현재 이력서와 다른 모든 이력서의 유사도를 한 번에 계산
+        started = time.perf_counter()
+        await similarity_service.refresh_similarity_engine(db.resumes)
+        engine = similarity_service.similarity_engine
+        engine.upsert(current_resume)
+        scores = engine.similarities_for(resume_id)
         
-        # 현재 이력서의 비교 텍스트 (유사도 계산 필드)
-        current_fields = {
-            "growthBackground": current_resume.get("growthBackground", ""),
-            "motivation": current_resume.get("motivation", ""),
-            "careerHistory": current_resume.get("careerHistory", "")
-        }
-        
-        # 전체 텍스트 조합
-        current_text = " ".join([text for text in current_fields.values() if text])
+        # LSH 후보 생성 (텍스트 일부를 공유하는 이력서만 대상으로 좁힘)
+        near_duplicates = None
+        if candidate_mode == "lsh":
+            await similarity_service.refresh_near_duplicate_index(db.resumes, db.resume_signatures)
+            await similarity_service.index_resume_signatures(current_resume, db.resume_signatures)
+            near_duplicates = similarity_service.near_duplicate_index.candidates_for(resume_id, lsh_threshold)
         
         similarity_results = []
-        
-        for other_resume in other_resumes:
-            other_id = str(other_resume["_id"])
-            
-            # 다른 이력서의 비교 텍스트
-            other_fields = {
-                "growthBackground": other_resume.get("growthBackground", ""),
-                "motivation": other_resume.get("motivation", ""), 
-                "careerHistory": other_resume.get("careerHistory", "")
-            }
-            other_text = " ".join([text for text in other_fields.values() if text])
-            
-            # 실제 유사도 계산 사용
-            try:
-                print(f"💫 이력서 간 유사도 계산 시작: {resume_id} vs {other_id}")
-                
-                # SimilarityService의 텍스트 유사도 계산 메서드 직접 호출
-                text_similarity = similarity_service._calculate_text_similarity(current_resume, other_resume)
-                overall_similarity = text_similarity if text_similarity is not None else 0.0
-                
-                print(f"📊 텍스트 유사도 결과: {overall_similarity:.3f}")
-                
-                # 필드별 유사도 계산
-                field_similarities = {}
-                for field_name in current_fields.keys():
-                    if current_fields[field_name] and other_fields[field_name]:
-                        # 필드별 개별 텍스트 유사도 계산
-                        field_sim = similarity_service._calculate_text_similarity(
-                            {field_name: current_fields[field_name]},
-                            {field_name: other_fields[field_name]}
-                        )
-                        field_similarities[field_name] = field_sim if field_sim is not None else 0.0
-                        print(f"📋 {field_name} 유사도: {field_similarities[field_name]:.3f}")
-                    else:
-                        field_similarities[field_name] = 0.0
-                        
-            except Exception as e:
-                print(f"❌ 유사도 계산 중 오류 발생: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                # 오류 시 기본값 사용
-                import random
-                overall_similarity = random.uniform(0.1, 0.9)
-                field_similarities = {}
-                for field_name in current_fields.keys():
-                    if current_fields[field_name] and other_fields[field_name]:
-                        field_similarities[field_name] = random.uniform(0.0, 1.0)
-                    else:
-                        field_similarities[field_name] = 0.0
+        for i, other_id in enumerate(scores["resume_ids"]):
+            if near_duplicates is not None and other_id not in near_duplicates:
+                continue
+            info = scores["infos"][i]
+            overall_similarity = float(scores["overall"][i])
             
             similarity_result = {
                 "resume_id": other_id,
-                "applicant_name": other_resume.get("name", "알 수 없음"),
-                "position": other_resume.get("position", ""),
-                "department": other_resume.get("department", ""),
+                "applicant_name": info["name"],
+                "position": info["position"],
+                "department": info["department"],
                 "overall_similarity": round(overall_similarity, 4),
                 "field_similarities": {
-                    "growthBackground": round(field_similarities["growthBackground"], 4),
-                    "motivation": round(field_similarities["motivation"], 4),
-                    "careerHistory": round(field_similarities["careerHistory"], 4)
+                    field_name: round(float(scores["fields"][field_name][i]), 4)
+                    for field_name in ("growthBackground", "motivation", "careerHistory")
                 },
                 "is_high_similarity": overall_similarity > 0.7,
                 "is_moderate_similarity": 0.4 <= overall_similarity <= 0.7,
                 "is_low_similarity": overall_similarity < 0.4
             }
+            if near_duplicates is not None:
+                similarity_result["near_duplicate_fields"] = near_duplicates[other_id]
             
             similarity_results.append(similarity_result)
         
         # 유사도 높은 순으로 정렬
         similarity_results.sort(key=lambda x: x["overall_similarity"], reverse=True)
+        similarity_service.record_comparisons("engine", len(scores["resume_ids"]), time.perf_counter() - started,
+                                              [r["overall_similarity"] for r in similarity_results])
         
         # 통계 정보
         high_similarity_count = len([r for r in similarity_results if r["is_high_similarity"]])
@@ -721,8 +780,112 @@ async def check_resume_similarity(resume_id: str):
             "analysis_timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"유사도 체크 실패: {str(e)}")
 
+# 자기소개서 근사 중복(표절) 검색 API
+@app.post("/api/resume/near-duplicates")
+async def find_near_duplicate_texts(data: Dict[str, Any]):
+    """주어진 텍스트와 내용의 일정 비율 이상을 공유하는 이력서 필드 검색 (MinHash/LSH)"""
+    try:
+        text = data.get("text", "")
+        field = data.get("field")  # growthBackground, motivation, careerHistory (없으면 전체)
+        threshold = data.get("threshold", 0.5)
+        
+        if not text.strip():
+            raise HTTPException(status_code=400, detail="text가 필요합니다.")
+        
+        started = time.perf_counter()
+        await similarity_service.refresh_near_duplicate_index(db.resumes, db.resume_signatures)
+        matches = similarity_service.near_duplicate_index.query_text(text, threshold=threshold, field=field)
+        similarity_service.record_comparisons("lsh", len(matches), time.perf_counter() - started)
+        
+        return {
+            "matches": matches,
+            "total": len(matches),
+            "threshold": threshold,
+            "field": field,
+            "indexed_signatures": similarity_service.near_duplicate_index.size
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"근사 중복 검색 실패: {str(e)}")
+
+# 이력서 전체 중복 검사 API (N×N 유사도 행렬)
+@app.post("/api/resume/similarity-matrix")
+async def build_resume_similarity_matrix(data: Dict[str, Any] = None):
+    """모든 이력서 쌍의 유사도를 계산하여 임계값 이상인 중복 후보 쌍을 반환"""
+    try:
+        data = data or {}
+        threshold = data.get("threshold", 0.7)
+        
+        start_time = datetime.now()
+        await similarity_service.refresh_similarity_engine(db.resumes, rebuild=data.get("rebuild", False))
+        pairs = await asyncio.to_thread(similarity_service.similarity_engine.find_duplicate_pairs, threshold)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        total = similarity_service.similarity_engine.size
+        similarity_service.record_comparisons("matrix", total * (total - 1) // 2, elapsed)
+        
+        return {
+            "total_resumes": similarity_service.similarity_engine.size,
+            "threshold": threshold,
+            "duplicate_pairs": pairs,
+            "total_pairs": len(pairs),
+            "processing_time_seconds": round(elapsed, 3),
+            "analysis_timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"유사도 행렬 계산 실패: {str(e)}")
+
+# 자소서 일괄 분석 API
+@app.post("/api/cover-letters/batch")
+async def submit_cover_letter_batch(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(""),
+    analysis_type: str = Form("comprehensive")
+):
+    """여러 자소서 파일(또는 zip)을 일괄 분석 작업으로 등록합니다. 처리는 백그라운드에서 진행됩니다."""
+    if len(files) > COVER_LETTER_BATCH_MAX_FILES:
+        raise HTTPException(status_code=400,
+                            detail=f"파일이 너무 많습니다: {len(files)}개 (최대 {COVER_LETTER_BATCH_MAX_FILES}개)")
+    try:
+        uploads = []
+        for upload in files:
+            # 크기 제한을 넘는 순간 읽기를 멈춤 (작업 큐가 바이트를 들고 있으므로 메모리에 수집)
+            spooled = await spool_upload(upload, COVER_LETTER_BATCH_MAX_FILE_BYTES,
+                                         memory_limit=COVER_LETTER_BATCH_MAX_FILE_BYTES)
+            uploads.append((spooled.filename, spooled.data))
+        return await cover_letter_batch.submit(uploads, job_description, analysis_type)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=400, detail=f"{upload.filename}: {str(e)}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 분석 작업 등록 실패: {str(e)}")
+
+@app.get("/api/cover-letters/batch/{job_id}")
+async def get_cover_letter_batch(job_id: str, include_results: bool = False, after_index: int = -1, limit: int = 100):
+    """일괄 분석 작업 진행 상황 (include_results=true면 after_index 이후의 부분 결과 포함)"""
+    job = await cover_letter_batch.get_job(job_id, include_results, after_index, min(limit, 500))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+@app.get("/api/cover-letters/batch/{job_id}/stream")
+async def stream_cover_letter_batch(job_id: str):
+    """일괄 분석 진행 이벤트를 Server-Sent Events로 전송 (문서별 완료 이벤트 + 최종 작업 이벤트)"""
+    if await batch_job_store.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    async def event_stream():
+        async for event in cover_letter_batch.stream_events(job_id):
+            yield f"data: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -0,0 +1,192 @@
+import re
+import threading
+import zlib
+from typing import List, Dict, Any, Optional, Tuple, Set
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+def char_shingles(text: str, k: int = 3) -> Set[str]:
+    """
+    텍스트를 문자 k-gram(shingle) 집합으로 변환합니다.
+
+    한국어는 공백 기준 토큰화 시 조사/어미 변화에 약하므로 문자 단위 shingle을 사용합니다.
+
+    Args:
+        text (str): 원본 텍스트
+        k (int): shingle 길이
+
+    Returns:
+        Set[str]: shingle 집합
+    """
+    text = re.sub(r'\s+', ' ', (text or "").lower()).strip()
+    if not text:
+        return set()
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    (1/b)^(1/r)이 임계값에 가장 가까운 밴드 수 b와 밴드당 행 수 r을 고릅니다.
+
+    Args:
+        threshold (float): 목표 Jaccard 임계값
+        num_perm (int): 해시 순열 수
+
+    Returns:
+        Tuple[int, int]: (bands, rows)
+    """
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    def __init__(self, num_perm: int = 128, threshold: float = 0.5, shingle_size: int = 3, seed: int = 1):
+        """
+        MinHash 서명 + LSH 밴딩 기반 근사 중복 탐지 인덱스
+
+        서명은 텍스트당 한 번만 계산해 저장하고, 조회 시에는 같은 밴드 버킷에 들어간
+        후보만 서명 비교로 Jaccard를 추정하므로 전체 문서 수에 대해 준선형으로 동작합니다.
+
+        Args:
+            num_perm (int): 해시 순열 수 (서명 길이)
+            threshold (float): LSH 밴드 구성을 맞출 Jaccard 임계값
+            shingle_size (int): 문자 shingle 길이
+            seed (int): 해시 순열 난수 시드 (서명 호환성을 위해 고정)
+        """
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self._lock = threading.RLock()
+        self._signatures: Dict[Tuple[str, str], np.ndarray] = {}
+        self._resume_fields: Dict[str, Set[str]] = {}
+        self._buckets: List[Dict[bytes, Set[Tuple[str, str]]]] = [{} for _ in range(self.bands)]
+
+    @property
+    def size(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """텍스트의 MinHash 서명 (num_perm,) uint32 배열을 계산합니다. 빈 텍스트는 None."""
+        shingles = char_shingles(text, self.shingle_size)
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def insert(self, resume_id: str, field: str, signature: np.ndarray):
+        """(이력서, 필드) 키로 서명을 인덱스에 추가합니다. 기존 키는 교체됩니다."""
+        key = (str(resume_id), field)
+        signature = np.asarray(signature, dtype=np.uint32)
+        with self._lock:
+            self.remove(key[0], field)
+            self._signatures[key] = signature
+            self._resume_fields.setdefault(key[0], set()).add(field)
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def insert_text(self, resume_id: str, field: str, text: str) -> Optional[np.ndarray]:
+        """텍스트의 서명을 계산해 추가하고 서명을 반환합니다."""
+        signature = self.signature(text)
+        if signature is not None:
+            self.insert(resume_id, field, signature)
+        return signature
+
+    def remove(self, resume_id: str, field: Optional[str] = None):
+        """이력서의 서명을 제거합니다. field가 없으면 모든 필드를 제거합니다."""
+        resume_id = str(resume_id)
+        with self._lock:
+            fields = self._resume_fields.get(resume_id, set())
+            keys = [(resume_id, f) for f in list(fields) if field is None or f == field]
+            for key in keys:
+                fields.discard(key[1])
+                signature = self._signatures.pop(key)
+                for band, band_key in enumerate(self._band_keys(signature)):
+                    bucket = self._buckets[band].get(band_key)
+                    if bucket is not None:
+                        bucket.discard(key)
+                        if not bucket:
+                            del self._buckets[band][band_key]
+            if not fields:
+                self._resume_fields.pop(resume_id, None)
+
+    def query(self, signature: np.ndarray, threshold: Optional[float] = None,
+              field: Optional[str] = None, exclude_resume_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        서명과 추정 Jaccard가 임계값 이상인 (이력서, 필드) 목록을 찾습니다.
+
+        Args:
+            signature (np.ndarray): 조회할 MinHash 서명
+            threshold (Optional[float]): 최소 추정 유사도 (None이면 인덱스 임계값)
+            field (Optional[str]): 특정 필드만 조회
+            exclude_resume_id (Optional[str]): 결과에서 제외할 이력서 ID
+
+        Returns:
+            List[Dict[str, Any]]: resume_id, field, similarity 목록 (유사도 내림차순)
+        """
+        threshold = self.threshold if threshold is None else threshold
+        signature = np.asarray(signature, dtype=np.uint32)
+        with self._lock:
+            candidates: Set[Tuple[str, str]] = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates |= self._buckets[band].get(band_key, set())
+
+            results = []
+            for key in candidates:
+                if field is not None and key[1] != field:
+                    continue
+                if exclude_resume_id is not None and key[0] == str(exclude_resume_id):
+                    continue
+                similarity = float(np.mean(self._signatures[key] == signature))
+                if similarity >= threshold:
+                    results.append({"resume_id": key[0], "field": key[1], "similarity": round(similarity, 4)})
+
+        results.sort(key=lambda item: item["similarity"], reverse=True)
+        return results
+
+    def query_text(self, text: str, threshold: Optional[float] = None, field: Optional[str] = None,
+                   exclude_resume_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """텍스트와 유사한 (이력서, 필드) 목록을 찾습니다."""
+        signature = self.signature(text)
+        if signature is None:
+            return []
+        return self.query(signature, threshold, field, exclude_resume_id)
+
+    def candidates_for(self, resume_id: str, threshold: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        이미 등록된 이력서의 필드별 서명으로 근사 중복 후보 이력서를 찾습니다.
+
+        Returns:
+            Dict[str, Dict[str, float]]: 후보 resume_id -> {필드: 추정 유사도}
+        """
+        resume_id = str(resume_id)
+        with self._lock:
+            own = [(field, self._signatures[(resume_id, field)])
+                   for field in self._resume_fields.get(resume_id, set())]
+        candidates: Dict[str, Dict[str, float]] = {}
+        for field, signature in own:
+            for match in self.query(signature, threshold, field=field, exclude_resume_id=resume_id):
+                candidates.setdefault(match["resume_id"], {})[field] = match["similarity"]
+        return candidates
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
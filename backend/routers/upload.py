@@ -2,12 +2,13 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from fastapi.responses import JSONResponse
 from typing import Optional, Dict, List
 import os
-import tempfile
 import asyncio
-import aiofiles
 from datetime import datetime
 import google.generativeai as genai
 from pydantic import BaseModel
+from services.llm_providers.response_cache import llm_response_cache
+from services.llm_providers.scheduler import get_scheduler
+from utils.upload_ingest import SpooledUpload, UploadTooLargeError, spool_upload, extract_upload_text
 
 # Gemini API 설정
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -98,42 +99,32 @@ def validate_file(file: UploadFile) -> bool:
     
     return True
 
-async def extract_text_from_file(file_path: str, file_ext: str) -> str:
-    """파일에서 텍스트 추출"""
+async def spool_upload_or_reject(file: UploadFile) -> SpooledUpload:
+    """업로드를 청크 단위로 수집 (크기 제한을 넘으면 끝까지 읽지 않고 400)"""
     try:
-        if file_ext == '.txt':
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                return await f.read()
-        elif file_ext == '.pdf':
-            # PDF 텍스트 추출 (PyPDF2 또는 pdfplumber 사용)
-            try:
-                import PyPDF2
-                text = ""
-                with open(file_path, 'rb') as pdf_file:
-                    pdf_reader = PyPDF2.PdfReader(pdf_file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                return text
-            except ImportError:
-                # PyPDF2가 설치되지 않은 경우 기본 텍스트 반환
-                return "PDF 파일입니다. 텍스트 추출을 위해 PyPDF2를 설치해주세요."
-        elif file_ext in ['.doc', '.docx']:
-            # Word 문서 텍스트 추출 (python-docx 사용)
-            try:
-                from docx import Document
-                doc = Document(file_path)
-                text = ""
-                for paragraph in doc.paragraphs:
-                    text += paragraph.text + "\n"
-                return text
-            except ImportError:
-                return "Word 문서입니다. 텍스트 추출을 위해 python-docx를 설치해주세요."
-        else:
-            return "지원하지 않는 파일 형식입니다."
-    except Exception as e:
-        return f"파일 읽기 오류: {str(e)}"
+        return await spool_upload(file, MAX_FILE_SIZE)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=400,
+            detail="파일 크기가 너무 큽니다. 최대 10MB까지 업로드 가능합니다."
+        )
+
+async def _generate_content_cached(prompt: str, endpoint: str, use_cache: bool = True) -> str:
+    """Gemini 호출 결과 텍스트를 LLM 응답 캐시에서 재사용합니다. (같은 문서를 다시 요약하는 경우 등)"""
+    async def generate():
+        # 업로드 분석은 백그라운드 우선순위 (대화 요청이 먼저 슬롯을 받음)
+        response = await get_scheduler("gemini").run(
+            lambda: asyncio.to_thread(model.generate_content, prompt),
+            key=("gemini-1.5-flash", prompt), priority="background",
+            estimated_tokens=len(prompt) // 3 + 1000
+        )
+        return response.text
+    
+    return await llm_response_cache.get_or_generate(
+        prompt, "gemini-1.5-flash", generate, endpoint=endpoint, use_cache=use_cache
+    )
 
-async def generate_summary_with_gemini(content: str, summary_type: str = "general") -> SummaryResponse:
+async def generate_summary_with_gemini(content: str, summary_type: str = "general", use_cache: bool = True) -> SummaryResponse:
     """Gemini API를 사용하여 요약 생성"""
     if not GOOGLE_API_KEY:
         raise HTTPException(status_code=500, detail="Gemini API 키가 설정되지 않았습니다.")
@@ -187,12 +178,7 @@ async def generate_summary_with_gemini(content: str, summary_type: str = "genera
         prompt = prompts.get(summary_type, prompts["general"])
         
         # Gemini API 호출
-        response = await asyncio.to_thread(
-            model.generate_content,
-            prompt
-        )
-        
-        summary = response.text.strip()
+        summary = (await _generate_content_cached(prompt, "upload-summary", use_cache)).strip()
         
         # 키워드 추출을 위한 추가 요청
         keyword_prompt = f"""
@@ -203,12 +189,9 @@ async def generate_summary_with_gemini(content: str, summary_type: str = "genera
         키워드는 쉼표로 구분하여 나열해주세요.
         """
         
-        keyword_response = await asyncio.to_thread(
-            model.generate_content,
-            keyword_prompt
-        )
+        keyword_text = await _generate_content_cached(keyword_prompt, "upload-summary-keywords", use_cache)
         
-        keywords = [kw.strip() for kw in keyword_response.text.split(',')]
+        keywords = [kw.strip() for kw in keyword_text.split(',')]
         
         processing_time = (datetime.now() - start_time).total_seconds()
         
@@ -589,26 +572,14 @@ async def upload_and_summarize_file(
                 detail="지원하지 않는 파일 형식입니다. PDF, DOC, DOCX, TXT 파일만 업로드 가능합니다."
             )
         
-        # 파일 크기 확인
-        file_size = 0
-        content = await file.read()
-        file_size = len(content)
-        
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail="파일 크기가 너무 큽니다. 최대 10MB까지 업로드 가능합니다."
-            )
-        
-        # 임시 파일로 저장
+        # 청크 단위로 수집하며 파일 크기 확인 (작은 파일은 임시 파일 없이 메모리에서 파싱)
+        upload = await spool_upload_or_reject(file)
+        file_size = upload.size
         file_ext = os.path.splitext(file.filename.lower())[1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
         
         try:
-            # 파일에서 텍스트 추출
-            extracted_text = await extract_text_from_file(temp_file_path, file_ext)
+            # 파일에서 텍스트 추출 (프로세스 풀에서 파싱)
+            extracted_text = await extract_upload_text(upload, file_ext)
             
             if not extracted_text or extracted_text.strip() == "":
                 raise HTTPException(
@@ -631,9 +602,8 @@ async def upload_and_summarize_file(
             }
             
         finally:
-            # 임시 파일 삭제
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            # 임시 파일(큰 업로드인 경우) 삭제
+            upload.cleanup()
                 
     except HTTPException:
         raise
@@ -654,26 +624,14 @@ async def analyze_documents(
                 detail="지원하지 않는 파일 형식입니다. PDF, DOC, DOCX, TXT 파일만 업로드 가능합니다."
             )
         
-        # 파일 크기 확인
-        file_size = 0
-        content = await file.read()
-        file_size = len(content)
-        
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail="파일 크기가 너무 큽니다. 최대 10MB까지 업로드 가능합니다."
-            )
-        
-        # 임시 파일로 저장
+        # 청크 단위로 수집하며 파일 크기 확인 (작은 파일은 임시 파일 없이 메모리에서 파싱)
+        upload = await spool_upload_or_reject(file)
+        file_size = upload.size
         file_ext = os.path.splitext(file.filename.lower())[1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
         
         try:
-            # 파일에서 텍스트 추출
-            extracted_text = await extract_text_from_file(temp_file_path, file_ext)
+            # 파일에서 텍스트 추출 (프로세스 풀에서 파싱)
+            extracted_text = await extract_upload_text(upload, file_ext)
             
             if not extracted_text or extracted_text.strip() == "":
                 raise HTTPException(
@@ -729,9 +687,8 @@ async def analyze_documents(
                 }
             
         finally:
-            # 임시 파일 삭제
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            # 임시 파일(큰 업로드인 경우) 삭제
+            upload.cleanup()
                 
     except HTTPException:
         raise
@@ -0,0 +1,321 @@
+"""
+서비스별 실시간 카운터와 최근 구간 지연 시간 백분위 (GET /api/similarity/metrics)
+
+- ServiceStats: 누적 카운터 + 최근 window_seconds 동안의 처리량(초당 건수)과 지연 시간 표본
+- WorkerMetricsPublisher: 워커(프로세스)마다 스냅샷을 공유 디렉터리(METRICS_SHARED_DIR)에 주기적으로 기록
+- aggregate_snapshots(): 여러 워커의 스냅샷을 합산 (카운터/처리량은 합, 백분위는 표본을 합쳐서 계산)
+
+uvicorn --workers N처럼 프로세스가 여러 개면 요청을 받은 워커의 숫자만으로는 용량 계획을 할 수 없으므로,
+같은 호스트의 워커들이 같은 디렉터리에 스냅샷을 남기고 조회 시 모두 합칩니다.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import socket
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 처리량/백분위 계산 구간 (초)과 지표별 최대 지연 시간 표본 수
+METRICS_WINDOW_SECONDS = int(os.getenv("METRICS_WINDOW_SECONDS", "300"))
+METRICS_MAX_SAMPLES = int(os.getenv("METRICS_MAX_SAMPLES", "1024"))
+# 워커 스냅샷 기록 주기 (초) - 이 주기의 3배 넘게 갱신되지 않은 스냅샷은 종료된 워커로 보고 제외
+METRICS_PUBLISH_INTERVAL = float(os.getenv("METRICS_PUBLISH_INTERVAL", "10"))
+METRICS_SHARED_DIR = os.getenv("METRICS_SHARED_DIR", os.path.join(tempfile.gettempdir(), "hireme-service-metrics"))
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 표본의 q 백분위 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(math.ceil(q / 100 * len(sorted_values)), 1), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+def summarize_latency(samples: Iterable[float]) -> Dict[str, Any]:
+    """지연 시간 표본(초) → 개수/평균/백분위 (밀리초)"""
+    values = sorted(samples)
+    if not values:
+        return {"count": 0, "mean_ms": 0.0, **{f"p{q}_ms": 0.0 for q in PERCENTILES}}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 2),
+        **{f"p{q}_ms": round(percentile(values, q) * 1000, 2) for q in PERCENTILES}
+    }
+
+
+class ServiceStats:
+    """
+    서비스 하나의 누적 카운터와 최근 구간 처리량/지연 시간 (스레드 안전 - 인코딩 워커 스레드에서도 기록)
+
+        stats.inc("comparisons.vector", 12)
+        with stats.timer("query"):
+            ...
+
+    이미 instrumentation.span으로 재는 구간은 timer를 겹치지 말고 span(..., stats=stats)로 같은 측정값을 넘깁니다.
+    """
+
+    def __init__(self, service: str, window_seconds: int = METRICS_WINDOW_SECONDS,
+                 max_samples: int = METRICS_MAX_SAMPLES, clock=time.time):
+        self.service = service
+        self.window_seconds = window_seconds
+        self.max_samples = max_samples
+        self.clock = clock
+        self.started_at = clock()
+        self.counters: Dict[str, float] = {}
+        # 초 단위 버킷 [초, 건수] - 구간 길이만큼만 유지
+        self._rates: Dict[str, deque] = {}
+        # (시각, 소요 시간) 표본 - 최근 max_samples개만 유지
+        self._latencies: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1):
+        """누적 카운터와 초당 처리량 구간에 value만큼 더합니다."""
+        if not value:
+            return
+        second = int(self.clock())
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            buckets = self._rates.setdefault(name, deque())
+            if buckets and buckets[-1][0] == second:
+                buckets[-1][1] += value
+            else:
+                buckets.append([second, value])
+                while buckets and buckets[0][0] <= second - self.window_seconds:
+                    buckets.popleft()
+
+    def observe(self, name: str, seconds: float):
+        """지연 시간 표본을 기록합니다."""
+        with self._lock:
+            samples = self._latencies.get(name)
+            if samples is None:
+                samples = self._latencies[name] = deque(maxlen=self.max_samples)
+            samples.append((self.clock(), seconds))
+
+    def timer(self, name: str) -> "_Timer":
+        """with 블록 실행 시간을 name 지연 시간으로 기록 (예외가 나면 errors.<name> 카운터도 증가)"""
+        return _Timer(self, name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """워커 간 합산이 가능한 형태의 현재 상태 (구간 밖 표본은 제외)"""
+        now = self.clock()
+        cutoff = now - self.window_seconds
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "window_seconds": self.window_seconds,
+                "counters": dict(self.counters),
+                "rates": {name: [bucket for bucket in buckets if bucket[0] > cutoff]
+                          for name, buckets in self._rates.items()},
+                "latency": {name: [seconds for at, seconds in samples if at > cutoff]
+                            for name, samples in self._latencies.items()},
+                "taken_at": now
+            }
+
+    def reset(self):
+        with self._lock:
+            self.started_at = self.clock()
+            self.counters.clear()
+            self._rates.clear()
+            self._latencies.clear()
+
+
+class _Timer:
+    def __init__(self, stats: ServiceStats, name: str):
+        self.stats = stats
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stats.observe(self.name, time.perf_counter() - self.started)
+        if exc_type is not None and not issubclass(exc_type, (GeneratorExit, asyncio.CancelledError)):
+            self.stats.inc(f"errors.{self.name}")
+        return False
+
+
+def _rate(snapshot: Dict[str, Any], buckets: List[List[float]]) -> float:
+    """초당 건수 (워커가 시작한 지 구간보다 짧으면 실제 가동 시간으로 나눔)"""
+    span = min(snapshot["window_seconds"], max(snapshot["taken_at"] - snapshot["started_at"], 1.0))
+    return sum(count for _, count in buckets) / span
+
+
+def aggregate_snapshots(workers: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    워커 스냅샷 목록을 서비스별로 합산합니다.
+
+    Returns:
+        {서비스: {"counters": 합계, "rates": 초당 건수 합계, "latency": 합친 표본의 요약}}
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    for worker in workers:
+        for service, snapshot in worker.get("services", {}).items():
+            target = merged.setdefault(service, {"counters": {}, "rates": {}, "latency": {}})
+            for name, value in snapshot["counters"].items():
+                target["counters"][name] = target["counters"].get(name, 0) + value
+            for name, buckets in snapshot["rates"].items():
+                target["rates"][name] = target["rates"].get(name, 0.0) + _rate(snapshot, buckets)
+            for name, values in snapshot["latency"].items():
+                samples.setdefault(service, {}).setdefault(name, []).extend(values)
+
+    for service, by_name in samples.items():
+        merged[service]["latency"] = {name: summarize_latency(values) for name, values in by_name.items()}
+    for target in merged.values():
+        target["rates"] = {name: round(rate, 3) for name, rate in target["rates"].items()}
+    return merged
+
+
+class WorkerMetricsPublisher:
+    """
+    이 워커의 ServiceStats 스냅샷을 공유 디렉터리에 <호스트>-<pid>.json으로 주기적으로 기록하고,
+    조회 시 다른 워커들의 스냅샷과 함께 읽어 옵니다.
+    """
+
+    def __init__(self, sources: Dict[str, ServiceStats], directory: str = METRICS_SHARED_DIR,
+                 interval: float = METRICS_PUBLISH_INTERVAL):
+        self.sources = sources
+        self.directory = directory
+        self.interval = interval
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.path = os.path.join(directory, f"{self.worker_id}.json")
+        self._task: Optional[asyncio.Task] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "pid": os.getpid(),
+            "updated_at": time.time(),
+            "services": {name: stats.snapshot() for name, stats in self.sources.items()}
+        }
+
+    def publish(self):
+        """스냅샷을 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(temp_path, self.path)
+
+    def collect(self) -> List[Dict[str, Any]]:
+        """이 워커의 현재 스냅샷 + 최근에 갱신된 다른 워커들의 스냅샷"""
+        workers = [self.snapshot()]
+        stale_before = time.time() - self.interval * 3
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return workers
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if not name.endswith(".json") or path == self.path:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    worker = json.load(f)
+            except (OSError, ValueError):
+                continue  # 다른 워커가 교체 중이거나 손상된 파일
+            if worker.get("updated_at", 0) >= stale_before:
+                workers.append(worker)
+        return workers
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.publish)
+            except Exception as e:
+                logger.warning("워커 메트릭 스냅샷 기록 실패: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """기록 작업을 멈추고 이 워커의 스냅샷 파일을 지움 (종료된 워커가 합산에 남지 않도록)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _by_prefix(values: Dict[str, float], prefix: str) -> Dict[str, float]:
+    return {name[len(prefix):]: value for name, value in values.items() if name.startswith(prefix)}
+
+
+def build_similarity_report(workers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """similarity/embedding/vector 서비스 스냅샷을 GET /api/similarity/metrics 응답으로 정리"""
+    merged = aggregate_snapshots(workers)
+    empty = {"counters": {}, "rates": {}, "latency": {}}
+    similarity, embedding, vector = (merged.get(name, empty) for name in ("similarity", "embedding", "vector"))
+
+    usage_by_method = _by_prefix(similarity["counters"], "comparisons.")
+    score_sums = _by_prefix(similarity["counters"], "score_sum.")
+    scored = _by_prefix(similarity["counters"], "scored.")
+    total_scored = sum(scored.values())
+    all_operations = [seconds for worker in workers
+                      for seconds_list in worker.get("services", {}).get("similarity", {}).get("latency", {}).values()
+                      for seconds in seconds_list]
+
+    embedded = embedding["counters"].get("embeddings", 0)
+    cache_hits = embedding["counters"].get("cache_hits", 0)
+    window_embedded = embedding["rates"].get("embeddings", 0.0)
+    window_hits = embedding["rates"].get("cache_hits", 0.0)
+
+    return {
+        "total_comparisons": int(sum(usage_by_method.values())),
+        "average_similarity": round(sum(score_sums.values()) / total_scored, 4) if total_scored else None,
+        "supported_methods": sorted(usage_by_method),
+        "usage_by_method": {method: int(count) for method, count in usage_by_method.items()},
+        "average_similarity_by_method": {method: round(score_sums.get(method, 0) / count, 4)
+                                         for method, count in scored.items() if count},
+        "performance_stats": {
+            **summarize_latency(all_operations),
+            "comparisons_per_second": round(sum(_by_prefix(similarity["rates"], "comparisons.").values()), 3),
+            "cache_hit_rate": round(cache_hits / embedded, 4) if embedded else 0.0
+        },
+        "latency_by_method": similarity["latency"],
+        "embedding": {
+            "embeddings_total": int(embedded),
+            "encoded_total": int(embedding["counters"].get("encoded", 0)),
+            "embeddings_per_second": window_embedded,
+            "cache_hit_rate": round(cache_hits / embedded, 4) if embedded else 0.0,
+            "recent_cache_hit_rate": round(window_hits / window_embedded, 4) if window_embedded else 0.0,
+            "latency": embedding["latency"]
+        },
+        "vector": {
+            "queries_total": int(vector["counters"].get("queries", 0)),
+            "queries_per_second": vector["rates"].get("queries", 0.0),
+            "errors_total": int(sum(_by_prefix(vector["counters"], "errors.").values())),
+            "latency": vector["latency"]
+        },
+        "workers": [{
+            "worker_id": worker["worker_id"],
+            "pid": worker["pid"],
+            "updated_at": worker["updated_at"],
+            "total_comparisons": int(sum(_by_prefix(
+                worker["services"].get("similarity", empty)["counters"], "comparisons.").values())),
+            "embeddings_total": int(worker["services"].get("embedding", empty)["counters"].get("embeddings", 0)),
+            "vector_queries_total": int(worker["services"].get("vector", empty)["counters"].get("queries", 0))
+        } for worker in workers],
+        "window_seconds": max((snapshot["window_seconds"] for worker in workers
+                               for snapshot in worker.get("services", {}).values()), default=METRICS_WINDOW_SECONDS)
+    }
@@ -2,23 +2,38 @@
 자소서 자동 분석 서비스
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-from ...models.cover_letter_models import (
+from models.cover_letter_models import (
     CoverLetterAnalysis, CoverLetterUploadRequest, 
     TopStrength, STARAnalysis, JobSuitability,
     SentenceImprovement, EvaluationRubric
 )
-from ...utils.text_extractor import extract_text_from_file, validate_upload_file
-from ...services.llm_providers.base_provider import LLMProviderFactory, LLMResponse
+from utils.text_extractor import extract_text_from_file, validate_upload_file
+from services.llm_providers.base_provider import LLMProviderFactory, LLMResponse
+from services.llm_providers.response_cache import LLMResponseCache
 from .prompts import get_analysis_prompt
+from .masking import mask_personal_info
 
 logger = logging.getLogger(__name__)
 
+# 측면별 분석 프롬프트 (종합 분석 대신 동시에 실행 가능한 독립 분석)
+ASPECTS = ["summary", "star", "suitability", "improvement", "rubric"]
+
+# 배열/단일 객체로 응답하는 측면의 결과를 종합 분석 결과의 키로 감쌈
+ASPECT_RESULT_KEYS = {
+    "star": "star_cases",
+    "suitability": "job_suitability",
+    "improvement": "sentence_improvements",
+    "rubric": "evaluation_rubric",
+}
+
 
 class CoverLetterAnalyzer:
     """자소서 자동 분석 서비스"""
@@ -26,6 +41,13 @@ class CoverLetterAnalyzer:
     def __init__(self, llm_config: Dict[str, Any]):
         self.llm_config = llm_config
         self.llm_provider = None
+        # 측면 분석 동시 실행 수 제한
+        self.aspect_semaphore = asyncio.Semaphore(llm_config.get("max_concurrent_aspects", 3))
+        # (텍스트 해시, 직무 설명, 분석 유형) → 정제 전 분석 결과
+        self.result_cache = LLMResponseCache(
+            max_entries=llm_config.get("analysis_cache_size", 256),
+            ttl_seconds=llm_config.get("analysis_cache_ttl", 3600)
+        )
         self._initialize_llm_provider()
     
     def _initialize_llm_provider(self) -> None:
@@ -64,20 +86,19 @@ class CoverLetterAnalyzer:
         start_time = time.time()
         
         try:
-            # 1. 파일 유효성 검사
-            if not validate_upload_file(file_bytes, filename):
-                raise ValueError("업로드 파일이 유효하지 않습니다.")
+            # 1~2. 파일 유효성 검사 + 텍스트 추출 (PDF/DOCX 파싱은 CPU 작업이므로 워커 스레드에서)
+            extracted_text, file_type = await asyncio.to_thread(self._extract_text, file_bytes, filename)
             
-            # 2. 텍스트 추출
-            extracted_text, file_type = extract_text_from_file(file_bytes, filename)
+            # 3. 개인정보 마스킹 (로컬 정규식)
+            masked_text = self._mask_personal_info(extracted_text)
             
-            # 3. 개인정보 마스킹 (선택사항)
-            masked_text = await self._mask_personal_info(extracted_text)
-            
-            # 4. LLM 분석 실행
-            analysis_result = await self._run_llm_analysis(
-                masked_text, job_description, analysis_type
-            )
+            # 4. LLM 분석 실행 (측면 분석은 동시에 실행)
+            if analysis_type == "aspects" or analysis_type in ASPECTS or "," in analysis_type:
+                aspects = ASPECTS if analysis_type == "aspects" else \
+                    [aspect.strip() for aspect in analysis_type.split(",") if aspect.strip()]
+                analysis_result = await self._run_aspect_analyses(masked_text, job_description, aspects)
+            else:
+                analysis_result = await self._run_cached_analysis(masked_text, job_description, analysis_type)
             
             # 5. 결과 정제 및 검증
             cleaned_result = self._clean_analysis_result(analysis_result)
@@ -111,27 +132,50 @@ class CoverLetterAnalyzer:
                 status="error"
             )
     
-    async def _mask_personal_info(self, text: str) -> str:
-        """개인정보 마스킹 처리"""
-        try:
-            if not self.llm_provider:
-                return text
-            
-            prompt = get_analysis_prompt("masking", text=text)
-            response = await self.llm_provider.safe_generate(prompt)
-            
-            if response:
-                try:
-                    result = json.loads(response)
-                    return result.get("masked_text", text)
-                except json.JSONDecodeError:
-                    logger.warning("개인정보 마스킹 응답 파싱 실패, 원본 텍스트 사용")
-            
-            return text
-            
-        except Exception as e:
-            logger.warning(f"개인정보 마스킹 실패: {str(e)}, 원본 텍스트 사용")
-            return text
+    def _extract_text(self, file_bytes: bytes, filename: str):
+        """파일 유효성 검사 후 텍스트 추출 (워커 스레드에서 실행)"""
+        if not validate_upload_file(file_bytes, filename):
+            raise ValueError("업로드 파일이 유효하지 않습니다.")
+        return extract_text_from_file(file_bytes, filename)
+    
+    def _mask_personal_info(self, text: str) -> str:
+        """개인정보 마스킹 처리 (주민등록번호/전화번호/이메일)"""
+        masked_text, counts = mask_personal_info(text)
+        if counts:
+            logger.info(f"개인정보 마스킹: {counts}")
+        return masked_text
+    
+    async def _run_cached_analysis(self, text: str, job_description: str, analysis_type: str) -> Dict[str, Any]:
+        """(텍스트 해시, 직무 설명, 분석 유형)이 같은 결과는 캐시에서 재사용"""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        config = {"job_description": job_description}
+        cached = self.result_cache.get(text_hash, analysis_type, config)
+        if cached is not None:
+            return cached
+        
+        result = await self._run_llm_analysis(text, job_description, analysis_type)
+        if analysis_type in ASPECT_RESULT_KEYS:
+            result = {ASPECT_RESULT_KEYS[analysis_type]: result}
+        self.result_cache.set(text_hash, analysis_type, result, config)
+        return result
+    
+    async def _run_aspect_analyses(self, text: str, job_description: str, aspects: List[str]) -> Dict[str, Any]:
+        """독립적인 측면 분석을 세마포어 한도 내에서 동시에 실행하고 결과를 합칩니다."""
+        async def run(aspect: str) -> Dict[str, Any]:
+            async with self.aspect_semaphore:
+                return await self._run_cached_analysis(text, job_description, aspect)
+        
+        results = await asyncio.gather(*(run(aspect) for aspect in aspects), return_exceptions=True)
+        
+        merged: Dict[str, Any] = {}
+        for aspect, result in zip(aspects, results):
+            if isinstance(result, BaseException):
+                logger.error(f"측면 분석 실패: {aspect}, 오류: {str(result)}")
+                continue
+            merged.update(result)
+        if not merged:
+            raise RuntimeError("모든 측면 분석에 실패했습니다.")
+        return merged
     
     async def _run_llm_analysis(
         self, 
@@ -151,19 +195,21 @@ class CoverLetterAnalyzer:
                 job_description=job_description
             )
             
-            # LLM 응답 생성
-            response = await self.llm_provider.safe_generate(prompt)
+            # LLM 응답 생성 (대화보다 낮은 우선순위)
+            response = await self.llm_provider.safe_generate(
+                prompt, endpoint="cover-letter-analysis", priority="background"
+            )
             
             if not response:
                 raise RuntimeError("LLM 응답을 받지 못했습니다.")
             
             # JSON 파싱
             try:
-                result = json.loads(response)
+                result = json.loads(response.content)
                 return result
             except json.JSONDecodeError as e:
                 logger.error(f"LLM 응답 JSON 파싱 실패: {str(e)}")
-                logger.error(f"응답 내용: {response[:500]}...")
+                logger.error(f"응답 내용: {response.content[:500]}...")
                 raise ValueError("LLM 응답을 JSON으로 파싱할 수 없습니다.")
                 
         except Exception as e:
@@ -254,14 +300,31 @@ class CoverLetterAnalyzer:
         aspect: str, 
         job_description: str = ""
     ) -> Dict[str, Any]:
-        """특정 측면만 분석"""
+        """특정 측면만 분석 (같은 텍스트/직무 설명/측면은 캐시 사용)"""
         try:
-            result = await self._run_llm_analysis(text, job_description, aspect)
+            async with self.aspect_semaphore:
+                result = await self._run_cached_analysis(self._mask_personal_info(text), job_description, aspect)
             return self._clean_analysis_result(result)
         except Exception as e:
             logger.error(f"특정 측면 분석 실패: {aspect}, 오류: {str(e)}")
             return {}
     
+    async def analyze_aspects(
+        self, 
+        text: str, 
+        aspects: Optional[List[str]] = None, 
+        job_description: str = ""
+    ) -> Dict[str, Any]:
+        """여러 측면을 동시에 분석하고 정제된 결과를 합쳐 반환"""
+        try:
+            result = await self._run_aspect_analyses(
+                self._mask_personal_info(text), job_description, aspects or ASPECTS
+            )
+            return self._clean_analysis_result(result)
+        except Exception as e:
+            logger.error(f"측면 분석 실패: {aspects}, 오류: {str(e)}")
+            return {}
+    
     def get_analysis_summary(self, analysis: CoverLetterAnalysis) -> Dict[str, Any]:
         """분석 결과 요약"""
         summary = {
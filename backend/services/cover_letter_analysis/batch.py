@@ -0,0 +1,293 @@
+"""
+자소서 일괄 분석 작업
+
+여러 파일(또는 zip)을 하나의 작업으로 받아 MongoDB에 작업 기록을 남기고,
+제한된 워커 풀에서 하나의 분석기(프로바이더 클라이언트 공유)로 처리합니다.
+진행 상황과 부분 결과는 폴링(get_job/get_results) 또는 스트리밍(stream_events)으로 조회합니다.
+"""
+
+import asyncio
+import io
+import logging
+import time
+import uuid
+import zipfile
+from datetime import datetime
+from pathlib import PurePosixPath
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = {".txt", ".pdf", ".docx", ".doc"}
+MAX_ZIP_ENTRIES = 1000
+MAX_ZIP_TOTAL_BYTES = 500 * 1024 * 1024
+
+
+def expand_uploads(files: List[Tuple[str, bytes]], max_entries: int = MAX_ZIP_ENTRIES,
+                   max_total_bytes: int = MAX_ZIP_TOTAL_BYTES) -> List[Tuple[str, bytes]]:
+    """
+    업로드 파일 목록에서 zip을 풀어 (파일명, 바이트) 목록으로 만듭니다.
+    zip 안의 디렉터리, 숨김/메타 파일, 지원하지 않는 형식은 건너뜁니다.
+
+    Raises:
+        ValueError: zip 항목 수나 압축 해제 크기가 제한을 넘는 경우
+    """
+    expanded: List[Tuple[str, bytes]] = []
+    for filename, data in files:
+        if PurePosixPath(filename).suffix.lower() != ".zip":
+            expanded.append((filename, data))
+            continue
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            entries = [info for info in archive.infolist() if not info.is_dir()]
+            if len(entries) > max_entries:
+                raise ValueError(f"zip 파일 항목이 너무 많습니다: {len(entries)}개 (최대 {max_entries}개)")
+            # 압축 해제 전에 선언된 크기로 먼저 검사 (zip bomb 방지)
+            if sum(info.file_size for info in entries) > max_total_bytes:
+                raise ValueError("zip 파일의 압축 해제 크기가 제한을 초과했습니다.")
+
+            for info in entries:
+                path = PurePosixPath(info.filename)
+                if path.name.startswith(".") or "__MACOSX" in path.parts:
+                    continue
+                if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+                    continue
+                expanded.append((path.name, archive.read(info)))
+    return expanded
+
+
+class BatchJobStore:
+    def __init__(self, jobs_collection, results_collection):
+        """
+        일괄 분석 작업 저장소 (Motor 컬렉션)
+
+        작업 문서에는 진행 카운터와 처리량/지연 시간 지표를,
+        문서별 결과는 (job_id, index) 키로 별도 컬렉션에 저장합니다. (작업 문서 크기 제한 회피)
+        """
+        self.jobs = jobs_collection
+        self.results = results_collection
+
+    async def create_indexes(self):
+        try:
+            await self.jobs.create_index("job_id", unique=True)
+            await self.results.create_index([("job_id", 1), ("index", 1)], unique=True)
+        except OperationFailure as e:
+            print(f"[BatchJobStore] 인덱스 생성 실패: {e}")
+
+    async def create_job(self, job: Dict[str, Any]):
+        await self.jobs.insert_one(dict(job))
+
+    async def update_job(self, job_id: str, fields: Dict[str, Any], increments: Optional[Dict[str, int]] = None):
+        update: Dict[str, Any] = {"$set": {**fields, "updated_at": datetime.now()}}
+        if increments:
+            update["$inc"] = increments
+        await self.jobs.update_one({"job_id": job_id}, update)
+
+    async def save_result(self, job_id: str, result: Dict[str, Any]):
+        await self.results.update_one(
+            {"job_id": job_id, "index": result["index"]},
+            {"$set": {**result, "job_id": job_id}},
+            upsert=True
+        )
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.jobs.find_one({"job_id": job_id}, {"_id": 0})
+
+    async def get_results(self, job_id: str, after_index: int = -1, limit: int = 100) -> List[Dict[str, Any]]:
+        cursor = self.results.find({"job_id": job_id, "index": {"$gt": after_index}}, {"_id": 0}) \
+            .sort("index", 1).limit(limit)
+        return [document async for document in cursor]
+
+
+class _JobState:
+    """진행 중인 작업의 메모리 상태 (스트리밍 구독자, 지연 시간 기록)"""
+
+    def __init__(self, job_id: str, total: int):
+        self.job_id = job_id
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.latencies: List[float] = []
+        self.started = time.perf_counter()
+        self.subscribers: List[asyncio.Queue] = []
+        self.task: Optional[asyncio.Task] = None
+
+    def publish(self, event: Dict[str, Any]):
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+
+    def metrics(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        processed = self.completed + self.failed
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3)
+
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_docs_per_minute": round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "latency_avg_seconds": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "latency_p50_seconds": percentile(0.5),
+            "latency_p95_seconds": percentile(0.95),
+        }
+
+
+class CoverLetterBatchProcessor:
+    def __init__(self, analyzer, store: BatchJobStore, max_workers: int = 4):
+        """
+        Args:
+            analyzer: CoverLetterAnalyzer (모든 작업이 같은 분석기/프로바이더 클라이언트를 공유)
+            store (BatchJobStore): 작업 저장소
+            max_workers (int): 모든 작업을 합쳐 동시에 분석하는 최대 문서 수
+        """
+        self.analyzer = analyzer
+        self.store = store
+        self.max_workers = max_workers
+        self._slots = asyncio.Semaphore(max_workers)
+        self._jobs: Dict[str, _JobState] = {}
+
+    async def submit(self, files: List[Tuple[str, bytes]], job_description: str = "",
+                     analysis_type: str = "comprehensive") -> Dict[str, Any]:
+        """작업을 등록하고 백그라운드 처리를 시작합니다. (zip은 풀어서 등록)"""
+        # zip 해제는 CPU/메모리 작업이므로 이벤트 루프 밖에서 실행
+        documents = await asyncio.to_thread(expand_uploads, files)
+        if not documents:
+            raise ValueError("분석할 파일이 없습니다.")
+
+        job_id = uuid.uuid4().hex
+        now = datetime.now()
+        job = {
+            "job_id": job_id,
+            "status": "queued",
+            "total": len(documents),
+            "completed": 0,
+            "failed": 0,
+            "job_description": job_description,
+            "analysis_type": analysis_type,
+            "filenames": [filename for filename, _ in documents],
+            "metrics": {},
+            "created_at": now,
+            "updated_at": now,
+        }
+        await self.store.create_job(job)
+
+        state = _JobState(job_id, len(documents))
+        self._jobs[job_id] = state
+        state.task = asyncio.create_task(self._run_job(state, documents, job_description, analysis_type))
+        return {"job_id": job_id, "status": "queued", "total": len(documents)}
+
+    async def _run_job(self, state: _JobState, documents: List[Tuple[str, bytes]],
+                       job_description: str, analysis_type: str):
+        status = "failed"
+        try:
+            queue: asyncio.Queue = asyncio.Queue()
+            for index, (filename, data) in enumerate(documents):
+                queue.put_nowait((index, filename, data))
+            documents.clear()  # 큐만 파일 바이트를 들고 있도록 (처리된 파일은 바로 해제)
+
+            await self.store.update_job(state.job_id, {"status": "running", "started_at": datetime.now()})
+
+            async def worker():
+                while True:
+                    try:
+                        index, filename, data = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    async with self._slots:
+                        await self._process_document(state, index, filename, data, job_description, analysis_type)
+
+            await asyncio.gather(*(worker() for _ in range(min(self.max_workers, state.total))))
+            status = "completed" if state.failed == 0 else ("failed" if state.completed == 0 else "partial")
+        except Exception as e:
+            logger.error(f"일괄 분석 작업 실패: {state.job_id}, 오류: {str(e)}")
+        finally:
+            # 저장소 오류/취소가 있어도 구독자에게 종료를 알리고 작업 목록에서 제거
+            metrics = state.metrics()
+            try:
+                await self.store.update_job(state.job_id, {"status": status, "finished_at": datetime.now(),
+                                                           "metrics": metrics})
+            except Exception as e:
+                logger.error(f"일괄 분석 작업 상태 저장 실패: {state.job_id}, 오류: {str(e)}")
+            finally:
+                state.publish({"type": "job", "job_id": state.job_id, "status": status, "total": state.total,
+                               "completed": state.completed, "failed": state.failed, "metrics": metrics})
+                state.publish(None)
+                self._jobs.pop(state.job_id, None)
+
+    async def _process_document(self, state: _JobState, index: int, filename: str, data: bytes,
+                                job_description: str, analysis_type: str):
+        started = time.perf_counter()
+        try:
+            analysis = await self.analyzer.analyze_cover_letter(data, filename, job_description, analysis_type)
+            ok = analysis.status == "completed"
+            result = {
+                "index": index,
+                "filename": filename,
+                "status": analysis.status,
+                "summary": self.analyzer.get_analysis_summary(analysis),
+                "analysis": analysis.model_dump(mode="json", exclude={"id", "original_text", "embedding"}) if ok else None,
+                "error": None if ok else "분석에 실패했습니다.",
+            }
+        except Exception as e:
+            ok = False
+            result = {"index": index, "filename": filename, "status": "error",
+                      "summary": None, "analysis": None, "error": str(e)}
+
+        latency = round(time.perf_counter() - started, 3)
+        result["latency_seconds"] = latency
+        state.latencies.append(latency)
+        if ok:
+            state.completed += 1
+        else:
+            state.failed += 1
+
+        await self.store.save_result(state.job_id, result)
+        await self.store.update_job(
+            state.job_id, {"metrics": state.metrics()},
+            increments={"completed": 1} if ok else {"failed": 1}
+        )
+        state.publish({"type": "document", "job_id": state.job_id, "index": index, "filename": filename,
+                       "status": result["status"], "latency_seconds": latency, "summary": result["summary"],
+                       "completed": state.completed, "failed": state.failed, "total": state.total})
+
+    async def get_job(self, job_id: str, include_results: bool = False, after_index: int = -1,
+                      limit: int = 100) -> Optional[Dict[str, Any]]:
+        """작업 상태 (폴링용). include_results면 after_index 이후의 부분 결과도 포함합니다."""
+        job = await self.store.get_job(job_id)
+        if job is None:
+            return None
+        state = self._jobs.get(job_id)
+        if state is not None:
+            job["metrics"] = state.metrics()
+        if include_results:
+            job["results"] = await self.store.get_results(job_id, after_index, limit)
+        return job
+
+    async def stream_events(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """진행 이벤트 스트림. 이미 끝난 작업이면 최종 상태 하나만 반환합니다."""
+        state = self._jobs.get(job_id)
+        if state is None:
+            job = await self.store.get_job(job_id)
+            if job is not None:
+                yield {"type": "job", "job_id": job_id, "status": job["status"], "total": job["total"],
+                       "completed": job["completed"], "failed": job["failed"], "metrics": job.get("metrics", {})}
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        state.subscribers.append(queue)
+        try:
+            yield {"type": "progress", "job_id": job_id, "total": state.total,
+                   "completed": state.completed, "failed": state.failed}
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            if queue in state.subscribers:
+                state.subscribers.remove(queue)
@@ -0,0 +1,32 @@
+"""
+자소서 개인정보 마스킹 (로컬 정규식)
+
+LLM 왕복 없이 주민등록번호, 전화번호, 이메일을 마스킹합니다.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+# (유형, 정규식, 치환 문자열) - 주민등록번호를 전화번호보다 먼저 처리
+PII_PATTERNS: List[Tuple[str, "re.Pattern", str]] = [
+    ("주민등록번호", re.compile(r"(?<!\d)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\s*-?\s*[1-8]\d{6}(?!\d)"),
+     "******-*******"),
+    ("이메일", re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"), "***@***"),
+    ("전화번호", re.compile(r"(?<!\d)(?:\+82[-.\s]?|0)(?:1[016789]|2|[3-6][1-5]|70)[-.\s)]?\d{3,4}[-.\s]?\d{4}(?!\d)"),
+     "***-****-****"),
+]
+
+
+def mask_personal_info(text: str) -> Tuple[str, Dict[str, int]]:
+    """
+    개인정보를 마스킹합니다.
+
+    Returns:
+        (마스킹된 텍스트, 유형별 마스킹 개수)
+    """
+    counts: Dict[str, int] = {}
+    for pii_type, pattern, replacement in PII_PATTERNS:
+        text, count = pattern.subn(replacement, text)
+        if count:
+            counts[pii_type] = count
+    return text, counts
@@ -7,6 +7,9 @@ from typing import Dict, Any, Optional
 import logging
 from datetime import datetime
 
+from .response_cache import LLMResponseCache, llm_response_cache
+from .scheduler import ProviderScheduler, get_scheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +22,14 @@ class LLMProvider(ABC):
         self.max_tokens = config.get("max_tokens", 2000)
         self.temperature = config.get("temperature", 0.1)
         self.is_available = False
+        # 응답 캐시 (config["cache"]로 교체 가능, config["use_cache"]=False면 이 프로바이더는 캐시 미사용)
+        self.cache: LLMResponseCache = config.get("cache") or llm_response_cache
+        self.use_cache = config.get("use_cache", True)
+        # 호출 스케줄러 (속도 제한/동시 실행 제한/중복 호출 병합/재시도), 같은 프로바이더끼리 공유
+        self.scheduler: ProviderScheduler = config.get("scheduler") or get_scheduler(
+            self.__class__.__name__.replace("Provider", "").lower(),
+            max_retries=config.get("max_retries", 3)
+        )
         self._initialize()
     
     @abstractmethod
@@ -67,8 +78,60 @@ class LLMProvider(ABC):
         
         return True
     
-    async def safe_generate(self, prompt: str, **kwargs) -> Optional['LLMResponse']:
-        """안전한 응답 생성 (예외 처리 포함)"""
+    # 캐시 키에서 제외할 요청 옵션 (응답 내용에 영향 없음)
+    _CACHE_IGNORED_KWARGS = ("timeout", "stream")
+    
+    def _cache_config(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시 키에 들어가는 생성 설정"""
+        config = {"max_tokens": self.max_tokens, "temperature": self.temperature}
+        config.update({k: v for k, v in kwargs.items() if k not in self._CACHE_IGNORED_KWARGS})
+        return config
+    
+    def estimate_tokens(self, prompt: str, **kwargs) -> int:
+        """토큰 버킷에서 차감할 예상 토큰 수 (프롬프트 + 최대 출력)"""
+        return len(prompt) // 3 + kwargs.get("max_tokens", self.max_tokens)
+    
+    async def cached_generate(self, prompt: str, endpoint: Optional[str] = None, use_cache: bool = True,
+                              priority: str = "interactive", **kwargs) -> 'LLMResponse':
+        """
+        응답 캐시와 스케줄러를 거쳐 generate_response를 호출합니다.
+        
+        Args:
+            endpoint: 엔드포인트 이름 (LLM_CACHE_DISABLED_ENDPOINTS에 있으면 캐시 미사용)
+            use_cache: False면 이번 호출은 항상 원격 모델을 호출
+            priority: "interactive"(대화) / "background"(분석 작업) 스케줄러 우선순위
+        """
+        hit = True
+        model = kwargs.get("model", self.model_name)
+        config = self._cache_config(kwargs)
+        
+        async def generate():
+            nonlocal hit
+            hit = False
+            # 캐시 미스인 동일 프롬프트가 동시에 들어오면 원격 호출 1회를 공유
+            return await self.scheduler.run(
+                lambda: self.generate_response(prompt, **kwargs),
+                key=(self.__class__.__name__, LLMResponseCache.make_key(prompt, model, config)),
+                priority=priority,
+                estimated_tokens=self.estimate_tokens(prompt, **kwargs)
+            )
+        
+        response = await self.cache.get_or_generate(
+            prompt, model, generate,
+            config=config, endpoint=endpoint,
+            use_cache=use_cache and self.use_cache,
+            should_cache=lambda r: bool(r and r.content and r.content.strip())
+        )
+        if hit:
+            # 캐시된 객체를 공유하지 않도록 복사본에 캐시 적중 표시
+            now = datetime.now()
+            response = LLMResponse(response.content, response.provider, response.model,
+                                   {**response.metadata, "cache_hit": True}, now, now)
+        return response
+    
+    async def safe_generate(self, prompt: str, endpoint: Optional[str] = None, use_cache: bool = True,
+                            priority: str = "interactive", **kwargs) -> Optional['LLMResponse']:
+        """안전한 응답 생성 (예외 처리 포함, 응답 캐시/스케줄러 사용)"""
         try:
             if not self.is_available:
                 logger.error("LLM 프로바이더가 사용 불가능합니다.")
@@ -78,7 +141,8 @@ class LLMProvider(ABC):
                 logger.error("프롬프트 유효성 검사 실패")
                 return None
             
-            response = await self.generate_response(prompt, **kwargs)
+            response = await self.cached_generate(prompt, endpoint=endpoint, use_cache=use_cache,
+                                                  priority=priority, **kwargs)
             
             if not response or not response.content or len(response.content.strip()) == 0:
                 logger.warning("빈 응답을 받았습니다.")
@@ -0,0 +1,262 @@
+"""
+토큰 예산 기반 대화 컨텍스트 구성
+
+- 프로바이더별 토큰 추정기 (OpenAI는 tiktoken이 설치되어 있으면 실제 토큰 수 사용)
+- 최근 대화는 토큰 예산 안에서 최신순으로 포함하고, 예산 밖으로 밀려난 이전 대화는
+  세션별 누적 요약에 한 번만 반영합니다. (요약 상태는 세션 저장소에 캐시)
+- 여러 번 붙여넣은 긴 문단(채용 공고 등)은 가장 최근 것만 남기고 짧은 표시로 바꿉니다.
+
+대화가 길어져도 매 턴 프롬프트 크기는 token_budget + summary_tokens 근처에서 일정하게 유지됩니다.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_CJK_PATTERN = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣぀-ヿ一-鿿]")
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+SUMMARY_PREFIX = "[이전 대화 요약]"
+CLIP_MARKER = "\n…(중략)…\n"
+
+# 채팅 엔드포인트 기본 예산
+CHAT_CONTEXT_TOKEN_BUDGET = int(os.getenv("CHAT_CONTEXT_TOKEN_BUDGET", "1500"))
+CHAT_SUMMARY_TOKENS = int(os.getenv("CHAT_SUMMARY_TOKENS", "250"))
+
+
+class TokenEstimator:
+    """문자 종류별 비율로 토큰 수를 추정 (한글/한자/가나는 글자당, 그 외는 평균 글자 수 기준)"""
+
+    def __init__(self, chars_per_token: float = 4.0, cjk_tokens_per_char: float = 1.0, per_message_overhead: int = 4):
+        self.chars_per_token = chars_per_token
+        self.cjk_tokens_per_char = cjk_tokens_per_char
+        self.per_message_overhead = per_message_overhead
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        cjk = len(_CJK_PATTERN.findall(text))
+        return math.ceil(cjk * self.cjk_tokens_per_char + (len(text) - cjk) / self.chars_per_token)
+
+    def count_message(self, message: Dict[str, str]) -> int:
+        return self.count(message.get("content", "")) + self.per_message_overhead
+
+
+class TiktokenEstimator(TokenEstimator):
+    """tiktoken 인코딩으로 정확한 토큰 수 계산 (OpenAI 모델)"""
+
+    def __init__(self, encoding, per_message_overhead: int = 4):
+        super().__init__(per_message_overhead=per_message_overhead)
+        self.encoding = encoding
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text)) if text else 0
+
+
+# 프로바이더별 추정 비율 (한국어는 Gemini 토크나이저가 OpenAI보다 글자당 토큰이 적음)
+_ESTIMATOR_PRESETS = {
+    "gemini": {"chars_per_token": 4.0, "cjk_tokens_per_char": 0.6},
+    "openai": {"chars_per_token": 4.0, "cjk_tokens_per_char": 1.1},
+    "default": {"chars_per_token": 4.0, "cjk_tokens_per_char": 1.0},
+}
+_estimators: Dict[str, TokenEstimator] = {}
+
+
+def get_token_estimator(provider: str = "default") -> TokenEstimator:
+    """프로바이더별 토큰 추정기 (공유 인스턴스)"""
+    provider = provider.lower()
+    if provider not in _estimators:
+        estimator = None
+        if provider == "openai":
+            try:
+                import tiktoken
+                estimator = TiktokenEstimator(tiktoken.get_encoding("cl100k_base"))
+            except Exception:
+                estimator = None
+        _estimators[provider] = estimator or TokenEstimator(
+            **_ESTIMATOR_PRESETS.get(provider, _ESTIMATOR_PRESETS["default"])
+        )
+    return _estimators[provider]
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def _normalize_message(message: Dict[str, Any]) -> Dict[str, str]:
+    role = "user" if message.get("role") == "user" else "assistant"
+    return {"role": role, "content": str(message.get("content") or "")}
+
+
+Summarizer = Callable[[str, List[Dict[str, str]]], Awaitable[str]]
+
+
+class ConversationContextBuilder:
+    def __init__(self, estimator: TokenEstimator, token_budget: int = 1500, summary_tokens: int = 250,
+                 max_message_tokens: int = 400, min_summarize_messages: int = 4, dedup_min_chars: int = 200,
+                 summarizer: Optional[Summarizer] = None, store=None):
+        """
+        Args:
+            estimator (TokenEstimator): 프로바이더 토큰 추정기
+            token_budget (int): 현재 입력 + 최근 대화에 쓸 토큰 예산
+            summary_tokens (int): 이전 대화 요약에 쓸 최대 토큰 수
+            max_message_tokens (int): 메시지 하나의 최대 토큰 수 (넘으면 가운데를 생략)
+            min_summarize_messages (int): 요약에 새로 반영할 메시지가 이만큼 모이면 summarizer 호출
+                (그 전까지는 앞부분만 발췌해서 포함 - 매 턴 요약 호출 방지)
+            dedup_min_chars (int): 중복 제거 대상 문단의 최소 길이
+            summarizer: async (기존 요약, 새 메시지 목록) -> 새 요약
+            store: 요약 상태를 캐시할 세션 저장소 (None이면 "context_summaries" 공유 저장소)
+        """
+        self.estimator = estimator
+        self.token_budget = token_budget
+        self.summary_tokens = summary_tokens
+        self.max_message_tokens = max_message_tokens
+        self.min_summarize_messages = min_summarize_messages
+        self.dedup_min_chars = dedup_min_chars
+        self.summarizer = summarizer
+        self._store = store
+        self.stats = {"builds": 0, "summaries": 0, "summary_failures": 0, "deduplicated": 0, "clipped": 0}
+
+    @property
+    def store(self):
+        if self._store is None:
+            # 챗봇 패키지 초기화 순서와 엮이지 않도록 처음 사용할 때 가져옴
+            from chatbot.services.session_store import get_session_store
+            self._store = get_session_store("context_summaries")
+        return self._store
+
+    def clip_text(self, text: str, max_tokens: int) -> str:
+        """토큰 수가 넘으면 앞 2/3, 뒤 1/3만 남기고 가운데를 생략"""
+        tokens = self.estimator.count(text)
+        if tokens <= max_tokens:
+            return text
+        keep_chars = max(1, int(len(text) * (max_tokens - self.estimator.count(CLIP_MARKER)) / tokens))
+        head = keep_chars * 2 // 3
+        return text[:head] + CLIP_MARKER + text[len(text) - (keep_chars - head):]
+
+    def _deduplicate(self, messages: List[Dict[str, str]], prompt: str) -> List[Dict[str, str]]:
+        # 최신 메시지부터 보면서, 이미 본(더 최근에 붙여넣은) 긴 문단은 표시로 대체
+        seen = {_fingerprint(p) for p in _PARAGRAPH_SPLIT.split(prompt) if len(p.strip()) >= self.dedup_min_chars}
+        result = []
+        for message in reversed(messages):
+            paragraphs = _PARAGRAPH_SPLIT.split(message["content"])
+            changed = False
+            for index, paragraph in enumerate(paragraphs):
+                if len(paragraph.strip()) < self.dedup_min_chars:
+                    continue
+                fingerprint = _fingerprint(paragraph)
+                if fingerprint in seen:
+                    paragraphs[index] = f"[이후에 다시 붙여넣은 내용과 같아 생략 ({len(paragraph)}자)]"
+                    changed = True
+                    self.stats["deduplicated"] += 1
+                else:
+                    seen.add(fingerprint)
+            result.append({**message, "content": "\n\n".join(paragraphs)} if changed else message)
+        return result[::-1]
+
+    def _extract_snippets(self, messages: List[Dict[str, str]]) -> str:
+        return "\n".join(
+            f"{'사용자' if m['role'] == 'user' else '어시스턴트'}: {' '.join(m['content'].split())[:80]}"
+            for m in messages
+        )
+
+    @staticmethod
+    def _hash_messages(messages: List[Dict[str, str]]) -> str:
+        digest = hashlib.sha1()
+        for message in messages:
+            digest.update(f"{message['role']}\0{message['content']}\0".encode("utf-8"))
+        return digest.hexdigest()
+
+    async def _summarize_overflow(self, session_id: Optional[str], messages: List[Dict[str, str]],
+                                  kept_from: int) -> Tuple[str, int]:
+        """
+        예산 밖으로 밀려난 메시지(messages[:kept_from])의 요약. 이미 요약에 반영된 메시지는 다시 요약하지 않고,
+        최근 대화에 다시 포함하지도 않습니다. (입력 길이에 따라 경계가 앞뒤로 움직여도 요약을 새로 만들지 않음)
+        세션 ID가 없으면 첫 메시지 내용으로 대화를 구분합니다.
+
+        Returns:
+            (요약, 실제 최근 대화 시작 위치)
+        """
+        key = session_id or f"anonymous-{_fingerprint(messages[0]['content'])}"
+        state = await self.store.get(key)
+        # 기록이 바뀌었으면(다른 대화, 앞부분 수정) 처음부터 다시 요약
+        if (not state or state["count"] > len(messages)
+                or state["prefix_hash"] != self._hash_messages(messages[:state["count"]])):
+            state = {"summary": "", "count": 0, "prefix_hash": self._hash_messages([])}
+        kept_from = max(kept_from, state["count"])
+
+        pending = messages[state["count"]:kept_from]
+        if self.summarizer and len(pending) >= self.min_summarize_messages:
+            try:
+                summary = await self.summarizer(state["summary"], pending)
+                state = {
+                    "summary": self.clip_text(summary.strip(), self.summary_tokens),
+                    "count": kept_from,
+                    "prefix_hash": self._hash_messages(messages[:kept_from])
+                }
+                await self.store.save(key, state)
+                self.stats["summaries"] += 1
+                pending = []
+            except Exception as e:
+                self.stats["summary_failures"] += 1
+                logger.warning(f"이전 대화 요약 실패, 발췌로 대체: {e}")
+
+        parts = [state["summary"]] if state["summary"] else []
+        if pending:
+            parts.append(self._extract_snippets(pending))
+        return self.clip_text("\n".join(parts), self.summary_tokens), kept_from
+
+    async def build(self, prompt: str, history: Optional[List[Dict[str, Any]]] = None,
+                    session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Returns:
+            {
+                "summary": 이전 대화 요약 (없으면 ""),
+                "history": 예산 안에 들어간 최근 메시지 [{"role": "user"|"assistant", "content"}],
+                "dropped_messages": 요약으로 대체된 메시지 수,
+                "prompt_tokens": 요약 + 최근 대화 + 현재 입력의 추정 토큰 수
+            }
+        """
+        self.stats["builds"] += 1
+        raw = [_normalize_message(m) for m in (history or []) if m.get("content")]
+        messages = self._deduplicate(raw, prompt)
+
+        clipped = []
+        for message in messages:
+            content = self.clip_text(message["content"], self.max_message_tokens)
+            if content is not message["content"]:
+                self.stats["clipped"] += 1
+            clipped.append({**message, "content": content})
+
+        # 최신 메시지부터 예산 안에서 포함
+        history_budget = max(0, self.token_budget - self.estimator.count(prompt))
+        kept_from = len(clipped)
+        used = 0
+        for index in range(len(clipped) - 1, -1, -1):
+            cost = self.estimator.count_message(clipped[index])
+            if used + cost > history_budget:
+                break
+            used += cost
+            kept_from = index
+
+        summary = ""
+        if kept_from:
+            # 요약 상태는 원본 메시지 기준으로 추적 (중복 표시는 이후 붙여넣기에 따라 바뀔 수 있음)
+            summary, summarized_to = await self._summarize_overflow(session_id, raw, kept_from)
+            used -= sum(self.estimator.count_message(m) for m in clipped[kept_from:summarized_to])
+            kept_from = summarized_to
+        return {
+            "summary": summary,
+            "history": clipped[kept_from:],
+            "dropped_messages": kept_from,
+            "prompt_tokens": used + self.estimator.count(prompt) + self.estimator.count(summary)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "token_budget": self.token_budget, "summary_tokens": self.summary_tokens}
+
@@ -10,6 +10,7 @@ import logging
 from typing import Dict, Any, Optional, List
 import asyncio
 import json
+import time
 from datetime import datetime
 
 try:
@@ -42,6 +43,13 @@ class OpenAIProvider(LLMProvider):
         self.max_retries = 3
         self.timeout = 60.0
         self.request_timeout = 30.0
+        self._connection_checked = False
+        # 연결 확인 실패 시 재시도 대기 (일시 장애로 프로바이더가 영구 비활성화되지 않도록)
+        self.connection_retry_base = 1.0
+        self.connection_retry_max = 60.0
+        self._connection_failures = 0
+        self._connection_retry_at = 0.0
+        self._connection_lock = asyncio.Lock()
         super().__init__(config)
     
     def _initialize(self) -> None:
@@ -54,11 +62,9 @@ class OpenAIProvider(LLMProvider):
             # 클라이언트 설정 구성
             client_config = self._build_client_config()
             
-            # 클라이언트 생성
+            # 클라이언트 생성 (네트워크 연결 확인은 첫 요청 시 비동기로 수행)
             self.client = AsyncOpenAI(**client_config)
-            
-            # 연결 테스트
-            self._test_connection()
+            self.is_available = True
             
         except Exception as e:
             logger.error(f"OpenAI 초기화 실패: {str(e)}")
@@ -102,7 +108,8 @@ class OpenAIProvider(LLMProvider):
         """클라이언트 설정 구성"""
         client_config = {
             "api_key": self.api_key,
-            "max_retries": self.max_retries,
+            # 재시도는 프로바이더 스케줄러가 지터 백오프로 수행 (중복 재시도 방지)
+            "max_retries": 0,
             "timeout": self.timeout
         }
         
@@ -115,35 +122,41 @@ class OpenAIProvider(LLMProvider):
         
         return client_config
     
-    def _test_connection(self) -> None:
-        """연결 테스트"""
-        try:
-            # 간단한 모델 목록 조회로 연결 테스트
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def test():
-                try:
-                    models = await self.client.models.list()
-                    available_models = [model.id for model in models.data]
-                    logger.info(f"OpenAI 연결 성공. 사용 가능한 모델: {len(available_models)}개")
-                    logger.debug(f"사용 가능한 모델: {available_models[:5]}...")
-                    self.is_available = True
-                except Exception as e:
-                    logger.error(f"OpenAI 연결 테스트 실패: {str(e)}")
-                    self.is_available = False
-            
-            loop.run_until_complete(test())
-            loop.close()
-            
-        except Exception as e:
-            logger.error(f"연결 테스트 중 오류: {str(e)}")
-            self.is_available = False
+    async def _ensure_connection(self) -> None:
+        """
+        첫 요청 시 연결을 확인합니다.
+        
+        초기화 시점에 별도 이벤트 루프를 만들어 동기적으로 기다리지 않도록
+        실제 사용 중인 이벤트 루프에서 지연 수행합니다.
+        실패하면 확인 완료로 표시하지 않고, 지수 백오프가 지난 뒤의 요청에서 다시 확인합니다.
+        """
+        if self._connection_checked:
+            return
+        async with self._connection_lock:
+            if self._connection_checked:
+                return
+            if time.monotonic() < self._connection_retry_at:
+                raise RuntimeError("OpenAI 연결 재시도 대기 중입니다.")
+            try:
+                # 간단한 모델 목록 조회로 연결 테스트
+                models = await self.client.models.list()
+                available_models = [model.id for model in models.data]
+                logger.info(f"OpenAI 연결 성공. 사용 가능한 모델: {len(available_models)}개")
+                logger.debug(f"사용 가능한 모델: {available_models[:5]}...")
+                self._connection_checked = True
+                self._connection_failures = 0
+            except Exception as e:
+                delay = min(self.connection_retry_base * (2 ** self._connection_failures), self.connection_retry_max)
+                self._connection_failures += 1
+                self._connection_retry_at = time.monotonic() + delay
+                logger.error(f"OpenAI 연결 테스트 실패 ({delay:.1f}초 후 재시도): {str(e)}")
+                raise RuntimeError(f"OpenAI 연결에 실패했습니다: {str(e)}")
     
     async def generate_response(self, prompt: str, **kwargs) -> LLMResponse:
         """OpenAI API를 사용한 응답 생성"""
         if not self.is_available or not self.client:
             raise RuntimeError("OpenAI 프로바이더가 초기화되지 않았습니다.")
+        await self._ensure_connection()
         
         start_time = datetime.now()
         
@@ -231,22 +244,25 @@ class OpenAIProvider(LLMProvider):
             end_time=datetime.now()
         )
     
-    async def generate_streaming_response(self, prompt: str, **kwargs):
-        """스트리밍 응답 생성"""
+    async def generate_streaming_response(self, prompt: str, priority: str = "interactive", **kwargs):
+        """스트리밍 응답 생성 (스트림이 닫힐 때까지 스케줄러 슬롯 점유)"""
         if not self.is_available or not self.client:
             raise RuntimeError("OpenAI 프로바이더가 초기화되지 않았습니다.")
+        await self._ensure_connection()
         
         try:
             request_params = self._build_request_params(prompt, **kwargs)
             request_params["stream"] = True
             
-            stream = await self.client.chat.completions.create(**request_params)
-            
-            async for chunk in stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if delta.content:
-                        yield delta.content
+            async with self.scheduler.stream(priority=priority,
+                                             estimated_tokens=self.estimate_tokens(prompt, **kwargs)):
+                stream = await self.client.chat.completions.create(**request_params)
+                
+                async for chunk in stream:
+                    if chunk.choices and len(chunk.choices) > 0:
+                        delta = chunk.choices[0].delta
+                        if delta.content:
+                            yield delta.content
                         
         except Exception as e:
             logger.error(f"OpenAI 스트리밍 응답 생성 실패: {str(e)}")
@@ -0,0 +1,202 @@
+"""
+LLM 응답 캐시
+
+동일하거나 거의 같은 프롬프트에 대한 원격 모델 호출을 줄이기 위한 캐시입니다.
+
+- 정확 일치 계층: 정규화한 프롬프트 + 모델 + 생성 설정의 해시를 키로 사용
+- 임베딩 유사도 계층(선택): 같은 모델/설정 안에서 임베딩 코사인 유사도가 임계값 이상이면 재사용
+- TTL 만료와 최대 항목 수 기반 LRU 제거
+- 엔드포인트별 비활성화 (LLM_CACHE_DISABLED_ENDPOINTS 또는 호출 시 use_cache=False)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """앞뒤 공백을 제거하고 연속 공백/줄바꿈을 하나의 공백으로 줄입니다."""
+    return _WHITESPACE.sub(" ", prompt or "").strip()
+
+
+class _CacheEntry:
+    __slots__ = ("value", "scope", "embedding", "expires_at")
+
+    def __init__(self, value: Any, scope: str, embedding: Optional[np.ndarray], expires_at: float):
+        self.value = value
+        self.scope = scope
+        self.embedding = embedding
+        self.expires_at = expires_at
+
+
+class LLMResponseCache:
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600.0,
+                 embedder: Optional[Callable[[str], Sequence[float]]] = None,
+                 similarity_threshold: float = 0.97, enabled: bool = True,
+                 disabled_endpoints: Iterable[str] = ()):
+        """
+        Args:
+            max_entries (int): 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+            ttl_seconds (float): 항목 유효 시간 (초)
+            embedder (Callable): 텍스트 → 임베딩 벡터 함수. 지정하면 유사도 계층이 활성화됩니다.
+            similarity_threshold (float): 유사도 계층에서 재사용할 최소 코사인 유사도
+            enabled (bool): False면 캐시를 전혀 사용하지 않음
+            disabled_endpoints (Iterable[str]): 캐시를 사용하지 않을 엔드포인트 이름
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled
+        self.disabled_endpoints = set(disabled_endpoints)
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    # ---- 키 ----
+    @staticmethod
+    def scope_key(model: str, config: Optional[Dict[str, Any]] = None) -> str:
+        """모델과 생성 설정(정렬된 JSON)으로 만든 범위 키. 유사도 계층은 같은 범위 안에서만 비교합니다."""
+        config_json = json.dumps(config or {}, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{model}|{config_json}"
+
+    @classmethod
+    def make_key(cls, prompt: str, model: str, config: Optional[Dict[str, Any]] = None) -> str:
+        raw = f"{cls.scope_key(model, config)}|{normalize_prompt(prompt)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def is_enabled_for(self, endpoint: Optional[str]) -> bool:
+        return self.enabled and self.max_entries > 0 and endpoint not in self.disabled_endpoints
+
+    # ---- 조회/저장 ----
+    def _embed(self, prompt: str) -> Optional[np.ndarray]:
+        if self.embedder is None:
+            return None
+        try:
+            vector = np.asarray(self.embedder(normalize_prompt(prompt)), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"캐시 임베딩 생성 실패 (유사도 계층 건너뜀): {e}")
+            return None
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    def _evict_expired(self, now: float):
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self.stats["expired"] += len(expired)
+
+    def get(self, prompt: str, model: str, config: Optional[Dict[str, Any]] = None,
+            embedding: Optional[np.ndarray] = None) -> Optional[Any]:
+        """정확 일치 → 유사도 순으로 조회합니다. 없으면 None."""
+        key = self.make_key(prompt, model, config)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats["exact_hits"] += 1
+                    return entry.value
+                del self._entries[key]
+                self.stats["expired"] += 1
+
+            if embedding is not None:
+                scope = self.scope_key(model, config)
+                self._evict_expired(now)
+                candidates = [(k, e) for k, e in self._entries.items()
+                              if e.scope == scope and e.embedding is not None]
+                if candidates:
+                    matrix = np.stack([e.embedding for _, e in candidates])
+                    scores = matrix @ embedding
+                    best = int(np.argmax(scores))
+                    if float(scores[best]) >= self.similarity_threshold:
+                        best_key, best_entry = candidates[best]
+                        self._entries.move_to_end(best_key)
+                        self.stats["semantic_hits"] += 1
+                        return best_entry.value
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, prompt: str, model: str, value: Any, config: Optional[Dict[str, Any]] = None,
+            embedding: Optional[np.ndarray] = None):
+        key = self.make_key(prompt, model, config)
+        entry = _CacheEntry(value, self.scope_key(model, config), embedding, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    async def get_or_generate(self, prompt: str, model: str, generate: Callable[[], Awaitable[Any]],
+                              config: Optional[Dict[str, Any]] = None, endpoint: Optional[str] = None,
+                              use_cache: bool = True,
+                              should_cache: Callable[[Any], bool] = lambda value: bool(value)) -> Any:
+        """
+        캐시에 있으면 반환하고, 없으면 generate()를 호출한 뒤 결과를 저장합니다.
+
+        Args:
+            generate: 실제 원격 호출을 수행하는 코루틴 함수
+            endpoint: 엔드포인트 이름 (비활성화 목록에 있으면 캐시를 건너뜀)
+            use_cache: False면 이번 호출만 캐시를 건너뜀
+            should_cache: 결과를 저장할지 판단하는 함수 (오류 응답 등은 저장하지 않음)
+        """
+        if not use_cache or not self.is_enabled_for(endpoint):
+            return await generate()
+
+        embedding = await asyncio.to_thread(self._embed, prompt) if self.embedder is not None else None
+        cached = self.get(prompt, model, config, embedding)
+        if cached is not None:
+            return cached
+
+        value = await generate()
+        if should_cache(value):
+            self.set(prompt, model, value, config, embedding)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+            stats = dict(self.stats)
+        lookups = stats["exact_hits"] + stats["semantic_hits"] + stats["misses"]
+        stats.update({
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "semantic_tier": self.embedder is not None,
+            "hit_rate": round((stats["exact_hits"] + stats["semantic_hits"]) / lookups, 4) if lookups else 0.0
+        })
+        return stats
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "on")
+
+
+# 애플리케이션 전역 캐시 (유사도 계층은 llm_response_cache.embedder를 지정하면 활성화)
+llm_response_cache = LLMResponseCache(
+    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000")),
+    ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", "3600")),
+    similarity_threshold=float(os.getenv("LLM_CACHE_SIMILARITY_THRESHOLD", "0.97")),
+    enabled=_env_flag("LLM_CACHE_ENABLED", "true"),
+    disabled_endpoints=[name.strip() for name in os.getenv("LLM_CACHE_DISABLED_ENDPOINTS", "").split(",") if name.strip()]
+)
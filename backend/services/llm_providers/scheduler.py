@@ -0,0 +1,298 @@
+"""
+LLM 호출 스케줄러
+
+버스트 트래픽에서 429 오류를 줄이기 위해 프로바이더 호출을 조절합니다.
+
+- 토큰 버킷: 분당 요청 수와 분당 예상 토큰 수를 모두 제한
+- 동시 실행 수 제한: 우선순위 레인(interactive가 background보다 먼저 슬롯을 받음)
+- 단일 비행(single-flight): 동일한 프롬프트가 진행 중이면 새로 호출하지 않고 결과를 공유
+- 재시도: 429/5xx/타임아웃 등 일시적 오류는 지터를 준 지수 백오프로 재시도
+- 스트리밍: stream() 구간이 끝날 때(제너레이터가 닫힐 때)까지 슬롯을 점유 (재시도/병합 없음)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 레인 (숫자가 작을수록 먼저 처리)
+PRIORITY_LANES = {"interactive": 0, "background": 1}
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = ("RateLimit", "Timeout", "APIConnection", "ServiceUnavailable",
+                         "ResourceExhausted", "InternalServerError", "DeadlineExceeded")
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """일시적인 오류(속도 제한, 서버 오류, 타임아웃, 연결 오류)인지 판단합니다."""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int) and status in RETRYABLE_STATUS_CODES:
+        return True
+    name = type(error).__name__
+    return any(marker in name for marker in RETRYABLE_ERROR_NAMES) or "429" in str(error)
+
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """응답 헤더의 Retry-After 값 (있는 경우)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, per_minute: float):
+        """
+        분당 한도를 초당 보충 속도로 나눠 채우는 토큰 버킷 (용량 = 분당 한도)
+
+        Args:
+            per_minute (float): 분당 허용량 (0 이하면 제한 없음)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """amount만큼 차감될 때까지 기다립니다. 대기한 시간(초)을 반환합니다."""
+        if self.unlimited:
+            return 0.0
+        amount = min(amount, self.capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        waited = 0.0
+        # 잠금으로 대기 순서를 보장 (먼저 온 요청이 먼저 토큰을 받음)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= amount
+        return waited
+
+
+class ProviderScheduler:
+    def __init__(self, name: str = "llm", max_concurrency: int = 8, requests_per_minute: float = 0,
+                 tokens_per_minute: float = 0, max_retries: int = 3, base_delay: float = 0.5,
+                 max_delay: float = 20.0):
+        """
+        Args:
+            name (str): 스케줄러 이름 (로그/통계용)
+            max_concurrency (int): 동시에 진행할 수 있는 최대 호출 수
+            requests_per_minute (float): 분당 요청 한도 (0이면 제한 없음)
+            tokens_per_minute (float): 분당 예상 토큰 한도 (0이면 제한 없음)
+            max_retries (int): 일시적 오류 시 최대 재시도 횟수
+            base_delay (float): 백오프 기본 대기 시간 (초)
+            max_delay (float): 백오프 최대 대기 시간 (초)
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        self._pending_refs: Dict[Hashable, int] = {}
+        self.stats = {"calls": 0, "streams": 0, "coalesced": 0, "retries": 0, "failures": 0,
+                      "throttled_seconds": 0.0}
+
+    # ---- 우선순위 슬롯 ----
+    async def _acquire_slot(self, priority: int):
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._sequence), future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            # 슬롯은 _release_slot에서 그대로 넘겨받음 (_in_flight 변화 없음)
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 넘겨받은 직후 취소됨 → 다음 대기자에게 반납
+                self._release_slot()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release_slot(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    # ---- 실행 ----
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        # full jitter: 0 ~ min(max_delay, base * 2^attempt)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def _execute(self, call: Callable[[], Awaitable[Any]], priority: int, estimated_tokens: float) -> Any:
+        attempt = 0
+        while True:
+            await self._acquire_slot(priority)
+            try:
+                throttled = await self.request_bucket.acquire(1)
+                throttled += await self.token_bucket.acquire(estimated_tokens)
+                self.stats["throttled_seconds"] += throttled
+                self.stats["calls"] += 1
+                async with span("llm_call", provider=self.name):
+                    return await call()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable_error(e):
+                    self.stats["failures"] += 1
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self.stats["retries"] += 1
+                logger.warning(f"[{self.name}] 일시적 오류로 {delay:.2f}초 후 재시도 ({attempt}/{self.max_retries}): {e}")
+            finally:
+                self._release_slot()
+            # 대기 중에는 슬롯을 점유하지 않음
+            await asyncio.sleep(delay)
+
+    async def run(self, call: Callable[[], Awaitable[Any]], key: Optional[Hashable] = None,
+                  priority: Union[str, int] = "interactive", estimated_tokens: float = 0) -> Any:
+        """
+        스케줄링 규칙에 따라 call()을 실행합니다.
+
+        Args:
+            call: 실제 원격 호출 코루틴 함수 (재시도 시 다시 호출됨)
+            key: 단일 비행 키. 같은 키의 호출이 진행 중이면 그 결과를 공유합니다. (None이면 공유 안 함)
+            priority: "interactive" / "background" 또는 정수 (작을수록 우선)
+            estimated_tokens: 토큰 버킷에서 차감할 예상 토큰 수
+        """
+        lane = PRIORITY_LANES.get(priority, 0) if isinstance(priority, str) else int(priority)
+        if key is None:
+            return await self._execute(call, lane, estimated_tokens)
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(call, lane, estimated_tokens))
+            self._pending[key] = task
+            self._pending_refs[key] = 0
+            task.add_done_callback(lambda _: (self._pending.pop(key, None), self._pending_refs.pop(key, None)))
+        else:
+            self.stats["coalesced"] += 1
+        self._pending_refs[key] += 1
+        try:
+            # 한 호출자가 취소되어도 같은 결과를 기다리는 다른 호출자에게는 영향이 없도록 shield
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 기다리는 호출자가 모두 취소되면 원격 호출도 취소
+            if key in self._pending_refs:
+                self._pending_refs[key] -= 1
+                if self._pending_refs[key] <= 0:
+                    task.cancel()
+            raise
+
+    @asynccontextmanager
+    async def stream(self, priority: Union[str, int] = "interactive",
+                     estimated_tokens: float = 0) -> AsyncIterator[None]:
+        """
+        스트리밍 호출 구간. 요청/토큰 버킷을 차감하고, 구간을 벗어날 때까지 동시 실행 슬롯을 점유합니다.
+        스트림은 일부를 이미 내보낸 뒤에는 다시 시도할 수 없으므로 재시도하지 않습니다.
+
+            async with scheduler.stream(estimated_tokens=...):
+                async for chunk in await client.generate(..., stream=True):
+                    yield chunk
+        """
+        lane = PRIORITY_LANES.get(priority, 0) if isinstance(priority, str) else int(priority)
+        await self._acquire_slot(lane)
+        try:
+            throttled = await self.request_bucket.acquire(1)
+            throttled += await self.token_bucket.acquire(estimated_tokens)
+            self.stats["throttled_seconds"] += throttled
+            self.stats["calls"] += 1
+            self.stats["streams"] += 1
+            async with span("llm_stream", provider=self.name):
+                yield
+        except (asyncio.CancelledError, GeneratorExit):
+            raise
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+        finally:
+            self._release_slot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "throttled_seconds": round(self.stats["throttled_seconds"], 3),
+            "in_flight": self._in_flight,
+            "queued": sum(1 for _, _, future in self._waiters if not future.done()),
+            "coalescing": len(self._pending),
+            "max_concurrency": self.max_concurrency,
+        }
+
+
+_schedulers: Dict[str, ProviderScheduler] = {}
+
+
+def get_scheduler(name: str, **overrides) -> ProviderScheduler:
+    """
+    이름별(프로바이더별) 공유 스케줄러를 반환합니다. 처음 생성할 때만 설정이 적용됩니다.
+
+    환경 변수 (이름을 대문자로 한 접두사가 우선, 없으면 공통 값):
+        {NAME}_MAX_CONCURRENCY / LLM_MAX_CONCURRENCY (기본 8)
+        {NAME}_REQUESTS_PER_MINUTE / LLM_REQUESTS_PER_MINUTE (기본 0 = 제한 없음)
+        {NAME}_TOKENS_PER_MINUTE / LLM_TOKENS_PER_MINUTE (기본 0 = 제한 없음)
+        {NAME}_MAX_RETRIES / LLM_MAX_RETRIES (기본 3)
+    """
+    scheduler = _schedulers.get(name)
+    if scheduler is None:
+        def setting(key: str, default: str) -> str:
+            return os.getenv(f"{name.upper()}_{key}") or os.getenv(f"LLM_{key}", default)
+
+        config = {
+            "max_concurrency": int(setting("MAX_CONCURRENCY", "8")),
+            "requests_per_minute": float(setting("REQUESTS_PER_MINUTE", "0")),
+            "tokens_per_minute": float(setting("TOKENS_PER_MINUTE", "0")),
+            "max_retries": int(setting("MAX_RETRIES", "3")),
+        }
+        config.update(overrides)
+        scheduler = ProviderScheduler(name, **config)
+        _schedulers[name] = scheduler
+    return scheduler
+
+
+def get_all_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: scheduler.get_stats() for name, scheduler in _schedulers.items()}
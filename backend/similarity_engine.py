@@ -0,0 +1,250 @@
+import threading
+from typing import List, Dict, Any, Optional, Callable, Tuple
+import numpy as np
+
+class ResumeSimilarityEngine:
+    # SimilarityService._calculate_text_similarity와 동일한 필드 가중치
+    FIELD_WEIGHTS = {
+        'growthBackground': 0.4,   # 성장배경 (가장 중요)
+        'motivation': 0.35,        # 지원동기
+        'careerHistory': 0.25,     # 경력사항
+    }
+    # 비교 가능한 필드가 없을 때 사용하는 전체 텍스트 토큰
+    BASIC_FIELD = '_basic'
+
+    def __init__(self, extract_text: Callable[[Dict[str, Any]], str],
+                 is_meaningless: Callable[[str], bool]):
+        """
+        이력서 간 Jaccard 유사도를 벡터 연산으로 계산하는 엔진
+
+        각 이력서는 등록 시 한 번만 토큰화되어 필드별 역색인(term -> 이력서 슬롯)에
+        저장되며, 한 이력서와 나머지 전체의 유사도는 역색인 포스팅을 bincount로
+        합산하는 한 번의 벡터 연산으로 계산됩니다.
+
+        Args:
+            extract_text (Callable): 이력서 전체 텍스트 추출 함수 (기본 유사도용)
+            is_meaningless (Callable): 의미없는 텍스트 판별 함수
+        """
+        self.extract_text = extract_text
+        self.is_meaningless = is_meaningless
+        self.fields = list(self.FIELD_WEIGHTS) + [self.BASIC_FIELD]
+        self._lock = threading.RLock()
+
+        self._vocabulary: Dict[str, int] = {}
+        self._slots: Dict[str, int] = {}           # resume_id -> 슬롯 번호
+        self._slot_ids: List[Optional[str]] = []   # 슬롯 번호 -> resume_id (삭제 시 None)
+        self._slot_info: List[Optional[Dict[str, Any]]] = []
+        self._slot_terms: List[Dict[str, np.ndarray]] = []
+        self._sizes = {field: np.zeros(0, dtype=np.int32) for field in self.fields}
+        self._postings: Dict[str, Dict[int, List[int]]] = {field: {} for field in self.fields}
+        self._posting_arrays: Dict[str, Dict[int, np.ndarray]] = {field: {} for field in self.fields}
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return str(resume_id) in self._slots
+
+    def tokenize(self, resume: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """이력서를 필드별 고유 토큰 ID 배열로 변환합니다."""
+        terms = {}
+        for field in self.FIELD_WEIGHTS:
+            value = (resume.get(field) or "").strip().lower()
+            if value and not self.is_meaningless(value):
+                terms[field] = self._term_ids(value.split())
+            else:
+                terms[field] = np.zeros(0, dtype=np.int32)
+        basic_text = self.extract_text(resume) or ""
+        terms[self.BASIC_FIELD] = self._term_ids(basic_text.lower().split())
+        return terms
+
+    def upsert(self, resume: Dict[str, Any]):
+        """이력서를 엔진에 추가하거나 갱신합니다."""
+        resume_id = str(resume["_id"])
+        terms = self.tokenize(resume)
+        info = {
+            "name": resume.get("name", "알 수 없음"),
+            "position": resume.get("position", ""),
+            "department": resume.get("department", "")
+        }
+        with self._lock:
+            slot = self._slots.get(resume_id)
+            if slot is None:
+                # 새 이력서는 새 슬롯에 추가
+                slot = len(self._slot_ids)
+                self._slot_ids.append(resume_id)
+                self._slot_info.append(None)
+                self._slot_terms.append({})
+                self._slots[resume_id] = slot
+                self._grow(slot + 1)
+            else:
+                # 기존 이력서는 같은 슬롯을 재사용
+                self._clear_slot(slot)
+            self._slot_info[slot] = info
+            self._slot_terms[slot] = terms
+            for field in self.fields:
+                field_terms = terms[field]
+                self._sizes[field][slot] = len(field_terms)
+                postings = self._postings[field]
+                for term in field_terms.tolist():
+                    postings.setdefault(term, []).append(slot)
+                    self._posting_arrays[field].pop(term, None)
+
+    def load(self, resumes: List[Dict[str, Any]]):
+        """여러 이력서를 한 번에 등록합니다."""
+        for resume in resumes:
+            self.upsert(resume)
+
+    def remove(self, resume_id: str) -> bool:
+        """이력서를 엔진에서 제거합니다."""
+        with self._lock:
+            slot = self._slots.pop(str(resume_id), None)
+            if slot is None:
+                return False
+            self._clear_slot(slot)
+            self._slot_ids[slot] = None
+            self._slot_info[slot] = None
+            return True
+
+    def _clear_slot(self, slot: int):
+        """슬롯의 토큰을 역색인에서 제거합니다."""
+        for field in self.fields:
+            postings = self._postings[field]
+            for term in self._slot_terms[slot].get(field, np.zeros(0, dtype=np.int32)).tolist():
+                remaining = [s for s in postings.get(term, []) if s != slot]
+                if remaining:
+                    postings[term] = remaining
+                else:
+                    postings.pop(term, None)
+                self._posting_arrays[field].pop(term, None)
+            self._sizes[field][slot] = 0
+        self._slot_terms[slot] = {}
+
+    def _grow(self, size: int):
+        """필드별 토큰 수 배열의 용량을 필요 시 두 배로 늘립니다."""
+        capacity = len(self._sizes[self.fields[0]])
+        if size <= capacity:
+            return
+        capacity = max(256, capacity * 2, size)
+        for field in self.fields:
+            sizes = np.zeros(capacity, dtype=np.int32)
+            sizes[:len(self._sizes[field])] = self._sizes[field]
+            self._sizes[field] = sizes
+
+    def similarities_for(self, resume_id: str) -> Dict[str, Any]:
+        """
+        한 이력서와 등록된 다른 모든 이력서의 유사도를 한 번에 계산합니다.
+
+        Args:
+            resume_id (str): 기준 이력서 ID (먼저 upsert 되어 있어야 함)
+
+        Returns:
+            Dict[str, Any]: resume_ids, infos, overall (N,) 배열과 fields (필드명 -> (N,) 배열)
+        """
+        with self._lock:
+            slot = self._slots[str(resume_id)]
+            overall, field_scores = self._score_slot(slot)
+
+            alive = np.array([other is not None for other in self._slot_ids], dtype=bool)
+            alive[slot] = False
+            others = np.nonzero(alive)[0]
+            return {
+                "resume_ids": [self._slot_ids[i] for i in others],
+                "infos": [self._slot_info[i] for i in others],
+                "overall": overall[others],
+                "fields": {field: scores[others] for field, scores in field_scores.items()}
+            }
+
+    def similarity_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        등록된 모든 이력서의 N×N 종합 유사도 행렬을 계산합니다.
+
+        Returns:
+            Tuple[List[str], np.ndarray]: 이력서 ID 목록과 (N, N) float32 유사도 행렬
+        """
+        with self._lock:
+            live_slots = np.array([slot for slot, resume_id in enumerate(self._slot_ids)
+                                   if resume_id is not None], dtype=np.int64)
+            matrix = np.zeros((len(live_slots), len(live_slots)), dtype=np.float32)
+            for row, slot in enumerate(live_slots):
+                overall, _ = self._score_slot(int(slot))
+                matrix[row] = overall[live_slots]
+            np.fill_diagonal(matrix, 1.0)
+            return [self._slot_ids[slot] for slot in live_slots], matrix
+
+    def find_duplicate_pairs(self, threshold: float = 0.7) -> List[Dict[str, Any]]:
+        """
+        종합 유사도가 임계값 이상인 이력서 쌍을 찾습니다. (배치 중복 검사용)
+
+        Args:
+            threshold (float): 중복으로 판단할 최소 유사도
+
+        Returns:
+            List[Dict[str, Any]]: 유사도 내림차순의 이력서 쌍 목록
+        """
+        resume_ids, matrix = self.similarity_matrix()
+        rows, cols = np.nonzero(np.triu(matrix >= threshold, k=1))
+        pairs = [
+            {
+                "resume_id_a": resume_ids[i],
+                "resume_id_b": resume_ids[j],
+                "similarity": round(float(matrix[i, j]), 4)
+            }
+            for i, j in zip(rows.tolist(), cols.tolist())
+        ]
+        pairs.sort(key=lambda pair: pair["similarity"], reverse=True)
+        return pairs
+
+    def _term_ids(self, tokens: List[str]) -> np.ndarray:
+        ids = set()
+        for token in tokens:
+            term_id = self._vocabulary.get(token)
+            if term_id is None:
+                term_id = len(self._vocabulary)
+                self._vocabulary[token] = term_id
+            ids.add(term_id)
+        return np.fromiter(ids, dtype=np.int32, count=len(ids))
+
+    def _posting_array(self, field: str, term: int) -> np.ndarray:
+        array = self._posting_arrays[field].get(term)
+        if array is None:
+            array = np.asarray(self._postings[field].get(term, []), dtype=np.int64)
+            self._posting_arrays[field][term] = array
+        return array
+
+    def _jaccard(self, field: str, slot: int) -> np.ndarray:
+        """한 슬롯의 필드 토큰과 모든 슬롯의 Jaccard 유사도 (N,)"""
+        capacity = len(self._slot_ids)
+        query_terms = self._slot_terms[slot].get(field, np.zeros(0, dtype=np.int32))
+        if len(query_terms) == 0:
+            return np.zeros(capacity, dtype=np.float32)
+
+        postings = [self._posting_array(field, term) for term in query_terms.tolist()]
+        intersection = np.bincount(np.concatenate(postings), minlength=capacity)[:capacity]
+        union = self._sizes[field][:capacity] + len(query_terms) - intersection
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(union > 0, intersection / union, 0.0)
+        return scores.astype(np.float32)
+
+    def _score_slot(self, slot: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """필드별 Jaccard를 가중 평균하고, 비교 가능한 필드가 없으면 전체 텍스트 유사도를 사용합니다."""
+        capacity = len(self._slot_ids)
+        weighted = np.zeros(capacity, dtype=np.float32)
+        total_weight = np.zeros(capacity, dtype=np.float32)
+        field_scores = {}
+
+        for field, weight in self.FIELD_WEIGHTS.items():
+            scores = self._jaccard(field, slot)
+            if len(self._slot_terms[slot].get(field, [])):
+                valid = self._sizes[field][:capacity] > 0
+            else:
+                valid = np.zeros(capacity, dtype=bool)
+            field_scores[field] = np.where(valid, scores, 0.0).astype(np.float32)
+            weighted += field_scores[field] * weight
+            total_weight += valid * weight
+
+        basic = self._jaccard(self.BASIC_FIELD, slot)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            overall = np.where(total_weight > 0, weighted / total_weight, basic)
+        return overall.astype(np.float32), field_scores
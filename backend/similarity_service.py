@@ -4,8 +4,28 @@ from pymongo.collection import Collection
 from embedding_service import EmbeddingService
 from vector_service import VectorService
 from chunking_service import ChunkingService
+from similarity_engine import ResumeSimilarityEngine
+from minhash_lsh import MinHashLSH
+from pymongo import DeleteOne, UpdateOne
+import numpy as np
+import hashlib
 import re
+import time
+import logging
+from datetime import datetime
+import asyncio
 from collections import Counter
+from instrumentation import log_payload, span
+from service_metrics import ServiceStats
+
+logger = logging.getLogger(__name__)
+
+# 유사도 결과에 포함할 이력서 상세 필드 (Resume 모델 필드 + 텍스트 추출용 resume_text)
+RESUME_DETAIL_PROJECTION = {
+    "resume_id": 1, "name": 1, "position": 1, "department": 1, "experience": 1, "skills": 1,
+    "growthBackground": 1, "motivation": 1, "careerHistory": 1, "resume_text": 1,
+    "analysisScore": 1, "analysisResult": 1, "status": 1, "created_at": 1
+}
 
 class SimilarityService:
     def __init__(self, embedding_service: EmbeddingService, vector_service: VectorService):
@@ -27,6 +47,188 @@ class SimilarityService:
             'motivation': 0.2,         # 지원동기 20% 이상
             'careerHistory': 0.2,      # 경력사항 20% 이상
         }
+        # 이력서 간 텍스트 유사도를 벡터 연산으로 계산하는 엔진 (증분 갱신)
+        self.similarity_engine = ResumeSimilarityEngine(self._extract_resume_text, self._is_meaningless_text)
+        self.engine_rebuild_interval = 600  # 전체 재적재 주기 (초)
+        self._engine_loaded_at = 0.0
+        self._engine_last_id: Optional[ObjectId] = None
+        # 자기소개서 표절 탐지용 MinHash/LSH 인덱스 (문자 shingle 기반)
+        self.near_duplicate_index = self._new_near_duplicate_index()
+        self.near_duplicate_fields = ['growthBackground', 'motivation', 'careerHistory']
+        self._lsh_loaded_at = 0.0
+        self._lsh_last_id: Optional[ObjectId] = None
+        # 방식별 비교 수/유사도 점수/처리 시간 (GET /api/similarity/metrics)
+        self.stats = ServiceStats("similarity")
+    
+    def record_comparisons(self, method: str, count: int, seconds: Optional[float] = None,
+                           scores: Optional[List[float]] = None):
+        """
+        유사도 비교 실적을 방식별로 기록합니다.
+        
+        Args:
+            method (str): 비교 방식 ("vector", "chunk", "query", "engine", "matrix", "lsh")
+            count (int): 비교한 이력서(청크) 쌍의 수
+            seconds (Optional[float]): 작업 전체 소요 시간
+            scores (Optional[List[float]]): 결과로 반환한 유사도 점수 (평균 유사도 계산용)
+        """
+        self.stats.inc(f"comparisons.{method}", count)
+        if seconds is not None:
+            self.stats.observe(method, seconds)
+        if scores:
+            self.stats.inc(f"score_sum.{method}", float(sum(scores)))
+            self.stats.inc(f"scored.{method}", len(scores))
+    
+    @staticmethod
+    def _new_near_duplicate_index() -> MinHashLSH:
+        return MinHashLSH(num_perm=128, threshold=0.5)
+
+    @staticmethod
+    def _signature_text_hash(text: str) -> str:
+        """서명을 계산한 필드 텍스트의 지문 (수정된 이력서 판별용)"""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    async def index_resume_signatures(self, resume: Dict[str, Any], signature_collection) -> int:
+        """
+        이력서 필드별 MinHash 서명을 계산해 LSH 인덱스와 MongoDB에 저장합니다.
+        (이력서 등록 시 한 번만 호출)
+        
+        Args:
+            resume (Dict[str, Any]): 이력서 데이터 (_id 포함)
+            signature_collection: 서명을 저장할 Motor 컬렉션 (resume_signatures)
+            
+        Returns:
+            int: 저장된 서명 수
+        """
+        resume_id = str(resume["_id"])
+        operations = []
+        for field in self.near_duplicate_fields:
+            text = (resume.get(field) or "").strip()
+            if self._is_meaningless_text(text):
+                self.near_duplicate_index.remove(resume_id, field)
+                continue
+            signature = self.near_duplicate_index.insert_text(resume_id, field, text)
+            if signature is not None:
+                operations.append(UpdateOne(
+                    {"resume_id": resume_id, "field": field},
+                    {"$set": {"signature": signature.tolist(), "text_hash": self._signature_text_hash(text),
+                              "updated_at": datetime.now()}},
+                    upsert=True
+                ))
+        if operations and signature_collection is not None:
+            await signature_collection.bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    async def refresh_near_duplicate_index(self, collection, signature_collection, rebuild: bool = False) -> int:
+        """
+        LSH 인덱스를 MongoDB(Motor) 컬렉션과 동기화합니다.
+        
+        처음이거나 rebuild 주기(engine_rebuild_interval)가 지나면 전체 이력서를 다시 읽어 인덱스를 새로 만들고,
+        저장된 서명 중 텍스트 지문이 그대로인 것은 재사용하고 수정/추가된 필드만 다시 계산합니다.
+        (삭제된 이력서/비워진 필드의 서명은 저장소에서도 제거)
+        그 외에는 마지막으로 적재한 _id 이후에 추가된 이력서만 증분으로 반영합니다.
+        
+        Args:
+            collection: Motor 이력서 컬렉션
+            signature_collection: Motor 서명 컬렉션 (resume_signatures)
+            rebuild (bool): 강제로 전체 재적재할지 여부
+            
+        Returns:
+            int: 이번에 서명을 새로 계산한 이력서 수
+        """
+        projection = {field: 1 for field in self.near_duplicate_fields}
+        full_reload = (rebuild or self._lsh_last_id is None or
+                       time.time() - self._lsh_loaded_at > self.engine_rebuild_interval)
+        
+        if full_reload:
+            resumes = await collection.find({}, projection).to_list(None)
+            signed = await self._rebuild_near_duplicate_index(resumes, signature_collection)
+        else:
+            resumes = await collection.find({"_id": {"$gt": self._lsh_last_id}}, projection).to_list(None)
+            for resume in resumes:
+                await self.index_resume_signatures(resume, signature_collection)
+            signed = len(resumes)
+        
+        if resumes:
+            latest_id = max(resume["_id"] for resume in resumes)
+            if self._lsh_last_id is None or latest_id > self._lsh_last_id:
+                self._lsh_last_id = latest_id
+        return signed
+    
+    async def _rebuild_near_duplicate_index(self, resumes: List[Dict[str, Any]], signature_collection) -> int:
+        """저장된 서명과 현재 이력서 텍스트를 비교해 새 LSH 인덱스를 만들고 교체합니다."""
+        stored: Dict[tuple, Dict[str, Any]] = {}
+        if signature_collection is not None:
+            async for doc in signature_collection.find({}, {"resume_id": 1, "field": 1, "signature": 1, "text_hash": 1}):
+                stored[(doc["resume_id"], doc["field"])] = doc
+        
+        index = self._new_near_duplicate_index()
+        operations = []
+        resigned_ids = set()
+        for resume in resumes:
+            resume_id = str(resume["_id"])
+            for field in self.near_duplicate_fields:
+                text = (resume.get(field) or "").strip()
+                doc = stored.pop((resume_id, field), None)
+                if self._is_meaningless_text(text):
+                    if doc is not None:
+                        operations.append(DeleteOne({"_id": doc["_id"]}))
+                    continue
+                text_hash = self._signature_text_hash(text)
+                if doc is not None and doc.get("text_hash") == text_hash:
+                    index.insert(resume_id, field, np.asarray(doc["signature"], dtype=np.uint32))
+                    continue
+                signature = index.insert_text(resume_id, field, text)
+                if signature is not None:
+                    resigned_ids.add(resume_id)
+                    operations.append(UpdateOne(
+                        {"resume_id": resume_id, "field": field},
+                        {"$set": {"signature": signature.tolist(), "text_hash": text_hash,
+                                  "updated_at": datetime.now()}},
+                        upsert=True
+                    ))
+        # 남은 서명은 삭제된 이력서의 것
+        operations.extend(DeleteOne({"_id": doc["_id"]}) for doc in stored.values())
+        
+        if operations and signature_collection is not None:
+            await signature_collection.bulk_write(operations, ordered=False)
+        self.near_duplicate_index = index
+        self._lsh_loaded_at = time.time()
+        return len(resigned_ids)
+    
+    async def refresh_similarity_engine(self, collection, rebuild: bool = False) -> int:
+        """
+        유사도 엔진을 MongoDB(Motor) 컬렉션과 동기화합니다.
+        
+        처음이거나 rebuild 주기가 지나면 전체를 다시 적재하고, 그 외에는 마지막으로
+        적재한 _id 이후에 추가된 이력서만 증분으로 반영합니다.
+        
+        Args:
+            collection: Motor 이력서 컬렉션
+            rebuild (bool): 강제로 전체 재적재할지 여부
+            
+        Returns:
+            int: 이번에 반영된 이력서 수
+        """
+        projection = {"growthBackground": 1, "motivation": 1, "careerHistory": 1, "resume_text": 1,
+                      "name": 1, "position": 1, "department": 1}
+        full_reload = (rebuild or self._engine_last_id is None or
+                       time.time() - self._engine_loaded_at > self.engine_rebuild_interval)
+        
+        if full_reload:
+            resumes = await collection.find({}, projection).to_list(None)
+            engine = ResumeSimilarityEngine(self._extract_resume_text, self._is_meaningless_text)
+            engine.load(resumes)
+            self.similarity_engine = engine
+            self._engine_loaded_at = time.time()
+        else:
+            resumes = await collection.find({"_id": {"$gt": self._engine_last_id}}, projection).to_list(None)
+            self.similarity_engine.load(resumes)
+        
+        if resumes:
+            latest_id = max(resume["_id"] for resume in resumes)
+            if self._engine_last_id is None or latest_id > self._engine_last_id:
+                self._engine_last_id = latest_id
+        return len(resumes)
     
     async def save_resume_chunks(self, resume: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -39,7 +241,7 @@ class SimilarityService:
             Dict[str, Any]: 저장 결과
         """
         try:
-            print(f"[SimilarityService] === 청킹 기반 벡터 저장 시작 ===")
+            logger.debug("[SimilarityService] === 청킹 기반 벡터 저장 시작 ===")
             resume_id = str(resume["_id"])
             
             # 이력서를 청크로 분할
@@ -55,8 +257,8 @@ class SimilarityService:
             # 청크별 벡터 저장
             stored_vector_ids = await self.vector_service.save_chunk_vectors(chunks, self.embedding_service)
             
-            print(f"[SimilarityService] 총 {len(stored_vector_ids)}개 청크 벡터 저장 완료")
-            print(f"[SimilarityService] === 청킹 기반 벡터 저장 완료 ===")
+            logger.debug("[SimilarityService] 총 %s개 청크 벡터 저장 완료", len(stored_vector_ids))
+            logger.debug("[SimilarityService] === 청킹 기반 벡터 저장 완료 ===")
             
             return {
                 "success": True,
@@ -67,31 +269,81 @@ class SimilarityService:
             }
             
         except Exception as e:
-            print(f"[SimilarityService] 청킹 기반 벡터 저장 실패: {str(e)}")
+            logger.error("[SimilarityService] 청킹 기반 벡터 저장 실패: %s", str(e))
             return {
                 "success": False,
                 "error": str(e),
                 "chunks_count": 0
             }
     
-    async def find_similar_resumes_by_chunks(self, resume_id: str, collection: Collection, limit: int = 5) -> Dict[str, Any]:
+    def _is_async_collection(self, collection, use_async: Optional[bool] = None) -> bool:
+        """
+        컬렉션이 Motor(비동기) 컬렉션인지 판별합니다.
+
+        Args:
+            collection: Motor 또는 PyMongo 컬렉션
+            use_async (Optional[bool]): 호출 단위로 경로를 강제 (None이면 컬렉션 타입으로 자동 판별)
+        """
+        if use_async is not None:
+            return use_async
+        return type(collection).__module__.startswith("motor")
+
+    @span("mongo_query", op="find_one")
+    async def _fetch_resume(self, collection, resume_id: str, use_async: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """
+        이력서 한 건을 조회합니다. 동기 컬렉션은 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+        """
+        query = {"_id": ObjectId(resume_id)}
+        if self._is_async_collection(collection, use_async):
+            return await collection.find_one(query)
+        return await asyncio.to_thread(collection.find_one, query)
+
+    @span("mongo_query", op="find_many")
+    async def _fetch_resumes_by_ids(self, collection, resume_ids: List[str],
+                                    use_async: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 이력서의 상세 정보를 한 번의 $in 쿼리(필요 필드만 projection)로 조회합니다.
+
+        Args:
+            collection: Motor 또는 PyMongo 컬렉션
+            resume_ids (List[str]): 조회할 이력서 ID 목록
+            use_async (Optional[bool]): 호출 단위로 Motor 경로 사용 여부 (None이면 자동 판별)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 문자열 이력서 ID -> 이력서 문서
+        """
+        if not resume_ids:
+            return {}
+        query = {"_id": {"$in": [ObjectId(resume_id) for resume_id in dict.fromkeys(resume_ids)]}}
+        if self._is_async_collection(collection, use_async):
+            documents = await collection.find(query, RESUME_DETAIL_PROJECTION).to_list(None)
+        else:
+            documents = await asyncio.to_thread(
+                lambda: list(collection.find(query, RESUME_DETAIL_PROJECTION))
+            )
+        return {str(document["_id"]): document for document in documents}
+
+    async def find_similar_resumes_by_chunks(self, resume_id: str, collection: Collection, limit: int = 5,
+                                             use_async: Optional[bool] = None) -> Dict[str, Any]:
         """
         청킹 기반으로 특정 이력서와 유사한 이력서들을 찾습니다.
         
         Args:
             resume_id (str): 기준이 되는 이력서 ID
-            collection (Collection): MongoDB 컬렉션
+            collection (Collection): MongoDB 컬렉션 (Motor 또는 PyMongo)
             limit (int): 반환할 최대 결과 수
+            use_async (Optional[bool]): Motor 경로 사용 여부 (None이면 컬렉션 타입으로 자동 판별)
             
         Returns:
             Dict[str, Any]: 유사도 검색 결과
         """
+        started = time.perf_counter()
         try:
-            print(f"[SimilarityService] === 청킹 기반 유사도 검색 시작 ===")
-            print(f"[SimilarityService] 이력서 ID: {resume_id}")
+            logger.debug("[SimilarityService] === 청킹 기반 유사도 검색 시작 ===")
+            logger.debug("[SimilarityService] 이력서 ID: %s", resume_id)
             
             # 해당 이력서 조회
-            resume = collection.find_one({"_id": ObjectId(resume_id)})
+            resume = await self._fetch_resume(collection, resume_id, use_async)
             if not resume:
                 raise ValueError("이력서를 찾을 수 없습니다.")
             
@@ -100,86 +352,27 @@ class SimilarityService:
             if not query_chunks:
                 raise ValueError("검색할 청크가 없습니다.")
             
-            print(f"[SimilarityService] 검색 청크 수: {len(query_chunks)}")
+            logger.debug("[SimilarityService] 검색 청크 수: %s", len(query_chunks))
             
-            # 각 청크별로 유사 벡터 검색
-            chunk_similarities = {}
-            for chunk in query_chunks:
-                print(f"[SimilarityService] 청크 '{chunk['chunk_type']}' 검색 중...")
-                
-                # 청크 텍스트로 임베딩 생성
-                query_embedding = await self.embedding_service.create_embedding(chunk["text"])
-                if not query_embedding:
-                    continue
-                
-                # Pinecone에서 유사한 벡터 검색
-                search_result = await self.vector_service.search_similar_vectors(
-                    query_embedding=query_embedding,
-                    top_k=limit * 3,  # 청크별로 더 많이 검색
-                    filter_type="resume"
-                )
-                
-                # 결과 저장
-                for match in search_result["matches"]:
-                    match_resume_id = match["metadata"]["resume_id"]
-                    similarity_score = match["score"]
-                    chunk_type = match["metadata"]["chunk_type"]
-                    
-                    # 자기 자신 제외
-                    if match_resume_id == resume_id:
-                        continue
-                    
-                    # 이력서별로 청크 유사도 누적
-                    if match_resume_id not in chunk_similarities:
-                        chunk_similarities[match_resume_id] = {
-                            "chunks": {},
-                            "total_score": 0.0,
-                            "chunk_count": 0
-                        }
-                    
-                    # 동일한 청크 타입에서 더 높은 점수만 유지
-                    key = f"{chunk['chunk_type']}_to_{chunk_type}"
-                    if key not in chunk_similarities[match_resume_id]["chunks"] or \
-                       similarity_score > chunk_similarities[match_resume_id]["chunks"][key]["score"]:
-                        
-                        chunk_similarities[match_resume_id]["chunks"][key] = {
-                            "score": similarity_score,
-                            "query_chunk": chunk['chunk_type'],
-                            "match_chunk": chunk_type,
-                            "match_text": match["metadata"].get("text_preview", "")
-                        }
-            
-            # 이력서별 종합 점수 계산
-            resume_scores = []
-            for match_resume_id, data in chunk_similarities.items():
-                if not data["chunks"]:
-                    continue
-                
-                # 청크 점수들의 평균 계산
-                chunk_scores = [chunk_data["score"] for chunk_data in data["chunks"].values()]
-                avg_score = sum(chunk_scores) / len(chunk_scores)
-                
-                # 임계값 체크
-                if avg_score >= self.similarity_threshold:
-                    resume_scores.append({
-                        "resume_id": match_resume_id,
-                        "similarity_score": avg_score,
-                        "chunk_matches": len(data["chunks"]),
-                        "chunk_details": data["chunks"]
-                    })
+            # 모든 청크를 한 번에 임베딩하고 한 번의 다중 쿼리로 검색
+            query_embeddings = await self.embedding_service.embed_many([chunk["text"] for chunk in query_chunks])
+            search_results = await self.vector_service.search_similar_vectors_many(
+                query_embeddings,
+                top_k=limit * 3,  # 청크별로 더 많이 검색
+                filter_type="resume_chunk"  # 청크 벡터만 검색 (이력서 전체 벡터에는 chunk_type이 없음)
+            )
             
-            # 점수 순으로 정렬
-            resume_scores.sort(key=lambda x: x["similarity_score"], reverse=True)
-            resume_scores = resume_scores[:limit]
+            resume_scores = self._aggregate_chunk_matches(query_chunks, search_results, resume_id, limit)
             
             # MongoDB에서 상세 정보 조회
             results = []
             if resume_scores:
-                resume_ids = [ObjectId(score["resume_id"]) for score in resume_scores]
-                resumes_detail = list(collection.find({"_id": {"$in": resume_ids}}))
+                resumes_detail = await self._fetch_resumes_by_ids(
+                    collection, [score["resume_id"] for score in resume_scores], use_async
+                )
                 
                 for score_data in resume_scores:
-                    resume_detail = next((r for r in resumes_detail if str(r["_id"]) == score_data["resume_id"]), None)
+                    resume_detail = resumes_detail.get(score_data["resume_id"])
                     if resume_detail:
                         resume_detail["_id"] = str(resume_detail["_id"])
                         resume_detail["created_at"] = resume_detail["created_at"].isoformat()
@@ -192,8 +385,10 @@ class SimilarityService:
                             "chunk_details": score_data["chunk_details"]
                         })
             
-            print(f"[SimilarityService] 최종 유사 이력서 수: {len(results)}")
-            print(f"[SimilarityService] === 청킹 기반 유사도 검색 완료 ===")
+            logger.debug("[SimilarityService] 최종 유사 이력서 수: %s", len(results))
+            logger.debug("[SimilarityService] === 청킹 기반 유사도 검색 완료 ===")
+            self.record_comparisons("chunk", sum(len(result["matches"]) for result in search_results),
+                                    time.perf_counter() - started, [r["similarity_score"] for r in results])
             
             return {
                 "success": True,
@@ -209,58 +404,127 @@ class SimilarityService:
             }
             
         except Exception as e:
-            print(f"[SimilarityService] 청킹 기반 유사도 검색 실패: {str(e)}")
+            self.stats.inc("errors.chunk")
+            logger.error("[SimilarityService] 청킹 기반 유사도 검색 실패: %s", str(e))
             raise e
 
-    async def find_similar_resumes(self, resume_id: str, collection: Collection, limit: int = 5) -> Dict[str, Any]:
+    def _aggregate_chunk_matches(self, query_chunks: List[Dict[str, Any]], search_results: List[Dict[str, Any]],
+                                 resume_id: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        청크별 검색 결과를 이력서 단위 점수로 집계합니다.
+        
+        (이력서, 쿼리 청크 타입, 매칭 청크 타입) 조합마다 최고 점수만 남긴 뒤
+        이력서별 평균을 배열 연산으로 계산합니다.
+        
+        Args:
+            query_chunks (List[Dict[str, Any]]): 쿼리 청크 리스트
+            search_results (List[Dict[str, Any]]): 쿼리 청크 순서대로의 검색 결과
+            resume_id (str): 기준 이력서 ID (결과에서 제외)
+            limit (int): 반환할 최대 이력서 수
+            
+        Returns:
+            List[Dict[str, Any]]: 점수 내림차순의 이력서별 집계 결과
+        """
+        match_resume_ids, pair_keys, scores, matches = [], [], [], []
+        for chunk, search_result in zip(query_chunks, search_results):
+            for match in search_result["matches"]:
+                match_resume_id = match["metadata"]["resume_id"]
+                # 자기 자신 제외
+                if match_resume_id == resume_id:
+                    continue
+                key = f"{chunk['chunk_type']}_to_{match['metadata']['chunk_type']}"
+                match_resume_ids.append(match_resume_id)
+                pair_keys.append(f"{match_resume_id}\x00{key}")
+                scores.append(match["score"])
+                matches.append((key, chunk["chunk_type"], match))
+        
+        if not scores:
+            return []
+        
+        scores = np.asarray(scores, dtype=np.float64)
+        # 동일한 (이력서, 청크 타입 조합)에서는 가장 높은 점수만 유지
+        order = np.argsort(-scores, kind="stable")
+        _, first = np.unique(np.asarray(pair_keys, dtype=object)[order], return_index=True)
+        best = order[first]
+        
+        resume_labels, resume_index = np.unique(np.asarray(match_resume_ids, dtype=object)[best], return_inverse=True)
+        chunk_counts = np.bincount(resume_index)
+        averages = np.bincount(resume_index, weights=scores[best]) / chunk_counts
+        
+        resume_scores = []
+        for label_index in np.argsort(-averages, kind="stable"):
+            # 임계값 체크
+            if averages[label_index] < self.similarity_threshold or len(resume_scores) >= limit:
+                break
+            chunk_details = {}
+            for match_index in best[resume_index == label_index]:
+                key, query_chunk, match = matches[match_index]
+                chunk_details[key] = {
+                    "score": match["score"],
+                    "query_chunk": query_chunk,
+                    "match_chunk": match["metadata"]["chunk_type"],
+                    "match_text": match["metadata"].get("text_preview", "")
+                }
+            resume_scores.append({
+                "resume_id": resume_labels[label_index],
+                "similarity_score": float(averages[label_index]),
+                "chunk_matches": int(chunk_counts[label_index]),
+                "chunk_details": chunk_details
+            })
+        return resume_scores
+    
+    async def find_similar_resumes(self, resume_id: str, collection: Collection, limit: int = 5,
+                                   use_async: Optional[bool] = None) -> Dict[str, Any]:
         """
         특정 이력서와 유사한 이력서들을 찾습니다.
         
         Args:
             resume_id (str): 기준이 되는 이력서 ID
-            collection (Collection): MongoDB 컬렉션
+            collection (Collection): MongoDB 컬렉션 (Motor 또는 PyMongo)
             limit (int): 반환할 최대 결과 수
+            use_async (Optional[bool]): Motor 경로 사용 여부 (None이면 컬렉션 타입으로 자동 판별)
             
         Returns:
             Dict[str, Any]: 유사도 검색 결과
         """
+        started = time.perf_counter()
         try:
-            print(f"[SimilarityService] === 유사도 검색 시작 ===")
-            print(f"[SimilarityService] 이력서 ID: {resume_id}")
-            print(f"[SimilarityService] 검색 제한: {limit}")
-            print(f"[SimilarityService] 유사도 임계값: {self.similarity_threshold}")
+            logger.debug("[SimilarityService] === 유사도 검색 시작 ===")
+            logger.debug("[SimilarityService] 이력서 ID: %s", resume_id)
+            logger.debug("[SimilarityService] 검색 제한: %s", limit)
+            logger.debug("[SimilarityService] 유사도 임계값: %s", self.similarity_threshold)
             
             # 해당 이력서 조회
-            resume = collection.find_one({"_id": ObjectId(resume_id)})
+            resume = await self._fetch_resume(collection, resume_id, use_async)
             if not resume:
                 raise ValueError("이력서를 찾을 수 없습니다.")
             
-            print(f"[SimilarityService] 이력서 찾음: {resume.get('name', 'Unknown')}")
+            logger.debug("[SimilarityService] 이력서 찾음: %s", resume.get('name', 'Unknown'))
             
             # 이력서 텍스트로 임베딩 생성
             resume_text = self._extract_resume_text(resume)
             if not resume_text:
                 raise ValueError("이력서 텍스트가 없습니다.")
             
-            print(f"[SimilarityService] 임베딩 생성할 텍스트 길이: {len(resume_text)}")
-            print(f"[SimilarityService] 추출된 텍스트: {resume_text[:200]}...")
+            logger.debug("[SimilarityService] 임베딩 생성할 텍스트 길이: %s", len(resume_text))
+            log_payload(logger, "[SimilarityService] 추출된 텍스트: %s...", resume_text[:200])
             
             # 임베딩 생성
             query_embedding = await self.embedding_service.create_embedding(resume_text)
             if not query_embedding:
                 raise ValueError("이력서 임베딩 생성에 실패했습니다.")
             
-            print(f"[SimilarityService] 이력서 임베딩 생성 성공!")
+            logger.debug("[SimilarityService] 이력서 임베딩 생성 성공!")
             
             # Pinecone에서 유사한 벡터 검색 (자기 자신 제외)
-            print(f"[SimilarityService] Pinecone 유사도 검색 시작...")
+            logger.debug("[SimilarityService] Pinecone 유사도 검색 시작...")
             search_result = await self.vector_service.search_similar_vectors(
                 query_embedding=query_embedding,
                 top_k=limit + 1,  # 자기 자신을 포함할 수 있으므로 +1
                 filter_type="resume"
             )
             
-            print(f"[SimilarityService] Pinecone 검색 완료! 결과 수: {len(search_result['matches'])}")
+            logger.debug("[SimilarityService] Pinecone 검색 완료! 결과 수: %s", len(search_result['matches']))
             
             # 자기 자신 제외하고 유사한 이력서들 필터링 (임계값 적용)
             similar_resumes = []
@@ -268,26 +532,27 @@ class SimilarityService:
                 match_resume_id = match["metadata"]["resume_id"]
                 similarity_score = match["score"]
                 
-                print(f"[SimilarityService] 검색 결과 - ID: {match_resume_id}, 점수: {similarity_score:.3f}")
+                logger.debug("[SimilarityService] 검색 결과 - ID: %s, 점수: %s", match_resume_id, format(similarity_score, ".3f"))
                 
                 # 자기 자신 제외하고 유사도 임계값(0.6) 이상인 것만 포함
                 if match_resume_id != str(resume["_id"]) and similarity_score >= self.similarity_threshold:
                     similar_resumes.append(match)
-                    print(f"[SimilarityService] 유사 이력서 추가: {match_resume_id} (점수: {similarity_score:.3f})")
+                    logger.debug("[SimilarityService] 유사 이력서 추가: %s (점수: %s)", match_resume_id, format(similarity_score, ".3f"))
                 else:
-                    print(f"[SimilarityService] 제외된 이력서: {match_resume_id} (점수: {similarity_score:.3f})")
+                    logger.debug("[SimilarityService] 제외된 이력서: %s (점수: %s)", match_resume_id, format(similarity_score, ".3f"))
             
-            print(f"[SimilarityService] 자기 자신 제외 후 유사 이력서 수: {len(similar_resumes)}")
+            logger.debug("[SimilarityService] 자기 자신 제외 후 유사 이력서 수: %s", len(similar_resumes))
             
             # MongoDB에서 상세 정보 조회
             if similar_resumes:
-                resume_ids = [ObjectId(match["metadata"]["resume_id"]) for match in similar_resumes]
-                resumes_detail = list(collection.find({"_id": {"$in": resume_ids}}))
+                resumes_detail = await self._fetch_resumes_by_ids(
+                    collection, [match["metadata"]["resume_id"] for match in similar_resumes], use_async
+                )
                 
                 # 검색 결과와 상세 정보 매칭
                 results = []
                 for match in similar_resumes:
-                    resume_detail = next((r for r in resumes_detail if str(r["_id"]) == match["metadata"]["resume_id"]), None)
+                    resume_detail = resumes_detail.get(match["metadata"]["resume_id"])
                     if resume_detail:
                         resume_detail["_id"] = str(resume_detail["_id"])
                         if "resume_id" in resume_detail:
@@ -306,7 +571,7 @@ class SimilarityService:
                         if reverse_similarity is not None:
                             avg_similarity = (match["score"] + reverse_similarity) / 2
                             avg_percentage = round(avg_similarity * 100, 1)
-                            print(f"[SimilarityService] 상호 유사도 - A→B: {similarity_percentage}%, B→A: {round(reverse_similarity * 100, 1)}%, 평균: {avg_percentage}%")
+                            logger.debug("[SimilarityService] 상호 유사도 - A→B: %s%%, B→A: %s%%, 평균: %s%%", similarity_percentage, round(reverse_similarity * 100, 1), avg_percentage)
                             similarity_percentage = avg_percentage
                             match["score"] = avg_similarity
                         
@@ -316,20 +581,20 @@ class SimilarityService:
                             # 벡터 유사도와 텍스트 유사도의 가중 평균 사용
                             final_similarity = (match["score"] * 0.7 + text_similarity * 0.3)
                             final_percentage = round(final_similarity * 100, 1)
-                            print(f"[SimilarityService] 텍스트 유사도: {round(text_similarity * 100, 1)}%, 최종 유사도: {final_percentage}%")
+                            logger.debug("[SimilarityService] 텍스트 유사도: %s%%, 최종 유사도: %s%%", round(text_similarity * 100, 1), final_percentage)
                             
                             # 필드별 임계값 검증 (너무 엄격하지 않게 수정)
                             field_validation = self._validate_field_thresholds(resume, resume_detail)
                             if field_validation or final_similarity > 0.8:  # 80% 이상이면 필드 검증 무시
                                 similarity_percentage = final_percentage
                                 match["score"] = final_similarity
-                                print(f"[SimilarityService] 필드 임계값 검증 통과 (필드검증: {field_validation}, 높은유사도: {final_similarity > 0.8})")
+                                logger.debug("[SimilarityService] 필드 임계값 검증 통과 (필드검증: %s, 높은유사도: %s)", field_validation, final_similarity > 0.8)
                             else:
-                                print(f"[SimilarityService] 필드 임계값 검증 실패 - 하지만 유사도가 낮아서 제외")
+                                logger.debug("[SimilarityService] 필드 임계값 검증 실패 - 하지만 유사도가 낮아서 제외")
                                 continue
                         else:
                             # 텍스트 유사도 계산 실패 시 벡터 유사도만 사용
-                            print(f"[SimilarityService] 텍스트 유사도 계산 실패, 벡터 유사도만 사용")
+                            logger.warning("[SimilarityService] 텍스트 유사도 계산 실패, 벡터 유사도만 사용")
                         
                         results.append({
                             "similarity_score": match["score"],
@@ -340,10 +605,12 @@ class SimilarityService:
                 # 유사도 점수로 정렬 (높은 순)
                 results.sort(key=lambda x: x["similarity_score"], reverse=True)
                 
-                print(f"[SimilarityService] 최종 유사 이력서 수: {len(results)}")
+                logger.debug("[SimilarityService] 최종 유사 이력서 수: %s", len(results))
                 for result in results:
-                    print(f"[SimilarityService] 최종 결과: {result['resume']['name']} (점수: {result['similarity_percentage']}%)")
-                print(f"[SimilarityService] === 유사도 검색 완료 ===")
+                    logger.debug("[SimilarityService] 최종 결과: %s (점수: %s%%)", result['resume']['name'], result['similarity_percentage'])
+                logger.debug("[SimilarityService] === 유사도 검색 완료 ===")
+                self.record_comparisons("vector", len(search_result["matches"]), time.perf_counter() - started,
+                                        [r["similarity_score"] for r in results])
                 
                 return {
                     "success": True,
@@ -359,8 +626,9 @@ class SimilarityService:
                     }
                 }
             else:
-                print(f"유사한 이력서가 없습니다.")
-                print(f"=== 유사도 검색 완료 ===")
+                logger.debug("유사한 이력서가 없습니다.")
+                logger.debug("=== 유사도 검색 완료 ===")
+                self.record_comparisons("vector", len(search_result["matches"]), time.perf_counter() - started)
                 
                 return {
                     "success": True,
@@ -377,66 +645,67 @@ class SimilarityService:
                 }
                 
         except Exception as e:
-            print(f"=== 유사도 검색 중 오류 발생 ===")
-            print(f"오류 메시지: {str(e)}")
-            print(f"오류 타입: {type(e).__name__}")
-            import traceback
-            print(f"스택 트레이스: {traceback.format_exc()}")
+            self.stats.inc("errors.vector")
+            logger.exception("[SimilarityService] 유사도 검색 중 오류 (%s): %s", type(e).__name__, e)
             raise e
     
     async def search_resumes_by_query(self, query: str, collection: Collection, 
-                                    search_type: str = "resume", limit: int = 10) -> Dict[str, Any]:
+                                    search_type: str = "resume", limit: int = 10,
+                                    use_async: Optional[bool] = None) -> Dict[str, Any]:
         """
         쿼리 텍스트로 이력서를 검색합니다.
         
         Args:
             query (str): 검색할 쿼리 텍스트
-            collection (Collection): MongoDB 컬렉션
+            collection (Collection): MongoDB 컬렉션 (Motor 또는 PyMongo)
             search_type (str): 검색할 타입 ("resume", "cover_letter", "portfolio")
             limit (int): 반환할 최대 결과 수
+            use_async (Optional[bool]): Motor 경로 사용 여부 (None이면 컬렉션 타입으로 자동 판별)
             
         Returns:
             Dict[str, Any]: 검색 결과
         """
+        started = time.perf_counter()
         try:
             if not query:
                 raise ValueError("검색어를 입력해주세요.")
             
             # 쿼리 텍스트 임베딩 생성
-            print(f"=== 검색 임베딩 처리 시작 ===")
-            print(f"검색 쿼리: {query}")
-            print(f"검색 타입: {search_type}")
-            print(f"검색 제한: {limit}")
+            logger.debug("=== 검색 임베딩 처리 시작 ===")
+            log_payload(logger, "검색 쿼리: %s", query)
+            logger.debug("검색 타입: %s", search_type)
+            logger.debug("검색 제한: %s", limit)
             
             query_embedding = await self.embedding_service.create_embedding(query)
             
             if not query_embedding:
-                print(f"검색어 임베딩 생성 실패!")
+                logger.warning("검색어 임베딩 생성 실패")
                 raise ValueError("검색어 임베딩 생성에 실패했습니다.")
             
-            print(f"검색어 임베딩 생성 성공!")
-            print(f"검색 임베딩 차원: {len(query_embedding)}")
+            logger.debug("검색어 임베딩 생성 성공!")
+            logger.debug("검색 임베딩 차원: %s", len(query_embedding))
             
             # Pinecone에서 유사한 벡터 검색
-            print(f"Pinecone 검색 시작...")
+            logger.debug("Pinecone 검색 시작...")
             search_result = await self.vector_service.search_similar_vectors(
                 query_embedding=query_embedding,
                 top_k=limit,
                 filter_type=search_type
             )
             
-            print(f"Pinecone 검색 완료!")
-            print(f"검색 결과 수: {len(search_result['matches'])}")
-            print(f"=== 검색 임베딩 처리 완료 ===")
+            logger.debug("Pinecone 검색 완료!")
+            logger.debug("검색 결과 수: %s", len(search_result['matches']))
+            logger.debug("=== 검색 임베딩 처리 완료 ===")
             
             # MongoDB에서 상세 정보 조회
-            resume_ids = [ObjectId(match["metadata"]["resume_id"]) for match in search_result["matches"]]
-            resumes = list(collection.find({"_id": {"$in": resume_ids}}))
+            resumes = await self._fetch_resumes_by_ids(
+                collection, [match["metadata"]["resume_id"] for match in search_result["matches"]], use_async
+            )
             
             # 검색 결과와 상세 정보 매칭
             results = []
             for match in search_result["matches"]:
-                resume = next((r for r in resumes if str(r["_id"]) == match["metadata"]["resume_id"]), None)
+                resume = resumes.get(match["metadata"]["resume_id"])
                 if resume:
                     resume["_id"] = str(resume["_id"])
                     resume["resume_id"] = str(resume["resume_id"])
@@ -448,6 +717,8 @@ class SimilarityService:
                         "resume": resume
                     })
             
+            self.record_comparisons("query", len(search_result["matches"]), time.perf_counter() - started,
+                                    [r["score"] for r in results])
             return {
                 "success": True,
                 "data": {
@@ -458,7 +729,8 @@ class SimilarityService:
             }
             
         except Exception as e:
-            print(f"이력서 검색 중 오류: {str(e)}")
+            self.stats.inc("errors.query")
+            logger.error("이력서 검색 중 오류: %s", str(e))
             raise e
     
     def _extract_resume_text(self, resume: Dict[str, Any]) -> str:
@@ -474,7 +746,7 @@ class SimilarityService:
         # ResumeUpload 모델의 경우
         if "resume_text" in resume and resume["resume_text"]:
             extracted_text = self._preprocess_text(resume["resume_text"])
-            print(f"[SimilarityService] 추출된 이력서 텍스트: '{extracted_text}'")
+            log_payload(logger, "[SimilarityService] 추출된 이력서 텍스트: '%s'", extracted_text)
             return extracted_text
         
         # ResumeCreate 모델의 경우 지정된 필드들만 사용
@@ -495,10 +767,10 @@ class SimilarityService:
             
             combined_text = " ".join(text_parts)
             extracted_text = self._preprocess_text(combined_text)
-            print(f"[SimilarityService] 추출된 이력서 텍스트 (제외 필드 없음): '{extracted_text}'")
+            log_payload(logger, "[SimilarityService] 추출된 이력서 텍스트 (제외 필드 없음): '%s'", extracted_text)
             return extracted_text
         
-        print(f"[SimilarityService] 텍스트 추출 실패 - 빈 텍스트 반환")
+        logger.warning("[SimilarityService] 텍스트 추출 실패 - 빈 텍스트 반환")
         return ""
 
     def _is_meaningless_text(self, text: str) -> bool:
@@ -580,7 +852,7 @@ class SimilarityService:
                 
                 # 의미없는 텍스트는 제외
                 if self._is_meaningless_text(value_a) or self._is_meaningless_text(value_b):
-                    print(f"[SimilarityService] {field} 필드 의미없는 텍스트 제외")
+                    logger.debug("[SimilarityService] %s 필드 의미없는 텍스트 제외", field)
                     continue
                 
                 if value_a and value_b:
@@ -588,20 +860,20 @@ class SimilarityService:
                     field_similarity = self._calculate_field_similarity(value_a, value_b, field)
                     total_similarity += field_similarity * weight
                     total_weight += weight
-                    print(f"[SimilarityService] {field} 유사도: {field_similarity:.3f} (가중치: {weight})")
+                    logger.debug("[SimilarityService] %s 유사도: %s (가중치: %s)", field, format(field_similarity, ".3f"), weight)
             
             # 전체 유사도 계산
             if total_weight > 0:
                 final_similarity = total_similarity / total_weight
-                print(f"[SimilarityService] 필드별 가중 평균 유사도: {final_similarity:.3f}")
+                logger.debug("[SimilarityService] 필드별 가중 평균 유사도: %s", format(final_similarity, ".3f"))
                 return final_similarity
             
             # 의미있는 필드가 없는 경우 기본 유사도 반환
-            print(f"[SimilarityService] 의미있는 필드가 없음, 기본 유사도 계산")
+            logger.debug("[SimilarityService] 의미있는 필드가 없음, 기본 유사도 계산")
             return self._calculate_basic_similarity(resume_a, resume_b)
             
         except Exception as e:
-            print(f"[SimilarityService] 텍스트 유사도 계산 중 오류: {str(e)}")
+            logger.warning("[SimilarityService] 텍스트 유사도 계산 중 오류: %s", str(e))
             return None
 
     def _calculate_basic_similarity(self, resume_a: Dict[str, Any], resume_b: Dict[str, Any]) -> float:
@@ -636,7 +908,7 @@ class SimilarityService:
             return intersection / union if union > 0 else 0.0
             
         except Exception as e:
-            print(f"[SimilarityService] 기본 유사도 계산 중 오류: {str(e)}")
+            logger.warning("[SimilarityService] 기본 유사도 계산 중 오류: %s", str(e))
             return 0.0
 
     def _calculate_field_similarity(self, value_a: str, value_b: str, field_type: str) -> float:
@@ -675,7 +947,7 @@ class SimilarityService:
                 return intersection / union if union > 0 else 0.0
                 
         except Exception as e:
-            print(f"[SimilarityService] 필드 유사도 계산 중 오류: {str(e)}")
+            logger.warning("[SimilarityService] 필드 유사도 계산 중 오류: %s", str(e))
             return 0.0
 
     def _calculate_skills_similarity(self, skills_a: str, skills_b: str) -> float:
@@ -708,7 +980,7 @@ class SimilarityService:
             return intersection / union if union > 0 else 0.0
             
         except Exception as e:
-            print(f"[SimilarityService] 기술스택 유사도 계산 중 오류: {str(e)}")
+            logger.warning("[SimilarityService] 기술스택 유사도 계산 중 오류: %s", str(e))
             return 0.0
 
     def _calculate_keyword_similarity(self, resume_a: Dict[str, Any], resume_b: Dict[str, Any]) -> float:
@@ -746,7 +1018,7 @@ class SimilarityService:
             return intersection / union if union > 0 else 0.0
             
         except Exception as e:
-            print(f"[SimilarityService] 키워드 유사도 계산 중 오류: {str(e)}")
+            logger.warning("[SimilarityService] 키워드 유사도 계산 중 오류: %s", str(e))
             return 0.0
 
     # 기존 비효율적인 상호 유사도 함수 (사용 안함)
@@ -774,7 +1046,7 @@ class SimilarityService:
             
             # 의미없는 텍스트나 빈 값은 검증에서 제외하되, 너무 많이 제외되지 않도록 함
             if self._is_meaningless_text(value_a) or self._is_meaningless_text(value_b) or not value_a or not value_b:
-                print(f"[SimilarityService] 필드 '{field}' 의미없는/빈 텍스트, 임계값 검증 제외")
+                logger.debug("[SimilarityService] 필드 '%s' 의미없는/빈 텍스트, 임계값 검증 제외", field)
                 continue
             
             valid_field_count += 1
@@ -782,20 +1054,20 @@ class SimilarityService:
             
             if field_similarity >= threshold:
                 passed_field_count += 1
-                print(f"[SimilarityService] 필드 '{field}' 임계값 달성: {field_similarity:.3f} >= {threshold}")
+                logger.debug("[SimilarityService] 필드 '%s' 임계값 달성: %s >= %s", field, format(field_similarity, ".3f"), threshold)
             else:
-                print(f"[SimilarityService] 필드 '{field}' 임계값 미달: {field_similarity:.3f} < {threshold}")
+                logger.debug("[SimilarityService] 필드 '%s' 임계값 미달: %s < %s", field, format(field_similarity, ".3f"), threshold)
         
         # 검증 가능한 필드가 없으면 통과로 처리
         if valid_field_count == 0:
-            print(f"[SimilarityService] 검증 가능한 필드가 없음 - 통과 처리")
+            logger.debug("[SimilarityService] 검증 가능한 필드가 없음 - 통과 처리")
             return True
         
         # 절반 이상의 필드가 통과하면 OK
         threshold_ratio = passed_field_count / valid_field_count
         result = threshold_ratio >= 0.5
         
-        print(f"[SimilarityService] 필드 검증 결과: {passed_field_count}/{valid_field_count} 통과 ({threshold_ratio:.2f}) -> {'통과' if result else '실패'}")
+        logger.debug("[SimilarityService] 필드 검증 결과: %s/%s 통과 (%s) -> %s", passed_field_count, valid_field_count, format(threshold_ratio, ".2f"), '통과' if result else '실패')
         return result
     
     def _calculate_reverse_text_similarity(self, resume_a: Dict[str, Any], resume_b: Dict[str, Any]) -> Optional[float]:
@@ -835,17 +1107,17 @@ class SimilarityService:
                 total_similarity += bidirectional_similarity
                 valid_comparisons += 1
                 
-                print(f"[SimilarityService] {field} 상호유사도: A→B={similarity_ab:.3f}, B→A={similarity_ba:.3f}, 평균={bidirectional_similarity:.3f}")
+                logger.debug("[SimilarityService] %s 상호유사도: A→B=%s, B→A=%s, 평균=%s", field, format(similarity_ab, ".3f"), format(similarity_ba, ".3f"), format(bidirectional_similarity, ".3f"))
             
             if valid_comparisons == 0:
-                print(f"[SimilarityService] 상호 유사도 계산 불가 - 비교 가능한 필드 없음")
+                logger.debug("[SimilarityService] 상호 유사도 계산 불가 - 비교 가능한 필드 없음")
                 return None
             
             average_similarity = total_similarity / valid_comparisons
-            print(f"[SimilarityService] 전체 상호 유사도: {average_similarity:.3f} ({valid_comparisons}개 필드)")
+            logger.debug("[SimilarityService] 전체 상호 유사도: %s (%s개 필드)", format(average_similarity, ".3f"), valid_comparisons)
             
             return average_similarity
             
         except Exception as e:
-            print(f"[SimilarityService] 상호 유사도 계산 중 오류: {str(e)}")
+            logger.error("[SimilarityService] 상호 유사도 계산 중 오류: %s", str(e))
             return None
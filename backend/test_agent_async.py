@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+비동기 Agent 파이프라인 테스트 (Gemini 호출은 가짜 모델로 대체)
+"""
+
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import agent_system as agent_module
+from agent_system import AgentSystem
+from chatbot.core.tiered_classifier import LLMBudget
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeAsyncModel:
+    """지정한 지연 후 응답하는 가짜 Gemini 모델"""
+
+    def __init__(self, intent="chat", delay=0.0):
+        self.intent = intent
+        self.delay = delay
+
+    async def generate_content_async(self, prompt):
+        await asyncio.sleep(self.delay)
+        if "분류 결과만 반환" in prompt:
+            return FakeResponse(self.intent)
+        return FakeResponse("## 📋 채용공고\n서울 개발자 3명 모집")
+
+    def generate_content(self, prompt):
+        raise AssertionError("비동기 파이프라인에서 동기 호출이 발생했습니다.")
+
+
+def run_with_model(fake_model, coro_factory):
+    original = agent_module.model
+    agent_module.model = fake_model
+    try:
+        return asyncio.run(coro_factory())
+    finally:
+        agent_module.model = original
+
+
+def test_concurrent_requests_do_not_block():
+    """느린 LLM 호출 여러 개가 동시에 진행되는지 확인"""
+    agent = AgentSystem()
+    agent.intent_detector.tiers.budget = LLMBudget(max_calls=-1)
+
+    async def main():
+        started = time.perf_counter()
+        results = await asyncio.gather(*(agent.process_request_async("이 내용 좀 정리해줄 수 있어?") for _ in range(20)))
+        return results, time.perf_counter() - started
+
+    results, elapsed = run_with_model(FakeAsyncModel("chat", delay=0.2), main)
+
+    assert all(result["success"] and result["intent"] == "chat" for result in results)
+    assert elapsed < 1.0  # 순차 실행이면 4초 이상
+    print(f"✅ 동시 요청 처리 통과 ({elapsed:.2f}초)")
+
+
+def test_intent_timeout_falls_back_to_chat():
+    """LLM 의도 분류가 타임아웃되면 일반 대화로 처리되는지 확인 (로컬 모델이 확신하지 못하는 입력)"""
+    agent = AgentSystem()
+    agent.node_timeouts["intent"] = 0.05
+
+    result = run_with_model(FakeAsyncModel("recruit", delay=1.0),
+                            lambda: agent.process_request_async("이 내용 좀 정리해줄 수 있어?"))
+
+    assert result["success"]
+    assert result["intent"] == "chat"
+    assert agent.intent_detector.get_tier_stats()["counts"]["llm"] == 0
+    print("✅ 의도 분류 타임아웃 처리 통과")
+
+
+def test_greeting_skips_llm():
+    """인사처럼 로컬 모델이 확신하는 입력은 LLM을 호출하지 않는지 확인"""
+    agent = AgentSystem()
+
+    class NoCallModel(FakeAsyncModel):
+        async def generate_content_async(self, prompt):
+            if "분류 결과만 반환" in prompt:
+                raise AssertionError("의도 분류에 LLM이 호출되었습니다.")
+            return await super().generate_content_async(prompt)
+
+    intent = run_with_model(NoCallModel(), lambda: agent.intent_detector.detect_intent_async("안녕하세요"))
+
+    assert intent == "chat"
+    assert agent.intent_detector.get_tier_stats()["counts"]["local_model"] == 1
+    print("✅ 인사 로컬 판정 통과")
+
+
+def test_recruit_node_runs_async_and_extracts_fields():
+    """채용공고 노드가 비동기로 실행되고 필드가 추출되는지 확인"""
+    agent = AgentSystem()
+
+    result = run_with_model(FakeAsyncModel("recruit"),
+                            lambda: agent.process_request_async("서울에서 개발자 3명 뽑아요"))
+
+    assert result["intent"] == "recruit"
+    assert "채용공고" in result["response"]
+    assert result["extracted_fields"].get("headcount") == "3명"
+    print("✅ 채용공고 노드 비동기 실행 통과")
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_do_not_block()
+    test_intent_timeout_falls_back_to_chat()
+    test_greeting_skips_llm()
+    test_recruit_node_runs_async_and_extracts_fields()
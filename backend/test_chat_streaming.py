@@ -0,0 +1,161 @@
+"""
+채팅 SSE 스트리밍 테스트 (LLM 스트림과 HTTP 요청은 가짜 객체로 대체)
+"""
+
+import sys
+import os
+import asyncio
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+
+from chatbot.services.stream_service import stream_handler_events, relay_stream, is_streaming
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def parse_event(raw):
+    event_line, data_line = raw.strip().split("\n")
+    return event_line[len("event: "):], json.loads(data_line[len("data: "):])
+
+
+def make_llm_stream(state, count=None, delay=0.0):
+    """생성한 청크 수와 종료 여부를 기록하는 가짜 LLM 스트림 (count가 None이면 끝없이 생성)"""
+    async def generate():
+        try:
+            index = 0
+            while count is None or index < count:
+                await asyncio.sleep(delay)
+                state["produced"] += 1
+                yield f"토큰{index} "
+                index += 1
+        finally:
+            state["closed"] = True
+    return generate()
+
+
+def test_tokens_then_trailing_result():
+    """LLM 토큰이 먼저 오고, 필드 추출 결과가 마지막 result 이벤트로 오는지 확인"""
+    state = {"produced": 0, "closed": False}
+
+    async def handler():
+        assert is_streaming()
+        text = await relay_stream(make_llm_stream(state, count=3))
+        return {"message": text, "field": "department", "value": "개발팀"}
+
+    async def main():
+        assert not is_streaming()
+        return [parse_event(raw) async for raw in stream_handler_events(FakeRequest(), handler)]
+
+    events = asyncio.run(main())
+    assert [name for name, _ in events] == ["token", "token", "token", "result", "done"]
+    assert "".join(data["text"] for name, data in events if name == "token") == events[3][1]["message"]
+    assert events[3][1]["value"] == "개발팀"
+    print("✅ 토큰 이벤트 + 마지막 결과 이벤트 통과")
+
+
+def test_backpressure_pauses_upstream():
+    """클라이언트가 읽지 않으면 큐 크기 이상으로 LLM 스트림을 소비하지 않는지 확인"""
+    state = {"produced": 0, "closed": False}
+
+    async def handler():
+        return {"message": await relay_stream(make_llm_stream(state, count=100))}
+
+    async def main():
+        events = stream_handler_events(FakeRequest(), handler, queue_size=2, poll_seconds=0.01)
+        first = await events.__anext__()
+        await asyncio.sleep(0.05)  # 느린 클라이언트
+        produced_while_paused = state["produced"]
+        remaining = [raw async for raw in events]
+        return first, produced_while_paused, remaining
+
+    first, produced_while_paused, remaining = asyncio.run(main())
+    assert parse_event(first)[0] == "token"
+    assert produced_while_paused <= 1 + 2 + 1  # 전달한 1개 + 큐 2개 + 대기 중 1개
+    assert len(remaining) == 99 + 2 and state["produced"] == 100
+    print("✅ 백프레셔 통과")
+
+
+def test_disconnect_cancels_llm_call():
+    """클라이언트 연결이 끊기면 핸들러와 LLM 스트림이 취소되는지 확인"""
+    state = {"produced": 0, "closed": False}
+    request = FakeRequest()
+
+    async def handler():
+        return await relay_stream(make_llm_stream(state, delay=0.01))
+
+    async def main():
+        events = stream_handler_events(request, handler, queue_size=1, poll_seconds=0.01)
+        await events.__anext__()
+        request.disconnected = True
+        rest = [raw async for raw in events]
+        await asyncio.sleep(0.05)
+        return rest
+
+    rest = asyncio.run(main())
+    assert rest == [] or all(parse_event(raw)[0] == "token" for raw in rest)
+    assert state["closed"] and state["produced"] < 20
+    print("✅ 연결 끊김 시 LLM 호출 취소 통과")
+
+
+def test_handler_error_event():
+    """핸들러의 HTTPException은 error 이벤트로 전달되는지 확인"""
+    async def handler():
+        raise HTTPException(status_code=400, detail="유효하지 않은 세션입니다")
+
+    async def main():
+        return [parse_event(raw) async for raw in stream_handler_events(FakeRequest(), handler)]
+
+    events = asyncio.run(main())
+    assert events[0] == ("error", {"status": 400, "detail": "유효하지 않은 세션입니다"})
+    assert events[-1][0] == "done"
+    print("✅ 오류 이벤트 통과")
+
+
+def test_only_user_facing_calls_stream():
+    """추출용 call_ai_api 호출은 스트리밍 중에도 토큰을 보내지 않고, stream=True인 답변만 전달되는지 확인"""
+    import chatbot_router
+
+    class FakeGemini:
+        client = object()
+
+        async def generate_response(self, prompt, conversation_history=None, **kwargs):
+            return "개발팀"
+
+        async def generate_streaming_response(self, prompt, conversation_history=None, **kwargs):
+            for chunk in ("답변1 ", "답변2"):
+                yield chunk
+
+    async def handler():
+        extracted = await chatbot_router.call_ai_api("필드 추출 프롬프트")
+        reply = await chatbot_router.call_ai_api("사용자 질문", stream=True)
+        return {"message": reply, "value": extracted}
+
+    async def main():
+        return [parse_event(raw) async for raw in stream_handler_events(FakeRequest(), handler)]
+
+    original = chatbot_router.gemini_service
+    chatbot_router.gemini_service = FakeGemini()
+    try:
+        events = asyncio.run(main())
+    finally:
+        chatbot_router.gemini_service = original
+
+    assert [data["text"] for name, data in events if name == "token"] == ["답변1 ", "답변2"]
+    assert events[-2] == ("result", {"message": "답변1 답변2", "value": "개발팀"})
+    print("✅ 사용자 응답만 스트리밍 통과")
+
+
+if __name__ == "__main__":
+    test_tokens_then_trailing_result()
+    test_backpressure_pauses_upstream()
+    test_disconnect_cancels_llm_call()
+    test_handler_error_event()
+    test_only_user_facing_calls_stream()
@@ -0,0 +1,96 @@
+"""
+청크 저장소 테스트
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pymongo import UpdateOne, DeleteMany
+from chunk_store import ChunkStore, split_text_windows
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def __aiter__(self):
+        self._iter = iter(self.documents)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeChunkCollection:
+    """bulk_write를 (resume_id, field_name, chunk_index) 키 업서트로 흉내내는 테스트용 컬렉션"""
+
+    def __init__(self):
+        self.documents = {}
+        self.bulk_calls = 0
+        self.next_id = 0
+
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_calls += 1
+        assert ordered is False
+        for op in operations:
+            if isinstance(op, UpdateOne):
+                doc = op._doc
+                key = (op._filter["resume_id"], op._filter["field_name"], op._filter["chunk_index"])
+                if key not in self.documents:
+                    self.next_id += 1
+                    self.documents[key] = {"_id": self.next_id, **doc["$setOnInsert"]}
+                self.documents[key].update(doc["$set"])
+            elif isinstance(op, DeleteMany):
+                f = op._filter
+                for key in [k for k in self.documents
+                            if k[0] == f["resume_id"] and k[1] == f["field_name"] and k[2] >= f["chunk_index"]["$gte"]]:
+                    del self.documents[key]
+
+    def find(self, query, projection=None):
+        fields = set(query["field_name"]["$in"])
+        return FakeCursor([d for k, d in self.documents.items() if k[0] == query["resume_id"] and k[1] in fields])
+
+
+def make_chunks(resume_id, field_name, text):
+    return [
+        {"resume_id": resume_id, "field_name": field_name, "chunk_index": i, "text": chunk_text,
+         "start_pos": start, "end_pos": end}
+        for i, (start, end, chunk_text) in enumerate(split_text_windows(text, 10, 3))
+    ]
+
+
+def test_split_text_windows_overlap_and_blank():
+    """겹침 윈도우 분할과 공백 청크 제외 확인"""
+    windows = list(split_text_windows("a" * 10 + " " * 10 + "b" * 5, 10, 0))
+
+    assert [(s, e) for s, e, _ in windows] == [(0, 10), (20, 25)]
+    assert [(s, e) for s, e, _ in split_text_windows("x" * 20, 10, 3)] == [(0, 10), (7, 17), (14, 20)]
+    assert len(list(split_text_windows("x" * 20, 5, 5))) == 4  # 겹침 >= 길이여도 종료
+    print("✅ 윈도우 분할 통과")
+
+
+def test_reprocessing_is_idempotent_single_bulk_write():
+    """재처리 시 중복 없이 업서트되고 줄어든 청크는 삭제되는지 확인"""
+    collection = FakeChunkCollection()
+    store = ChunkStore(collection)
+
+    first = asyncio.run(store.save_chunks("r1", {"motivation": make_chunks("r1", "motivation", "x" * 30)}))
+    first_ids = [chunk["id"] for chunk in first]
+    again = asyncio.run(store.save_chunks("r1", {"motivation": make_chunks("r1", "motivation", "x" * 30)}))
+    shorter = asyncio.run(store.save_chunks("r1", {"motivation": make_chunks("r1", "motivation", "x" * 12)}))
+
+    assert collection.bulk_calls == 3
+    assert [chunk["id"] for chunk in again] == first_ids
+    assert len(shorter) == 2
+    assert sorted(k[2] for k in collection.documents) == [0, 1]
+    print("✅ 멱등 일괄 업서트 통과")
+
+
+if __name__ == "__main__":
+    test_split_text_windows_overlap_and_blank()
+    test_reprocessing_is_idempotent_single_bulk_write()
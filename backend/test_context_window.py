@@ -0,0 +1,117 @@
+"""
+토큰 예산 기반 대화 컨텍스트 구성 테스트 (요약기는 호출 기록만 남기는 가짜 함수)
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.llm_providers.context_window import ConversationContextBuilder, TokenEstimator, get_token_estimator
+from chatbot.services.session_store import MemorySessionStore
+
+JOB_POSTING = "백엔드 개발자 채용 공고입니다. Python, FastAPI 경험 3년 이상, MongoDB 운영 경험 우대. " * 8
+
+
+def make_builder(calls, **kwargs):
+    async def summarizer(summary, messages):
+        calls.append(len(messages))
+        return f"{summary} 요약{len(calls)}".strip()
+
+    options = {"token_budget": 300, "summary_tokens": 60, "max_message_tokens": 120, "min_summarize_messages": 4}
+    options.update(kwargs)
+    return ConversationContextBuilder(TokenEstimator(), summarizer=summarizer,
+                                      store=MemorySessionStore("context-test"), **options)
+
+
+def make_history(turns):
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"{i}번째 질문입니다. 주요 업무를 어떻게 작성하면 좋을까요?"})
+        history.append({"role": "assistant", "content": f"{i}번째 답변입니다. 개발, 운영, 개선 업무를 구체적으로 적어주세요."})
+    return history
+
+
+def test_prompt_tokens_stay_flat():
+    """대화가 길어져도 프롬프트 토큰이 예산 + 요약 한도를 넘지 않고, 요약은 묶음마다 한 번만 호출되는지 확인"""
+    calls = []
+    builder = make_builder(calls)
+
+    async def main():
+        results = []
+        for turns in range(1, 41):
+            results.append(await builder.build("다음 질문입니다.", make_history(turns), session_id="s1"))
+        # 같은 기록으로 다시 구성하면 캐시된 요약을 그대로 사용
+        again = await builder.build("다음 질문입니다.", make_history(40), session_id="s1")
+        return results, again
+
+    results, again = asyncio.run(main())
+    assert max(r["prompt_tokens"] for r in results) <= builder.token_budget + builder.summary_tokens
+    assert results[-1]["dropped_messages"] > 60 and results[-1]["summary"]
+    assert all(count >= builder.min_summarize_messages for count in calls)
+    assert sum(calls) <= results[-1]["dropped_messages"]  # 이미 요약된 메시지는 다시 요약하지 않음
+    assert len(calls) == builder.stats["summaries"] and again["summary"] == results[-1]["summary"]
+    print("✅ 프롬프트 토큰 일정 유지/요약 캐시 통과")
+
+
+def test_summary_boundary_does_not_move_backwards():
+    """입력이 짧아져 예산이 늘어도 이미 요약된 메시지는 최근 대화에 다시 넣지 않는지 확인"""
+    calls = []
+    builder = make_builder(calls)
+    history = make_history(20)
+
+    async def main():
+        long_prompt = await builder.build("긴 질문 " * 60, history, session_id="s2")
+        short_prompt = await builder.build("짧은 질문", history, session_id="s2")
+        return long_prompt, short_prompt
+
+    long_prompt, short_prompt = asyncio.run(main())
+    assert len(calls) == 1
+    assert short_prompt["dropped_messages"] >= calls[0]
+    assert short_prompt["summary"] == long_prompt["summary"]
+    print("✅ 요약 경계 유지 통과")
+
+
+def test_repeated_paste_and_clipping():
+    """여러 번 붙여넣은 공고는 최신 것만 남기고, 너무 긴 메시지는 가운데를 생략하는지 확인"""
+    builder = make_builder([], token_budget=2000)
+    history = [
+        {"role": "user", "content": f"이 공고 봐주세요.\n\n{JOB_POSTING}"},
+        {"role": "assistant", "content": "확인했습니다."},
+        {"role": "user", "content": f"다시 붙여넣을게요.\n\n{JOB_POSTING}"},
+        {"role": "assistant", "content": "x" * 2000},
+    ]
+
+    context = asyncio.run(builder.build(f"이 공고로 제목 추천해주세요.\n\n{JOB_POSTING}", history))
+    first, _, second, long_reply = context["history"]
+    assert "생략" in first["content"] and "생략" in second["content"]
+    assert JOB_POSTING not in first["content"] and JOB_POSTING not in second["content"]
+    assert "중략" in long_reply["content"]
+    assert builder.estimator.count(long_reply["content"]) <= builder.max_message_tokens
+    assert builder.stats["deduplicated"] == 2 and builder.stats["clipped"] == 1
+    print("✅ 반복 붙여넣기 제거/긴 메시지 생략 통과")
+
+
+def test_estimator_and_summary_failure():
+    """한국어는 글자당 토큰으로 계산되고, 요약 실패 시 발췌로 대체되는지 확인"""
+    estimator = get_token_estimator("gemini")
+    assert estimator is get_token_estimator("gemini")
+    assert estimator.count("abcd" * 10) == 10
+    assert estimator.count("채용공고") == 3  # 4글자 * 0.6
+
+    async def failing_summarizer(summary, messages):
+        raise RuntimeError("quota exceeded")
+
+    builder = ConversationContextBuilder(TokenEstimator(), token_budget=100, summary_tokens=200,
+                                         summarizer=failing_summarizer, store=MemorySessionStore("context-test"))
+    context = asyncio.run(builder.build("질문", make_history(10), session_id="s3"))
+    assert context["summary"].startswith("사용자: 0번째 질문입니다.")
+    assert builder.stats["summary_failures"] == 1
+    print("✅ 토큰 추정/요약 실패 대체 통과")
+
+
+if __name__ == "__main__":
+    test_prompt_tokens_stay_flat()
+    test_summary_boundary_does_not_move_backwards()
+    test_repeated_paste_and_clipping()
+    test_estimator_and_summary_failure()
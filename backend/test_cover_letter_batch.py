@@ -0,0 +1,177 @@
+"""
+자소서 일괄 분석 작업 테스트 (Motor 컬렉션과 분석기는 가짜 객체로 대체)
+"""
+
+import sys
+import os
+import io
+import asyncio
+import zipfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.cover_letter_analysis.batch import BatchJobStore, CoverLetterBatchProcessor, expand_uploads
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction):
+        self.documents.sort(key=lambda d: d[key], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    def __aiter__(self):
+        self._iter = iter(self.documents)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    """insert_one / update_one($set, $inc, upsert) / find_one / find 만 흉내내는 컬렉션"""
+
+    def __init__(self):
+        self.documents = []
+
+    def _match(self, document, query):
+        for key, value in query.items():
+            if isinstance(value, dict) and "$gt" in value:
+                if not document.get(key, float("-inf")) > value["$gt"]:
+                    return False
+            elif document.get(key) != value:
+                return False
+        return True
+
+    async def insert_one(self, document):
+        self.documents.append(dict(document))
+
+    async def update_one(self, query, update, upsert=False):
+        document = next((d for d in self.documents if self._match(d, query)), None)
+        if document is None:
+            if not upsert:
+                return
+            document = dict(query)
+            self.documents.append(document)
+        document.update(update.get("$set", {}))
+        for key, amount in update.get("$inc", {}).items():
+            document[key] = document.get(key, 0) + amount
+
+    async def find_one(self, query, projection=None):
+        return next((dict(d) for d in self.documents if self._match(d, query)), None)
+
+    def find(self, query, projection=None):
+        return FakeCursor([dict(d) for d in self.documents if self._match(d, query)])
+
+
+class FakeAnalysis:
+    def __init__(self, filename, status):
+        self.filename = filename
+        self.status = status
+
+    def model_dump(self, **kwargs):
+        return {"filename": self.filename, "summary": "요약"}
+
+
+class FakeAnalyzer:
+    """동시 실행 수를 기록하고, 이름에 'broken'이 있으면 실패를 반환하는 분석기"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def analyze_cover_letter(self, file_bytes, filename, job_description="", analysis_type="comprehensive"):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return FakeAnalysis(filename, "error" if "broken" in filename else "completed")
+
+    def get_analysis_summary(self, analysis):
+        return {"filename": analysis.filename, "status": analysis.status}
+
+
+def make_zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_expand_uploads_unpacks_zip():
+    """zip 안의 지원 형식만 풀고, 메타 파일/미지원 형식은 건너뛰는지 확인"""
+    archive = make_zip({"a.pdf": b"1", "dir/b.docx": b"2", "__MACOSX/._a.pdf": b"x", "notes.png": b"3"})
+    files = expand_uploads([("c.txt", b"4"), ("bundle.zip", archive)])
+
+    assert [name for name, _ in files] == ["c.txt", "a.pdf", "b.docx"]
+    try:
+        expand_uploads([("bundle.zip", archive)], max_entries=2)
+        raise AssertionError("항목 수 제한이 적용되지 않았습니다.")
+    except ValueError:
+        pass
+    print("✅ zip 업로드 풀기 통과")
+
+
+def test_batch_job_processes_with_bounded_workers():
+    """작업 기록/부분 결과/지표가 저장되고, 워커 수가 제한되며, 이벤트가 스트리밍되는지 확인"""
+    store = BatchJobStore(FakeCollection(), FakeCollection())
+    analyzer = FakeAnalyzer()
+    processor = CoverLetterBatchProcessor(analyzer, store, max_workers=3)
+    files = [(f"letter{i}.txt", b"x") for i in range(9)] + [("broken.txt", b"x")]
+
+    async def main():
+        submitted = await processor.submit(files, job_description="백엔드")
+        events = [event async for event in processor.stream_events(submitted["job_id"])]
+        job = await processor.get_job(submitted["job_id"], include_results=True, after_index=4)
+        return submitted, events, job
+
+    submitted, events, job = asyncio.run(main())
+
+    assert submitted["total"] == 10
+    assert analyzer.max_active == 3
+    assert job["status"] == "partial"
+    assert job["completed"] == 9 and job["failed"] == 1
+    assert job["metrics"]["throughput_docs_per_minute"] > 0
+    assert job["metrics"]["latency_p95_seconds"] is not None
+    assert [result["index"] for result in job["results"]] == [5, 6, 7, 8, 9]
+    assert all("latency_seconds" in result for result in job["results"])
+
+    document_events = [event for event in events if event["type"] == "document"]
+    assert len(document_events) == 10
+    assert events[-1]["type"] == "job" and events[-1]["status"] == "partial"
+    print("✅ 일괄 분석 작업 처리 통과")
+
+
+def test_batch_job_always_terminates_stream():
+    """작업 상태 저장이 실패해도 종료 이벤트가 발행되고 작업 목록에서 제거되는지 확인"""
+    class BrokenStore(BatchJobStore):
+        async def update_job(self, job_id, fields):
+            raise ConnectionError("mongo down")
+
+    store = BrokenStore(FakeCollection(), FakeCollection())
+    processor = CoverLetterBatchProcessor(FakeAnalyzer(), store, max_workers=2)
+
+    async def main():
+        submitted = await processor.submit([("a.txt", b"x"), ("b.txt", b"x")])
+        events = [event async for event in processor.stream_events(submitted["job_id"])]
+        return submitted, events
+
+    submitted, events = asyncio.run(main())
+
+    assert events[-1]["type"] == "job" and events[-1]["status"] == "failed"
+    assert submitted["job_id"] not in processor._jobs
+    print("✅ 저장 실패 시 작업 종료 보장 통과")
+
+
+if __name__ == "__main__":
+    test_expand_uploads_unpacks_zip()
+    test_batch_job_processes_with_bounded_workers()
+    test_batch_job_always_terminates_stream()
@@ -0,0 +1,103 @@
+"""
+자소서 분석 파이프라인 테스트 (로컬 마스킹, 측면 동시 분석, 결과 캐시)
+LLM 프로바이더는 가짜 객체로 대체합니다.
+"""
+
+import sys
+import os
+import asyncio
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.cover_letter_analysis.masking import mask_personal_info
+
+
+def test_local_masking():
+    """주민등록번호/전화번호/이메일만 마스킹하고 일반 숫자는 유지하는지 확인"""
+    text = "연락처 010-1234-5678, 02-123-4567 / hong@example.com / 900101-1234567 / 매출 1234567890원 25% 증가"
+    masked, counts = mask_personal_info(text)
+
+    assert "010-1234-5678" not in masked and "02-123-4567" not in masked
+    assert "hong@example.com" not in masked and "900101-1234567" not in masked
+    assert "1234567890원 25% 증가" in masked
+    assert counts == {"주민등록번호": 1, "이메일": 1, "전화번호": 2}
+    print("✅ 로컬 개인정보 마스킹 통과")
+
+
+def test_resident_number_without_hyphen():
+    """하이픈 없이 붙여 쓰거나 공백으로 구분한 주민등록번호도 마스킹하는지 확인"""
+    for resident_number in ("9001011234567", "900101 1234567", "900101 - 1234567"):
+        masked, counts = mask_personal_info(f"주민번호 {resident_number} 입니다")
+        assert resident_number not in masked and counts == {"주민등록번호": 1}, resident_number
+    # 생년월일 형태가 아닌 13자리 숫자는 유지
+    assert mask_personal_info("주문번호 9913991234567")[1] == {}
+    print("✅ 하이픈 없는 주민등록번호 마스킹 통과")
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeProvider:
+    """측면별 JSON을 지연 후 반환하는 가짜 LLM 프로바이더"""
+
+    RESPONSES = {
+        "HR 전문가": {"overall_score": 7.5},  # 루브릭 프롬프트에도 "STAR"가 있으므로 먼저 확인
+        "핵심 요약": {"summary": "요약", "top_strengths": []},
+        "STAR": [{"s": "상황", "t": "과제", "a": "행동", "r": "결과"}],
+        "직무 적합성": {"score": 80, "matched_skills": ["React"], "missing_skills": [], "explanation": "적합"},
+        "간결하고": [{"original": "원본", "improved": "개선", "improvement_type": "간결성"}],
+    }
+
+    def __init__(self):
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def safe_generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        for marker, response in self.RESPONSES.items():
+            if marker in prompt:
+                return FakeResponse(json.dumps(response, ensure_ascii=False))
+        return None
+
+    def is_healthy(self):
+        return True
+
+
+def test_aspects_run_concurrently_and_are_cached():
+    """측면 분석이 세마포어 한도 내에서 동시에 실행되고, 같은 입력은 캐시되는지 확인"""
+    from services.cover_letter_analysis.analyzer import CoverLetterAnalyzer
+
+    analyzer = CoverLetterAnalyzer({"provider": "none", "max_concurrent_aspects": 2})
+    provider = FakeProvider()
+    analyzer.llm_provider = provider
+    text = "저는 React 개발자입니다. 연락처 010-1234-5678"
+
+    async def main():
+        first = await analyzer.analyze_aspects(text, job_description="프론트엔드")
+        second = await analyzer.analyze_aspects(text, job_description="프론트엔드")
+        other_job = await analyzer.analyze_specific_aspect(text, "rubric", job_description="백엔드")
+        return first, second, other_job
+
+    first, second, other_job = asyncio.run(main())
+
+    assert first == second
+    assert first["summary"] == "요약" and first["job_suitability"].score == 80
+    assert len(first["star_cases"]) == 1 and len(first["sentence_improvements"]) == 1
+    assert other_job["evaluation_rubric"].overall_score == 7.5
+    assert len(provider.prompts) == 6  # 5개 측면 + 다른 직무 설명의 rubric 1개
+    assert provider.max_active == 2
+    assert all("010-1234-5678" not in prompt for prompt in provider.prompts)
+    print("✅ 측면 동시 분석/결과 캐시 통과")
+
+
+if __name__ == "__main__":
+    test_local_masking()
+    test_resident_number_without_hyphen()
+    test_aspects_run_concurrently_and_are_cached()
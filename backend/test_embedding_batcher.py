@@ -0,0 +1,83 @@
+"""
+임베딩 마이크로 배치 테스트
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from embedding_service import EmbeddingBatcher
+
+
+class FakeEncoder:
+    """호출 기록을 남기는 가짜 인코더"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[float(len(text)), 1.0] for text in texts])
+
+
+def test_concurrent_requests_are_batched():
+    """동시 요청이 하나의 배치로 묶이고 중복 텍스트는 한 번만 인코딩되는지 확인"""
+    encoder = FakeEncoder()
+
+    async def run():
+        batcher = EmbeddingBatcher(encoder, max_batch_size=64, max_wait_ms=20)
+        return await asyncio.gather(
+            batcher.submit(["가나다", "hello"]),
+            batcher.submit(["hello"]),
+            batcher.submit(["abcd", "가나다"]),
+        )
+
+    results = asyncio.run(run())
+
+    assert len(encoder.calls) == 1
+    assert encoder.calls[0] == ["가나다", "hello", "abcd"]
+    assert results[0].dtype == np.float32
+    assert results[0].shape == (2, 2)
+    assert results[1][0][0] == 5.0
+    assert results[2][1][0] == 3.0
+    print("✅ 동시 요청 배치 처리 통과")
+
+
+def test_batch_flushes_at_max_size():
+    """최대 배치 크기에 도달하면 대기 없이 바로 인코딩되는지 확인"""
+    encoder = FakeEncoder()
+
+    async def run():
+        batcher = EmbeddingBatcher(encoder, max_batch_size=2, max_wait_ms=10_000)
+        return await asyncio.wait_for(batcher.submit(["a", "b"]), timeout=1.0)
+
+    result = asyncio.run(run())
+
+    assert result.shape == (2, 2)
+    assert encoder.calls == [["a", "b"]]
+    print("✅ 최대 배치 크기 즉시 처리 통과")
+
+
+def test_encoder_error_propagates():
+    """인코딩 실패가 배치의 모든 요청에 전달되는지 확인"""
+
+    def failing_encoder(texts):
+        raise RuntimeError("encode failed")
+
+    async def run():
+        batcher = EmbeddingBatcher(failing_encoder, max_wait_ms=1)
+        return await asyncio.gather(batcher.submit(["a"]), batcher.submit(["b"]),
+                                    return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    print("✅ 인코딩 오류 전파 통과")
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_are_batched()
+    test_batch_flushes_at_max_size()
+    test_encoder_error_propagates()
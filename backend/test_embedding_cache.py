@@ -0,0 +1,102 @@
+"""
+임베딩 캐시 테스트
+"""
+
+import sys
+import os
+import tempfile
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from embedding_cache import EmbeddingCache
+
+
+def test_normalized_text_shares_key():
+    """공백만 다른 텍스트가 같은 키를 사용하고 모델이 다르면 분리되는지 확인"""
+    cache = EmbeddingCache("model-a", db_path=None)
+    other = EmbeddingCache("model-b", db_path=None)
+
+    assert cache.make_key("성장  배경\n입니다 ") == cache.make_key("성장 배경 입니다")
+    assert cache.make_key("성장 배경") != other.make_key("성장 배경")
+    print("✅ 캐시 키 정규화 통과")
+
+
+def test_hit_miss_counts_and_lru_budget():
+    """적중/미스 카운트와 메모리 바이트 예산에 따른 LRU 제거 확인"""
+    vector = np.ones(4, dtype=np.float32)  # 16 bytes
+    cache = EmbeddingCache("model", db_path=None, memory_budget_bytes=32)
+
+    assert cache.get_many(["a"]) == [None]
+    cache.put_many(["a", "b"], [vector, vector * 2])
+    cache.get_many(["a"])  # a를 최근 사용으로 갱신
+    cache.put_many(["c"], [vector * 3])  # 예산 초과 -> b 제거
+
+    results = cache.get_many(["a", "b", "c"])
+    stats = cache.stats()
+
+    assert results[0] is not None and results[2] is not None
+    assert results[1] is None
+    assert stats["memory_bytes"] <= 32
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+    print("✅ 적중/미스 카운트 및 LRU 제거 통과")
+
+
+def test_disk_cache_survives_restart():
+    """디스크 캐시가 새 인스턴스에서도 조회되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "embeddings.sqlite3")
+        vector = np.arange(4, dtype=np.float32)
+
+        EmbeddingCache("model", db_path=db_path).put_many(["지원동기"], [vector])
+        reopened = EmbeddingCache("model", db_path=db_path)
+        result = reopened.get_many(["지원동기"])[0]
+
+        assert np.array_equal(result, vector)
+        assert reopened.stats()["disk_hits"] == 1
+        print("✅ 디스크 캐시 재시작 유지 통과")
+
+
+def test_disk_budget_evicts_oldest():
+    """디스크 예산을 넘으면 오래된 항목부터 삭제되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "embeddings.sqlite3")
+        cache = EmbeddingCache("model", db_path=db_path, disk_budget_bytes=32)
+        vector = np.ones(4, dtype=np.float32)
+
+        for text in ["a", "b", "c"]:
+            cache.put_many([text], [vector])
+
+        assert cache.stats()["disk_bytes"] <= 32
+        fresh = EmbeddingCache("model", db_path=db_path, memory_budget_bytes=0)
+        assert fresh.get_many(["a"])[0] is None
+        assert fresh.get_many(["c"])[0] is not None
+        print("✅ 디스크 예산 제거 통과")
+
+
+def test_async_paths_and_incremental_disk_bytes():
+    """비동기 조회/저장 경로와 디스크 사용량 증분 갱신(교체 시 중복 집계 없음) 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "embeddings.sqlite3")
+        cache = EmbeddingCache("model", db_path=db_path, memory_budget_bytes=0)  # 메모리에는 마지막 1개만
+        vector = np.ones(4, dtype=np.float32)
+
+        async def run():
+            await cache.put_many_async(["a", "b"], [vector, vector])
+            await cache.put_many_async(["a"], [vector * 2])  # 교체는 사용량을 늘리지 않음
+            return await cache.get_many_async(["a", "b", "c"])
+
+        results = asyncio.run(run())
+        assert np.array_equal(results[0], vector * 2) and results[1] is not None and results[2] is None
+        assert cache.stats()["disk_hits"] == 1
+        assert cache.stats()["disk_bytes"] == 32 == EmbeddingCache("model", db_path=db_path).stats()["disk_bytes"]
+        print("✅ 비동기 경로 및 디스크 사용량 증분 갱신 통과")
+
+
+if __name__ == "__main__":
+    test_normalized_text_shares_key()
+    test_hit_miss_counts_and_lru_budget()
+    test_disk_cache_survives_restart()
+    test_disk_budget_evicts_oldest()
+    test_async_paths_and_incremental_disk_bytes()
@@ -0,0 +1,113 @@
+"""
+GitHub API 공용 클라이언트 테스트 (httpx.MockTransport로 GitHub 응답 대체)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+from github_client import GitHubClient
+
+REPO_URL = "https://api.github.com/repos/octo/app"
+
+
+def make_transport(requests, delay=0.0):
+    """ETag가 같으면 304를 돌려주고, 동시 요청 수를 기록하는 가짜 GitHub"""
+    state = {"active": 0, "max_active": 0}
+
+    async def handler(request):
+        requests.append(request)
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(delay)
+        state["active"] -= 1
+        headers = {"ETag": '"v1"', "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(5000 - len(requests)),
+                   "X-RateLimit-Reset": str(int(time.time()) + 3600)}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, headers=headers, json={"message": "Not Found"})
+        return httpx.Response(200, headers=headers, json={"url": str(request.url)})
+
+    return httpx.MockTransport(handler), state
+
+
+def test_etag_revalidation_and_disk_cache():
+    """만료된 캐시는 If-None-Match로 재검증하고, 디스크 캐시는 새 클라이언트에서도 사용되는지 확인"""
+    requests = []
+    transport, _ = make_transport(requests)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = GitHubClient(cache_dir=cache_dir, fresh_seconds=0, transport=transport)
+        first = asyncio.run(client.get_json(REPO_URL, "token"))
+        second = asyncio.run(client.get_json(REPO_URL, "token"))
+
+        assert first == second == {"url": REPO_URL}
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert client.stats["not_modified"] == 1
+        assert client.rate_limit("token")["remaining"] == 4998
+
+        # 프로세스 재시작을 가정한 새 클라이언트: 디스크의 ETag로 바로 조건부 요청
+        restarted = GitHubClient(cache_dir=cache_dir, fresh_seconds=0, transport=transport)
+        assert asyncio.run(restarted.get_json(REPO_URL, "token")) == {"url": REPO_URL}
+        assert requests[2].headers["If-None-Match"] == '"v1"'
+
+        # 다른 토큰은 캐시를 공유하지 않음
+        asyncio.run(restarted.get_json(REPO_URL, "other-token"))
+        assert "If-None-Match" not in requests[3].headers
+    print("✅ ETag 재검증/디스크 캐시 통과")
+
+
+def test_fresh_cache_and_exhausted_rate_limit_skip_requests():
+    """신선한 캐시와 rate limit 소진 시에는 요청을 보내지 않고, 소진은 토큰별로 따지는지 확인"""
+    requests = []
+    transport, _ = make_transport(requests)
+    client = GitHubClient(cache_dir=None, fresh_seconds=60, transport=transport)
+
+    async def main():
+        await client.get_json(REPO_URL)
+        await client.get_json(REPO_URL)
+        client.fresh_seconds = 0
+        await client.get_json(REPO_URL, "token")
+        client.rate_limit().update({"remaining": 0, "reset": int(time.time()) + 60})
+        stale = await client.get_json(REPO_URL)
+        # 익명 한도가 소진돼도 다른 토큰은 계속 재검증
+        await client.get_json(REPO_URL, "token")
+        return stale
+
+    assert asyncio.run(main()) == {"url": REPO_URL}
+    assert len(requests) == 3
+    assert not client.rate_limit_exhausted("token") and client.rate_limit_exhausted()
+    assert client.stats["fresh_hits"] == 1 and client.stats["stale_served"] == 1
+    print("✅ 신선한 캐시/rate limit 소진 시 요청 생략 통과")
+
+
+def test_concurrency_limit_and_errors():
+    """동시 요청 수가 제한되고, 오류 응답은 HTTPStatusError로 전달되는지 확인"""
+    requests = []
+    transport, state = make_transport(requests, delay=0.02)
+    client = GitHubClient(cache_dir=None, max_concurrency=3, transport=transport)
+
+    async def main():
+        await asyncio.gather(*(client.get_json(f"{REPO_URL}/contents/{i}") for i in range(10)))
+        try:
+            await client.get_json(f"{REPO_URL}/missing")
+            raise AssertionError("404가 전달되지 않았습니다.")
+        except httpx.HTTPStatusError as e:
+            assert e.response.status_code == 404
+        await client.close()
+
+    asyncio.run(main())
+    assert state["max_active"] == 3
+    print("✅ 동시 요청 제한/오류 전달 통과")
+
+
+if __name__ == "__main__":
+    test_etag_revalidation_and_disk_cache()
+    test_fresh_cache_and_exhausted_rate_limit_skip_requests()
+    test_concurrency_limit_and_errors()
@@ -0,0 +1,106 @@
+"""
+지연 시간 계측/디버그 로그 샘플링 테스트
+"""
+
+import sys
+import os
+import asyncio
+import logging
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrumentation import MetricsRegistry, span, log_payload, STAGE_DURATION, STAGE_ERRORS
+
+
+def test_span_records_histograms():
+    """with 문/async with 문/데코레이터 구간이 stage별 히스토그램에 기록되고, 예외는 오류 카운터에 기록되는지 확인"""
+    registry = MetricsRegistry()
+
+    @span("classifier", registry, name="keyword")
+    def classify(text):
+        return text.upper()
+
+    @span("llm_call", registry, provider="gemini")
+    async def call_llm():
+        await asyncio.sleep(0.02)
+        return "응답"
+
+    assert classify("a") == "A" and classify("b") == "B"
+    assert asyncio.run(call_llm()) == "응답"
+    try:
+        with span("vector_query", registry, backend="local"):
+            raise RuntimeError("index unavailable")
+    except RuntimeError:
+        pass
+
+    async def cancelled():
+        async with span("llm_call", registry, provider="gemini"):
+            raise asyncio.CancelledError()
+    try:
+        asyncio.run(cancelled())
+    except asyncio.CancelledError:
+        pass
+
+    assert registry.get_histogram(STAGE_DURATION, stage="classifier", name="keyword").count == 2
+    llm = registry.get_histogram(STAGE_DURATION, stage="llm_call", provider="gemini")
+    assert llm.count == 2 and llm.sum >= 0.02
+    assert registry.get_counter(STAGE_ERRORS, stage="vector_query", backend="local") == 1
+    assert registry.get_counter(STAGE_ERRORS, stage="llm_call", provider="gemini") == 0  # 취소는 오류 아님
+    print("✅ 구간 계측 통과")
+
+
+def test_prometheus_rendering():
+    """누적 버킷/합계/개수가 Prometheus 텍스트 형식으로 출력되는지 확인"""
+    registry = MetricsRegistry()
+    for value in (0.003, 0.04, 0.04, 2.0):
+        registry.observe(STAGE_DURATION, value, buckets=(0.01, 0.05, 1.0), stage="embedding")
+    registry.inc(STAGE_ERRORS, stage="embedding")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE stage_duration_seconds histogram" in lines
+    assert 'stage_duration_seconds_bucket{stage="embedding",le="0.01"} 1' in lines
+    assert 'stage_duration_seconds_bucket{stage="embedding",le="0.05"} 3' in lines
+    assert 'stage_duration_seconds_bucket{stage="embedding",le="1"} 3' in lines
+    assert 'stage_duration_seconds_bucket{stage="embedding",le="+Inf"} 4' in lines
+    assert 'stage_duration_seconds_count{stage="embedding"} 4' in lines
+    assert 'stage_duration_seconds_sum{stage="embedding"} 2.083000' in lines
+    assert 'stage_errors_total{stage="embedding"} 1' in lines
+    print("✅ Prometheus 출력 통과")
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_payload_logging_is_levelled_and_sampled():
+    """큰 디버그 내용은 DEBUG 레벨에서만, 샘플링 비율만큼, 길이를 잘라서 기록되는지 확인"""
+    logger = logging.getLogger("test_instrumentation.payload")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    logger.setLevel(logging.INFO)
+    log_payload(logger, "요청: %s", {"user_input": "x"}, rate=1.0)
+    assert handler.messages == []
+
+    logger.setLevel(logging.DEBUG)
+    log_payload(logger, "요청: %s", "채용 공고 " * 500, rate=1.0)
+    log_payload(logger, "요청: %s", "생략됨", rate=0.0)
+    assert len(handler.messages) == 1
+    assert len(handler.messages[0]) < 600 and "자)" in handler.messages[0]
+
+    for _ in range(2000):
+        log_payload(logger, "임베딩: %s", [0.1] * 384, rate=0.05)
+    assert 30 < len(handler.messages) - 1 < 200
+    logger.removeHandler(handler)
+    print("✅ 디버그 내용 로그 레벨/샘플링 통과")
+
+
+if __name__ == "__main__":
+    test_span_records_histograms()
+    test_prometheus_rendering()
+    test_payload_logging_is_levelled_and_sampled()
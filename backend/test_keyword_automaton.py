@@ -0,0 +1,58 @@
+"""
+키워드 오토마톤 테스트
+"""
+
+import sys
+import os
+import re
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from chatbot.core.keyword_automaton import KeywordAutomaton, PatternSet
+
+
+def test_matches_equal_substring_search():
+    """오토마톤 결과가 키워드별 부분 문자열 검색과 같은지 확인 (겹침/접두 포함)"""
+    keywords = ["채용", "채용공고", "공고", "모집", "모집합니다", "Java", "JavaScript", "찾고", "찾고 있습니다", "he", "she", "hers"]
+    automaton = KeywordAutomaton([(keyword, keyword) for keyword in keywords])
+    rng = random.Random(0)
+    alphabet = list("채용공고모집합니다 찾있습JavScrpthers")
+
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert automaton.matched_tags(text) == {k for k in keywords if k in text}, text
+
+    assert automaton.matched_tags("JavaScript 채용공고") == {"Java", "JavaScript", "채용", "채용공고", "공고"}
+    print("✅ 부분 문자열 검색과 동일한 결과 통과")
+
+
+def test_case_insensitive_and_shared_terms():
+    """대소문자 무시 옵션과 한 키워드에 여러 태그가 붙는 경우 확인"""
+    automaton = KeywordAutomaton(
+        [("React", ("tech", "react")), ("react", ("tech", "react")), ("참여", ("signal", "참여")), ("참여", ("qual", "참여"))],
+        case_sensitive=False
+    )
+
+    assert automaton.matched_tags("REACT 프로젝트 참여") == {("tech", "react"), ("signal", "참여"), ("qual", "참여")}
+    assert automaton.matched_terms("nothing") == set()
+    print("✅ 대소문자 무시/다중 태그 통과")
+
+
+def test_pattern_set_matches_individual_regexes():
+    """합친 정규식 사전 필터가 개별 re.search 결과를 바꾸지 않는지 확인"""
+    patterns = [r"([가-힣]+)\s*개발자", r"(\d+)\s*년차", r"경력\s*(\d+)\s*년"]
+    pattern_set = PatternSet(patterns)
+
+    for text in ["백엔드 개발자 3년차", "경력 5년", "안녕하세요", "3년차 프론트 개발자"]:
+        expected = [i for i, pattern in enumerate(patterns) if re.search(pattern, text)]
+        assert pattern_set.matching_indices(text) == expected
+        first = next((re.search(p, text) for p in patterns if re.search(p, text)), None)
+        result = pattern_set.first_match(text)
+        assert (result.group(0) if result else None) == (first.group(0) if first else None)
+    print("✅ 정규식 묶음 통과")
+
+
+if __name__ == "__main__":
+    test_matches_equal_substring_search()
+    test_case_insensitive_and_shared_terms()
+    test_pattern_set_matches_individual_regexes()
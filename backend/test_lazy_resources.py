@@ -0,0 +1,126 @@
+"""
+지연 리소스 레지스트리 테스트
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lazy_resources import ResourceRegistry
+
+
+def test_factory_runs_once_on_first_use():
+    """동시에 여러 번 요청해도 factory가 한 번만 실행되는지 확인"""
+    calls = []
+
+    def factory():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return "model"
+
+    registry = ResourceRegistry()
+    resource = registry.register("model", factory)
+
+    assert resource.state == "pending" and calls == []
+
+    async def main():
+        return await asyncio.gather(*(resource.get_async() for _ in range(8)))
+
+    assert asyncio.run(main()) == ["model"] * 8
+    assert len(calls) == 1
+    assert registry.register("model", factory) is resource
+    print("✅ 최초 사용 시 1회 초기화 통과")
+
+
+def test_readiness_ignores_optional_failures():
+    """선택 리소스 실패는 readiness에 영향을 주지 않고, 필수 리소스가 준비되어야 ready인지 확인"""
+    def broken():
+        raise RuntimeError("JVM 없음")
+
+    registry = ResourceRegistry()
+    registry.register("embedding", lambda: object())
+    optional = registry.register("okt", broken, required=False)
+
+    assert registry.readiness()["ready"] is False
+
+    asyncio.run(registry.warm_up())
+    readiness = registry.readiness()
+
+    assert readiness["ready"] is True
+    assert readiness["resources"]["okt"]["state"] == "failed"
+    assert "JVM" in readiness["resources"]["okt"]["error"]
+    assert not optional.available
+    print("✅ readiness 상태 보고 통과")
+
+
+def test_background_load_does_not_block_caller():
+    """load_in_background는 바로 반환하고, 로딩이 끝나기 전에는 ready가 False인지 확인"""
+    release = threading.Event()
+
+    def slow_factory():
+        release.wait(2)
+        return "okt"
+
+    resource = ResourceRegistry().register("okt", slow_factory, required=False)
+
+    started = time.perf_counter()
+    resource.load_in_background()
+    resource.load_in_background()  # 이미 로딩 중이면 무시
+    assert time.perf_counter() - started < 0.1
+    time.sleep(0.02)
+    assert resource.state == "loading" and not resource.ready and resource.available
+
+    release.set()
+    for _ in range(100):
+        if resource.ready:
+            break
+        time.sleep(0.01)
+    assert resource.get() == "okt"
+    print("✅ 백그라운드 로딩 비차단 통과")
+
+
+def test_openai_connection_check_retries_after_failure():
+    """일시적인 연결 확인 실패가 프로바이더를 영구 비활성화하지 않고 백오프 후 재시도되는지 확인"""
+    from types import SimpleNamespace
+    from services.llm_providers.openai_provider import OpenAIProvider
+
+    attempts = []
+
+    class FlakyModels:
+        async def list(self):
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise ConnectionError("temporary")
+            return SimpleNamespace(data=[SimpleNamespace(id="gpt-4o-mini")])
+
+    provider = OpenAIProvider({"api_key": "test-key"})
+    provider.client = SimpleNamespace(models=FlakyModels())
+    provider.connection_retry_base = 0.05
+
+    async def main():
+        for expected_attempts in (1, 1):
+            try:
+                await provider._ensure_connection()
+                assert False, "연결 실패가 전파되어야 함"
+            except RuntimeError:
+                pass
+            assert len(attempts) == expected_attempts
+        assert provider.is_available and not provider._connection_checked
+        await asyncio.sleep(0.06)
+        await provider._ensure_connection()
+        await provider._ensure_connection()
+
+    asyncio.run(main())
+    assert len(attempts) == 2
+    assert provider._connection_checked and provider.is_healthy()
+    print("✅ OpenAI 연결 확인 백오프 재시도 통과")
+
+
+if __name__ == "__main__":
+    test_factory_runs_once_on_first_use()
+    test_readiness_ignores_optional_failures()
+    test_background_load_does_not_block_caller()
+    test_openai_connection_check_retries_after_failure()
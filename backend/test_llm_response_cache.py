@@ -0,0 +1,126 @@
+"""
+LLM 응답 캐시 테스트 (원격 모델 호출은 가짜 함수로 대체)
+"""
+
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.llm_providers.response_cache import LLMResponseCache
+from services.llm_providers.base_provider import LLMProvider, LLMResponse
+
+
+def make_counter(value="응답"):
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return value
+
+    return calls, generate
+
+
+def test_exact_tier_normalizes_prompt_and_separates_config():
+    """공백만 다른 프롬프트는 같은 키, 모델/생성 설정이 다르면 다른 키인지 확인"""
+    cache = LLMResponseCache()
+    calls, generate = make_counter()
+
+    async def main():
+        await cache.get_or_generate("제목을  추천해줘\n", "gemini", generate, config={"temperature": 0.7})
+        await cache.get_or_generate(" 제목을 추천해줘", "gemini", generate, config={"temperature": 0.7})
+        await cache.get_or_generate("제목을 추천해줘", "gemini", generate, config={"temperature": 0.2})
+        await cache.get_or_generate("제목을 추천해줘", "gpt-4o-mini", generate, config={"temperature": 0.7})
+
+    asyncio.run(main())
+    assert len(calls) == 3
+    assert cache.get_stats()["exact_hits"] == 1
+    print("✅ 정확 일치 계층 통과")
+
+
+def test_ttl_lru_and_opt_out():
+    """TTL 만료, 최대 항목 수 제거, 엔드포인트/호출 단위 비활성화 확인"""
+    cache = LLMResponseCache(max_entries=2, ttl_seconds=0.05, disabled_endpoints=["generate-title"])
+
+    cache.set("a", "m", "A")
+    cache.set("b", "m", "B")
+    assert cache.get("a", "m") == "A"          # a를 최근 사용으로 갱신
+    cache.set("c", "m", "C")                   # 가장 오래 사용되지 않은 b 제거
+    assert cache.get("b", "m") is None and cache.get("c", "m") == "C"
+    assert cache.get_stats()["evictions"] == 1
+
+    time.sleep(0.06)
+    assert cache.get("a", "m") is None
+
+    calls, generate = make_counter()
+
+    async def main():
+        for _ in range(2):
+            await cache.get_or_generate("제목", "m", generate, endpoint="generate-title")
+            await cache.get_or_generate("요약", "m", generate, use_cache=False)
+
+    asyncio.run(main())
+    assert len(calls) == 4
+    print("✅ TTL/크기 제한/비활성화 통과")
+
+
+def test_semantic_tier_threshold_and_errors_not_cached():
+    """유사도 계층은 임계값 이상일 때만 재사용하고, 빈 응답은 저장하지 않는지 확인"""
+    vectors = {"이력서 요약": [1.0, 0.0], "이력서를 요약": [0.99, 0.1], "날씨 알려줘": [0.0, 1.0]}
+    cache = LLMResponseCache(embedder=lambda text: vectors[text], similarity_threshold=0.95)
+    calls, generate = make_counter("요약 결과")
+    empty_calls, generate_empty = make_counter("")
+
+    async def main():
+        first = await cache.get_or_generate("이력서 요약", "m", generate)
+        similar = await cache.get_or_generate("이력서를 요약", "m", generate)
+        await cache.get_or_generate("날씨 알려줘", "m", generate)
+        await cache.get_or_generate("날씨 알려줘", "other", generate_empty)
+        await cache.get_or_generate("날씨 알려줘", "other", generate_empty)
+        return first, similar
+
+    first, similar = asyncio.run(main())
+    assert first == similar == "요약 결과"
+    assert len(calls) == 2 and len(empty_calls) == 2
+    assert cache.get_stats()["semantic_hits"] == 1
+    print("✅ 유사도 계층 통과")
+
+
+class FakeProvider(LLMProvider):
+    def _initialize(self):
+        self.calls = 0
+        self.is_available = True
+
+    async def generate_response(self, prompt, **kwargs):
+        self.calls += 1
+        return LLMResponse(f"{prompt} 응답", "Fake", self.model_name)
+
+    def is_healthy(self):
+        return True
+
+
+def test_provider_safe_generate_uses_cache():
+    """프로바이더의 safe_generate가 캐시를 거치고, 적중 응답에 표시가 붙는지 확인"""
+    provider = FakeProvider({"model_name": "fake", "cache": LLMResponseCache()})
+
+    async def main():
+        first = await provider.safe_generate("자기소개서 분석")
+        second = await provider.safe_generate("자기소개서 분석")
+        other = await provider.safe_generate("자기소개서 분석", temperature=0.9)
+        skipped = await provider.safe_generate("자기소개서 분석", use_cache=False)
+        return first, second, other, skipped
+
+    first, second, other, skipped = asyncio.run(main())
+    assert first.content == second.content
+    assert "cache_hit" not in first.metadata and second.metadata["cache_hit"] is True
+    assert "cache_hit" not in other.metadata and "cache_hit" not in skipped.metadata
+    assert provider.calls == 3
+    print("✅ 프로바이더 캐시 통과")
+
+
+if __name__ == "__main__":
+    test_exact_tier_normalizes_prompt_and_separates_config()
+    test_ttl_lru_and_opt_out()
+    test_semantic_tier_threshold_and_errors_not_cached()
+    test_provider_safe_generate_uses_cache()
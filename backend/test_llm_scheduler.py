@@ -0,0 +1,181 @@
+"""
+LLM 호출 스케줄러 테스트 (원격 호출은 가짜 코루틴으로 대체)
+"""
+
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.llm_providers.scheduler import ProviderScheduler, TokenBucket
+from services.llm_providers.response_cache import LLMResponseCache
+from services.llm_providers.base_provider import LLMProvider, LLMResponse
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_identical_prompts_are_coalesced():
+    """진행 중인 동일 키 호출은 원격 호출 1회를 공유하는지 확인"""
+    scheduler = ProviderScheduler("test")
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "결과"
+
+    async def main():
+        return await asyncio.gather(*(scheduler.run(call, key="같은 프롬프트") for _ in range(5)))
+
+    assert asyncio.run(main()) == ["결과"] * 5
+    assert len(calls) == 1
+    assert scheduler.get_stats()["coalesced"] == 4
+    print("✅ 동일 요청 병합 통과")
+
+
+def test_priority_lanes_and_concurrency_limit():
+    """슬롯이 비면 interactive가 먼저 들어가고, 동시 실행 수가 제한되는지 확인"""
+    scheduler = ProviderScheduler("test", max_concurrency=1)
+    order = []
+    active = []
+
+    def make_call(name, delay=0.02):
+        async def call():
+            active.append(name)
+            assert len(active) == 1
+            await asyncio.sleep(delay)
+            active.remove(name)
+            order.append(name)
+            return name
+        return call
+
+    async def main():
+        blocker = asyncio.create_task(scheduler.run(make_call("blocker", 0.05)))
+        await asyncio.sleep(0.01)
+        background = asyncio.create_task(scheduler.run(make_call("background"), priority="background"))
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(scheduler.run(make_call("interactive"), priority="interactive"))
+        await asyncio.gather(blocker, background, interactive)
+
+    asyncio.run(main())
+    assert order == ["blocker", "interactive", "background"]
+    assert scheduler.get_stats()["in_flight"] == 0
+    print("✅ 우선순위 레인/동시 실행 제한 통과")
+
+
+def test_retries_transient_errors_only():
+    """429는 백오프 후 재시도하고, 그 외 오류는 바로 전달되는지 확인"""
+    scheduler = ProviderScheduler("test", max_retries=3, base_delay=0.01, max_delay=0.02)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RateLimitError("429 Too Many Requests")
+        return "성공"
+
+    async def broken():
+        raise ValueError("잘못된 요청")
+
+    async def main():
+        result = await scheduler.run(flaky)
+        try:
+            await scheduler.run(broken)
+            raise AssertionError("예외가 전달되지 않았습니다.")
+        except ValueError:
+            pass
+        return result
+
+    assert asyncio.run(main()) == "성공"
+    stats = scheduler.get_stats()
+    assert len(attempts) == 3 and stats["retries"] == 2 and stats["failures"] == 1
+    print("✅ 일시적 오류 재시도 통과")
+
+
+def test_token_bucket_throttles_after_burst():
+    """버킷 용량을 다 쓰면 보충될 때까지 기다리는지 확인"""
+    bucket = TokenBucket(per_minute=6000)  # 초당 100
+
+    async def main():
+        assert await bucket.acquire(6000) == 0.0
+        started = time.perf_counter()
+        await bucket.acquire(10)
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(main())
+    assert 0.07 < elapsed < 0.5
+    print(f"✅ 토큰 버킷 통과 ({elapsed:.2f}초 대기)")
+
+
+def test_stream_holds_slot_until_generator_closes():
+    """스트리밍은 제너레이터가 닫힐 때까지 슬롯을 점유하고, 일반 호출은 그동안 대기하는지 확인"""
+    scheduler = ProviderScheduler("test", max_concurrency=1, tokens_per_minute=600)
+    order = []
+
+    async def stream_chunks():
+        async with scheduler.stream(estimated_tokens=100):
+            for index in range(3):
+                await asyncio.sleep(0.02)
+                yield f"청크{index}"
+
+    async def call():
+        order.append("call")
+        return "결과"
+
+    async def main():
+        chunks = stream_chunks()
+        order.append(await chunks.__anext__())
+        assert scheduler.get_stats()["in_flight"] == 1
+        waiting = asyncio.ensure_future(scheduler.run(call))
+        await asyncio.sleep(0.03)
+        assert order == ["청크0"]  # 스트림이 슬롯을 쥐고 있는 동안 일반 호출은 대기
+        order.append(await chunks.__anext__())
+        await chunks.aclose()  # 클라이언트 연결이 끊겨 중간에 닫힌 스트림도 슬롯을 반납
+        return await waiting
+
+    assert asyncio.run(main()) == "결과"
+    assert order == ["청크0", "청크1", "call"]
+    stats = scheduler.get_stats()
+    assert stats["streams"] == 1 and stats["calls"] == 2 and stats["in_flight"] == 0
+    assert scheduler.token_bucket.tokens < 550  # 스트림 예상 토큰(100) 차감
+    print("✅ 스트리밍 슬롯/토큰 점유 통과")
+
+
+class SlowProvider(LLMProvider):
+    def _initialize(self):
+        self.calls = 0
+        self.is_available = True
+
+    async def generate_response(self, prompt, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return LLMResponse(f"{prompt} 응답", "Slow", self.model_name)
+
+    def is_healthy(self):
+        return True
+
+
+def test_provider_concurrent_misses_share_one_call():
+    """캐시 미스인 동일 프롬프트가 동시에 들어오면 프로바이더 호출이 1회인지 확인"""
+    provider = SlowProvider({"model_name": "slow", "cache": LLMResponseCache(),
+                             "scheduler": ProviderScheduler("slow")})
+
+    async def main():
+        return await asyncio.gather(*(provider.safe_generate("면접 질문 생성") for _ in range(4)))
+
+    responses = asyncio.run(main())
+    assert all(response.content == "면접 질문 생성 응답" for response in responses)
+    assert provider.calls == 1
+    print("✅ 프로바이더 동시 요청 병합 통과")
+
+
+if __name__ == "__main__":
+    test_identical_prompts_are_coalesced()
+    test_priority_lanes_and_concurrency_limit()
+    test_retries_transient_errors_only()
+    test_token_bucket_throttles_after_burst()
+    test_stream_holds_slot_until_generator_closes()
+    test_provider_concurrent_misses_share_one_call()
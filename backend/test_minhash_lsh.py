@@ -0,0 +1,63 @@
+"""
+MinHash/LSH 근사 중복 탐지 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from minhash_lsh import MinHashLSH, char_shingles, optimal_bands
+
+ORIGINAL = ("저는 어린 시절부터 컴퓨터에 관심이 많아 프로그래밍을 독학으로 시작했습니다. "
+            "대학교에서는 컴퓨터공학을 전공하며 다양한 팀 프로젝트를 경험했고, "
+            "그 과정에서 협업과 소통의 중요성을 깨달았습니다.")
+COPIED = ("저는 어린 시절부터 컴퓨터에 관심이 많아서 프로그래밍을 독학으로 시작하였습니다. "
+          "대학교에서는 컴퓨터공학을 전공하며 다양한 팀 프로젝트를 경험했고, "
+          "그 과정에서 협업과 소통의 중요성을 배웠습니다.")
+UNRELATED = "귀사의 물류 자동화 비전에 공감하여 지원하게 되었으며 현장 운영 경험을 살리고 싶습니다."
+
+
+def test_shingles_and_band_selection():
+    """문자 shingle 생성과 밴드 파라미터 선택 확인"""
+    assert char_shingles("가나 다라", 3) == {"가나 ", "나 다", " 다라"}
+    assert char_shingles("가나", 3) == {"가나"}
+    bands, rows = optimal_bands(0.5, 128)
+    assert bands * rows == 128
+    assert abs((1 / bands) ** (1 / rows) - 0.5) < 0.1
+    print("✅ shingle/밴드 선택 통과")
+
+
+def test_finds_copied_text_but_not_unrelated():
+    """표절된 텍스트는 찾고 무관한 텍스트는 제외하는지 확인"""
+    index = MinHashLSH(num_perm=128, threshold=0.5)
+    index.insert_text("r1", "motivation", ORIGINAL)
+    index.insert_text("r2", "motivation", UNRELATED)
+
+    matches = index.query_text(COPIED, threshold=0.5)
+
+    assert [match["resume_id"] for match in matches] == ["r1"]
+    assert matches[0]["similarity"] >= 0.5
+    print("✅ 표절 텍스트 탐지 통과")
+
+
+def test_candidates_for_registered_resume_and_remove():
+    """등록된 이력서 기준 후보 탐색과 삭제 확인"""
+    index = MinHashLSH(num_perm=128, threshold=0.5)
+    index.insert_text("r1", "growthBackground", ORIGINAL)
+    index.insert_text("r2", "growthBackground", COPIED)
+    index.insert_text("r3", "growthBackground", UNRELATED)
+
+    candidates = index.candidates_for("r1")
+    assert set(candidates) == {"r2"}
+    assert "growthBackground" in candidates["r2"]
+
+    index.remove("r2")
+    assert index.candidates_for("r1") == {}
+    assert index.size == 2
+    print("✅ 후보 탐색/삭제 통과")
+
+
+if __name__ == "__main__":
+    test_shingles_and_band_selection()
+    test_finds_copied_text_but_not_unrelated()
+    test_candidates_for_registered_resume_and_remove()
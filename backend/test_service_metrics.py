@@ -0,0 +1,197 @@
+"""
+서비스 실시간 지표(카운터/처리량/지연 시간 백분위)와 워커 합산 테스트
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from service_metrics import ServiceStats, WorkerMetricsPublisher, aggregate_snapshots, build_similarity_report
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_rolling_window_rates_and_percentiles():
+    """초당 처리량과 백분위가 최근 구간 표본으로만 계산되는지 확인"""
+    clock = FakeClock()
+    stats = ServiceStats("vector", window_seconds=60, clock=clock)
+
+    for latency in (0.5,) * 10:  # 구간 밖으로 밀려날 느린 표본
+        stats.observe("query", latency)
+    stats.inc("queries", 10)
+    clock.now += 120
+
+    for index in range(100):
+        stats.observe("query", (index + 1) / 1000)
+        stats.inc("queries")
+        clock.now += 0.5
+    try:
+        with stats.timer("query"):
+            raise RuntimeError("index unavailable")
+    except RuntimeError:
+        pass
+
+    merged = aggregate_snapshots([{"services": {"vector": stats.snapshot()}}])["vector"]
+    assert merged["counters"]["queries"] == 110
+    assert merged["counters"]["errors.query"] == 1
+    assert merged["rates"]["queries"] == round(100 / 60, 3)
+    latency = merged["latency"]["query"]
+    assert latency["count"] == 101
+    assert latency["p50_ms"] == 50.0 and latency["p99_ms"] == 99.0  # 실패한 호출(약 0ms) 포함
+    print("✅ 최근 구간 처리량/백분위 통과")
+
+
+def test_span_feeds_service_stats():
+    """span 한 번의 측정값이 단계 히스토그램과 서비스 지표에 함께 기록되는지 확인"""
+    from instrumentation import MetricsRegistry, span
+
+    stats = ServiceStats("vector")
+    registry = MetricsRegistry()
+    with span("vector_query", registry, stats=stats, backend="local", op="query") as measured:
+        pass
+    try:
+        with span("vector_query", registry, stats=stats, backend="local", op="query"):
+            raise RuntimeError("index unavailable")
+    except RuntimeError:
+        pass
+
+    snapshot = stats.snapshot()
+    assert snapshot["latency"]["query"][0] == measured.elapsed
+    assert len(snapshot["latency"]["query"]) == 2
+    assert snapshot["counters"] == {"errors.query": 1}
+    print("✅ span → 서비스 지표 기록 통과")
+
+
+def test_workers_are_aggregated():
+    """워커별 스냅샷 파일이 합산되고, 갱신이 끊긴 워커는 제외되는지 확인"""
+    directory = tempfile.mkdtemp()
+    workers = []
+    for worker_index in range(3):
+        similarity = ServiceStats("similarity")
+        embedding = ServiceStats("embedding")
+        similarity.inc("comparisons.vector", 10)
+        similarity.inc("score_sum.vector", 1.5 * (worker_index + 1))
+        similarity.inc("scored.vector", 3)
+        similarity.observe("vector", 0.01 * (worker_index + 1))
+        embedding.inc("embeddings", 100)
+        embedding.inc("cache_hits", 25 * worker_index)
+        publisher = WorkerMetricsPublisher({"similarity": similarity, "embedding": embedding},
+                                           directory=directory, interval=10)
+        publisher.worker_id = f"worker-{worker_index}"
+        publisher.path = os.path.join(directory, f"{publisher.worker_id}.json")
+        workers.append(publisher)
+
+    for publisher in workers[1:]:
+        publisher.publish()
+    # 비정상 종료로 갱신이 끊긴 워커
+    stopped = ServiceStats("similarity")
+    stopped.inc("comparisons.vector", 999)
+    with open(os.path.join(directory, "worker-stopped.json"), "w", encoding="utf-8") as f:
+        json.dump({"worker_id": "worker-stopped", "pid": 0, "updated_at": 0,
+                   "services": {"similarity": stopped.snapshot()}}, f)
+
+    report = build_similarity_report(workers[0].collect())
+    assert len(report["workers"]) == 3
+    assert report["total_comparisons"] == 30
+    assert report["usage_by_method"] == {"vector": 30}
+    assert report["average_similarity"] == round((1.5 + 3.0 + 4.5) / 9, 4)
+    assert report["embedding"]["embeddings_total"] == 300
+    assert report["embedding"]["cache_hit_rate"] == 0.25
+    assert report["latency_by_method"]["vector"]["count"] == 3
+    assert report["latency_by_method"]["vector"]["p99_ms"] == 30.0
+
+    asyncio.run(workers[1].stop())
+    assert not os.path.exists(workers[1].path)
+    assert len(workers[0].collect()) == 2
+    print("✅ 워커별 지표 합산 통과")
+
+
+class FakeCache:
+    def __init__(self):
+        self.vectors = {}
+
+    def get_many(self, texts):
+        return [self.vectors.get(text) for text in texts]
+
+    def put_many(self, texts, vectors):
+        self.vectors.update(zip(texts, vectors))
+
+    async def get_many_async(self, texts):
+        return self.get_many(texts)
+
+    async def put_many_async(self, texts, vectors):
+        self.put_many(texts, vectors)
+
+
+class FakeBatcher:
+    max_batch_size = 64
+
+    def __init__(self, encode):
+        self.encode = encode
+
+    async def submit(self, texts):
+        return self.encode(texts)
+
+
+class FakeModel:
+    def encode(self, texts, **kwargs):
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+def test_embedding_service_counts_cache_hits():
+    """embed_many가 요청 텍스트 수, 캐시 적중 수, 실제 인코딩 수를 기록하는지 확인"""
+    from embedding_service import EmbeddingService
+
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.stats = ServiceStats("embedding")
+    service.cache = FakeCache()
+    service.batcher = FakeBatcher(service._encode_batch)
+    service.model_resource = type("Resource", (), {"get": staticmethod(lambda: FakeModel())})()
+
+    asyncio.run(service.embed_many(["a", "b", "a"]))
+    asyncio.run(service.embed_many(["a", "c"]))
+
+    counters = service.stats.snapshot()["counters"]
+    assert counters["embeddings"] == 5
+    assert counters["cache_hits"] == 1
+    assert counters["encoded"] == 3
+    assert len(service.stats.snapshot()["latency"]["encode_batch"]) == 2
+    print("✅ 임베딩 캐시 적중/인코딩 수 기록 통과")
+
+
+def test_sync_encode_shares_cache():
+    """동기 encode가 embed_many와 같은 캐시/카운터를 쓰는지 확인 (LLM 응답 캐시 유사도 계층용)"""
+    from embedding_service import EmbeddingService
+
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.stats = ServiceStats("embedding")
+    service.cache = FakeCache()
+    service.batcher = FakeBatcher(service._encode_batch)
+    service.model_resource = type("Resource", (), {"get": staticmethod(lambda: FakeModel())})()
+
+    asyncio.run(service.embed_many(["a"]))
+    vectors = service.encode(["a", "b"])
+
+    assert len(vectors) == 2 and vectors[1].shape == (4,)
+    counters = service.stats.snapshot()["counters"]
+    assert counters["cache_hits"] == 1
+    assert counters["encoded"] == 2
+    print("✅ 동기 encode 캐시 공유 통과")
+
+
+if __name__ == "__main__":
+    test_rolling_window_rates_and_percentiles()
+    test_span_feeds_service_stats()
+    test_workers_are_aggregated()
+    test_embedding_service_counts_cache_hits()
+    test_sync_encode_shares_cache()
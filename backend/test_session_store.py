@@ -0,0 +1,232 @@
+"""
+세션 저장소 테스트 (Mongo 컬렉션/Redis 클라이언트는 가짜 객체로 대체)
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from chatbot.services.session_store import (
+    MemorySessionStore, MongoSessionStore, RedisSessionStore, pack_session, unpack_session
+)
+from chatbot.services.session_service import SessionService
+
+
+def test_compact_serialization():
+    """datetime 보존, 대화 기록 상한, 큰 세션 압축이 적용되는지 확인"""
+    created = datetime(2025, 1, 2, 3, 4, 5)
+    history = [{"role": "user", "content": "채용 공고 " * 20} for _ in range(80)]
+    payload = pack_session({"created_at": created, "conversation_history": history}, max_history=50)
+    restored = unpack_session(payload)
+
+    assert restored["created_at"] == created
+    assert len(restored["conversation_history"]) == 50
+    assert payload[:1] == b"z" and len(payload) < len(str(history[-50:]).encode()) // 10
+    assert pack_session({"page": "recruit"})[:1] == b"j"
+    print("✅ 세션 압축 직렬화 통과")
+
+
+def test_memory_store_lru_ttl_and_sweeper():
+    """최대 개수를 넘으면 LRU로 제거되고, TTL이 지나면 정리 작업이 제거하는지 확인"""
+    async def main():
+        store = MemorySessionStore("test", ttl_seconds=0.05, max_entries=2, sweep_interval=0.02)
+        await store.save("a", {"n": 1})
+        await store.save("b", {"n": 2})
+        assert (await store.get("a"))["n"] == 1  # a를 최근 사용으로
+        await store.save("c", {"n": 3})  # b가 제거됨
+        evicted = await store.get("b")
+
+        # 조회한 세션을 수정해도 저장 전에는 반영되지 않음
+        session = await store.get("a")
+        session["n"] = 100
+        unchanged = (await store.get("a"))["n"]
+
+        await asyncio.sleep(0.12)
+        remaining = len(store)
+        stats = store.get_stats()
+        await store.close()
+        return evicted, unchanged, remaining, stats
+
+    evicted, unchanged, remaining, stats = asyncio.run(main())
+    assert evicted is None and unchanged == 1
+    assert remaining == 0
+    assert stats["evictions"] == 1 and stats["expirations"] == 2
+    print("✅ 메모리 저장소 LRU/TTL/정리 작업 통과")
+
+
+class FakeMongoCollection:
+    def __init__(self):
+        self.documents = {}
+        self.indexes = []
+
+    async def create_index(self, key, **kwargs):
+        self.indexes.append((key, kwargs))
+
+    async def find_one(self, query):
+        document = self.documents.get(query["_id"])
+        if document and document["expires_at"] > query["expires_at"]["$gt"]:
+            return document
+        return None
+
+    async def update_one(self, query, update, upsert=False):
+        document = self.documents.get(query["_id"])
+        if document is not None and "expires_at" in query and document["expires_at"] > query["expires_at"]["$lte"]:
+            # 조건에 안 맞는 기존 문서가 있으면 upsert는 _id 중복으로 실패
+            error = Exception("E11000 duplicate key error")
+            error.code = 11000
+            raise error
+        self.documents.setdefault(query["_id"], {"_id": query["_id"]}).update(update["$set"])
+
+    async def delete_one(self, query):
+        document = self.documents.get(query["_id"])
+        matched = document is not None and all(document.get(k) == v for k, v in query.items())
+
+        class Result:
+            deleted_count = 1 if matched else 0
+        if matched:
+            del self.documents[query["_id"]]
+        return Result()
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key, (None, None))[0]
+
+    async def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = (value, ex)
+        return True
+
+    async def delete(self, key):
+        return 1 if self.values.pop(key, None) else 0
+
+    async def eval(self, script, numkeys, key, token):
+        # RELEASE_LOCK_SCRIPT: 값이 같을 때만 삭제
+        if self.values.get(key, (None, None))[0] == token:
+            return await self.delete(key)
+        return 0
+
+
+def test_shared_backends():
+    """Mongo 저장소는 TTL 인덱스/만료 시각을, Redis 저장소는 EX 만료를 사용하는지 확인"""
+    collection = FakeMongoCollection()
+    redis = FakeRedis()
+    mongo_store = MongoSessionStore(collection, "modal", ttl_seconds=600)
+    redis_store = RedisSessionStore(redis, "modal", ttl_seconds=600)
+
+    async def main():
+        for store in (mongo_store, redis_store):
+            await store.save("s1", {"filled_fields": {"department": "개발팀"}})
+            assert (await store.get("s1"))["filled_fields"]["department"] == "개발팀"
+            assert await store.delete("s1") and await store.get("s1") is None
+
+        await mongo_store.save("old", {"n": 1})
+        collection.documents["modal:old"]["expires_at"] = datetime.utcnow() - timedelta(seconds=1)
+        return await mongo_store.get("old")
+
+    assert asyncio.run(main()) is None  # TTL 모니터가 지우기 전이라도 만료 세션은 반환하지 않음
+    assert collection.indexes == [("expires_at", {"expireAfterSeconds": 0})]
+    redis_store_key = "session:modal:s2"
+    asyncio.run(redis_store.save("s2", {"n": 2}))
+    assert redis.values[redis_store_key][1] == 600
+    print("✅ Mongo/Redis 저장소 통과")
+
+
+def test_mongo_index_creation_retried_after_failure():
+    """TTL 인덱스 생성이 실패하면 다음 요청에서 다시 시도하는지 확인"""
+    class FlakyIndexCollection(FakeMongoCollection):
+        def __init__(self):
+            super().__init__()
+            self.index_attempts = 0
+
+        async def create_index(self, key, **kwargs):
+            self.index_attempts += 1
+            if self.index_attempts == 1:
+                raise ConnectionError("primary stepped down")
+            await super().create_index(key, **kwargs)
+
+    collection = FlakyIndexCollection()
+    store = MongoSessionStore(collection, "modal")
+
+    async def main():
+        await store.get("s1")
+        assert not store._indexes_ready
+        await store.get("s1")
+        await store.get("s1")
+
+    asyncio.run(main())
+    assert collection.index_attempts == 2
+    assert collection.indexes == [("expires_at", {"expireAfterSeconds": 0})]
+    print("✅ TTL 인덱스 생성 재시도 통과")
+
+
+def test_lock_serializes_read_modify_write():
+    """같은 세션의 동시 get → 수정 → save가 잠금으로 직렬화되어 변경이 사라지지 않는지 확인"""
+    redis = FakeRedis()
+    collection = FakeMongoCollection()
+    # 같은 Redis/Mongo를 쓰는 두 워커를 저장소 인스턴스 두 개로 가정
+    store_pairs = [
+        (MemorySessionStore("lock-test"),) * 2,
+        (RedisSessionStore(redis, "lock-test"), RedisSessionStore(redis, "lock-test")),
+        (MongoSessionStore(collection, "lock-test"), MongoSessionStore(collection, "lock-test")),
+    ]
+
+    async def append(store, value):
+        async with store.lock("s1"):
+            session = await store.get("s1")
+            await asyncio.sleep(0.01)  # LLM 호출 등으로 조회와 저장 사이가 벌어진 상황
+            session["history"].append(value)
+            await store.save("s1", session)
+
+    async def main(first, second):
+        await first.save("s1", {"history": []})
+        await asyncio.gather(*(append(first if i % 2 else second, i) for i in range(6)))
+        session = await first.get("s1")
+        await first.close()
+        return session
+
+    for first, second in store_pairs:
+        session = asyncio.run(main(first, second))
+        assert sorted(session["history"]) == list(range(6)), first.backend
+        assert not first._local_locks
+    assert not [key for key in redis.values if key.endswith(":lock")]
+    assert not [key for key in collection.documents if key.endswith(":lock")]
+    assert store_pairs[1][0].stats["lock_waits"] + store_pairs[1][1].stats["lock_waits"] > 0
+    print("✅ 세션 잠금 직렬화 통과")
+
+
+def test_session_services_share_store():
+    """같은 저장소를 쓰는 SessionService 인스턴스끼리 세션을 공유하는지 확인"""
+    store = MemorySessionStore("chatbot-test")
+    chatbot_service = SessionService(store)
+    conversation_service = SessionService(store)
+
+    async def main():
+        await chatbot_service.create_session("s1", "recruit", "conversational")
+        await conversation_service.add_message("s1", {"user_input": "안녕하세요"})
+        await chatbot_service.update_field("s1", "department", "개발팀")
+        session = await conversation_service.get_session("s1")
+        ended = await conversation_service.end_session("s1")
+        await store.close()
+        return session, ended
+
+    session, ended = asyncio.run(main())
+    assert session["conversation_history"] == [{"user_input": "안녕하세요"}]
+    assert session["fields"] == {"department": "개발팀"}
+    assert isinstance(session["created_at"], datetime) and ended
+    print("✅ SessionService 저장소 공유 통과")
+
+
+if __name__ == "__main__":
+    test_compact_serialization()
+    test_memory_store_lru_ttl_and_sweeper()
+    test_shared_backends()
+    test_mongo_index_creation_retried_after_failure()
+    test_lock_serializes_read_modify_write()
+    test_session_services_share_store()
@@ -0,0 +1,86 @@
+"""
+벡터화된 이력서 유사도 엔진 테스트
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from bson import ObjectId
+from similarity_service import SimilarityService
+
+WORDS = ["저는", "개발자", "협업", "성장", "react", "python", "프로젝트", "경험", "리더십",
+         "문제", "해결", "지원", "회사", "비전", "3년", "백엔드", "데이터", "열정"]
+
+
+def make_resume(rng, name):
+    resume = {"_id": ObjectId(), "name": name, "position": "개발", "department": "IT"}
+    for field in ("growthBackground", "motivation", "careerHistory"):
+        if rng.random() < 0.8:
+            resume[field] = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+    return resume
+
+
+def test_engine_matches_pairwise_similarity():
+    """엔진 결과가 기존 쌍별 _calculate_text_similarity와 동일한지 확인"""
+    rng = random.Random(7)
+    service = SimilarityService(embedding_service=None, vector_service=None)
+    resumes = [make_resume(rng, f"지원자{i}") for i in range(40)]
+    service.similarity_engine.load(resumes)
+
+    for current in resumes[:5]:
+        scores = service.similarity_engine.similarities_for(str(current["_id"]))
+        others = {str(r["_id"]): r for r in resumes}
+        for i, other_id in enumerate(scores["resume_ids"]):
+            expected = service._calculate_text_similarity(current, others[other_id])
+            assert abs(scores["overall"][i] - expected) < 1e-5
+
+    print("✅ 쌍별 유사도와 동일 결과 통과")
+
+
+def test_incremental_update_and_remove():
+    """이력서 갱신/삭제가 결과에 반영되는지 확인"""
+    service = SimilarityService(embedding_service=None, vector_service=None)
+    engine = service.similarity_engine
+    a = {"_id": ObjectId(), "name": "A", "motivation": "회사 비전 공감 지원"}
+    b = {"_id": ObjectId(), "name": "B", "motivation": "전혀 다른 내용"}
+    engine.load([a, b])
+
+    assert engine.similarities_for(str(a["_id"]))["overall"][0] == 0.0
+
+    engine.upsert({**b, "motivation": "회사 비전 공감 지원"})
+    assert abs(engine.similarities_for(str(a["_id"]))["overall"][0] - 1.0) < 1e-6
+
+    engine.remove(str(b["_id"]))
+    assert engine.similarities_for(str(a["_id"]))["resume_ids"] == []
+    assert engine.size == 1
+    print("✅ 증분 갱신/삭제 통과")
+
+
+def test_duplicate_pairs_from_matrix():
+    """N×N 행렬에서 임계값 이상 쌍을 찾는지 확인"""
+    service = SimilarityService(embedding_service=None, vector_service=None)
+    text = "저는 문제 해결 경험 많은 백엔드 개발자 입니다"
+    resumes = [
+        {"_id": ObjectId(), "name": "A", "growthBackground": text},
+        {"_id": ObjectId(), "name": "B", "growthBackground": text},
+        {"_id": ObjectId(), "name": "C", "growthBackground": "완전히 다른 성장 배경"},
+    ]
+    service.similarity_engine.load(resumes)
+
+    ids, matrix = service.similarity_engine.similarity_matrix()
+    pairs = service.similarity_engine.find_duplicate_pairs(threshold=0.9)
+
+    assert matrix.shape == (3, 3)
+    assert np.allclose(matrix, matrix.T)
+    assert len(pairs) == 1
+    assert {pairs[0]["resume_id_a"], pairs[0]["resume_id_b"]} == {str(resumes[0]["_id"]), str(resumes[1]["_id"])}
+    print("✅ 중복 쌍 탐지 통과")
+
+
+if __name__ == "__main__":
+    test_engine_matches_pairwise_similarity()
+    test_incremental_update_and_remove()
+    test_duplicate_pairs_from_matrix()
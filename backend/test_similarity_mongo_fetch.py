@@ -0,0 +1,176 @@
+"""
+유사도 서비스 MongoDB 조회 경로 테스트 (Motor / PyMongo)
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+from similarity_service import SimilarityService, RESUME_DETAIL_PROJECTION
+
+
+class FakeSyncCollection:
+    """PyMongo 컬렉션처럼 동작하는 테스트용 컬렉션"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def find_one(self, query):
+        self.calls.append(("find_one", query, None))
+        return next((d for d in self.documents if d["_id"] == query["_id"]), None)
+
+    def find(self, query, projection=None):
+        self.calls.append(("find", query, projection))
+        ids = set(query["_id"]["$in"])
+        return iter([dict(d) for d in self.documents if d["_id"] in ids])
+
+
+class FakeAsyncCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length):
+        return self.documents
+
+
+class FakeAsyncCollection(FakeSyncCollection):
+    """Motor 컬렉션처럼 코루틴/커서를 반환하는 테스트용 컬렉션"""
+
+    async def find_one(self, query):
+        return FakeSyncCollection.find_one(self, query)
+
+    def find(self, query, projection=None):
+        return FakeAsyncCursor(list(FakeSyncCollection.find(self, query, projection)))
+
+
+class FakeResumeCollection:
+    """전체 조회({})와 _id 증분 조회($gt)를 지원하는 Motor 이력서 컬렉션"""
+
+    def __init__(self):
+        self.documents = []
+
+    def find(self, query, projection=None):
+        last_id = query.get("_id", {}).get("$gt")
+        return FakeAsyncCursor([dict(d) for d in self.documents if last_id is None or d["_id"] > last_id])
+
+
+class FakeSignatureCollection:
+    """bulk_write의 UpdateOne(upsert)/DeleteOne을 반영하는 Motor 서명 컬렉션"""
+
+    def __init__(self):
+        self.documents = []
+
+    async def _iterate(self):
+        for doc in list(self.documents):
+            yield dict(doc)
+
+    def find(self, query, projection=None):
+        return self._iterate()
+
+    async def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            if isinstance(op, DeleteOne):
+                self.documents = [d for d in self.documents if d["_id"] != op._filter["_id"]]
+            elif isinstance(op, UpdateOne):
+                doc = next((d for d in self.documents
+                            if all(d.get(k) == v for k, v in op._filter.items())), None)
+                if doc is None:
+                    doc = {"_id": ObjectId(), **op._filter}
+                    self.documents.append(doc)
+                doc.update(op._doc["$set"])
+
+    def fields_of(self, resume_id):
+        return {d["field"] for d in self.documents if d["resume_id"] == resume_id}
+
+
+def make_documents(count):
+    return [{"_id": ObjectId(), "name": f"지원자{i}", "large_blob": "x" * 10} for i in range(count)]
+
+
+def make_service():
+    return SimilarityService.__new__(SimilarityService)
+
+
+def test_fetch_by_ids_uses_single_projected_in_query():
+    """상세 조회가 projection을 포함한 한 번의 $in 쿼리로 수행되고 dict로 조인되는지 확인"""
+    documents = make_documents(5)
+    ids = [str(d["_id"]) for d in reversed(documents)] + [str(documents[0]["_id"])]
+
+    for collection, use_async in ((FakeSyncCollection(documents), False), (FakeAsyncCollection(documents), True)):
+        result = asyncio.run(make_service()._fetch_resumes_by_ids(collection, ids, use_async))
+
+        assert len(collection.calls) == 1
+        _, query, projection = collection.calls[0]
+        assert projection == RESUME_DETAIL_PROJECTION
+        assert len(query["_id"]["$in"]) == 5
+        assert set(result) == set(ids)
+        assert result[ids[0]]["name"] == "지원자4"
+    print("✅ 단일 $in 조회 및 dict 조인 통과")
+
+
+def test_fetch_resume_selects_path_per_call():
+    """컬렉션 타입 또는 호출 인자로 Motor/PyMongo 경로가 선택되는지 확인"""
+    documents = make_documents(2)
+    service = make_service()
+    resume_id = str(documents[1]["_id"])
+
+    sync_result = asyncio.run(service._fetch_resume(FakeSyncCollection(documents), resume_id))
+    async_result = asyncio.run(service._fetch_resume(FakeAsyncCollection(documents), resume_id, use_async=True))
+
+    assert sync_result["name"] == async_result["name"] == "지원자1"
+    assert not service._is_async_collection(FakeAsyncCollection(documents))
+    assert service._is_async_collection(FakeSyncCollection(documents), use_async=True)
+    print("✅ 호출 단위 조회 경로 선택 통과")
+
+
+def test_near_duplicate_index_follows_collection_changes():
+    """빈 컬렉션으로 처음 적재한 뒤 추가/수정/삭제된 이력서가 LSH 인덱스와 서명 저장소에 반영되는지 확인"""
+    original = ("저는 어린 시절부터 컴퓨터에 관심이 많아 프로그래밍을 독학으로 시작했습니다. "
+                "대학교에서는 컴퓨터공학을 전공하며 다양한 팀 프로젝트를 경험했습니다.")
+    copied = ("저는 어린 시절부터 컴퓨터에 관심이 많아서 프로그래밍을 독학으로 시작하였습니다. "
+              "대학교에서는 컴퓨터공학을 전공하며 다양한 팀 프로젝트를 경험했습니다.")
+    unrelated = "귀사의 물류 자동화 비전에 공감하여 지원하게 되었으며 현장 운영 경험을 살리고 싶습니다."
+
+    service = make_service()
+    service.near_duplicate_index = service._new_near_duplicate_index()
+    service.near_duplicate_fields = ["growthBackground", "motivation", "careerHistory"]
+    service.engine_rebuild_interval = 600
+    service._lsh_loaded_at = 0.0
+    service._lsh_last_id = None
+    resumes, signatures = FakeResumeCollection(), FakeSignatureCollection()
+
+    async def scenario():
+        # 빈 컬렉션으로 첫 적재 → 이후 추가된 이력서도 반영되어야 함
+        assert await service.refresh_near_duplicate_index(resumes, signatures) == 0
+        first, second = ObjectId(), ObjectId()
+        resumes.documents.append({"_id": first, "motivation": original})
+        assert await service.refresh_near_duplicate_index(resumes, signatures) == 1
+        resumes.documents.append({"_id": second, "motivation": copied})
+        assert await service.refresh_near_duplicate_index(resumes, signatures) == 1
+        assert set(service.near_duplicate_index.candidates_for(str(first))) == {str(second)}
+
+        # 수정된 이력서만 재서명되고 후보에서 빠져야 함
+        resumes.documents[1]["motivation"] = unrelated
+        assert await service.refresh_near_duplicate_index(resumes, signatures, rebuild=True) == 1
+        assert service.near_duplicate_index.candidates_for(str(first)) == {}
+
+        # 삭제된 이력서의 서명은 rebuild 주기가 지나면 저장소에서도 제거
+        resumes.documents.pop(0)
+        service._lsh_loaded_at -= service.engine_rebuild_interval + 1
+        assert await service.refresh_near_duplicate_index(resumes, signatures) == 0
+        assert signatures.fields_of(str(first)) == set()
+        assert signatures.fields_of(str(second)) == {"motivation"}
+        assert service.near_duplicate_index.size == 1
+
+    asyncio.run(scenario())
+    print("✅ 근사 중복 인덱스 증분/재적재 동기화 통과")
+
+
+if __name__ == "__main__":
+    test_fetch_by_ids_uses_single_projected_in_query()
+    test_fetch_resume_selects_path_per_call()
+    test_near_duplicate_index_follows_collection_changes()
@@ -0,0 +1,127 @@
+"""
+TextExtractor PDF 페이지 병렬 추출/캐시 테스트
+(PDF 라이브러리는 페이지 텍스트를 '|'로 나눈 바이트를 읽는 가짜 모듈로 대체)
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils.text_extractor as text_extractor_module
+from utils.text_extractor import TextExtractor
+from utils.upload_ingest import shutdown_parse_pool
+
+
+class FakePlumberPage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        if self.text == "BAD":
+            raise ValueError("깨진 페이지")
+        if self.text == "SLOW":
+            time.sleep(0.3)
+        return self.text
+
+
+class FakePlumberPdf:
+    def __init__(self, stream):
+        self.pages = [FakePlumberPage(text) for text in stream.read().decode().split("|")]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FakePdfPlumber:
+    open = FakePlumberPdf
+
+
+class FakePyPdfPage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return f"PyPDF2 {self.text.lower()}"
+
+
+class FakePdfReader:
+    def __init__(self, stream):
+        self.pages = [FakePyPdfPage(text) for text in stream.read().decode().split("|")]
+
+
+def use_fake_pdf_libraries():
+    text_extractor_module.pdfplumber = FakePdfPlumber
+    text_extractor_module.PdfReader = FakePdfReader
+    text_extractor_module.PDFPLUMBER_AVAILABLE = True
+    text_extractor_module.PYPDF2_AVAILABLE = True
+
+
+def test_bad_page_falls_back_per_page():
+    """pdfplumber로 실패한 페이지만 PyPDF2로 다시 추출하는지 확인"""
+    use_fake_pdf_libraries()
+    extractor = TextExtractor(min_pages_per_task=100)
+
+    text, file_type = extractor.extract_text(b"first|BAD|third", "portfolio.pdf")
+
+    assert file_type == ".pdf"
+    assert text.split("\n") == ["[페이지 1]", "first", "[페이지 2]", "PyPDF2 bad", "[페이지 3]", "third"]
+    print("✅ 페이지 단위 PyPDF2 대체 통과")
+
+
+def test_pages_split_across_process_pool():
+    """페이지 범위를 프로세스 풀로 나눠 추출해도 순서가 유지되는지 확인"""
+    use_fake_pdf_libraries()
+    extractor = TextExtractor(min_pages_per_task=2, cache_size=0)
+    pages = [f"page{i}" for i in range(1, 10)]
+
+    try:
+        text, _ = extractor.extract_text("|".join(pages).encode(), "long.pdf")
+    finally:
+        shutdown_parse_pool()
+
+    assert [line for line in text.split("\n") if line.startswith("page")] == pages
+    print("✅ 프로세스 풀 페이지 분할 추출 통과")
+
+
+def test_page_and_time_caps():
+    """페이지 제한을 넘는 페이지와 시간 제한 이후 페이지를 건너뛰는지 확인"""
+    use_fake_pdf_libraries()
+
+    capped, _ = TextExtractor(max_pdf_pages=2, min_pages_per_task=100).extract_text(b"a|b|c|d", "capped.pdf")
+    assert "[페이지 2]" in capped and "[페이지 3]" not in capped
+    assert "이후 2페이지는 페이지 제한(2)으로 생략" in capped
+
+    extractor = TextExtractor(pdf_timeout=0.1, min_pages_per_task=100)
+    timed_out, _ = extractor.extract_text(b"SLOW|b|c", "slow.pdf")
+    assert "[페이지 3] - 시간 제한으로 추출 생략" in timed_out
+    assert extractor.get_cache_stats()["entries"] == 0  # 일부가 빠진 결과는 캐시하지 않음
+    print("✅ 페이지/시간 제한 통과")
+
+
+def test_reupload_hits_content_hash_cache():
+    """같은 내용의 파일은 파일명이 달라도 다시 추출하지 않는지 확인"""
+    extractor = TextExtractor()
+    calls = []
+    original = extractor.supported_formats[".txt"]
+    extractor.supported_formats[".txt"] = lambda data, name: calls.append(name) or original(data, name)
+
+    first = extractor.extract_text("자기소개서 내용".encode(), "a.txt")
+    second = extractor.extract_text("자기소개서 내용".encode(), "b.txt")
+
+    assert first == second and calls == ["a.txt"]
+    assert extractor.get_cache_stats()["hits"] == 1
+    print("✅ 내용 해시 캐시 통과")
+
+
+if __name__ == "__main__":
+    test_bad_page_falls_back_per_page()
+    test_pages_split_across_process_pool()
+    test_page_and_time_caps()
+    test_reupload_hits_content_hash_cache()
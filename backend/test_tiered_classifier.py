@@ -0,0 +1,94 @@
+"""
+계층형 분류 엔진 테스트 (LLM 호출은 가짜 함수로 대체)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from chatbot.core.tiered_classifier import LLMBudget, KeywordIntentModel, LogisticScorer, TieredDecider
+from chatbot.core.two_stage_classifier import TwoStageClassifier
+
+
+def test_llm_budget_limits_calls_per_window():
+    """윈도우 안에서 예산만큼만 허용되고, 윈도우가 지나면 다시 허용되는지 확인"""
+    budget = LLMBudget(max_calls=2, window_seconds=0.1)
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    assert budget.remaining() == 0
+
+    import time
+    time.sleep(0.12)
+    assert budget.try_acquire()
+    assert LLMBudget(max_calls=-1).try_acquire()
+    print("✅ 분당 LLM 예산 통과")
+
+
+def test_keyword_intent_model_confidence():
+    """명확한 키워드는 높은 신뢰도, 충돌/무매칭은 낮은 신뢰도인지 확인"""
+    model = KeywordIntentModel({
+        "search": {"동향": 2},
+        "recruit": {"채용": 2, "뽑아요": 2.5},
+        "chat": {"안녕": 2}
+    })
+
+    intent, confidence = model.predict("안녕하세요")
+    assert intent == "chat" and confidence > 0.9
+    assert model.predict("개발자 뽑아요")[0] == "recruit"
+    assert model.predict("채용 동향")[1] == 0.5
+    assert model.predict("이건 뭐죠?") == ("chat", 0.0)
+    print("✅ 로컬 의도 모델 신뢰도 통과")
+
+
+def test_logistic_scorer_fit():
+    """라벨 예시로 학습한 가중치가 라벨을 가르는 특징 쪽으로 기우는지 확인"""
+    examples = [({"posting": 1, "question": 0}, 1)] * 5 + [({"posting": 0, "question": 1}, 0)] * 5
+    scorer = LogisticScorer.fit(examples)
+
+    assert scorer.weights["posting"] > 0 > scorer.weights["question"]
+    assert scorer.predict_proba({"posting": 1}) > 0.8
+    assert scorer.predict_proba({"question": 1}) < 0.2
+    print("✅ 로지스틱 모델 학습 통과")
+
+
+def test_two_stage_escalates_only_when_needed():
+    """애매한 구간에서 로컬 모델이 확신하면 LLM을 부르지 않고, 예산이 없으면 로컬 판정을 쓰는지 확인"""
+    classifier = TwoStageClassifier()
+    classifier.tiers = TieredDecider(confidence_threshold=0.75, budget=LLMBudget(max_calls=1))
+    llm_calls = []
+
+    def fake_second_stage(text):
+        llm_calls.append(text)
+        return {'is_recruitment': True, 'confidence': 0.9, 'fields': {}, 'suggestions': {}}
+
+    classifier._second_stage_semantic_analysis = fake_second_stage
+
+    # 같은 3점이라도 문장 형태로 갈림 → 로컬 모델이 확정
+    posting = classifier.classify_text("백엔드 개발자 구함, 연봉 협의")
+    question = classifier.classify_text("디자이너 연봉은 보통 얼마야?")
+    # 4점 (개발자 + 이력서), 형태 단서 없음 → 로컬 신뢰도 부족 → LLM (예산 1회)
+    escalated = classifier.classify_text("개발자 이력서")
+    # 같은 4점 → 예산 초과로 로컬 판정
+    fallback = classifier.classify_text("디자이너 포트폴리오")
+    # 명확한 채용공고 → 1차 규칙으로 확정
+    rule = classifier.classify_text("프론트엔드 개발자를 모집합니다. 이력서를 제출해주세요.")
+
+    assert posting['first_stage_score'] == question['first_stage_score'] == 3
+    assert posting['stage'] == 'local_model' and posting['is_recruitment']
+    assert question['stage'] == 'local_model' and not question['is_recruitment']
+    assert escalated['stage'] == 'two_stage' and escalated['is_recruitment']
+    assert fallback['stage'] == 'local_model'
+    assert rule['stage'] == 'first_stage' and rule['is_recruitment']
+    assert llm_calls == ["개발자 이력서"]
+
+    stats = classifier.get_tier_stats()
+    assert stats['counts'] == {'rule': 1, 'local_model': 2, 'llm': 1, 'budget_fallback': 1}
+    assert stats['total'] == 5
+    print("✅ 2단계 분류기 계층 판정 통과")
+
+
+if __name__ == "__main__":
+    test_llm_budget_limits_calls_per_window()
+    test_keyword_intent_model_confidence()
+    test_logistic_scorer_fit()
+    test_two_stage_escalates_only_when_needed()
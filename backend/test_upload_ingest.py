@@ -0,0 +1,91 @@
+"""
+업로드 스트리밍 수집/파싱 테스트
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.upload_ingest import UploadTooLargeError, spool_upload, iter_document_text, shutdown_parse_pool
+
+
+class FakeUploadFile:
+    """청크 단위 read(size)만 지원하는 UploadFile 대역 (읽은 바이트 수 기록)"""
+
+    def __init__(self, filename, data):
+        self.filename = filename
+        self.data = data
+        self.offset = 0
+
+    async def read(self, size=-1):
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += len(chunk)
+        return chunk
+
+
+def test_small_upload_stays_in_memory():
+    """메모리 한도 이하 업로드는 임시 파일 없이 바이트로 보관되는지 확인"""
+    upload = asyncio.run(spool_upload(FakeUploadFile("a.txt", "안녕하세요".encode()), max_bytes=1024, chunk_size=4))
+
+    assert upload.path is None and upload.data == "안녕하세요".encode()
+    assert upload.size == len("안녕하세요".encode())
+    print("✅ 작은 업로드 메모리 보관 통과")
+
+
+def test_large_upload_spills_to_temp_file():
+    """메모리 한도를 넘으면 임시 파일로 옮기고, cleanup 시 삭제되는지 확인"""
+    data = b"line\n" * 100
+
+    async def main():
+        upload = await spool_upload(FakeUploadFile("b.txt", data), max_bytes=1024, chunk_size=64, memory_limit=128)
+        text = "".join([part async for part in iter_document_text(upload, ".txt")])
+        return upload, text
+
+    upload, text = asyncio.run(main())
+    path = upload.path
+
+    assert upload.data is None and os.path.exists(path)
+    assert text == data.decode() and upload.size == len(data)
+    upload.cleanup()
+    assert not os.path.exists(path)
+    print("✅ 큰 업로드 임시 파일 전환 통과")
+
+
+def test_oversized_upload_stops_reading_early():
+    """크기 제한을 넘는 순간 읽기를 멈추는지 확인"""
+    file = FakeUploadFile("c.pdf", b"x" * 10_000)
+    try:
+        asyncio.run(spool_upload(file, max_bytes=1000, chunk_size=256))
+        raise AssertionError("크기 제한이 적용되지 않았습니다.")
+    except UploadTooLargeError:
+        pass
+
+    assert file.offset < 2000
+    print("✅ 크기 제한 조기 중단 통과")
+
+
+def test_pdf_parsing_runs_in_process_pool():
+    """PDF 파싱이 프로세스 풀을 거쳐 텍스트(또는 라이브러리 미설치 안내)를 반환하는지 확인"""
+    async def main():
+        upload = await spool_upload(FakeUploadFile("d.pdf", b"%PDF-1.4 broken"), max_bytes=1024)
+        try:
+            return [part async for part in iter_document_text(upload, ".pdf")]
+        except Exception as e:
+            return e
+
+    try:
+        result = asyncio.run(main())
+    finally:
+        shutdown_parse_pool()
+
+    # PyPDF2가 있으면 손상된 PDF 오류, 없으면 설치 안내 문구
+    assert isinstance(result, Exception) or result == ["PDF 파일입니다. 텍스트 추출을 위해 PyPDF2를 설치해주세요."]
+    print("✅ 프로세스 풀 PDF 파싱 통과")
+
+
+if __name__ == "__main__":
+    test_small_upload_stays_in_memory()
+    test_large_upload_spills_to_temp_file()
+    test_oversized_upload_stops_reading_early()
+    test_pdf_parsing_runs_in_process_pool()
@@ -0,0 +1,145 @@
+"""
+로컬 벡터 백엔드 테스트
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vector_backends import LocalVectorBackend, matches_filter
+
+
+def make_vectors(count, dimension=8, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(count, dimension)).astype(np.float32)
+
+
+def test_query_with_metadata_filter():
+    """코사인 검색 결과와 메타데이터 필터 확인"""
+    backend = LocalVectorBackend(dimension=3)
+    backend.upsert([
+        {"id": "a", "values": [1, 0, 0], "metadata": {"type": "resume", "resume_id": "r1"}},
+        {"id": "b", "values": [0.9, 0.1, 0], "metadata": {"type": "cover_letter", "resume_id": "r1"}},
+        {"id": "c", "values": [0, 1, 0], "metadata": {"type": "resume", "resume_id": "r2"}},
+    ])
+
+    result = backend.query([1, 0, 0], top_k=2, filter={"type": "resume"})
+    ids = [match["id"] for match in result["matches"]]
+
+    assert ids == ["a", "c"]
+    assert abs(result["matches"][0]["score"] - 1.0) < 1e-5
+    assert matches_filter({"type": "resume"}, {"type": {"$in": ["resume", "portfolio"]}})
+    assert not matches_filter({"type": "resume"}, {"type": {"$ne": "resume"}})
+    print("✅ 메타데이터 필터 검색 통과")
+
+
+def test_upsert_fetch_and_delete_by_resume():
+    """업서트 덮어쓰기, 조회, 이력서 단위 삭제 확인"""
+    backend = LocalVectorBackend(dimension=3)
+    backend.upsert([
+        {"id": "r1_summary", "values": [1, 0, 0], "metadata": {"resume_id": "r1"}},
+        {"id": "r1_skills", "values": [0, 1, 0], "metadata": {"resume_id": "r1"}},
+        {"id": "r2_summary", "values": [0, 0, 1], "metadata": {"resume_id": "r2"}},
+    ])
+    backend.upsert([{"id": "r2_summary", "values": [0, 1, 1], "metadata": {"resume_id": "r2", "v": 2}}])
+
+    assert backend.count == 3
+    assert backend.fetch(["r2_summary"])["vectors"]["r2_summary"]["metadata"]["v"] == 2
+
+    backend.delete_by_resume("r1")
+
+    assert backend.count == 1
+    assert backend.fetch(["r1_summary", "r2_summary"])["vectors"].keys() == {"r2_summary"}
+    assert backend.query([0, 1, 1], top_k=5)["matches"][0]["id"] == "r2_summary"
+    print("✅ 업서트/조회/이력서 삭제 통과")
+
+
+def test_persists_to_memory_mapped_files():
+    """디스크에 저장된 인덱스를 다시 열었을 때 동일하게 검색되는지 확인"""
+    vectors = make_vectors(50)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = LocalVectorBackend(path=tmp_dir, dimension=8)
+        backend.upsert([{"id": f"v{i}", "values": v, "metadata": {"i": i}} for i, v in enumerate(vectors)])
+        backend.delete(["v3"])
+        expected = backend.query(vectors[10], top_k=5)["matches"]
+        del backend
+
+        reopened = LocalVectorBackend(path=tmp_dir, dimension=8)
+
+        assert reopened.count == 49
+        assert reopened.query(vectors[10], top_k=5)["matches"] == expected
+        print("✅ 메모리 맵 영속화 통과")
+
+
+def test_metadata_writes_append_to_log_and_compact():
+    """쓰기마다 메타데이터 스냅샷 전체를 다시 쓰지 않고 로그에 추가하며, 압축 후에도 다시 열면 같은지 확인"""
+    vectors = make_vectors(1200)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = LocalVectorBackend(path=tmp_dir, dimension=8)
+        meta_path = os.path.join(tmp_dir, "meta.json")
+        snapshot_mtime = os.stat(meta_path).st_mtime_ns
+
+        for i in range(20):
+            backend.upsert([{"id": f"v{i}", "values": vectors[i], "metadata": {"i": i}}])
+        backend.delete(["v3", "v7"])
+        assert os.stat(meta_path).st_mtime_ns == snapshot_mtime
+        assert LocalVectorBackend(path=tmp_dir, dimension=8).fetch(["v19"])["vectors"]["v19"]["metadata"] == {"i": 19}
+
+        # 로그가 max(1000, 벡터 수)를 넘으면 스냅샷으로 압축하고 새 세대 로그를 시작
+        for i in range(20, 1200):
+            backend.upsert([{"id": f"v{i}", "values": vectors[i], "metadata": {"i": i}}])
+        backend.upsert([{"id": "v0", "values": vectors[0], "metadata": {"i": 0, "v": 2}}])
+        backend.delete(["v5"])
+        logs = [name for name in os.listdir(tmp_dir) if name.endswith(".log")]
+        assert logs == [f"meta.{backend._generation}.log"] and backend._generation >= 2
+
+        reopened = LocalVectorBackend(path=tmp_dir, dimension=8)
+        assert reopened.count == backend.count == 1197
+        assert reopened._ids == backend._ids
+        assert reopened.fetch(["v0"])["vectors"]["v0"]["metadata"] == {"i": 0, "v": 2}
+        assert reopened.query(vectors[100], top_k=1)["matches"][0]["id"] == "v100"
+        print("✅ 메타데이터 로그 추가/압축 통과")
+
+
+def test_ivf_index_finds_exact_match():
+    """IVF 인덱스 사용 시에도 자기 자신을 최상위로 찾는지 확인"""
+    vectors = make_vectors(600, dimension=16, seed=1)
+    backend = LocalVectorBackend(dimension=16, ivf_threshold=500, nprobe=4)
+    backend.upsert([{"id": f"v{i}", "values": v, "metadata": {}} for i, v in enumerate(vectors)])
+
+    assert backend._centroids is not None
+    for i in (0, 123, 599):
+        assert backend.query(vectors[i], top_k=1)["matches"][0]["id"] == f"v{i}"
+    print("✅ IVF 인덱스 검색 통과")
+
+
+def test_query_many_matches_single_queries():
+    """여러 쿼리를 한 번에 검색한 결과가 개별 검색과 같은지 확인"""
+    vectors = make_vectors(200, seed=2)
+    backend = LocalVectorBackend(dimension=8)
+    backend.upsert([
+        {"id": f"v{i}", "values": v, "metadata": {"type": "resume_chunk" if i % 2 else "resume"}}
+        for i, v in enumerate(vectors)
+    ])
+    queries = vectors[:5]
+
+    batched = backend.query_many(queries, top_k=3, filter={"type": "resume_chunk"})
+    single = [backend.query(q, top_k=3, filter={"type": "resume_chunk"}) for q in queries]
+
+    for batch_result, single_result in zip(batched, single):
+        assert [m["id"] for m in batch_result["matches"]] == [m["id"] for m in single_result["matches"]]
+        assert np.allclose([m["score"] for m in batch_result["matches"]],
+                           [m["score"] for m in single_result["matches"]], atol=1e-5)
+    assert all(m["metadata"]["type"] == "resume_chunk" for r in batched for m in r["matches"])
+    print("✅ 다중 쿼리 일괄 검색 통과")
+
+
+if __name__ == "__main__":
+    test_query_with_metadata_filter()
+    test_upsert_fetch_and_delete_by_resume()
+    test_persists_to_memory_mapped_files()
+    test_metadata_writes_append_to_log_and_compact()
+    test_ivf_index_finds_exact_match()
+    test_query_many_matches_single_queries()
@@ -0,0 +1,175 @@
+"""
+벡터 쓰기 지연(write-behind) 큐 테스트
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vector_backends import LocalVectorBackend
+from vector_service import VectorService
+
+
+def make_vector(vector_id, values, resume_id="r1"):
+    return {"id": vector_id, "values": values, "metadata": {"resume_id": resume_id, "type": "resume"}}
+
+
+def test_async_writes_are_batched_in_background():
+    """async 모드 쓰기가 즉시 반환되고 백그라운드에서 한 배치로 저장되는지 확인"""
+    backend = LocalVectorBackend(dimension=2)
+    service = VectorService(backend=backend, write_consistency="async")
+    service.write_queue.flush_interval = 0.05
+
+    async def run():
+        await service._write_vectors([make_vector("a", [1, 0])])
+        await service._write_vectors([make_vector("b", [0, 1])])
+        queued = await service.get_vector_status(["a", "b"])
+        assert backend.count == 0
+        await asyncio.sleep(0.2)
+        written = await service.get_vector_status(["a", "b", "c"], verify=True)
+        await service.flush_writes()
+        return queued, written
+
+    queued, written = asyncio.run(run())
+
+    assert queued["statuses"]["a"]["state"] == "queued"
+    assert written["statuses"]["a"]["state"] == "indexed"
+    assert written["statuses"]["b"]["state"] == "indexed"
+    assert written["statuses"]["c"]["state"] == "unknown"
+    assert written["queue"]["flushed_batches"] == 1
+    assert backend.count == 2
+    print("✅ 백그라운드 배치 저장 통과")
+
+
+def test_sync_consistency_writes_immediately():
+    """sync 모드는 호출이 끝나면 바로 저장되어 있는지 확인"""
+    backend = LocalVectorBackend(dimension=2)
+    service = VectorService(backend=backend, write_consistency="async")
+
+    async def run():
+        await service._write_vectors([make_vector("a", [1, 0])], consistency="sync")
+        return await service.get_vector_status(["a"])
+
+    status = asyncio.run(run())
+
+    assert backend.count == 1
+    assert status["statuses"]["a"]["state"] == "written"
+    print("✅ 동기 쓰기 통과")
+
+
+def test_flush_on_close_persists_pending_writes():
+    """종료 시 대기 중인 벡터가 모두 저장되는지 확인"""
+    backend = LocalVectorBackend(dimension=2)
+    service = VectorService(backend=backend, write_consistency="async")
+    service.write_queue.flush_interval = 60
+
+    async def run():
+        await service._write_vectors([make_vector(f"v{i}", [1, i]) for i in range(5)])
+        await service.flush_writes()
+
+    asyncio.run(run())
+
+    assert backend.count == 5
+    print("✅ 종료 시 플러시 통과")
+
+
+class FlakyBackend(LocalVectorBackend):
+    """처음 failures번의 업서트는 실패하는 백엔드"""
+
+    def __init__(self, failures):
+        super().__init__(dimension=2)
+        self.failures = failures
+        self.calls = 0
+
+    def upsert(self, vectors):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("temporary outage")
+        return super().upsert(vectors)
+
+
+def test_failed_batch_is_retried_with_backoff():
+    """업서트가 한 번 실패해도 벡터가 버려지지 않고 백오프 후 다시 저장되는지 확인"""
+    backend = FlakyBackend(failures=1)
+    service = VectorService(backend=backend, write_consistency="async")
+    queue = service.write_queue
+    queue.flush_interval = 0.01
+    queue.retry_backoff = 0.05
+
+    async def run():
+        await service._write_vectors([make_vector("a", [1, 0]), make_vector("b", [0, 1])])
+        await asyncio.sleep(0.03)
+        retrying = await service.get_vector_status(["a"])
+        await asyncio.sleep(0.15)
+        written = await service.get_vector_status(["a", "b"])
+        await service.flush_writes()
+        return retrying, written
+
+    retrying, written = asyncio.run(run())
+
+    assert retrying["statuses"]["a"]["state"] == "retrying"
+    assert "temporary outage" in retrying["statuses"]["a"]["error"]
+    assert written["statuses"]["a"]["state"] == written["statuses"]["b"]["state"] == "written"
+    assert written["queue"]["retried_vectors"] == 2 and written["queue"]["failed_vectors"] == 0
+    assert backend.count == 2 and backend.calls == 2
+    print("✅ 실패 배치 재시도 통과")
+
+
+def test_gives_up_after_max_attempts():
+    """계속 실패하면 max_attempts번 시도한 뒤에만 failed로 기록되는지 확인"""
+    backend = FlakyBackend(failures=100)
+    service = VectorService(backend=backend, write_consistency="async")
+    service.write_queue.retry_backoff = 0.001
+    service.write_queue.max_attempts = 3
+
+    async def run():
+        await service._write_vectors([make_vector("a", [1, 0])])
+        await service.flush_writes()
+        return await service.get_vector_status(["a"])
+
+    status = asyncio.run(run())
+
+    assert backend.calls == 3
+    assert status["statuses"]["a"]["state"] == "failed"
+    assert status["queue"]["failed_vectors"] == 1 and status["queue"]["retrying"] == 0
+    print("✅ 최대 시도 후 실패 기록 통과")
+
+
+def test_search_and_delete_run_off_event_loop():
+    """단건 검색/이력서 삭제가 이벤트 루프 스레드가 아닌 워커 스레드에서 인덱스를 호출하는지 확인"""
+    import threading
+
+    class RecordingBackend(LocalVectorBackend):
+        def query(self, *args, **kwargs):
+            threads.append(threading.current_thread())
+            return super().query(*args, **kwargs)
+
+        def delete_by_resume(self, resume_id):
+            threads.append(threading.current_thread())
+            return super().delete_by_resume(resume_id)
+
+    threads = []
+    backend = RecordingBackend(dimension=2)
+    service = VectorService(backend=backend, write_consistency="sync")
+
+    async def run():
+        await service._write_vectors([make_vector("a", [1, 0])])
+        result = await service.search_similar_vectors([1, 0], top_k=1, filter_type="resume")
+        deleted = await service.delete_vectors_by_resume_id("r1")
+        return result, deleted
+
+    result, deleted = asyncio.run(run())
+
+    assert result["matches"][0]["id"] == "a" and deleted and backend.count == 0
+    assert len(threads) == 2 and threading.main_thread() not in threads
+    print("✅ 검색/삭제 워커 스레드 실행 통과")
+
+
+if __name__ == "__main__":
+    test_async_writes_are_batched_in_background()
+    test_sync_consistency_writes_immediately()
+    test_flush_on_close_persists_pending_writes()
+    test_failed_batch_is_retried_with_backoff()
+    test_gives_up_after_max_attempts()
+    test_search_and_delete_run_off_event_loop()
@@ -2,11 +2,21 @@
 다양한 파일 형식에서 텍스트를 추출하는 유틸리티
 """
 
+import hashlib
 import io
 import logging
-from typing import Optional, Tuple
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+from instrumentation import span
+
 try:
     import pdfplumber
     PDFPLUMBER_AVAILABLE = True
@@ -28,13 +38,105 @@ except ImportError:
     PYPDF2_AVAILABLE = False
     logging.warning("PyPDF2가 설치되지 않았습니다. PDF 처리가 제한됩니다.")
 
+from utils.upload_ingest import PARSE_WORKERS, get_parse_pool, shutdown_parse_pool
+
 logger = logging.getLogger(__name__)
 
+# PDF 추출 제한 (긴 포트폴리오가 요청을 오래 붙잡지 않도록)
+MAX_PDF_PAGES = int(os.getenv("PDF_MAX_PAGES", "200"))
+PDF_EXTRACTION_TIMEOUT = float(os.getenv("PDF_EXTRACTION_TIMEOUT", "20"))
+# 이 페이지 수 이하 문서는 프로세스 풀을 거치지 않고 바로 추출 (작업 전달 비용이 더 큼)
+PDF_MIN_PAGES_PER_TASK = int(os.getenv("PDF_MIN_PAGES_PER_TASK", "4"))
+TEXT_CACHE_SIZE = int(os.getenv("TEXT_EXTRACTION_CACHE_SIZE", "128"))
+
+PDF_TIMEOUT_NOTICE = "시간 제한으로 추출 생략"
+
+
+def _format_page(index: int, page_text: Optional[str]) -> str:
+    if page_text:
+        return f"[페이지 {index + 1}]\n{page_text}"
+    return f"[페이지 {index + 1}] - 텍스트 추출 불가"
+
+
+def _pdf_page_count(file_bytes: bytes) -> int:
+    """PDF 페이지 수 (pdfplumber로 열 수 없으면 PyPDF2로 확인)"""
+    if PDFPLUMBER_AVAILABLE:
+        try:
+            with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
+                return len(pdf.pages)
+        except Exception as e:
+            logger.warning(f"pdfplumber로 PDF 열기 실패, PyPDF2로 재시도: {str(e)}")
+    if PYPDF2_AVAILABLE:
+        return len(PdfReader(io.BytesIO(file_bytes)).pages)
+    raise ValueError("PDF 텍스트 추출에 실패했습니다.")
+
+
+def _extract_pdf_pages(file_bytes: bytes, start: int, stop: int, deadline: float) -> List[str]:
+    """
+    [start, stop) 페이지 텍스트 추출 (프로세스 풀 작업자에서도 실행되므로 모듈 최상위 함수)
+
+    pdfplumber로 실패한 페이지만 PyPDF2로 다시 추출하고,
+    deadline(time.time() 기준)이 지나면 남은 페이지는 건너뜁니다.
+    """
+    texts: List[str] = []
+    plumber_pdf = None
+    pypdf_reader = None
+    try:
+        if PDFPLUMBER_AVAILABLE:
+            try:
+                plumber_pdf = pdfplumber.open(io.BytesIO(file_bytes))
+            except Exception as e:
+                logger.warning(f"pdfplumber로 PDF 열기 실패: {str(e)}")
+
+        for index in range(start, stop):
+            if time.time() > deadline:
+                texts.append(f"[페이지 {index + 1}] - {PDF_TIMEOUT_NOTICE}")
+                continue
+
+            page_text = None
+            extracted = False
+            if plumber_pdf is not None:
+                try:
+                    page_text = plumber_pdf.pages[index].extract_text()
+                    extracted = True
+                except Exception as e:
+                    logger.warning(f"pdfplumber로 {index + 1}페이지 추출 실패, PyPDF2로 재시도: {str(e)}")
+
+            if not extracted and PYPDF2_AVAILABLE:
+                try:
+                    if pypdf_reader is None:
+                        pypdf_reader = PdfReader(io.BytesIO(file_bytes))
+                    page_text = pypdf_reader.pages[index].extract_text()
+                except Exception as e:
+                    logger.warning(f"PyPDF2로도 {index + 1}페이지 추출 실패: {str(e)}")
+
+            texts.append(_format_page(index, page_text))
+    finally:
+        if plumber_pdf is not None:
+            plumber_pdf.close()
+    return texts
+
 
 class TextExtractor:
     """다양한 파일 형식에서 텍스트를 추출하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_pdf_pages: int = MAX_PDF_PAGES, pdf_timeout: float = PDF_EXTRACTION_TIMEOUT,
+                 min_pages_per_task: int = PDF_MIN_PAGES_PER_TASK, cache_size: int = TEXT_CACHE_SIZE):
+        """
+        Args:
+            max_pdf_pages (int): PDF에서 추출할 최대 페이지 수
+            pdf_timeout (float): PDF 한 건의 추출 시간 제한 (초)
+            min_pages_per_task (int): 프로세스 풀 작업 하나가 맡는 최소 페이지 수
+            cache_size (int): 내용 해시 기준으로 보관할 추출 결과 수 (0이면 캐시 사용 안 함)
+        """
+        self.max_pdf_pages = max_pdf_pages
+        self.pdf_timeout = pdf_timeout
+        self.min_pages_per_task = min_pages_per_task
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # to_thread로 여러 스레드에서 호출됨
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.supported_formats = {
             '.txt': self._extract_text,
             '.pdf': self._extract_pdf,
@@ -42,6 +144,7 @@ class TextExtractor:
             '.doc': self._extract_doc,
         }
     
+    @span("text_extraction", op="extract_text")
     def extract_text(self, file_bytes: bytes, filename: str) -> Tuple[str, str]:
         """
         파일에서 텍스트를 추출
@@ -60,12 +163,23 @@ class TextExtractor:
             if file_extension not in self.supported_formats:
                 raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
             
+            # 같은 내용의 파일을 다시 올리면 추출 없이 바로 반환
+            cache_key = f"{file_extension}:{hashlib.sha256(file_bytes).hexdigest()}"
+            cached_text = self._get_cached(cache_key)
+            if cached_text is not None:
+                logger.info(f"텍스트 추출 캐시 적중: {filename} ({len(cached_text)} 문자)")
+                return cached_text, file_extension
+            
             extractor = self.supported_formats[file_extension]
             text = extractor(file_bytes, filename)
             
             # 텍스트 정제
             cleaned_text = self._clean_text(text)
             
+            # 시간 제한으로 일부 페이지가 빠진 결과는 캐시하지 않음
+            if PDF_TIMEOUT_NOTICE not in cleaned_text:
+                self._set_cached(cache_key, cleaned_text)
+            
             logger.info(f"텍스트 추출 완료: {filename} ({len(cleaned_text)} 문자)")
             return cleaned_text, file_extension
             
@@ -86,43 +200,80 @@ class TextExtractor:
                     continue
             raise ValueError("텍스트 파일의 인코딩을 확인할 수 없습니다.")
     
+    def _get_cached(self, key: str) -> Optional[str]:
+        if self.cache_size <= 0:
+            return None
+        with self._cache_lock:
+            text = self._cache.get(key)
+            if text is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return text
+    
+    def _set_cached(self, key: str, text: str):
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = text
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def get_cache_stats(self) -> dict:
+        """추출 결과 캐시 통계"""
+        with self._cache_lock:
+            return {"entries": len(self._cache), "max_entries": self.cache_size,
+                    "hits": self.cache_hits, "misses": self.cache_misses}
+    
     def _extract_pdf(self, file_bytes: bytes, filename: str) -> str:
-        """PDF 파일에서 텍스트 추출"""
+        """
+        PDF 파일에서 텍스트 추출
+        
+        페이지 범위를 나눠 프로세스 풀에서 동시에 추출하고, pdfplumber로 실패한 페이지만 PyPDF2로 다시 추출합니다.
+        max_pdf_pages를 넘는 페이지와 pdf_timeout 이후의 페이지는 건너뜁니다.
+        """
         if not PDFPLUMBER_AVAILABLE and not PYPDF2_AVAILABLE:
             raise ImportError("PDF 처리를 위한 라이브러리가 설치되지 않았습니다.")
         
-        text_parts = []
+        deadline = time.time() + self.pdf_timeout
+        page_count = _pdf_page_count(file_bytes)
+        pages_to_read = min(page_count, self.max_pdf_pages)
         
-        # pdfplumber 우선 사용 (더 정확한 텍스트 추출)
-        if PDFPLUMBER_AVAILABLE:
-            try:
-                with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-                    for page_num, page in enumerate(pdf.pages):
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(f"[페이지 {page_num + 1}]\n{page_text}")
-                        else:
-                            text_parts.append(f"[페이지 {page_num + 1}] - 텍스트 추출 불가")
-                return "\n\n".join(text_parts)
-            except Exception as e:
-                logger.warning(f"pdfplumber로 PDF 추출 실패, PyPDF2로 재시도: {str(e)}")
+        text_parts = self._extract_pdf_ranges(file_bytes, pages_to_read, deadline)
+        if pages_to_read < page_count:
+            text_parts.append(f"[이후 {page_count - pages_to_read}페이지는 페이지 제한({self.max_pdf_pages})으로 생략]")
+        return "\n\n".join(text_parts)
+    
+    def _extract_pdf_ranges(self, file_bytes: bytes, page_count: int, deadline: float) -> List[str]:
+        if page_count <= self.min_pages_per_task:
+            return _extract_pdf_pages(file_bytes, 0, page_count, deadline)
         
-        # PyPDF2로 대체
-        if PYPDF2_AVAILABLE:
-            try:
-                pdf_reader = PdfReader(io.BytesIO(file_bytes))
-                for page_num, page in enumerate(pdf_reader.pages):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"[페이지 {page_num + 1}]\n{page_text}")
-                    else:
-                        text_parts.append(f"[페이지 {page_num + 1}] - 텍스트 추출 불가")
-                return "\n\n".join(text_parts)
-            except Exception as e:
-                logger.error(f"PyPDF2로도 PDF 추출 실패: {str(e)}")
-                raise
+        try:
+            pool = get_parse_pool()
+            pages_per_task = max(self.min_pages_per_task, math.ceil(page_count / PARSE_WORKERS))
+            ranges = [(start, min(start + pages_per_task, page_count))
+                      for start in range(0, page_count, pages_per_task)]
+            futures = [pool.submit(_extract_pdf_pages, file_bytes, start, stop, deadline) for start, stop in ranges]
+        except (BrokenProcessPool, RuntimeError) as e:
+            logger.warning(f"PDF 추출 프로세스 풀 사용 불가, 현재 스레드에서 추출: {str(e)}")
+            shutdown_parse_pool()
+            return _extract_pdf_pages(file_bytes, 0, page_count, deadline)
         
-        raise ValueError("PDF 텍스트 추출에 실패했습니다.")
+        text_parts: List[str] = []
+        for future, (start, stop) in zip(futures, ranges):
+            try:
+                # 작업자도 deadline을 확인하므로 여유 시간을 조금 더 줌
+                text_parts.extend(future.result(timeout=max(0.0, deadline - time.time()) + 1.0))
+            except FuturesTimeoutError:
+                future.cancel()
+                text_parts.extend(f"[페이지 {index + 1}] - {PDF_TIMEOUT_NOTICE}" for index in range(start, stop))
+            except BrokenProcessPool:
+                logger.warning("PDF 추출 프로세스 풀이 손상되어 남은 범위를 현재 스레드에서 추출합니다.")
+                shutdown_parse_pool()
+                text_parts.extend(_extract_pdf_pages(file_bytes, start, stop, deadline))
+        return text_parts
     
     def _extract_docx(self, file_bytes: bytes, filename: str) -> str:
         """DOCX 파일에서 텍스트 추출"""
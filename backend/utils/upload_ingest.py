@@ -0,0 +1,208 @@
+"""
+업로드 파일 스트리밍 수집 및 텍스트 파싱
+
+업로드를 청크 단위로 읽으면서 크기 제한을 바로 적용하고, 작은 파일은 메모리에서,
+큰 파일만 임시 파일로 넘겨 파싱합니다. PDF/DOCX 파싱은 프로세스 풀에서 실행하고
+PDF는 페이지 묶음 단위로 텍스트를 순서대로 넘겨줍니다. (이벤트 루프 블로킹 방지)
+"""
+
+import asyncio
+import io
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Union
+
+from instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# 이 크기를 넘는 업로드만 임시 파일로 옮김 (그 이하는 메모리에서 바로 파싱)
+SPOOL_MEMORY_LIMIT = int(os.getenv("UPLOAD_SPOOL_MEMORY_BYTES", str(4 * 1024 * 1024)))
+PDF_PAGE_BATCH = int(os.getenv("UPLOAD_PDF_PAGE_BATCH", "8"))
+PARSE_WORKERS = int(os.getenv("UPLOAD_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+Source = Union[bytes, str]
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 크기 제한 초과"""
+
+
+class SpooledUpload:
+    """수집된 업로드 (메모리 바이트 또는 임시 파일 경로 중 하나)"""
+
+    def __init__(self, filename: str, size: int, data: Optional[bytes] = None, path: Optional[str] = None):
+        self.filename = filename
+        self.size = size
+        self.data = data
+        self.path = path
+
+    @property
+    def source(self) -> Source:
+        return self.data if self.data is not None else self.path
+
+    def cleanup(self):
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+        self.path = None
+        self.data = None
+
+
+async def spool_upload(file, max_bytes: int, chunk_size: int = UPLOAD_CHUNK_SIZE,
+                       memory_limit: int = SPOOL_MEMORY_LIMIT) -> SpooledUpload:
+    """
+    업로드를 청크 단위로 읽어 수집합니다.
+
+    Args:
+        file: UploadFile (async read(size) 지원 객체)
+        max_bytes (int): 최대 허용 크기 - 넘는 순간 읽기를 멈춤
+        memory_limit (int): 메모리에 보관할 최대 크기 - 넘으면 임시 파일로 옮김
+
+    Raises:
+        UploadTooLargeError: 크기 제한을 넘은 경우
+    """
+    suffix = Path(file.filename or "").suffix.lower()
+    buffer = bytearray()
+    temp_file = None
+    size = 0
+
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(f"파일 크기가 제한({max_bytes} bytes)을 초과했습니다.")
+
+            if temp_file is None and len(buffer) + len(chunk) > memory_limit:
+                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+                await asyncio.to_thread(temp_file.write, bytes(buffer))
+                buffer = bytearray()
+            if temp_file is not None:
+                await asyncio.to_thread(temp_file.write, chunk)
+            else:
+                buffer.extend(chunk)
+    except BaseException:
+        if temp_file is not None:
+            temp_file.close()
+            os.unlink(temp_file.name)
+        raise
+
+    if temp_file is not None:
+        temp_file.close()
+        return SpooledUpload(file.filename, size, path=temp_file.name)
+    return SpooledUpload(file.filename, size, data=bytes(buffer))
+
+
+# ---- 프로세스 풀 작업 (하위 프로세스에서 import되므로 모듈 최상위 함수로 유지) ----
+
+def _as_stream(source: Source):
+    # PyPDF2/python-docx 모두 경로 문자열과 바이너리 스트림을 받음
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _pdf_page_count(source: Source) -> int:
+    import PyPDF2
+    return len(PyPDF2.PdfReader(_as_stream(source)).pages)
+
+
+def _pdf_page_texts(source: Source, start: int, stop: int) -> List[str]:
+    import PyPDF2
+    reader = PyPDF2.PdfReader(_as_stream(source))
+    return [(reader.pages[index].extract_text() or "") for index in range(start, stop)]
+
+
+def _docx_paragraphs(source: Source) -> List[str]:
+    from docx import Document
+    return [paragraph.text for paragraph in Document(_as_stream(source)).paragraphs]
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+async def _run_in_pool(func, *args):
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_parse_pool(), func, *args)
+    except BrokenProcessPool:
+        # 작업 프로세스가 죽은 풀은 재사용할 수 없으므로 다음 요청에서 새로 만듦
+        logger.error("파싱 프로세스 풀이 손상되어 재생성합니다.")
+        shutdown_parse_pool()
+        raise
+
+
+async def iter_document_text(upload: SpooledUpload, file_ext: str,
+                             page_batch: int = PDF_PAGE_BATCH) -> AsyncIterator[str]:
+    """
+    업로드 문서의 텍스트를 순서대로 조금씩 넘겨줍니다. (PDF는 페이지 단위)
+
+    PDF는 페이지 묶음을 프로세스 풀 작업자 수만큼만 동시에 파싱합니다.
+    (묶음마다 원본이 작업 프로세스로 복사되므로 진행 중인 묶음 수를 제한)
+    """
+    source = upload.source
+
+    if file_ext == '.txt':
+        if isinstance(source, bytes):
+            yield source.decode('utf-8', errors='ignore')
+        else:
+            yield await asyncio.to_thread(Path(source).read_text, encoding='utf-8', errors='ignore')
+
+    elif file_ext == '.pdf':
+        try:
+            page_count = await _run_in_pool(_pdf_page_count, source)
+        except ImportError:
+            # PyPDF2가 설치되지 않은 경우 기본 텍스트 반환
+            yield "PDF 파일입니다. 텍스트 추출을 위해 PyPDF2를 설치해주세요."
+            return
+
+        ranges = [(start, min(start + page_batch, page_count)) for start in range(0, page_count, page_batch)]
+        pending: List[asyncio.Future] = []
+        try:
+            for start, stop in ranges:
+                pending.append(asyncio.ensure_future(_run_in_pool(_pdf_page_texts, source, start, stop)))
+                if len(pending) < PARSE_WORKERS:
+                    continue
+                for page_text in await pending.pop(0):
+                    yield page_text + "\n"
+            while pending:
+                for page_text in await pending.pop(0):
+                    yield page_text + "\n"
+        finally:
+            for future in pending:
+                future.cancel()
+
+    elif file_ext in ['.doc', '.docx']:
+        try:
+            paragraphs = await _run_in_pool(_docx_paragraphs, source)
+        except ImportError:
+            yield "Word 문서입니다. 텍스트 추출을 위해 python-docx를 설치해주세요."
+            return
+        yield "".join(paragraph + "\n" for paragraph in paragraphs)
+
+    else:
+        yield "지원하지 않는 파일 형식입니다."
+
+
+@span("text_extraction", op="upload")
+async def extract_upload_text(upload: SpooledUpload, file_ext: str) -> str:
+    """업로드 문서 전체 텍스트"""
+    return "".join([part async for part in iter_document_text(upload, file_ext)])
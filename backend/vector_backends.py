@@ -0,0 +1,549 @@
+import os
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Any
+import numpy as np
+
+class VectorBackend(ABC):
+    """VectorService가 사용하는 벡터 저장소 인터페이스 (Pinecone 응답 형식을 따름)"""
+
+    # 한 번의 호출로 여러 쿼리를 처리할 수 있는 백엔드인지 여부
+    supports_batch_query = False
+
+    @abstractmethod
+    def upsert(self, vectors: List[Dict[str, Any]]) -> int:
+        """{"id", "values", "metadata"} 형식의 벡터들을 저장하고 저장된 개수를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def query(self, vector: List[float], top_k: int = 5,
+              filter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """{"matches": [{"id", "score", "metadata"}, ...]} 형식으로 유사 벡터를 반환합니다."""
+        pass
+
+    def query_many(self, vectors: List[List[float]], top_k: int = 5,
+                   filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """여러 쿼리 벡터를 검색합니다. 기본 구현은 query를 순서대로 호출합니다."""
+        return [self.query(vector, top_k=top_k, filter=filter) for vector in vectors]
+
+    @abstractmethod
+    def fetch(self, ids: List[str]) -> Dict[str, Any]:
+        """{"vectors": {id: {"id", "values", "metadata"}}} 형식으로 벡터를 조회합니다."""
+        pass
+
+    @abstractmethod
+    def delete(self, ids: List[str]) -> bool:
+        """ID 목록에 해당하는 벡터를 삭제합니다."""
+        pass
+
+    @abstractmethod
+    def delete_by_resume(self, resume_id: str) -> bool:
+        """특정 이력서에 속한 모든 벡터를 삭제합니다."""
+        pass
+
+
+def matches_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """
+    Pinecone 메타데이터 필터 문법($eq, $ne, $in, $nin, $gt, $gte, $lt, $lte, $and, $or)을 평가합니다.
+
+    Args:
+        metadata (Dict[str, Any]): 벡터 메타데이터
+        filter (Optional[Dict[str, Any]]): 필터 조건
+
+    Returns:
+        bool: 조건을 만족하는지 여부
+    """
+    if not filter:
+        return True
+
+    for key, condition in filter.items():
+        if key == "$and":
+            if not all(matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+
+        value = metadata.get(key)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        for op, expected in condition.items():
+            if op == "$eq" and value != expected:
+                return False
+            if op == "$ne" and value == expected:
+                return False
+            if op == "$in" and value not in expected:
+                return False
+            if op == "$nin" and value in expected:
+                return False
+            if op in ("$gt", "$gte", "$lt", "$lte"):
+                if value is None:
+                    return False
+                if op == "$gt" and not value > expected:
+                    return False
+                if op == "$gte" and not value >= expected:
+                    return False
+                if op == "$lt" and not value < expected:
+                    return False
+                if op == "$lte" and not value <= expected:
+                    return False
+    return True
+
+
+class PineconeBackend(VectorBackend):
+    def __init__(self, index):
+        """
+        Pinecone 인덱스 백엔드
+
+        Args:
+            index: pinecone.Index 객체
+        """
+        self.index = index
+
+    @classmethod
+    def connect(cls, api_key: str, index_name: str, dimension: int = 384) -> Optional["PineconeBackend"]:
+        """Pinecone 인덱스에 연결하고, 없으면 생성합니다. 실패 시 None을 반환합니다."""
+        from pinecone import Pinecone, ServerlessSpec
+
+        pc = Pinecone(api_key=api_key)
+        try:
+            index = pc.Index(index_name)
+            print(f"Pinecone 인덱스 '{index_name}' 연결 성공")
+            return cls(index)
+        except Exception:
+            print(f"인덱스 '{index_name}'을 찾을 수 없습니다. 새로 생성합니다...")
+            try:
+                # 인덱스 생성 (all-MiniLM-L6-v2는 384차원)
+                pc.create_index(
+                    name=index_name,
+                    dimension=dimension,
+                    metric='cosine',
+                    spec=ServerlessSpec(
+                        cloud='aws',
+                        region='us-east-1'
+                    )
+                )
+                print(f"인덱스 '{index_name}'이 성공적으로 생성되었습니다.")
+                return cls(pc.Index(index_name))
+            except Exception as create_error:
+                print(f"인덱스 생성 실패: {create_error}")
+                # 인덱스 생성에 실패해도 서버는 계속 실행
+                return None
+
+    def upsert(self, vectors: List[Dict[str, Any]]) -> int:
+        self.index.upsert(vectors=vectors)
+        return len(vectors)
+
+    def query(self, vector: List[float], top_k: int = 5,
+              filter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        params = {"vector": vector, "top_k": top_k, "include_metadata": True}
+        if filter:
+            params["filter"] = filter
+        return self.index.query(**params)
+
+    def fetch(self, ids: List[str]) -> Dict[str, Any]:
+        return self.index.fetch(ids=ids)
+
+    def delete(self, ids: List[str]) -> bool:
+        self.index.delete(ids=ids)
+        return True
+
+    def delete_by_resume(self, resume_id: str) -> bool:
+        self.index.delete(ids=[
+            f"resume_{resume_id}_resume",
+            f"resume_{resume_id}_cover_letter",
+            f"resume_{resume_id}_portfolio"
+        ])
+        try:
+            # 청크 벡터는 메타데이터 필터로 삭제 (서버리스 인덱스는 미지원일 수 있음)
+            self.index.delete(filter={"resume_id": {"$eq": resume_id}})
+        except Exception as e:
+            print(f"[PineconeBackend] 메타데이터 필터 삭제 미지원: {e}")
+        return True
+
+
+class LocalVectorBackend(VectorBackend):
+    def __init__(self, path: Optional[str] = None, dimension: int = 384,
+                 ivf_threshold: int = 20000, nprobe: int = 8):
+        """
+        프로세스 내 로컬 벡터 인덱스 (코사인 유사도)
+
+        벡터 수가 ivf_threshold 미만이면 전수 비교(brute-force)를, 이상이면
+        k-means 기반 IVF 인덱스로 후보를 좁혀 검색합니다. path가 주어지면
+        벡터는 메모리 맵 float32 파일에 저장되고, 메타데이터 변경은 로그 파일에
+        추가만 하다가 로그가 인덱스 크기만큼 커지면 JSON 스냅샷으로 압축합니다.
+
+        Args:
+            path (Optional[str]): 저장 디렉토리 (None이면 메모리에만 유지)
+            dimension (int): 벡터 차원
+            ivf_threshold (int): IVF 인덱스를 사용하기 시작하는 벡터 수
+            nprobe (int): IVF 검색 시 탐색할 클러스터 수
+        """
+        self.path = path
+        self.dimension = dimension
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+
+        self._ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._capacity = 0
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+
+        # IVF 상태 (행별 클러스터 할당)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+
+        # 메타데이터 변경 로그 (스냅샷 세대별 meta.<세대>.log, 쓰기마다 변경분만 추가)
+        self._generation = 0
+        self._log_entries = 0
+        self._pending_log: List[Dict[str, Any]] = []
+
+        if path:
+            os.makedirs(path, exist_ok=True)
+            if not self._load():
+                self._compact()  # 새 인덱스는 빈 스냅샷부터 시작 (이후 변경은 로그로)
+
+    @property
+    def count(self) -> int:
+        return len(self._ids)
+
+    def upsert(self, vectors: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            for item in vectors:
+                values = np.asarray(item["values"], dtype=np.float32)
+                norm = np.linalg.norm(values)
+                if norm > 0:
+                    values = values / norm
+
+                position = self._positions.get(item["id"])
+                metadata = dict(item.get("metadata") or {})
+                if position is None:
+                    position = self.count
+                    self._ensure_capacity(position + 1)
+                    self._append_meta(item["id"], metadata)
+                    self._assignments[position] = -1
+                else:
+                    self._metadata[position] = metadata
+                if self.path:
+                    self._pending_log.append({"op": "put", "id": item["id"], "metadata": metadata})
+
+                self._vectors[position] = values
+                if self._centroids is not None:
+                    self._assignments[position] = self._nearest_centroids(values[None, :], 1)[0, 0]
+
+            self._maybe_train()
+            self._save()
+            return len(vectors)
+
+    def query(self, vector: List[float], top_k: int = 5,
+              filter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with self._lock:
+            if self.count == 0 or top_k <= 0:
+                return {"matches": []}
+
+            query = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            if norm > 0:
+                query = query / norm
+
+            rows = self._candidate_rows(query)
+            matches = self._rank(query, rows, top_k, filter)
+
+            # IVF 후보만으로 부족하면 전체를 대상으로 다시 검색
+            if len(matches) < top_k and rows is not None:
+                matches = self._rank(query, None, top_k, filter)
+
+            return {"matches": matches}
+
+    supports_batch_query = True
+
+    def query_many(self, vectors: List[List[float]], top_k: int = 5,
+                   filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """여러 쿼리 벡터의 점수를 한 번의 행렬 곱으로 계산합니다."""
+        with self._lock:
+            if self.count == 0 or top_k <= 0 or len(vectors) == 0:
+                return [{"matches": []} for _ in vectors]
+
+            queries = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), self.dimension)
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms > 0, norms, 1.0)
+
+            if self._centroids is not None:
+                # IVF 사용 시에는 쿼리별 후보가 다르므로 개별 검색
+                return [self.query(query, top_k=top_k, filter=filter) for query in queries]
+
+            scores = queries @ self._vectors[:self.count].T
+            return [{"matches": self._select(row, None, top_k, filter)} for row in scores]
+
+    def fetch(self, ids: List[str]) -> Dict[str, Any]:
+        with self._lock:
+            vectors = {}
+            for vector_id in ids:
+                position = self._positions.get(vector_id)
+                if position is None:
+                    continue
+                vectors[vector_id] = {
+                    "id": vector_id,
+                    "values": self._vectors[position].tolist(),
+                    "metadata": self._metadata[position]
+                }
+            return {"vectors": vectors}
+
+    def delete(self, ids: List[str]) -> bool:
+        with self._lock:
+            for vector_id in ids:
+                position = self._remove_meta(vector_id)
+                if position is None:
+                    continue
+                # 마지막 행을 삭제 위치로 옮겨 저장 공간을 연속으로 유지 (메타데이터는 _remove_meta에서 이동)
+                last = self.count
+                if position != last:
+                    self._vectors[position] = self._vectors[last]
+                    self._assignments[position] = self._assignments[last]
+                if self.path:
+                    self._pending_log.append({"op": "delete", "id": vector_id})
+            self._save()
+            return True
+
+    def _append_meta(self, vector_id: str, metadata: Dict[str, Any]):
+        self._positions[vector_id] = len(self._ids)
+        self._ids.append(vector_id)
+        self._metadata.append(metadata)
+
+    def _remove_meta(self, vector_id: str) -> Optional[int]:
+        """ID를 제거하고 마지막 항목을 그 위치로 옮깁니다. (로그 재생에서도 같은 순서로 적용)"""
+        position = self._positions.pop(vector_id, None)
+        if position is None:
+            return None
+        last = len(self._ids) - 1
+        if position != last:
+            moved_id = self._ids[last]
+            self._ids[position] = moved_id
+            self._metadata[position] = self._metadata[last]
+            self._positions[moved_id] = position
+        self._ids.pop()
+        self._metadata.pop()
+        return position
+
+    def delete_by_resume(self, resume_id: str) -> bool:
+        with self._lock:
+            ids = [vector_id for vector_id, metadata in zip(self._ids, self._metadata)
+                   if str(metadata.get("resume_id")) == str(resume_id)]
+            return self.delete(ids)
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """IVF가 학습되어 있으면 가까운 클러스터의 행 번호를, 아니면 None(전체)을 반환합니다."""
+        if self._centroids is None:
+            return None
+        probes = self._nearest_centroids(query[None, :], self.nprobe)[0]
+        return np.nonzero(np.isin(self._assignments[:self.count], probes))[0]
+
+    def _rank(self, query: np.ndarray, rows: Optional[np.ndarray], top_k: int,
+              filter: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """후보 행들의 코사인 점수를 한 번에 계산하고 필터를 통과한 상위 결과를 반환합니다."""
+        vectors = self._vectors[:self.count] if rows is None else self._vectors[rows]
+        if len(vectors) == 0:
+            return []
+        return self._select(vectors @ query, rows, top_k, filter)
+
+    def _select(self, scores: np.ndarray, rows: Optional[np.ndarray], top_k: int,
+                filter: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """점수 배열에서 필터를 통과한 상위 top_k 결과를 고릅니다."""
+        # 필터 탈락을 고려해 여유 있게 부분 정렬하고, 부족할 때만 전체 정렬
+        window = min(len(scores), top_k * 4 if filter else top_k)
+        while True:
+            if window < len(scores):
+                head = np.argpartition(-scores, window - 1)[:window]
+                order = head[np.argsort(-scores[head], kind="stable")]
+            else:
+                order = np.argsort(-scores, kind="stable")
+
+            matches = []
+            for index in order:
+                position = int(index) if rows is None else int(rows[index])
+                metadata = self._metadata[position]
+                if not matches_filter(metadata, filter):
+                    continue
+                matches.append({
+                    "id": self._ids[position],
+                    "score": float(scores[index]),
+                    "metadata": metadata
+                })
+                if len(matches) >= top_k:
+                    break
+
+            if len(matches) >= top_k or window >= len(scores):
+                return matches
+            window = len(scores)
+
+    def _nearest_centroids(self, vectors: np.ndarray, n: int) -> np.ndarray:
+        scores = vectors @ self._centroids.T
+        n = min(n, self._centroids.shape[0])
+        return np.argsort(-scores, axis=1)[:, :n].astype(np.int32)
+
+    def _maybe_train(self):
+        """벡터 수가 임계값을 넘었거나 마지막 학습 이후 두 배가 되면 IVF를 다시 학습합니다."""
+        if self.count < self.ivf_threshold:
+            self._centroids = None
+            self._trained_size = 0
+            return
+        if self._centroids is not None and self.count < self._trained_size * 2:
+            return
+
+        data = self._vectors[:self.count]
+        n_lists = max(1, int(np.sqrt(self.count)))
+        rng = np.random.default_rng(0)
+        sample = data[rng.choice(self.count, size=min(self.count, n_lists * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+
+        for _ in range(10):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(n_lists):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroid = members.mean(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[cluster] = centroid / norm if norm > 0 else centroid
+
+        self._centroids = centroids
+        for start in range(0, self.count, 8192):
+            block = data[start:start + 8192]
+            self._assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        self._trained_size = self.count
+        print(f"[LocalVectorBackend] IVF 인덱스 학습 완료 (벡터 {self.count}개, 클러스터 {n_lists}개)")
+
+    def _ensure_capacity(self, size: int):
+        """벡터 저장 공간을 필요 시 두 배씩 늘립니다."""
+        if size <= self._capacity:
+            return
+        capacity = max(1024, self._capacity * 2, size)
+        if self.path:
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            new_path = self._vectors_path() + ".tmp"
+            vectors = np.memmap(new_path, dtype=np.float32, mode="w+", shape=(capacity, self.dimension))
+            vectors[:self.count] = self._vectors[:self.count]
+            vectors.flush()
+            del vectors
+            self._vectors = None
+            os.replace(new_path, self._vectors_path())
+            self._vectors = np.memmap(self._vectors_path(), dtype=np.float32, mode="r+",
+                                      shape=(capacity, self.dimension))
+        else:
+            vectors = np.zeros((capacity, self.dimension), dtype=np.float32)
+            vectors[:self.count] = self._vectors[:self.count]
+            self._vectors = vectors
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[:self.count] = self._assignments[:self.count]
+        self._assignments = assignments
+        self._capacity = capacity
+
+    def _vectors_path(self) -> str:
+        return os.path.join(self.path, "vectors.f32")
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.path, "meta.json")
+
+    def _log_path(self, generation: int) -> str:
+        return os.path.join(self.path, f"meta.{generation}.log")
+
+    def _save(self):
+        """메모리 맵을 플러시하고 이번 변경분만 메타데이터 로그에 추가합니다. (로그가 커지면 스냅샷으로 압축)"""
+        if not self.path:
+            return
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+        entries, self._pending_log = self._pending_log, []
+        if not entries:
+            return
+        if self._log_entries + len(entries) > max(1000, self.count):
+            self._compact()
+            return
+        with open(self._log_path(self._generation), "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+        self._log_entries += len(entries)
+
+    def _compact(self):
+        """
+        전체 ID/메타데이터를 새 세대 스냅샷으로 원자적으로 기록하고 이전 로그를 지웁니다.
+        스냅샷이 가리키는 세대의 로그만 재생하므로 교체 도중 중단되어도 두 번 적용되지 않습니다.
+        """
+        previous_log = self._log_path(self._generation)
+        self._generation += 1
+        if os.path.exists(self._log_path(self._generation)):
+            os.remove(self._log_path(self._generation))  # 버려진 인덱스의 같은 세대 로그
+        tmp_path = self._meta_path() + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "dimension": self.dimension,
+                "capacity": self._capacity,
+                "generation": self._generation,
+                "ids": self._ids,
+                "metadata": self._metadata
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self._meta_path())
+        self._log_entries = 0
+        if os.path.exists(previous_log):
+            os.remove(previous_log)
+
+    def _replay_log(self) -> int:
+        """스냅샷 이후의 메타데이터 변경 로그를 순서대로 적용합니다."""
+        path = self._log_path(self._generation)
+        if not os.path.exists(path):
+            return 0
+        applied = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # 기록 도중 중단된 마지막 줄
+                if entry["op"] == "put":
+                    position = self._positions.get(entry["id"])
+                    if position is None:
+                        self._append_meta(entry["id"], entry["metadata"])
+                    else:
+                        self._metadata[position] = entry["metadata"]
+                else:
+                    self._remove_meta(entry["id"])
+                applied += 1
+        return applied
+
+    def _load(self):
+        """디스크에 저장된 인덱스를 메모리 맵으로 엽니다. (불러오지 못하면 False)"""
+        if not os.path.exists(self._meta_path()) or not os.path.exists(self._vectors_path()):
+            return False
+        try:
+            with open(self._meta_path(), "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state["dimension"] != self.dimension:
+                print(f"[LocalVectorBackend] 차원 불일치로 기존 인덱스를 무시합니다: {state['dimension']} != {self.dimension}")
+                return False
+            # 스냅샷 이후 용량이 늘었을 수 있으므로 용량은 벡터 파일 크기로 판단
+            self._capacity = os.path.getsize(self._vectors_path()) // (self.dimension * 4)
+            self._vectors = np.memmap(self._vectors_path(), dtype=np.float32, mode="r+",
+                                      shape=(self._capacity, self.dimension))
+            self._ids = state["ids"]
+            self._metadata = state["metadata"]
+            self._positions = {vector_id: i for i, vector_id in enumerate(self._ids)}
+            self._generation = state.get("generation", 0)
+            self._log_entries = self._replay_log()
+            self._assignments = np.full(self._capacity, -1, dtype=np.int32)
+            self._maybe_train()
+            print(f"[LocalVectorBackend] 로컬 인덱스 로드 완료 ({self.count}개 벡터)")
+            return True
+        except Exception as e:
+            print(f"[LocalVectorBackend] 로컬 인덱스 로드 실패: {e}")
+            self._ids, self._metadata, self._positions = [], [], {}
+            self._capacity = 0
+            self._vectors = np.zeros((0, self.dimension), dtype=np.float32)
+            self._assignments = np.zeros(0, dtype=np.int32)
+            self._generation, self._log_entries = 0, 0
+            return False
@@ -1,86 +1,279 @@
 import os
 import asyncio
+import logging
 import time
-from pinecone import Pinecone, ServerlessSpec
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from bson import ObjectId
+from vector_backends import VectorBackend, PineconeBackend, LocalVectorBackend
+from instrumentation import log_payload, span
+from service_metrics import ServiceStats
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 일관성 수준
+#   async  : 쓰기 큐에 넣고 즉시 반환 (백그라운드에서 배치 업서트)
+#   sync   : 업서트 완료까지 대기, 인덱싱 확인은 하지 않음
+#   strong : 업서트 후 fetch로 인덱싱 완료까지 확인 (기존 동작)
+WRITE_CONSISTENCY_LEVELS = ("async", "sync", "strong")
+
+class VectorWriteQueue:
+    def __init__(self, backend: VectorBackend, batch_size: int = 100,
+                 flush_interval: float = 0.5, max_tracked_ids: int = 50000,
+                 max_attempts: int = 5, retry_backoff: float = 0.5, max_retry_delay: float = 30.0):
+        """
+        벡터 업서트를 모아 백그라운드에서 배치로 저장하는 쓰기 지연(write-behind) 큐
+
+        Args:
+            backend (VectorBackend): 벡터 백엔드
+            batch_size (int): 한 번에 업서트할 최대 벡터 수
+            flush_interval (float): 배치를 모으기 위해 기다리는 최대 시간 (초)
+            max_tracked_ids (int): 상태를 추적할 최대 벡터 ID 수 (오래된 것부터 제거)
+            max_attempts (int): 업서트 실패 시 failed로 기록하기 전까지의 최대 시도 횟수
+            retry_backoff (float): 재시도 대기 시간 기준값 (초, 시도마다 두 배)
+            max_retry_delay (float): 재시도 대기 시간 상한 (초)
+        """
+        self.backend = backend
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_tracked_ids = max_tracked_ids
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_retry_delay = max_retry_delay
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 업서트에 실패해 재시도를 기다리는 벡터: ID → (벡터, 시도 횟수, 재시도 시각)
+        self._retrying: Dict[str, Tuple[Dict[str, Any], int, float]] = {}
+        self._attempts: Dict[str, int] = {}
+        self._status: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.flushed_batches = 0
+        self.flushed_vectors = 0
+        self.retried_vectors = 0
+        self.failed_vectors = 0
+
+    async def enqueue(self, vectors: List[Dict[str, Any]]):
+        """벡터들을 큐에 넣고 상태를 queued로 기록합니다. 같은 ID는 마지막 값만 저장됩니다."""
+        self._ensure_worker()
+        for vector in vectors:
+            self._pending.pop(vector["id"], None)
+            # 새 값이 들어오면 이전 값의 재시도는 버리고 시도 횟수도 새로 셈
+            self._retrying.pop(vector["id"], None)
+            self._attempts.pop(vector["id"], None)
+            self._pending[vector["id"]] = vector
+            self._set_status(vector["id"], "queued")
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self):
+        """대기 중인 모든 벡터를 즉시 저장합니다. (재시도 대기 중인 벡터는 성공하거나 failed가 될 때까지 기다림)"""
+        while self._pending or self._retrying:
+            if not self._pending:
+                earliest = min(due for _, _, due in self._retrying.values())
+                await asyncio.sleep(max(0.0, earliest - time.monotonic()))
+            self._promote_due_retries()
+            while self._pending:
+                await self._flush_batch()
+
+    async def close(self):
+        """남은 벡터를 저장하고 백그라운드 작업을 종료합니다."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self.flush()
+
+    def get_status(self, vector_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """벡터 ID별 쓰기 상태(queued/retrying/written/failed/unknown)를 반환합니다."""
+        return {
+            vector_id: dict(self._status.get(vector_id, {"state": "unknown"}))
+            for vector_id in vector_ids
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 상태 통계를 반환합니다."""
+        return {
+            "pending": len(self._pending),
+            "retrying": len(self._retrying),
+            "flushed_batches": self.flushed_batches,
+            "flushed_vectors": self.flushed_vectors,
+            "retried_vectors": self.retried_vectors,
+            "failed_vectors": self.failed_vectors,
+            "tracked_ids": len(self._status)
+        }
+
+    def mark_written(self, vector_ids: List[str]):
+        """큐를 거치지 않고 저장된 벡터의 상태를 기록합니다."""
+        for vector_id in vector_ids:
+            self._set_status(vector_id, "written")
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """배치가 차거나 flush_interval이 지나면 업서트를 실행하는 백그라운드 루프"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            self._promote_due_retries()
+            while self._pending:
+                await self._flush_batch()
+
+    async def _flush_batch(self):
+        batch = []
+        while self._pending and len(batch) < self.batch_size:
+            _, vector = self._pending.popitem(last=False)
+            batch.append(vector)
+        if not batch:
+            return
+
+        ids = [vector["id"] for vector in batch]
+        try:
+            # 백엔드 클라이언트는 동기식이므로 워커 스레드에서 실행
+            await asyncio.to_thread(self.backend.upsert, batch)
+            self.flushed_batches += 1
+            self.flushed_vectors += len(batch)
+            for vector_id in ids:
+                # 저장 중 같은 ID가 다시 큐에 들어왔다면 queued 상태를 유지
+                if vector_id not in self._pending:
+                    self._attempts.pop(vector_id, None)
+                    self._set_status(vector_id, "written")
+        except Exception as e:
+            self._schedule_retry(batch, e)
+
+    def _schedule_retry(self, batch: List[Dict[str, Any]], error: Exception):
+        """실패한 배치를 지수 백오프로 다시 큐에 넣고, max_attempts를 넘긴 벡터만 failed로 기록합니다."""
+        now = time.monotonic()
+        given_up = 0
+        for vector in batch:
+            vector_id = vector["id"]
+            if vector_id in self._pending:
+                continue  # 저장 중 새 값이 들어옴 - 새 값으로 저장
+            attempts = self._attempts.get(vector_id, 0) + 1
+            if attempts >= self.max_attempts:
+                self._attempts.pop(vector_id, None)
+                self._set_status(vector_id, "failed", error=str(error))
+                self.failed_vectors += 1
+                given_up += 1
+                continue
+            self._attempts[vector_id] = attempts
+            delay = min(self.retry_backoff * (2 ** (attempts - 1)), self.max_retry_delay)
+            self._retrying[vector_id] = (vector, attempts, now + delay)
+            self._set_status(vector_id, "retrying", error=str(error))
+        if given_up:
+            logger.error("[VectorWriteQueue] 배치 업서트 실패 - %s개는 %s회 시도 후 포기: %s",
+                         given_up, self.max_attempts, error)
+        else:
+            logger.warning("[VectorWriteQueue] 배치 업서트 실패 (%s개), 재시도 예정: %s", len(batch), error)
+
+    def _promote_due_retries(self):
+        """재시도 시각이 된 벡터를 저장 대기열로 옮깁니다."""
+        now = time.monotonic()
+        for vector_id, (vector, _, due) in list(self._retrying.items()):
+            if due <= now:
+                del self._retrying[vector_id]
+                self._pending[vector_id] = vector
+                self.retried_vectors += 1
+
+    def _set_status(self, vector_id: str, state: str, error: Optional[str] = None):
+        entry = {"state": state, "updated_at": datetime.now().isoformat()}
+        if error:
+            entry["error"] = error
+        self._status.pop(vector_id, None)
+        self._status[vector_id] = entry
+        while len(self._status) > self.max_tracked_ids:
+            self._status.popitem(last=False)
+
 
 class VectorService:
-    def __init__(self, api_key: str, index_name: str = "resume-vectors"):
+    def __init__(self, api_key: Optional[str] = None, index_name: str = "resume-vectors",
+                 backend: Optional[VectorBackend] = None, write_consistency: Optional[str] = None):
         """
         벡터 서비스 초기화
         
         Args:
-            api_key (str): Pinecone API 키
+            api_key (Optional[str]): Pinecone API 키
             index_name (str): 인덱스 이름
+            backend (Optional[VectorBackend]): 사용할 벡터 백엔드 (None이면 VECTOR_BACKEND 환경 변수로 선택)
+            write_consistency (Optional[str]): 기본 쓰기 일관성 수준 ("async", "sync", "strong")
         """
-        self.pc = Pinecone(api_key=api_key)
         self.index_name = index_name
-        self.index = None
-        self._initialize_index()
+        self.index = backend or self._create_backend(api_key)
+        self.write_consistency = write_consistency or os.getenv("VECTOR_WRITE_CONSISTENCY", "async")
+        self.write_queue = VectorWriteQueue(self.index) if self.index is not None else None
+        # 검색 쿼리 수와 지연 시간 (GET /api/similarity/metrics)
+        self.stats = ServiceStats("vector")
     
-    def _initialize_index(self):
-        """Pinecone 인덱스를 초기화합니다."""
+    def _create_backend(self, api_key: Optional[str]) -> Optional[VectorBackend]:
+        """
+        환경 변수에 따라 벡터 백엔드를 생성합니다.
+        
+        VECTOR_BACKEND=local 이거나 Pinecone API 키가 없으면 로컬 인덱스를,
+        그 외에는 Pinecone 인덱스를 사용합니다.
+        """
+        backend_type = os.getenv("VECTOR_BACKEND", "pinecone" if api_key else "local").lower()
+        
+        if backend_type == "local":
+            local_path = os.getenv(
+                "LOCAL_VECTOR_PATH",
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "vectors", self.index_name)
+            )
+            logger.info("로컬 벡터 인덱스 사용: %s", local_path)
+            return LocalVectorBackend(path=local_path, dimension=384)
+        
         try:
-            self.index = self.pc.Index(self.index_name)
-            print(f"Pinecone 인덱스 '{self.index_name}' 연결 성공")
+            return PineconeBackend.connect(api_key, self.index_name, dimension=384)
         except Exception as e:
-            print(f"인덱스 '{self.index_name}'을 찾을 수 없습니다. 새로 생성합니다...")
-            try:
-                # 인덱스 생성 (all-MiniLM-L6-v2는 384차원)
-                self.pc.create_index(
-                    name=self.index_name,
-                    dimension=384,
-                    metric='cosine',
-                    spec=ServerlessSpec(
-                        cloud='aws',
-                        region='us-east-1'
-                    )
-                )
-                print(f"인덱스 '{self.index_name}'이 성공적으로 생성되었습니다.")
-                self.index = self.pc.Index(self.index_name)
-            except Exception as create_error:
-                print(f"인덱스 생성 실패: {create_error}")
-                # 인덱스 생성에 실패해도 서버는 계속 실행
-                self.index = None
+            logger.error("Pinecone 초기화 실패: %s", e)
+            return None
     
-    async def save_chunk_vectors(self, chunks: List[Dict[str, Any]], embedding_service) -> List[str]:
+    async def save_chunk_vectors(self, chunks: List[Dict[str, Any]], embedding_service,
+                                 consistency: Optional[str] = None) -> List[str]:
         """
-        여러 청크의 벡터를 Pinecone에 저장합니다.
+        여러 청크의 벡터를 벡터 인덱스에 저장합니다.
         
         Args:
             chunks (List[Dict[str, Any]]): 청크 리스트
             embedding_service: 임베딩 서비스
+            consistency (Optional[str]): 쓰기 일관성 수준 (None이면 서비스 기본값)
             
         Returns:
             List[str]: 저장된 벡터 ID 리스트
         """
-        print(f"[VectorService] === 청크 벡터 저장 시작 ===")
-        print(f"[VectorService] 저장할 청크 수: {len(chunks)}")
+        logger.debug("[VectorService] === 청크 벡터 저장 시작 ===")
+        logger.debug("[VectorService] 저장할 청크 수: %s", len(chunks))
         
         if self.index is None:
-            print("[VectorService] Pinecone 인덱스가 없어 벡터를 저장할 수 없습니다.")
+            logger.warning("[VectorService] 벡터 인덱스가 없어 벡터를 저장할 수 없습니다.")
             return []
         
         stored_vector_ids = []
         vectors_to_upsert = []
         
-        # 모든 청크에 대해 임베딩 생성
-        for chunk in chunks:
+        # 모든 청크의 임베딩을 한 번의 배치 호출로 생성
+        try:
+            embeddings = await embedding_service.embed_many([chunk["text"] for chunk in chunks])
+        except Exception as e:
+            logger.error("[VectorService] 청크 임베딩 배치 생성 실패: %s", e)
+            return []
+        
+        for chunk, embedding in zip(chunks, embeddings):
             try:
-                # 청크 텍스트로 임베딩 생성
-                embedding = await embedding_service.create_embedding(chunk["text"])
-                
-                if not embedding:
-                    print(f"[VectorService] 청크 '{chunk['chunk_id']}' 임베딩 생성 실패")
-                    continue
-                
                 # 벡터 데이터 구성
                 vector_data = {
                     "id": chunk["chunk_id"],
-                    "values": embedding,
+                    "values": embedding.tolist(),
                     "metadata": {
+                        "type": "resume_chunk",
                         "resume_id": chunk["resume_id"],
                         "chunk_type": chunk["chunk_type"],
                         "section": chunk["metadata"]["section"],
@@ -94,48 +287,43 @@ class VectorService:
                 vectors_to_upsert.append(vector_data)
                 stored_vector_ids.append(chunk["chunk_id"])
                 
-                print(f"[VectorService] 청크 준비: {chunk['chunk_id']} ({chunk['chunk_type']}) - {len(chunk['text'])} 문자")
+                logger.debug("[VectorService] 청크 준비: %s (%s) - %s 문자", chunk['chunk_id'], chunk['chunk_type'], len(chunk['text']))
                 
             except Exception as e:
-                print(f"[VectorService] 청크 '{chunk['chunk_id']}' 처리 중 오류: {e}")
+                logger.error("[VectorService] 청크 '%s' 처리 중 오류: %s", chunk['chunk_id'], e)
                 continue
         
         # 배치로 모든 벡터 저장
         if vectors_to_upsert:
             try:
-                print(f"[VectorService] {len(vectors_to_upsert)}개 벡터 배치 저장 시작...")
-                self.index.upsert(vectors=vectors_to_upsert)
-                print(f"[VectorService] 배치 저장 성공!")
-                
-                # 인덱싱 완료 대기
-                print(f"[VectorService] 인덱싱 완료 대기 중...")
-                await self._wait_for_batch_indexing(stored_vector_ids)
-                print(f"[VectorService] 인덱싱 완료")
-                
+                logger.debug("[VectorService] %s개 벡터 배치 저장 시작...", len(vectors_to_upsert))
+                await self._write_vectors(vectors_to_upsert, consistency)
             except Exception as e:
-                print(f"[VectorService] 배치 저장 실패: {e}")
+                logger.error("[VectorService] 배치 저장 실패: %s", e)
                 return []
         
-        print(f"[VectorService] === 청크 벡터 저장 완료 ({len(stored_vector_ids)}개) ===")
+        logger.debug("[VectorService] === 청크 벡터 저장 완료 (%s개) ===", len(stored_vector_ids))
         return stored_vector_ids
 
-    async def save_vector(self, embedding: List[float], metadata: Dict[str, Any]) -> Optional[str]:
+    async def save_vector(self, embedding: List[float], metadata: Dict[str, Any],
+                          consistency: Optional[str] = None) -> Optional[str]:
         """
-        벡터를 Pinecone에 저장합니다.
+        벡터를 벡터 인덱스에 저장합니다.
         
         Args:
             embedding (List[float]): 저장할 임베딩 벡터
             metadata (Dict[str, Any]): 벡터와 함께 저장할 메타데이터
+            consistency (Optional[str]): 쓰기 일관성 수준 (None이면 서비스 기본값)
             
         Returns:
             Optional[str]: 저장된 벡터의 ID (실패 시 None)
         """
-        print(f"[VectorService] === Pinecone 벡터 저장 시작 ===")
-        print(f"[VectorService] 메타데이터: {metadata}")
+        logger.debug("[VectorService] === Pinecone 벡터 저장 시작 ===")
+        log_payload(logger, "[VectorService] 메타데이터: %s", metadata)
         
         if self.index is None:
-            print("[VectorService] Pinecone 인덱스가 없어 벡터를 저장할 수 없습니다.")
-            print(f"[VectorService] === Pinecone 벡터 저장 실패 (인덱스 없음) ===")
+            logger.warning("[VectorService] 벡터 인덱스가 없어 벡터를 저장할 수 없습니다.")
+            logger.error("[VectorService] === Pinecone 벡터 저장 실패 (인덱스 없음) ===")
             return None
         
         try:
@@ -152,32 +340,84 @@ class VectorService:
                 }
             }
             
-            print(f"[VectorService] 저장할 벡터 ID: {vector_id}")
-            print(f"[VectorService] 벡터 차원: {len(embedding)}")
-            print(f"[VectorService] 메타데이터 타입: {metadata['type']}")
-            print(f"[VectorService] 이력서 ID: {metadata['resume_id']}")
-            print(f"[VectorService] 이름: {metadata['name']}")
-            print(f"[VectorService] 이메일: {metadata['email']}")
-            
-            self.index.upsert(vectors=[vector_data])
-            print(f"[VectorService] 벡터가 Pinecone에 성공적으로 저장되었습니다!")
-            print(f"[VectorService] 저장된 벡터 ID: {vector_id}")
+            logger.debug("[VectorService] 저장할 벡터 ID: %s", vector_id)
+            logger.debug("[VectorService] 벡터 차원: %s", len(embedding))
+            logger.debug("[VectorService] 메타데이터 타입: %s", metadata['type'])
+            logger.debug("[VectorService] 이력서 ID: %s", metadata['resume_id'])
+            logger.debug("[VectorService] 이름: %s", metadata['name'])
+            logger.debug("[VectorService] 이메일: %s", metadata['email'])
             
-            # Pinecone 인덱싱 완료 대기 및 확인
-            print(f"[VectorService] Pinecone 인덱싱 대기 및 확인 중...")
-            await self._wait_for_indexing(vector_id)
-            print(f"[VectorService] 인덱싱 확인 완료")
+            await self._write_vectors([vector_data], consistency)
+            logger.debug("[VectorService] 저장된 벡터 ID: %s", vector_id)
             
-            print(f"[VectorService] === Pinecone 벡터 저장 완료 ===")
+            logger.debug("[VectorService] === Pinecone 벡터 저장 완료 ===")
             return vector_id
         except Exception as e:
-            print(f"[VectorService] === Pinecone 벡터 저장 실패 ===")
-            print(f"[VectorService] 오류 메시지: {e}")
-            print(f"[VectorService] 메타데이터: {metadata}")
-            print(f"[VectorService] 임베딩 차원: {len(embedding) if embedding else 'None'}")
-            print(f"[VectorService] === Pinecone 벡터 저장 실패 완료 ===")
+            logger.error("[VectorService] === Pinecone 벡터 저장 실패 ===")
+            logger.error("[VectorService] 오류 메시지: %s", e)
+            log_payload(logger, "[VectorService] 메타데이터: %s", metadata)
+            logger.debug("[VectorService] 임베딩 차원: %s", len(embedding) if embedding else 'None')
+            logger.error("[VectorService] === Pinecone 벡터 저장 실패 완료 ===")
             return None
     
+    async def _write_vectors(self, vectors: List[Dict[str, Any]], consistency: Optional[str] = None):
+        """
+        일관성 수준에 따라 벡터를 저장합니다.
+        
+        Args:
+            vectors (List[Dict[str, Any]]): 저장할 벡터 리스트
+            consistency (Optional[str]): "async"(쓰기 큐), "sync"(업서트 대기), "strong"(인덱싱 확인까지 대기)
+        """
+        consistency = consistency or self.write_consistency
+        if consistency not in WRITE_CONSISTENCY_LEVELS:
+            raise ValueError(f"지원하지 않는 쓰기 일관성 수준입니다: {consistency}")
+        
+        if consistency == "async":
+            await self.write_queue.enqueue(vectors)
+            return
+        
+        vector_ids = [vector["id"] for vector in vectors]
+        await asyncio.to_thread(self.index.upsert, vectors)
+        self.write_queue.mark_written(vector_ids)
+        
+        if consistency == "strong":
+            if len(vector_ids) == 1:
+                await self._wait_for_indexing(vector_ids[0])
+            else:
+                await self._wait_for_batch_indexing(vector_ids)
+    
+    async def flush_writes(self):
+        """쓰기 큐에 남아 있는 벡터를 모두 저장합니다."""
+        if self.write_queue is not None:
+            await self.write_queue.close()
+    
+    async def get_vector_status(self, vector_ids: List[str], verify: bool = False) -> Dict[str, Any]:
+        """
+        벡터 ID별 쓰기 상태를 조회합니다.
+        
+        Args:
+            vector_ids (List[str]): 조회할 벡터 ID 리스트
+            verify (bool): True이면 written 상태의 벡터를 인덱스에서 조회해 indexed 여부를 확인
+            
+        Returns:
+            Dict[str, Any]: ID별 상태와 쓰기 큐 통계
+        """
+        if self.write_queue is None:
+            return {"statuses": {vector_id: {"state": "unavailable"} for vector_id in vector_ids}, "queue": {}}
+        
+        statuses = self.write_queue.get_status(vector_ids)
+        if verify:
+            to_verify = [vector_id for vector_id, status in statuses.items()
+                         if status["state"] in ("written", "unknown")]
+            if to_verify:
+                fetch_result = await asyncio.to_thread(self.index.fetch, to_verify)
+                found = fetch_result.get("vectors", {})
+                for vector_id in to_verify:
+                    if vector_id in found:
+                        statuses[vector_id]["state"] = "indexed"
+        
+        return {"statuses": statuses, "queue": self.write_queue.stats()}
+    
     async def search_similar_vectors(self, query_embedding: List[float], 
                                    top_k: int = 5, 
                                    filter_type: Optional[str] = None) -> Dict[str, Any]:
@@ -193,35 +433,80 @@ class VectorService:
             Dict[str, Any]: 검색 결과
         """
         if self.index is None:
-            print("[VectorService] Pinecone 인덱스가 없어 검색할 수 없습니다.")
+            logger.warning("[VectorService] 벡터 인덱스가 없어 검색할 수 없습니다.")
             return {"matches": []}
         
         try:
-            print(f"[VectorService] Pinecone 검색 시작...")
-            print(f"[VectorService] 검색 제한: {top_k}")
-            print(f"[VectorService] 필터 타입: {filter_type}")
-            
-            # 검색 파라미터 설정
-            search_params = {
-                "vector": query_embedding,
-                "top_k": top_k,
-                "include_metadata": True
-            }
+            logger.debug("[VectorService] Pinecone 검색 시작...")
+            logger.debug("[VectorService] 검색 제한: %s", top_k)
+            logger.debug("[VectorService] 필터 타입: %s", filter_type)
             
             # 타입 필터가 있으면 추가
-            if filter_type:
-                search_params["filter"] = {"type": filter_type}
+            metadata_filter = {"type": filter_type} if filter_type else None
             
-            search_result = self.index.query(**search_params)
+            self.stats.inc("queries")
+            with span("vector_query", backend=type(self.index).__name__, op="query", stats=self.stats):
+                # Pinecone은 네트워크 I/O, 로컬 인덱스는 쓰기/IVF 학습과 잠금을 공유하므로 워커 스레드에서 실행
+                search_result = await asyncio.to_thread(self.index.query, query_embedding, top_k, metadata_filter)
             
-            print(f"[VectorService] Pinecone 검색 완료!")
-            print(f"[VectorService] 검색 결과 수: {len(search_result['matches'])}")
+            logger.debug("[VectorService] Pinecone 검색 완료!")
+            logger.debug("[VectorService] 검색 결과 수: %s", len(search_result['matches']))
             
             return search_result
         except Exception as e:
-            print(f"[VectorService] Pinecone 검색 실패: {e}")
+            logger.error("[VectorService] Pinecone 검색 실패: %s", e)
             return {"matches": []}
     
+    async def search_similar_vectors_many(self, query_embeddings: List[List[float]],
+                                          top_k: int = 5,
+                                          filter_type: Optional[str] = None,
+                                          max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리 임베딩을 한 번에 검색합니다.
+        
+        배치 검색을 지원하는 백엔드는 한 번의 호출로, 그 외 백엔드(Pinecone)는
+        세마포어로 동시 요청 수를 제한한 병렬 쿼리로 처리합니다.
+        
+        Args:
+            query_embeddings (List[List[float]]): 검색할 쿼리 임베딩 리스트
+            top_k (int): 쿼리별 반환할 최대 결과 수
+            filter_type (Optional[str]): 필터링할 타입 (예: "resume", "cover_letter")
+            max_concurrency (int): 개별 쿼리 시 최대 동시 요청 수
+            
+        Returns:
+            List[Dict[str, Any]]: 쿼리 순서대로의 검색 결과
+        """
+        if self.index is None:
+            logger.warning("[VectorService] 벡터 인덱스가 없어 검색할 수 없습니다.")
+            return [{"matches": []} for _ in query_embeddings]
+        
+        metadata_filter = {"type": filter_type} if filter_type else None
+        queries = [embedding.tolist() if hasattr(embedding, "tolist") else embedding
+                   for embedding in query_embeddings]
+        
+        if self.index.supports_batch_query:
+            try:
+                self.stats.inc("queries", len(queries))
+                with span("vector_query", backend=type(self.index).__name__, op="query_many", stats=self.stats):
+                    return await asyncio.to_thread(self.index.query_many, queries, top_k, metadata_filter)
+            except Exception as e:
+                logger.error("[VectorService] 배치 검색 실패: %s", e)
+                return [{"matches": []} for _ in queries]
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_query(query):
+            async with semaphore:
+                try:
+                    self.stats.inc("queries")
+                    with span("vector_query", backend=type(self.index).__name__, op="query", stats=self.stats):
+                        return await asyncio.to_thread(self.index.query, query, top_k, metadata_filter)
+                except Exception as e:
+                    logger.error("[VectorService] 검색 실패: %s", e)
+                    return {"matches": []}
+        
+        return list(await asyncio.gather(*(run_query(query) for query in queries)))
+    
     async def delete_vectors_by_resume_id(self, resume_id: str) -> bool:
         """
         특정 이력서 ID와 관련된 모든 벡터를 삭제합니다.
@@ -233,20 +518,15 @@ class VectorService:
             bool: 삭제 성공 여부
         """
         if self.index is None:
-            print("Pinecone 인덱스가 없어 벡터를 삭제할 수 없습니다.")
+            logger.warning("벡터 인덱스가 없어 벡터를 삭제할 수 없습니다.")
             return False
         
         try:
-            vectors_to_delete = [
-                f"resume_{resume_id}_resume",
-                f"resume_{resume_id}_cover_letter",
-                f"resume_{resume_id}_portfolio"
-            ]
-            self.index.delete(ids=vectors_to_delete)
-            print(f"이력서 ID {resume_id}의 벡터들이 성공적으로 삭제되었습니다.")
+            await asyncio.to_thread(self.index.delete_by_resume, resume_id)
+            logger.debug("이력서 ID %s의 벡터들이 성공적으로 삭제되었습니다.", resume_id)
             return True
         except Exception as e:
-            print(f"Pinecone 벡터 삭제 중 오류: {e}")
+            logger.error("Pinecone 벡터 삭제 중 오류: %s", e)
             return False
     
     async def _wait_for_indexing(self, vector_id: str, max_wait_time: int = 10, check_interval: float = 1.0):
@@ -258,7 +538,7 @@ class VectorService:
             max_wait_time (int): 최대 대기 시간 (초)
             check_interval (float): 확인 간격 (초)
         """
-        print(f"[VectorService] 벡터 '{vector_id}' 인덱싱 확인 시작...")
+        logger.debug("[VectorService] 벡터 '%s' 인덱싱 확인 시작...", vector_id)
         
         start_time = time.time()
         attempt = 0
@@ -267,21 +547,21 @@ class VectorService:
             attempt += 1
             try:
                 # 벡터가 검색 가능한지 확인
-                fetch_result = self.index.fetch(ids=[vector_id])
+                fetch_result = await asyncio.to_thread(self.index.fetch, [vector_id])
                 
                 if vector_id in fetch_result.get('vectors', {}):
                     elapsed = time.time() - start_time
-                    print(f"[VectorService] 인덱싱 확인 완료! (시도: {attempt}, 소요시간: {elapsed:.1f}초)")
+                    logger.debug("[VectorService] 인덱싱 확인 완료! (시도: %s, 소요시간: %s초)", attempt, format(elapsed, ".1f"))
                     return True
                 else:
-                    print(f"[VectorService] 인덱싱 대기 중... (시도: {attempt})")
+                    logger.debug("[VectorService] 인덱싱 대기 중... (시도: %s)", attempt)
                     await asyncio.sleep(check_interval)
                     
             except Exception as e:
-                print(f"[VectorService] 인덱싱 확인 중 오류 (시도 {attempt}): {e}")
+                logger.error("[VectorService] 인덱싱 확인 중 오류 (시도 %s): %s", attempt, e)
                 await asyncio.sleep(check_interval)
         
-        print(f"[VectorService] 인덱싱 확인 시간 초과 ({max_wait_time}초), 계속 진행...")
+        logger.warning("[VectorService] 인덱싱 확인 시간 초과 (%s초), 계속 진행...", max_wait_time)
         return False
     
     async def _wait_for_batch_indexing(self, vector_ids: List[str], max_wait_time: int = 15, check_interval: float = 2.0):
@@ -293,7 +573,7 @@ class VectorService:
             max_wait_time (int): 최대 대기 시간 (초)
             check_interval (float): 확인 간격 (초)
         """
-        print(f"[VectorService] {len(vector_ids)}개 벡터 배치 인덱싱 확인 시작...")
+        logger.debug("[VectorService] %s개 벡터 배치 인덱싱 확인 시작...", len(vector_ids))
         
         start_time = time.time()
         attempt = 0
@@ -303,20 +583,20 @@ class VectorService:
             try:
                 # 샘플 벡터들이 검색 가능한지 확인 (전체가 아닌 일부만)
                 sample_ids = vector_ids[:min(3, len(vector_ids))]  # 최대 3개만 확인
-                fetch_result = self.index.fetch(ids=sample_ids)
+                fetch_result = await asyncio.to_thread(self.index.fetch, sample_ids)
                 
                 found_count = len(fetch_result.get('vectors', {}))
                 if found_count >= len(sample_ids):
                     elapsed = time.time() - start_time
-                    print(f"[VectorService] 배치 인덱싱 확인 완료! (시도: {attempt}, 소요시간: {elapsed:.1f}초)")
+                    logger.debug("[VectorService] 배치 인덱싱 확인 완료! (시도: %s, 소요시간: %s초)", attempt, format(elapsed, ".1f"))
                     return True
                 else:
-                    print(f"[VectorService] 배치 인덱싱 대기 중... (시도: {attempt}, {found_count}/{len(sample_ids)} 준비됨)")
+                    logger.debug("[VectorService] 배치 인덱싱 대기 중... (시도: %s, %s/%s 준비됨)", attempt, found_count, len(sample_ids))
                     await asyncio.sleep(check_interval)
                     
             except Exception as e:
-                print(f"[VectorService] 배치 인덱싱 확인 중 오류 (시도 {attempt}): {e}")
+                logger.error("[VectorService] 배치 인덱싱 확인 중 오류 (시도 %s): %s", attempt, e)
                 await asyncio.sleep(check_interval)
         
-        print(f"[VectorService] 배치 인덱싱 확인 시간 초과 ({max_wait_time}초), 계속 진행...")
+        logger.warning("[VectorService] 배치 인덱싱 확인 시간 초과 (%s초), 계속 진행...", max_wait_time)
         return False